@@ -3,8 +3,8 @@ Configuration management for FDA CRL Explorer.
 Uses Pydantic Settings for environment variable validation and type safety.
 """
 
-from functools import lru_cache
-from typing import List
+from functools import cache, cached_property
+from typing import Optional, Tuple
 from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -94,6 +94,19 @@ class Settings(BaseSettings):
         description="OpenAI model for embeddings (text-embedding-3-large: 64.6% MTEB, 3072 dims)"
     )
 
+    openai_embedding_batch_size: int = Field(
+        default=512,
+        ge=1,
+        le=2048,
+        description="Maximum number of texts per embeddings API request (OpenAI allows 2048)"
+    )
+
+    embedding_cache_size: int = Field(
+        default=1024,
+        ge=0,
+        description="Maximum number of embeddings cached in memory per service (0 disables caching)"
+    )
+
     openai_qa_model: str = Field(
         default="gpt-5-nano",
         description="OpenAI model for Q&A"
@@ -112,6 +125,13 @@ class Settings(BaseSettings):
         description="Number of characters to use for dummy summaries in dry-run mode"
     )
 
+    ai_dry_run_embedding_dims: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=3072,
+        description="Dimensions of dummy embeddings in dry-run mode (default: the embedding model's size)"
+    )
+
     # RAG Configuration
     rag_top_k: int = Field(
         default=5,
@@ -173,17 +193,18 @@ class Settings(BaseSettings):
             )
         return self
 
-    def get_cors_origins_list(self) -> List[str]:
-        """Parse comma-separated CORS origins into a list."""
-        return [origin.strip() for origin in self.cors_origins.split(",")]
+    @cached_property
+    def cors_origins_list(self) -> Tuple[str, ...]:
+        """Comma-separated CORS origins, parsed once into a tuple."""
+        return tuple(origin.strip() for origin in self.cors_origins.split(","))
 
 
-@lru_cache()
+@cache
 def get_settings() -> Settings:
     """
     Get cached settings instance.
 
-    This function uses lru_cache to ensure settings are loaded only once
+    This function uses functools.cache to ensure settings are loaded only once
     and reused throughout the application lifecycle.
 
     Returns:
@@ -5,6 +5,9 @@ Provides DuckDB connection handling and CRUD operations via repository pattern.
 
 import duckdb
 import json
+import numpy as np
+from numpy.typing import DTypeLike
+import threading
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
@@ -16,6 +19,10 @@ from app.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Serializes writes from pipeline steps that run concurrently on their own
+# cursors; DuckDB rejects overlapping updates to the same rows.
+write_lock = threading.Lock()
+
 
 class DatabaseConnection:
     """
@@ -105,15 +112,16 @@ def init_db() -> None:
     conn = get_db()
 
     try:
-        # Create tables
-        for table_sql in ALL_TABLES:
-            conn.execute(table_sql)
-            logger.debug(f"Executed table creation SQL")
+        with write_lock:
+            # Create tables
+            for table_sql in ALL_TABLES:
+                conn.execute(table_sql)
+                logger.debug(f"Executed table creation SQL")
 
-        # Create indexes
-        for index_sql in CREATE_INDEXES:
-            conn.execute(index_sql)
-            logger.debug(f"Executed index creation SQL")
+            # Create indexes
+            for index_sql in CREATE_INDEXES:
+                conn.execute(index_sql)
+                logger.debug(f"Executed index creation SQL")
 
         logger.info("Database schema initialized successfully")
 
@@ -130,8 +138,8 @@ def init_db() -> None:
 class CRLRepository:
     """Repository for CRL (Complete Response Letter) operations."""
 
-    def __init__(self):
-        self.conn = get_db()
+    def __init__(self, conn: Optional[duckdb.DuckDBPyConnection] = None):
+        self.conn = conn if conn is not None else get_db()
 
     def create(self, crl_data: Dict[str, Any]) -> str:
         """
@@ -750,27 +758,59 @@ class CRLRepository:
 
         return stats
 
+    def get_basic_stats(self) -> Dict[str, Any]:
+        """
+        Get total, per-status and per-year CRL counts in a single query.
+
+        Lighter alternative to get_stats() for callers that only need the
+        headline numbers (e.g. data loading scripts).
+
+        Returns:
+            Dict: Statistics with total_crls, by_status and by_year keys
+        """
+        results = self.conn.execute("""
+            SELECT
+                approval_status,
+                letter_year,
+                GROUPING(approval_status) AS status_rollup,
+                GROUPING(letter_year) AS year_rollup,
+                COUNT(*) as count
+            FROM crls
+            GROUP BY GROUPING SETS ((approval_status), (letter_year), ())
+        """).fetchall()
+
+        stats = {"total_crls": 0, "by_status": {}, "by_year": {}}
+        for status, year, status_rollup, year_rollup, count in results:
+            if status_rollup and year_rollup:
+                stats["total_crls"] = count
+            elif year_rollup:
+                stats["by_status"][status] = count
+            else:
+                stats["by_year"][year] = count
+
+        return stats
+
 
 class SummaryRepository:
     """Repository for CRL summary operations."""
 
-    def __init__(self):
-        self.conn = get_db()
+    def __init__(self, conn: Optional[duckdb.DuckDBPyConnection] = None):
+        self.conn = conn if conn is not None else get_db()
 
     def create(self, summary_data: Dict[str, Any]) -> str:
-        """Create a new summary."""
+        """Create a new summary, letting DuckDB generate the ID if none is given."""
         query = """
         INSERT INTO crl_summaries (id, crl_id, summary, model, tokens_used)
-        VALUES (?, ?, ?, ?, ?)
+        VALUES (COALESCE(?, CAST(gen_random_uuid() AS VARCHAR)), ?, ?, ?, ?)
+        RETURNING id
         """
-        self.conn.execute(query, [
-            summary_data["id"],
+        return self.conn.execute(query, [
+            summary_data.get("id"),
             summary_data["crl_id"],
             summary_data["summary"],
             summary_data["model"],
             summary_data.get("tokens_used", 0),
-        ])
-        return summary_data["id"]
+        ]).fetchone()[0]
 
     def get_by_crl_id(self, crl_id: str) -> Optional[Dict[str, Any]]:
         """Get summary for a CRL."""
@@ -792,6 +832,10 @@ class SummaryRepository:
         ).fetchone()
         return result[0] > 0
 
+    def count(self) -> int:
+        """Count all stored summaries."""
+        return self.conn.execute("SELECT COUNT(*) FROM crl_summaries").fetchone()[0]
+
     def get_summaries_by_crl_ids(self, crl_ids: List[str]) -> List[Dict[str, Any]]:
         """Get summaries for multiple CRLs."""
         if not crl_ids:
@@ -814,8 +858,8 @@ class SummaryRepository:
 class EmbeddingRepository:
     """Repository for embedding operations."""
 
-    def __init__(self):
-        self.conn = get_db()
+    def __init__(self, conn: Optional[duckdb.DuckDBPyConnection] = None):
+        self.conn = conn if conn is not None else get_db()
 
     def create(self, embedding_data: Dict[str, Any]) -> str:
         """Create a new embedding."""
@@ -888,6 +932,44 @@ class EmbeddingRepository:
 
         return [{"crl_id": row[0], "embedding": row[1]} for row in results]
 
+    def get_embeddings_matrix(
+        self,
+        embedding_type: str = "summary",
+        dimension: Optional[int] = None,
+        dtype: DTypeLike = np.float32
+    ) -> Tuple[List[str], np.ndarray]:
+        """
+        Get embeddings stacked into a single matrix for similarity search.
+
+        Args:
+            embedding_type: Type of embedding to retrieve
+            dimension: Only return embeddings of this dimension (default: all,
+                       which requires every stored embedding to match)
+            dtype: Matrix dtype; np.float16 halves memory for large stores
+
+        Returns:
+            Tuple of (crl_ids, matrix) where row i of the contiguous
+            (N, D) matrix is the embedding for crl_ids[i]
+        """
+        query = """
+            SELECT crl_id, embedding
+            FROM crl_embeddings
+            WHERE embedding_type = ?
+        """
+        params: List[Any] = [embedding_type]
+
+        if dimension is not None:
+            query += " AND len(embedding) = ?"
+            params.append(dimension)
+
+        results = self.conn.execute(query, params).fetchall()
+
+        crl_ids = [row[0] for row in results]
+        if not results:
+            return crl_ids, np.empty((0, dimension or 0), dtype=dtype)
+
+        return crl_ids, np.array([row[1] for row in results], dtype=dtype)
+
     def exists(self, crl_id: str, embedding_type: str = "summary") -> bool:
         """Check if embedding exists for CRL."""
         result = self.conn.execute(
@@ -900,8 +982,8 @@ class EmbeddingRepository:
 class QARepository:
     """Repository for Q&A annotation operations."""
 
-    def __init__(self):
-        self.conn = get_db()
+    def __init__(self, conn: Optional[duckdb.DuckDBPyConnection] = None):
+        self.conn = conn if conn is not None else get_db()
 
     def create(self, qa_data: Dict[str, Any]) -> str:
         """Create a new Q&A record."""
@@ -937,8 +1019,8 @@ class QARepository:
 class MetadataRepository:
     """Repository for processing metadata operations."""
 
-    def __init__(self):
-        self.conn = get_db()
+    def __init__(self, conn: Optional[duckdb.DuckDBPyConnection] = None):
+        self.conn = conn if conn is not None else get_db()
 
     def set(self, key: str, value: str) -> None:
         """Set or update a metadata value."""
@@ -103,7 +103,7 @@ app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 # ============================================================================
 
 # Get allowed origins from settings
-allowed_origins = settings.get_cors_origins_list()
+allowed_origins = settings.cors_origins_list
 
 app.add_middleware(
     CORSMiddleware,
@@ -6,7 +6,7 @@ Handles downloading and extracting CRL data from FDA API.
 import json
 import zipfile
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Any, BinaryIO, Dict, Optional, Union
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
@@ -16,6 +16,13 @@ from app.utils.logging_config import get_logger
 logger = get_logger(__name__)
 
 
+def _source_name(source: Union[str, Path, BinaryIO]) -> str:
+    """Describe a file path or binary stream for log messages."""
+    if isinstance(source, (str, Path)):
+        return Path(source).name
+    return "<stream>"
+
+
 class DataIngestionService:
     """
     Service for downloading and extracting FDA CRL data.
@@ -27,7 +34,14 @@ class DataIngestionService:
     - Progress tracking
     """
 
-    def __init__(self):
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
+        """
+        Initialize the ingestion service.
+
+        Args:
+            transport: Optional httpx transport for downloads (defaults to the network)
+        """
+        self.transport = transport
         self.raw_dir = Path(settings.data_raw_dir)
         self.processed_dir = Path(settings.data_processed_dir)
 
@@ -57,7 +71,7 @@ class DataIngestionService:
 
         logger.info(f"Downloading CRL data from {url}")
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
+        async with httpx.AsyncClient(timeout=120.0, transport=self.transport) as client:
             try:
                 response = await client.get(url, follow_redirects=True)
                 response.raise_for_status()
@@ -74,12 +88,12 @@ class DataIngestionService:
                 logger.error(f"Failed to download CRL data: {e}")
                 raise
 
-    def extract_json_from_zip(self, zip_path: Path) -> Path:
+    def extract_json_from_zip(self, zip_path: Union[Path, BinaryIO]) -> Path:
         """
         Extract JSON file from ZIP archive.
 
         Args:
-            zip_path: Path to ZIP file
+            zip_path: Path to ZIP file, or a binary stream holding the archive
 
         Returns:
             Path: Path to extracted JSON file
@@ -88,7 +102,7 @@ class DataIngestionService:
             zipfile.BadZipFile: If ZIP file is corrupted
             FileNotFoundError: If JSON file not found in ZIP
         """
-        logger.info(f"Extracting {zip_path.name}")
+        logger.info(f"Extracting {_source_name(zip_path)}")
 
         try:
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
@@ -123,12 +137,12 @@ class DataIngestionService:
             logger.error(f"Failed to extract JSON: {e}")
             raise
 
-    def load_json_data(self, json_path: Path) -> Dict[str, Any]:
+    def load_json_data(self, json_path: Union[Path, BinaryIO]) -> Dict[str, Any]:
         """
         Load and parse JSON data from file.
 
         Args:
-            json_path: Path to JSON file
+            json_path: Path to JSON file, or a binary stream holding the JSON
 
         Returns:
             Dict: Parsed JSON data with 'meta' and 'results' keys
@@ -136,11 +150,14 @@ class DataIngestionService:
         Raises:
             json.JSONDecodeError: If JSON is malformed
         """
-        logger.info(f"Loading JSON data from {json_path.name}")
+        logger.info(f"Loading JSON data from {_source_name(json_path)}")
 
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if isinstance(json_path, (str, Path)):
+                with open(json_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            else:
+                data = json.load(json_path)
 
             # Validate structure
             if 'meta' not in data or 'results' not in data:
@@ -217,17 +234,21 @@ class DataIngestionService:
 
 
 # Convenience function for simple usage
-async def fetch_crl_data(use_cache: bool = True) -> Dict[str, Any]:
+async def fetch_crl_data(
+    use_cache: bool = True,
+    transport: Optional[httpx.AsyncBaseTransport] = None
+) -> Dict[str, Any]:
     """
     Fetch CRL data from FDA (or use cached data if available).
 
     Args:
         use_cache: If True, use cached data if available
+        transport: Optional httpx transport for the download
 
     Returns:
         Dict: CRL data with 'meta' and 'results' keys
     """
-    service = DataIngestionService()
+    service = DataIngestionService(transport=transport)
 
     if use_cache:
         cached_data = service.get_cached_json()
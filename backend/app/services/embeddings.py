@@ -5,13 +5,19 @@ This module provides functionality to generate vector embeddings for CRL text,
 enabling semantic search and similarity-based retrieval for the RAG system.
 """
 
+import hashlib
 import logging
-from typing import List, Optional
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, cast
 from app.config import Settings
 from app.utils.openai_client import OpenAIClient
 
 logger = logging.getLogger(__name__)
 
+# (id, embedding, error) as returned by EmbeddingsService.batch_generate_embeddings
+EmbeddingResult = tuple[str, Optional[List[float]], Optional[str]]
+
 
 class EmbeddingsService:
     """
@@ -20,6 +26,9 @@ class EmbeddingsService:
     Embeddings are dense vector representations that capture semantic meaning,
     enabling similarity search and retrieval for Q&A functionality.
 
+    Identical texts are embedded once: results are kept in an in-memory LRU
+    cache keyed by a SHA-256 hash of the model and text.
+
     Attributes:
         settings: Application settings
         openai_client: OpenAI client wrapper
@@ -34,6 +43,7 @@ class EmbeddingsService:
         """
         self.settings = settings
         self.openai_client = OpenAIClient(settings)
+        self.clear_cache()
 
     def generate_embedding(
         self,
@@ -57,16 +67,12 @@ class EmbeddingsService:
         if not text or not text.strip():
             raise ValueError("Text cannot be empty")
 
-        # Truncate very long texts to stay within token limits
-        # OpenAI embedding models typically have 8191 token limit
-        # Rough estimate: 1 token ≈ 4 chars, so ~30000 chars max
-        if truncate and len(text) > 30000:
-            truncated_text = text[:30000]
-            logger.warning(
-                f"Text truncated from {len(text)} to 30000 chars for embedding"
-            )
-        else:
-            truncated_text = text
+        truncated_text = self._truncate_text(text) if truncate else text
+
+        cache_key = self._cache_key(truncated_text)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
             embedding = self.openai_client.create_embedding(
@@ -78,6 +84,7 @@ class EmbeddingsService:
                 f"Generated embedding: {len(embedding)} dims "
                 f"(dry_run={self.settings.ai_dry_run})"
             )
+            self._cache_put(cache_key, embedding)
             return embedding
 
         except Exception as e:
@@ -88,37 +95,153 @@ class EmbeddingsService:
         self,
         texts: List[tuple[str, str]],
         truncate: bool = True
-    ) -> List[tuple[str, Optional[List[float]], Optional[str]]]:
+    ) -> List[EmbeddingResult]:
         """
         Generate embeddings for multiple texts.
 
+        Texts are sent in groups of settings.openai_embedding_batch_size,
+        one API request per group. If a request fails, every text in that
+        group is reported as failed. Repeated texts are embedded once.
+
         Args:
             texts: List of (id, text) tuples
             truncate: Whether to truncate very long texts
 
         Returns:
-            List of (id, embedding, error) tuples.
+            List of (id, embedding, error) tuples, in input order.
             If successful, error is None. If failed, embedding is None.
         """
-        results = []
+        results: List[Optional[EmbeddingResult]] = [None] * len(texts)
+        # Texts that still need embedding, keyed by cache key so repeated
+        # texts are sent once: cache key -> (text, [(position, id), ...])
+        pending: Dict[bytes, tuple[str, List[tuple[int, str]]]] = {}
+
+        for position, (item_id, text) in enumerate(texts):
+            if not text or not text.strip():
+                results[position] = (item_id, None, "Text cannot be empty")
+                logger.error(f"Failed to generate embedding for {item_id}: Text cannot be empty")
+                continue
 
-        for item_id, text in texts:
-            try:
-                embedding = self.generate_embedding(text, truncate=truncate)
-                results.append((item_id, embedding, None))
-                logger.info(f"Successfully generated embedding for {item_id}")
+            text = self._truncate_text(text) if truncate else text
+            cache_key = self._cache_key(text)
+            if cache_key in pending:
+                pending[cache_key][1].append((position, item_id))
+                continue
+
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                results[position] = (item_id, cached, None)
+                continue
+
+            pending[cache_key] = (text, [(position, item_id)])
 
+        batch_size = self.settings.openai_embedding_batch_size
+        unique = list(pending.items())
+
+        for start in range(0, len(unique), batch_size):
+            batch = unique[start:start + batch_size]
+
+            try:
+                embeddings = self.openai_client.create_embeddings(
+                    texts=[text for _, (text, _) in batch],
+                    model=self.settings.openai_embedding_model
+                )
             except Exception as e:
                 error_msg = str(e)
-                results.append((item_id, None, error_msg))
-                logger.error(f"Failed to generate embedding for {item_id}: {error_msg}")
+                for _, (_, items) in batch:
+                    for position, item_id in items:
+                        results[position] = (item_id, None, error_msg)
+                logger.error(
+                    f"Failed to generate embeddings for batch of {len(batch)}: {error_msg}"
+                )
+                continue
+
+            for (cache_key, (_, items)), embedding in zip(batch, embeddings):
+                self._cache_put(cache_key, embedding)
+                for position, item_id in items:
+                    results[position] = (item_id, list(embedding), None)
+            logger.info(f"Successfully generated embeddings for batch of {len(batch)}")
 
         successful = sum(1 for _, emb, _ in results if emb is not None)
         logger.info(
             f"Batch embedding generation complete: {successful}/{len(texts)} successful"
         )
 
-        return results
+        return cast(List[EmbeddingResult], results)  # every position is filled above
+
+    def cache_stats(self) -> Dict[str, int]:
+        """
+        Get embedding cache statistics.
+
+        Returns:
+            Dict with cache hits, misses, and current size
+        """
+        with self._cache_lock:
+            return {
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "size": len(self._cache),
+            }
+
+    def clear_cache(self) -> None:
+        """Empty the embedding cache and reset its statistics."""
+        self._cache: OrderedDict[bytes, List[float]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def _cache_key(self, text: str) -> bytes:
+        """Hash the model and text into a fixed-size cache key."""
+        model = self.settings.openai_embedding_model
+        return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).digest()
+
+    def _cache_get(self, key: bytes) -> Optional[List[float]]:
+        """Return a copy of a cached embedding, or None on a miss."""
+        if self.settings.embedding_cache_size == 0:
+            return None
+
+        with self._cache_lock:
+            embedding = self._cache.get(key)
+            if embedding is None:
+                self._cache_misses += 1
+                return None
+
+            self._cache.move_to_end(key)
+            self._cache_hits += 1
+
+        # Copy so callers can't modify the cached vector
+        return list(embedding)
+
+    def _cache_put(self, key: bytes, embedding: List[float]) -> None:
+        """Cache an embedding, evicting the least recently used if full."""
+        max_size = self.settings.embedding_cache_size
+        if max_size == 0:
+            return
+
+        with self._cache_lock:
+            self._cache[key] = list(embedding)
+            self._cache.move_to_end(key)
+            while len(self._cache) > max_size:
+                self._cache.popitem(last=False)
+
+    def _truncate_text(self, text: str) -> str:
+        """
+        Truncate very long texts to stay within embedding token limits.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Text of at most 30000 characters
+        """
+        # OpenAI embedding models typically have 8191 token limit
+        # Rough estimate: 1 token ≈ 4 chars, so ~30000 chars max
+        if len(text) > 30000:
+            logger.warning(
+                f"Text truncated from {len(text)} to 30000 chars for embedding"
+            )
+            return text[:30000]
+        return text
 
     def generate_query_embedding(
         self,
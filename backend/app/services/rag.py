@@ -9,11 +9,14 @@ This module implements a RAG system that:
 
 import logging
 from typing import List, Dict, Any, Optional
+
+import numpy as np
+
 from app.config import Settings
 from app.database import CRLRepository, EmbeddingRepository, QARepository
 from app.services.embeddings import EmbeddingsService
 from app.utils.openai_client import OpenAIClient
-from app.utils.vector_utils import find_top_k_similar
+from app.utils.vector_utils import cosine_similarity_matrix
 
 logger = logging.getLogger(__name__)
 
@@ -149,26 +152,27 @@ class RAGService:
             List of (crl_id, similarity_score, crl_data) tuples
 
         Raises:
-            ValueError: If no embeddings found in database
+            ValueError: If top_k < 1 or no embeddings found in database
         """
-        # Get embeddings optimized for search (only crl_id + embedding, no metadata)
-        all_embeddings = self.embedding_repo.get_embeddings_for_search(
-            embedding_type="summary"
+        if top_k < 1:
+            raise ValueError("top_k must be at least 1")
+
+        # Get embeddings of the query's dimension as one (N, D) matrix
+        crl_ids, matrix = self.embedding_repo.get_embeddings_matrix(
+            embedding_type="summary",
+            dimension=len(query_embedding)
         )
 
-        if not all_embeddings:
+        if not crl_ids:
             raise ValueError("No CRL embeddings found in database")
 
-        # Prepare candidate vectors
-        candidates = [(emb["crl_id"], emb["embedding"]) for emb in all_embeddings]
-
-        # Find top-k similar
-        top_results = find_top_k_similar(
-            query_vec=query_embedding,
-            candidate_vecs=candidates,
-            k=top_k,
-            similarity_fn="cosine"
-        )
+        # Score all candidates at once and find top-k similar
+        scores = cosine_similarity_matrix(query_embedding, matrix)
+        # Partition out the top-k in O(N), then sort only those k
+        k = min(top_k, len(scores))
+        top_indices = np.argpartition(-scores, k - 1)[:k]
+        top_indices = top_indices[np.argsort(-scores[top_indices])]
+        top_results = [(crl_ids[i], float(scores[i])) for i in top_indices]
 
         # Fetch full CRL data for top results
         results = []
@@ -140,8 +140,10 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
 
-    # Remove existing handlers to avoid duplicates
-    root_logger.handlers.clear()
+    # Remove (and close) existing handlers to avoid duplicates and leaked files
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+        handler.close()
 
     # Console handler (human-readable)
     console_handler = logging.StreamHandler(sys.stdout)
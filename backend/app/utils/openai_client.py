@@ -156,11 +156,8 @@ class OpenAIClient:
             model = self.settings.openai_embedding_model
 
         if self.dry_run:
-            # Return a dummy embedding vector
-            # text-embedding-3-small: 1536 dims, text-embedding-3-large: 3072 dims
-            dims = 3072 if "large" in model else 1536
-            dummy_embedding = [0.0] * dims
-            logger.debug(f"DRY-RUN: Generated dummy embedding vector ({dims} dims)")
+            dummy_embedding = self._generate_dummy_embedding(model)
+            logger.debug(f"DRY-RUN: Generated dummy embedding vector ({len(dummy_embedding)} dims)")
             return dummy_embedding
 
         try:
@@ -176,6 +173,68 @@ class OpenAIClient:
             logger.error(f"OpenAI embedding error: {e}")
             raise
 
+    @retry(
+        retry=retry_if_exception_type((OpenAIError, ConnectionError)),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        reraise=True
+    )
+    def create_embeddings(
+        self,
+        texts: List[str],
+        model: Optional[str] = None
+    ) -> List[List[float]]:
+        """
+        Create embedding vectors for several texts in a single API request.
+
+        In dry-run mode, returns one dummy vector of zeros per text.
+
+        Args:
+            texts: Texts to embed (at most 2048, per the OpenAI API limit)
+            model: Model name to use (defaults to settings.openai_embedding_model)
+
+        Returns:
+            Embedding vectors, in the same order as texts
+
+        Raises:
+            OpenAIError: If API call fails after retries
+        """
+        if model is None:
+            model = self.settings.openai_embedding_model
+
+        if self.dry_run:
+            dummy_embedding = self._generate_dummy_embedding(model)
+            logger.debug(f"DRY-RUN: Generated {len(texts)} dummy embedding vectors")
+            return [list(dummy_embedding) for _ in texts]
+
+        try:
+            response = self.client.embeddings.create(
+                input=texts,
+                model=model
+            )
+            # Results carry the index of their input; don't rely on response order
+            embeddings = [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+            logger.debug(f"OpenAI embeddings: {len(embeddings)} vectors, model={model}")
+            return embeddings
+
+        except OpenAIError as e:
+            logger.error(f"OpenAI embedding error: {e}")
+            raise
+
+    def _generate_dummy_embedding(self, model: str) -> List[float]:
+        """
+        Generate a dummy embedding vector for dry-run mode.
+
+        Args:
+            model: Embedding model name, used to pick the vector size
+
+        Returns:
+            Vector of zeros
+        """
+        # text-embedding-3-small: 1536 dims, text-embedding-3-large: 3072 dims
+        dims = self.settings.ai_dry_run_embedding_dims or (3072 if "large" in model else 1536)
+        return [0.0] * dims
+
     def _generate_dummy_summary(self, text: str) -> str:
         """
         Generate a dummy summary for dry-run mode.
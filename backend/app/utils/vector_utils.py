@@ -6,10 +6,12 @@ which is essential for semantic search and retrieval in the RAG system.
 """
 
 import math
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 
+import numpy as np
 
-def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
+
+def cosine_similarity(vec1: Sequence[float], vec2: Sequence[float]) -> float:
     """
     Compute cosine similarity between two vectors.
 
@@ -18,8 +20,8 @@ def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
     It's scale-invariant and works well for comparing embeddings.
 
     Args:
-        vec1: First vector
-        vec2: Second vector
+        vec1: First vector (list or NumPy array)
+        vec2: Second vector (list or NumPy array)
 
     Returns:
         Cosine similarity score between -1 and 1
@@ -27,7 +29,7 @@ def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
     Raises:
         ValueError: If vectors have different dimensions or are empty
     """
-    if not vec1 or not vec2:
+    if len(vec1) == 0 or len(vec2) == 0:
         raise ValueError("Vectors cannot be empty")
 
     if len(vec1) != len(vec2):
@@ -35,16 +37,63 @@ def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
             f"Vectors must have same dimension, got {len(vec1)} and {len(vec2)}"
         )
 
-    # Compute dot product and magnitudes
-    dot_product = sum(a * b for a, b in zip(vec1, vec2))
-    magnitude1 = math.sqrt(sum(a * a for a in vec1))
-    magnitude2 = math.sqrt(sum(b * b for b in vec2))
+    a = np.asarray(vec1, dtype=np.float64)
+    b = np.asarray(vec2, dtype=np.float64)
+
+    # Compute magnitudes
+    magnitude1 = np.linalg.norm(a)
+    magnitude2 = np.linalg.norm(b)
 
     # Avoid division by zero
     if magnitude1 == 0 or magnitude2 == 0:
         return 0.0
 
-    return dot_product / (magnitude1 * magnitude2)
+    return float(a @ b / (magnitude1 * magnitude2))
+
+
+def cosine_similarity_matrix(
+    query_vec: Sequence[float],
+    matrix: np.ndarray,
+    normalized: bool = False
+) -> np.ndarray:
+    """
+    Compute cosine similarity between a query and every row of a matrix.
+
+    All rows are scored with a single matrix-vector product instead of
+    one Python-level call per candidate.
+
+    Args:
+        query_vec: Query vector of dimension D
+        matrix: Candidate vectors as an (N, D) array; lower-precision
+                matrices (e.g. float16) are scored in float32
+        normalized: Whether the query and rows already have unit length,
+                    in which case the dot product is the cosine similarity
+
+    Returns:
+        Array of N similarity scores (0.0 for zero-magnitude vectors)
+
+    Raises:
+        ValueError: If the query is empty or dimensions don't match
+    """
+    query = np.asarray(query_vec, dtype=np.float32)
+
+    if query.size == 0:
+        raise ValueError("Query vector cannot be empty")
+
+    if matrix.ndim != 2 or matrix.shape[1] != query.size:
+        raise ValueError(
+            f"Matrix must have shape (N, {query.size}), got {matrix.shape}"
+        )
+
+    matrix = matrix.astype(np.float32, copy=False)
+    scores = matrix @ query
+
+    if normalized:
+        return scores
+
+    # Avoid division by zero
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    return np.divide(scores, norms, out=np.zeros_like(scores), where=norms != 0)
 
 
 def euclidean_distance(vec1: List[float], vec2: List[float]) -> float:
@@ -132,8 +181,8 @@ def normalize_vector(vec: List[float]) -> List[float]:
 
 
 def find_top_k_similar(
-    query_vec: List[float],
-    candidate_vecs: List[Tuple[str, List[float]]],
+    query_vec: Sequence[float],
+    candidate_vecs: List[Tuple[str, Sequence[float]]],
     k: int = 5,
     similarity_fn: str = "cosine"
 ) -> List[Tuple[str, float]]:
@@ -153,7 +202,7 @@ def find_top_k_similar(
     Raises:
         ValueError: If inputs are invalid or similarity_fn is unknown
     """
-    if not query_vec:
+    if len(query_vec) == 0:
         raise ValueError("Query vector cannot be empty")
 
     if not candidate_vecs:
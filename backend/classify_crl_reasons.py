@@ -27,29 +27,22 @@ Examples:
 
     # Reclassify ALL CRLs (use with caution!)
     python classify_crl_reasons.py --regenerate
-
-    --help, -h    Show this help message and exit
 """
 
+import argparse
 import asyncio
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
-
-# Check for help first
-if "--help" in sys.argv or "-h" in sys.argv:
-    print(__doc__)
-    sys.exit(0)
+from typing import List, Dict, Any, Optional
 
 # Add app to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from app.config import settings
-from app.database import init_db
+from app.database import init_db, get_db, write_lock
 from app.utils.openai_client import OpenAIClient
 from app.utils.logging_config import get_logger, setup_logging
-import duckdb
 
 try:
     from tqdm import tqdm
@@ -57,8 +50,6 @@ try:
 except ImportError:
     HAS_TQDM = False
 
-# Setup logging
-setup_logging(log_level="INFO", enable_file_logging=True)
 logger = get_logger(__name__)
 
 DEFICIENCY_CATEGORIES = [
@@ -70,30 +61,23 @@ DEFICIENCY_CATEGORIES = [
 ]
 
 
-def parse_args():
+def parse_args(argv: Optional[List[str]] = None) -> Dict[str, Any]:
     """Parse command line arguments."""
-    args = {
-        "regenerate": "--regenerate" in sys.argv,
-        "sequential": "--sequential" in sys.argv,
-        "limit": None,
-        "batch_size": 10,
-    }
-
-    if "--limit" in sys.argv:
-        try:
-            limit_idx = sys.argv.index("--limit")
-            args["limit"] = int(sys.argv[limit_idx + 1])
-        except (IndexError, ValueError):
-            logger.error("--limit requires a numeric argument")
-            sys.exit(1)
-
-    if "--batch-size" in sys.argv:
-        try:
-            batch_idx = sys.argv.index("--batch-size")
-            args["batch_size"] = int(sys.argv[batch_idx + 1])
-        except (IndexError, ValueError):
-            logger.error("--batch-size requires a numeric argument")
-            sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--regenerate", action="store_true")
+    parser.add_argument("--sequential", action="store_true")
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=10)
+
+    args = vars(parser.parse_args(argv))
+
+    if args["limit"] is not None and args["limit"] < 1:
+        parser.error("--limit must be a positive integer")
+    if args["batch_size"] < 1:
+        parser.error("--batch-size must be a positive integer")
 
     return args
 
@@ -236,10 +220,11 @@ async def process_single_crl(
             )
 
             # Update database
-            conn.execute(
-                "UPDATE crls SET deficiency_reason = ? WHERE id = ?",
-                [classification, crl_id]
-            )
+            with write_lock:
+                conn.execute(
+                    "UPDATE crls SET deficiency_reason = ? WHERE id = ?",
+                    [classification, crl_id]
+                )
 
             return {"status": "success", "crl_id": crl_id, "classification": classification}
 
@@ -293,10 +278,10 @@ async def classify_crls_async(
     return stats
 
 
-def main():
+def main(argv: Optional[List[str]] = None) -> int:
     """Main function."""
     try:
-        args = parse_args()
+        args = parse_args(argv)
 
         logger.info("=" * 60)
         logger.info("CRL Deficiency Reason Classification Script")
@@ -313,7 +298,8 @@ def main():
         # Initialize
         logger.info("\nInitializing database...")
         init_db()
-        conn = duckdb.connect(str(settings.database_path))
+        # Own cursor so this step can run alongside others on a worker thread
+        conn = get_db().cursor()
         logger.info(" Database initialized")
 
         # Get OpenAI client
@@ -365,6 +351,12 @@ def main():
         return 1
 
 
+def run(argv: Optional[List[str]] = None) -> int:
+    """Run this pipeline step in-process and return its exit code."""
+    return main(argv)
+
+
 if __name__ == "__main__":
-    exit_code = main()
-    sys.exit(exit_code)
+    # Setup logging; the ingest pipelines configure it once for all steps
+    setup_logging(log_level="INFO", enable_file_logging=True)
+    sys.exit(run())
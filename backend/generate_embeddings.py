@@ -31,21 +31,15 @@ Examples:
 
     # Embed full text instead of summaries
     python generate_embeddings.py --embed-full-text
-
-    --help, -h    Show this help message and exit
 """
 
+import argparse
 import asyncio
 import sys
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Set
-
-# Check for help first
-if "--help" in sys.argv or "-h" in sys.argv:
-    print(__doc__)
-    sys.exit(0)
+from typing import List, Dict, Any, Set, Optional
 
 # Add app to Python path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -65,40 +59,31 @@ setup_logging(log_level="INFO", enable_file_logging=True)
 logger = get_logger(__name__)
 
 
-def parse_args():
+def parse_args(argv: Optional[List[str]] = None) -> Dict[str, Any]:
     """Parse command line arguments."""
-    args = {
-        "regenerate": "--regenerate" in sys.argv,
-        "retry_failed": "--retry-failed" in sys.argv,
-        "sequential": "--sequential" in sys.argv,
-        "embed_full_text": "--embed-full-text" in sys.argv,
-        "limit": None,
-        "batch_size": 50,  # Embeddings are faster, so higher default
-    }
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--regenerate", action="store_true")
+    parser.add_argument("--retry-failed", action="store_true")
+    parser.add_argument("--embed-full-text", action="store_true")
+    parser.add_argument("--sequential", action="store_true")
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=50)
+
+    args = vars(parser.parse_args(argv))
+
+    if args["limit"] is not None and args["limit"] < 1:
+        parser.error("--limit must be a positive integer")
+    if args["batch_size"] < 1:
+        parser.error("--batch-size must be a positive integer")
 
     # Validate mutually exclusive options
     if args["regenerate"] and args["retry_failed"]:
         logger.warning("Both --regenerate and --retry-failed specified. Using --regenerate.")
         args["retry_failed"] = False
 
-    # Parse --limit
-    if "--limit" in sys.argv:
-        try:
-            limit_idx = sys.argv.index("--limit")
-            args["limit"] = int(sys.argv[limit_idx + 1])
-        except (IndexError, ValueError):
-            logger.error("--limit requires a numeric argument")
-            sys.exit(1)
-
-    # Parse --batch-size
-    if "--batch-size" in sys.argv:
-        try:
-            batch_idx = sys.argv.index("--batch-size")
-            args["batch_size"] = int(sys.argv[batch_idx + 1])
-        except (IndexError, ValueError):
-            logger.error("--batch-size requires a numeric argument")
-            sys.exit(1)
-
     return args
 
 
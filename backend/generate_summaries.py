@@ -9,8 +9,10 @@ Options:
     --regenerate        Regenerate summaries for ALL CRLs (including existing ones)
     --limit N           Process only N CRLs (default: all without summaries)
     --batch-size N      Number of concurrent API calls (default: 10)
-    --retry-failed      Retry only CRLs that previously failed
+    --retry-failed      Retry only CRLs that failed in the previous run
     --sequential        Process one at a time (slower, for debugging)
+    --dedup             Summarize identical CRL texts once and share the result
+    --verbose           Log full tracebacks for CRLs that fail after all retries
 
 Examples:
     # Generate summaries for new CRLs only (incremental)
@@ -28,26 +30,24 @@ Examples:
     # Use 20 concurrent API calls (faster)
     python generate_summaries.py --batch-size 20
 
-    --help, -h    Show this help message and exit
+    # Summarize each unique letter text only once (e.g. form letters)
+    python generate_summaries.py --dedup
 """
 
+import argparse
 import asyncio
+import hashlib
 import sys
-import uuid
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Set
-
-# Check for help first
-if "--help" in sys.argv or "-h" in sys.argv:
-    print(__doc__)
-    sys.exit(0)
+from typing import List, Dict, Any, Optional
 
 # Add app to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from app.config import settings
-from app.database import init_db, CRLRepository, SummaryRepository
+from app.database import init_db, get_db, CRLRepository, SummaryRepository
 from app.services.summarization import SummarizationService
 from app.utils.logging_config import get_logger, setup_logging
 
@@ -59,44 +59,51 @@ except ImportError:
     logger = get_logger(__name__)
     logger.warning("tqdm not installed. Install with 'pip install tqdm' for progress bars.")
 
-# Setup logging
-setup_logging(log_level="INFO", enable_file_logging=True)
 logger = get_logger(__name__)
 
+# Summaries shorter than this (ignoring surrounding whitespace) are treated as failed
+MIN_SUMMARY_CHARS = 50
+
+# IDs of CRLs that failed in the last run, one per line (next to the database)
+FAILED_CRLS_FILE = "failed_crls.txt"
+
+
+def get_failed_crls_path() -> Path:
+    """Return the path of the file listing CRLs that failed in the last run."""
+    return Path(settings.database_path).parent / FAILED_CRLS_FILE
+
 
-def parse_args():
+def is_valid_summary(summary_text: Optional[str]) -> bool:
+    """Check that a summary has at least MIN_SUMMARY_CHARS of non-padding text."""
+    return bool(summary_text) and len(summary_text.strip()) >= MIN_SUMMARY_CHARS
+
+
+def parse_args(argv: Optional[List[str]] = None) -> Dict[str, Any]:
     """Parse command line arguments."""
-    args = {
-        "regenerate": "--regenerate" in sys.argv,
-        "retry_failed": "--retry-failed" in sys.argv,
-        "sequential": "--sequential" in sys.argv,
-        "limit": None,
-        "batch_size": 10,  # Default concurrent API calls
-    }
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--regenerate", action="store_true")
+    parser.add_argument("--retry-failed", action="store_true")
+    parser.add_argument("--sequential", action="store_true")
+    parser.add_argument("--dedup", action="store_true")
+    parser.add_argument("--verbose", action="store_true")
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=10)
+
+    args = vars(parser.parse_args(argv))
+
+    if args["limit"] is not None and args["limit"] < 1:
+        parser.error("--limit must be a positive integer")
+    if args["batch_size"] < 1:
+        parser.error("--batch-size must be a positive integer")
 
     # Validate mutually exclusive options
     if args["regenerate"] and args["retry_failed"]:
         logger.warning("Both --regenerate and --retry-failed specified. Using --regenerate.")
         args["retry_failed"] = False
 
-    # Parse --limit
-    if "--limit" in sys.argv:
-        try:
-            limit_idx = sys.argv.index("--limit")
-            args["limit"] = int(sys.argv[limit_idx + 1])
-        except (IndexError, ValueError):
-            logger.error("--limit requires a numeric argument")
-            sys.exit(1)
-
-    # Parse --batch-size
-    if "--batch-size" in sys.argv:
-        try:
-            batch_idx = sys.argv.index("--batch-size")
-            args["batch_size"] = int(sys.argv[batch_idx + 1])
-        except (IndexError, ValueError):
-            logger.error("--batch-size requires a numeric argument")
-            sys.exit(1)
-
     return args
 
 
@@ -114,7 +121,8 @@ def get_crls_needing_summaries(
         crl_repo: CRL repository
         summary_repo: Summary repository
         regenerate: If True, regenerate all summaries (overwrite existing)
-        retry_failed: If True, only return CRLs with empty/failed summaries
+        retry_failed: If True, only return CRLs listed in the failed CRLs file
+            (or, without that file, CRLs with empty/failed summaries)
         limit: Maximum number of CRLs to return
 
     Returns:
@@ -156,12 +164,19 @@ def get_crls_needing_summaries(
         logger.info("⚠️  Regenerating summaries for ALL CRLs (existing summaries will be replaced)")
         return all_crls
     elif retry_failed:
-        # Find CRLs with empty or very short summaries (likely failed)
-        crls_to_retry = []
-        for crl in all_crls:
-            existing = summary_repo.get_by_crl_id(crl["id"])
-            if existing and (not existing.get("summary") or len(existing.get("summary", "").strip()) < 50):
-                crls_to_retry.append(crl)
+        failed_path = get_failed_crls_path()
+        if failed_path.exists():
+            # Retry the CRLs recorded as failed by the previous run
+            with open(failed_path) as failed_fp:
+                failed_ids = {line.strip() for line in failed_fp if line.strip()}
+            crls_to_retry = [crl for crl in all_crls if crl["id"] in failed_ids]
+        else:
+            # Find CRLs with empty or very short summaries (likely failed)
+            crls_to_retry = []
+            for crl in all_crls:
+                existing = summary_repo.get_by_crl_id(crl["id"])
+                if existing and not is_valid_summary(existing.get("summary")):
+                    crls_to_retry.append(crl)
         logger.info(f"Found {len(crls_to_retry)} CRLs with failed/empty summaries to retry")
         return crls_to_retry
     else:
@@ -177,12 +192,96 @@ def get_crls_needing_summaries(
         return crls_needing_summaries
 
 
+def group_crls_by_text(crls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Collapse CRLs with identical text into one representative per group.
+
+    Each returned CRL carries a "duplicate_ids" list with the IDs of the other
+    CRLs sharing its text, so a single API call can serve the whole group.
+
+    Args:
+        crls: List of CRL dictionaries
+
+    Returns:
+        List of representative CRL dictionaries (one per unique text)
+    """
+    groups: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for crl in crls:
+        crl_text = crl.get("text") or ""
+        groups[hashlib.sha1(crl_text.encode("utf-8")).hexdigest()].append(crl)
+
+    representatives = []
+    for members in groups.values():
+        representative = dict(members[0])
+        representative["duplicate_ids"] = [member["id"] for member in members[1:]]
+        representatives.append(representative)
+
+    logger.info(
+        f"Deduplicated {len(crls)} CRLs into {len(representatives)} unique texts"
+    )
+    return representatives
+
+
+def store_summary(
+    crl_ids: List[str],
+    summary_text: str,
+    summary_repo: SummaryRepository
+) -> int:
+    """
+    Store a summary for one or more CRLs, replacing any existing summaries.
+
+    Args:
+        crl_ids: IDs of the CRLs the summary applies to
+        summary_text: Generated summary text
+        summary_repo: Summary repository
+
+    Returns:
+        Net change in the number of stored summaries
+    """
+    model = settings.openai_summary_model
+    deleted = 0
+    for crl_id in crl_ids:
+        # Delete any existing summaries for this CRL to avoid duplicates
+        deleted += summary_repo.conn.execute(
+            "DELETE FROM crl_summaries WHERE crl_id = ?",
+            [crl_id]
+        ).fetchone()[0]
+
+        summary_repo.create({
+            "crl_id": crl_id,
+            "summary": summary_text,
+            "model": model,
+            "tokens_used": 0,
+        })
+
+    return len(crl_ids) - deleted
+
+
+def describe_error(error: Exception) -> str:
+    """Describe an error on one line, including the HTTP status code if any."""
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+
+    if status_code is not None:
+        return f"{error.__class__.__name__} (HTTP {status_code}): {error}"[:100]
+    return f"{error.__class__.__name__}: {error}"[:100]
+
+
+def flush_messages(messages: List[str]) -> None:
+    """Write buffered progress messages above the progress bar in one call."""
+    if messages:
+        tqdm.write("\n".join(messages))
+        messages.clear()
+
+
 async def process_single_crl(
     crl: Dict[str, Any],
     summary_service: SummarizationService,
     summary_repo: SummaryRepository,
     semaphore: asyncio.Semaphore,
-    max_retries: int = 3
+    max_retries: int = 3,
+    verbose: bool = False
 ) -> Dict[str, Any]:
     """
     Process a single CRL asynchronously with retry logic.
@@ -193,16 +292,23 @@ async def process_single_crl(
         summary_repo: Summary repository
         semaphore: Semaphore to limit concurrent requests
         max_retries: Maximum retry attempts
+        verbose: If True, log the full traceback of a final failure
 
     Returns:
         Dict with status and details
     """
     crl_id = crl["id"]
     crl_text = crl.get("text", "")
+    duplicate_ids = crl.get("duplicate_ids", [])
 
     # Skip CRLs with no text
     if not crl_text or not crl_text.strip():
-        return {"status": "skipped", "crl_id": crl_id, "reason": "no text"}
+        return {
+            "status": "skipped",
+            "crl_id": crl_id,
+            "duplicates": len(duplicate_ids),
+            "reason": "no text"
+        }
 
     # Use semaphore to limit concurrent API calls
     async with semaphore:
@@ -218,29 +324,17 @@ async def process_single_crl(
                 )
 
                 # Validate summary
-                if not summary_text or len(summary_text.strip()) < 50:
-                    raise ValueError(f"Summary too short ({len(summary_text)} chars)")
+                if not is_valid_summary(summary_text):
+                    raise ValueError(f"Summary too short ({len(summary_text or '')} chars)")
 
-                # Delete any existing summaries for this CRL to avoid duplicates
-                summary_repo.conn.execute(
-                    "DELETE FROM crl_summaries WHERE crl_id = ?",
-                    [crl_id]
-                )
-
-                # Store summary
-                summary_data = {
-                    "id": str(uuid.uuid4()),
-                    "crl_id": crl_id,
-                    "summary": summary_text,
-                    "model": settings.openai_summary_model,
-                    "tokens_used": 0,
-                }
-
-                summary_repo.create(summary_data)
+                # Store summary for this CRL and any CRLs sharing its text
+                added = store_summary([crl_id] + duplicate_ids, summary_text, summary_repo)
 
                 return {
                     "status": "success",
                     "crl_id": crl_id,
+                    "duplicates": len(duplicate_ids),
+                    "added": added,
                     "attempt": attempt + 1
                 }
 
@@ -250,10 +344,15 @@ async def process_single_crl(
                     await asyncio.sleep(1)
                     continue
                 else:
+                    error = describe_error(e)
+                    if verbose:
+                        logger.error(f"Failed to summarize {crl_id}: {error}", exc_info=True)
                     return {
                         "status": "failed",
                         "crl_id": crl_id,
-                        "error": str(e)[:100]
+                        "duplicates": len(duplicate_ids),
+                        "duplicate_ids": duplicate_ids,
+                        "error": error
                     }
 
 
@@ -262,7 +361,8 @@ async def generate_summaries_async(
     summary_service: SummarizationService,
     summary_repo: SummaryRepository,
     batch_size: int = 10,
-    max_retries: int = 3
+    max_retries: int = 3,
+    verbose: bool = False
 ) -> Dict[str, int]:
     """
     Generate and store summaries for CRLs concurrently.
@@ -273,20 +373,20 @@ async def generate_summaries_async(
         summary_repo: Summary repository
         batch_size: Number of concurrent API calls
         max_retries: Maximum retry attempts per CRL
+        verbose: If True, log full tracebacks of final failures
 
     Returns:
         Statistics dictionary with success/failure counts
     """
     stats = {
-        "total": len(crls),
+        "total": sum(1 + len(crl.get("duplicate_ids", [])) for crl in crls),
         "success": 0,
         "failed": 0,
         "skipped": 0,
         "retried": 0,
+        "added": 0,
     }
 
-    failed_crls: Set[str] = set()
-
     logger.info(f"Starting concurrent summarization of {len(crls)} CRLs...")
     logger.info(f"Concurrent API calls: {batch_size}")
     logger.info(f"Max retries per CRL: {max_retries}")
@@ -300,50 +400,64 @@ async def generate_summaries_async(
 
     # Process all CRLs concurrently
     tasks = [
-        process_single_crl(crl, summary_service, summary_repo, semaphore, max_retries)
+        process_single_crl(
+            crl, summary_service, summary_repo, semaphore, max_retries, verbose
+        )
         for crl in crls
     ]
 
-    # Gather results as they complete
-    for coro in asyncio.as_completed(tasks):
-        result = await coro
-
-        # Update stats based on result
-        if result["status"] == "success":
-            stats["success"] += 1
-            if result["attempt"] > 1:
-                stats["retried"] += 1
+    # Progress messages are buffered and written above the progress bar in batches
+    messages: List[str] = []
+
+    # Record failed CRL IDs as they occur so --retry-failed can pick them up
+    failed_path = get_failed_crls_path()
+    with open(failed_path, "w") as failed_fp:
+        # Gather results as they complete
+        for coro in asyncio.as_completed(tasks):
+            result = await coro
+            # CRLs sharing the processed text count towards the same outcome
+            count = 1 + result.get("duplicates", 0)
+
+            # Update stats based on result
+            if result["status"] == "success":
+                stats["success"] += count
+                stats["added"] += result["added"]
+                if result["attempt"] > 1:
+                    # Shown as a progress bar counter rather than a line per CRL
+                    stats["retried"] += 1
+            elif result["status"] == "failed":
+                stats["failed"] += count
+                for crl_id in [result["crl_id"]] + result["duplicate_ids"]:
+                    failed_fp.write(crl_id + "\n")
                 if HAS_TQDM:
-                    tqdm.write(f"✓ {result['crl_id']} (retry {result['attempt']})")
-        elif result["status"] == "failed":
-            stats["failed"] += 1
-            failed_crls.add(result["crl_id"])
-            if HAS_TQDM:
-                tqdm.write(f"✗ {result['crl_id']}: {result.get('error', 'Unknown error')}")
-            else:
-                logger.error(f"Failed: {result['crl_id']}: {result.get('error')}")
-        elif result["status"] == "skipped":
-            stats["skipped"] += 1
-            if HAS_TQDM:
-                tqdm.write(f"⊘ {result['crl_id']}: {result.get('reason')}")
+                    messages.append(f"✗ {result['crl_id']}: {result.get('error', 'Unknown error')}")
+                    flush_messages(messages)
+                else:
+                    logger.error(f"Failed: {result['crl_id']}: {result.get('error')}")
+            elif result["status"] == "skipped":
+                stats["skipped"] += count
+                if HAS_TQDM:
+                    messages.append(f"⊘ {result['crl_id']}: {result.get('reason')}")
 
-        # Update progress bar
-        if HAS_TQDM:
-            pbar.update(1)
-            pbar.set_postfix({
-                "✓": stats["success"],
-                "✗": stats["failed"],
-                "⊘": stats["skipped"]
-            })
+            # Update progress bar
+            if HAS_TQDM:
+                if len(messages) >= batch_size:
+                    flush_messages(messages)
+                pbar.update(1)
+                pbar.set_postfix({
+                    "✓": stats["success"],
+                    "⟳": stats["retried"],
+                    "✗": stats["failed"],
+                    "⊘": stats["skipped"]
+                })
 
     if HAS_TQDM:
+        flush_messages(messages)
         pbar.close()
 
-    # Log failed CRLs
-    if failed_crls:
-        logger.warning(f"\nFailed CRL IDs ({len(failed_crls)}):")
-        for crl_id in sorted(failed_crls):
-            logger.warning(f"  - {crl_id}")
+    # Point to the failed CRLs instead of logging each ID
+    if stats["failed"]:
+        logger.warning(f"\n{stats['failed']} failed CRL IDs written to {failed_path}")
         logger.info(f"\nTo retry failures, run: python generate_summaries.py --retry-failed")
 
     return stats
@@ -355,7 +469,9 @@ def generate_summaries(
     summary_repo: SummaryRepository,
     batch_size: int = 10,
     max_retries: int = 3,
-    sequential: bool = False
+    sequential: bool = False,
+    dedup: bool = False,
+    verbose: bool = False
 ) -> Dict[str, int]:
     """
     Generate and store summaries for CRLs (concurrent or sequential).
@@ -367,21 +483,26 @@ def generate_summaries(
         batch_size: Number of concurrent API calls (ignored if sequential=True)
         max_retries: Maximum retry attempts for failed CRLs
         sequential: If True, process one at a time (slower, for debugging)
+        dedup: If True, summarize each unique text once and share the result
+        verbose: If True, log full tracebacks of CRLs that fail after all retries
 
     Returns:
         Statistics dictionary with success/failure counts
     """
+    if dedup:
+        crls = group_crls_by_text(crls)
+
     if sequential:
         # Use old sequential implementation for debugging
         logger.info("Running in SEQUENTIAL mode (slower)")
         return _generate_summaries_sequential(
-            crls, summary_service, summary_repo, max_retries
+            crls, summary_service, summary_repo, max_retries, verbose
         )
     else:
         # Use new async concurrent implementation (default)
         logger.info("Running in CONCURRENT mode (faster)")
         return asyncio.run(generate_summaries_async(
-            crls, summary_service, summary_repo, batch_size, max_retries
+            crls, summary_service, summary_repo, batch_size, max_retries, verbose
         ))
 
 
@@ -389,82 +510,77 @@ def _generate_summaries_sequential(
     crls: List[Dict[str, Any]],
     summary_service: SummarizationService,
     summary_repo: SummaryRepository,
-    max_retries: int = 3
+    max_retries: int = 3,
+    verbose: bool = False
 ) -> Dict[str, int]:
     """Sequential implementation (for debugging)."""
     stats = {
-        "total": len(crls),
+        "total": sum(1 + len(crl.get("duplicate_ids", [])) for crl in crls),
         "success": 0,
         "failed": 0,
         "skipped": 0,
         "retried": 0,
+        "added": 0,
     }
 
-    failed_crls: Set[str] = set()
-    iterator = tqdm(crls, desc="Generating summaries", unit="CRL") if HAS_TQDM else crls
-
-    for crl in iterator:
-        crl_id = crl["id"]
-        crl_text = crl.get("text", "")
-
-        if not crl_text or not crl_text.strip():
-            if HAS_TQDM:
-                tqdm.write(f"⊘ {crl_id}: no text")
-            stats["skipped"] += 1
-            continue
-
-        for attempt in range(max_retries):
-            try:
-                summary_text = summary_service.summarize_crl(crl_text, max_summary_length=300)
-
-                if not summary_text or len(summary_text.strip()) < 50:
-                    raise ValueError(f"Summary too short ({len(summary_text)} chars)")
-
-                # Delete any existing summaries for this CRL to avoid duplicates
-                summary_repo.conn.execute(
-                    "DELETE FROM crl_summaries WHERE crl_id = ?",
-                    [crl_id]
-                )
+    failed_path = get_failed_crls_path()
+    with open(failed_path, "w") as failed_fp:
+        iterator = tqdm(crls, desc="Generating summaries", unit="CRL") if HAS_TQDM else crls
 
-                summary_data = {
-                    "id": str(uuid.uuid4()),
-                    "crl_id": crl_id,
-                    "summary": summary_text,
-                    "model": settings.openai_summary_model,
-                    "tokens_used": 0,
-                }
-
-                summary_repo.create(summary_data)
-                stats["success"] += 1
-
-                if attempt > 0:
-                    stats["retried"] += 1
-                break
+        for crl in iterator:
+            crl_id = crl["id"]
+            crl_text = crl.get("text", "")
+            duplicate_ids = crl.get("duplicate_ids", [])
+            count = 1 + len(duplicate_ids)
 
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    continue
-                else:
-                    failed_crls.add(crl_id)
-                    stats["failed"] += 1
-                    if HAS_TQDM:
-                        tqdm.write(f"✗ {crl_id}: {str(e)[:100]}")
+            if not crl_text or not crl_text.strip():
+                if HAS_TQDM:
+                    tqdm.write(f"⊘ {crl_id}: no text")
+                stats["skipped"] += count
+                continue
+
+            for attempt in range(max_retries):
+                try:
+                    summary_text = summary_service.summarize_crl(crl_text, max_summary_length=300)
+
+                    if not is_valid_summary(summary_text):
+                        raise ValueError(f"Summary too short ({len(summary_text or '')} chars)")
+
+                    stats["added"] += store_summary(
+                        [crl_id] + duplicate_ids, summary_text, summary_repo
+                    )
+                    stats["success"] += count
+
+                    if attempt > 0:
+                        stats["retried"] += 1
+                    break
+
+                except Exception as e:
+                    if attempt < max_retries - 1:
+                        continue
+                    else:
+                        for failed_id in [crl_id] + duplicate_ids:
+                            failed_fp.write(failed_id + "\n")
+                        stats["failed"] += count
+                        error = describe_error(e)
+                        if verbose:
+                            logger.error(f"Failed to summarize {crl_id}: {error}", exc_info=True)
+                        if HAS_TQDM:
+                            tqdm.write(f"✗ {crl_id}: {error}")
 
-        if HAS_TQDM:
-            iterator.set_postfix({"✓": stats["success"], "✗": stats["failed"], "⊘": stats["skipped"]})
+            if HAS_TQDM:
+                iterator.set_postfix({"✓": stats["success"], "✗": stats["failed"], "⊘": stats["skipped"]})
 
-    if failed_crls:
-        logger.warning(f"\nFailed CRL IDs ({len(failed_crls)}):")
-        for crl_id in sorted(failed_crls):
-            logger.warning(f"  - {crl_id}")
+    if stats["failed"]:
+        logger.warning(f"\n{stats['failed']} failed CRL IDs written to {failed_path}")
 
     return stats
 
 
-def main():
+def main(argv: Optional[List[str]] = None) -> int:
     """Main function to generate summaries."""
     try:
-        args = parse_args()
+        args = parse_args(argv)
 
         logger.info("=" * 60)
         logger.info("CRL Summary Generation Script")
@@ -483,16 +599,20 @@ def main():
             logger.info("Mode: Sequential processing (1 at a time, for debugging)")
         else:
             logger.info(f"Concurrent API calls: {args['batch_size']}")
+        if args['dedup']:
+            logger.info("Dedup: ON (identical CRL texts are summarized once)")
 
         # Initialize database
         logger.info("\n[Step 1/3] Initializing database...")
         init_db()
         logger.info("✓ Database initialized")
 
-        # Initialize services and repositories
-        crl_repo = CRLRepository()
-        summary_repo = SummaryRepository()
+        # Initialize services and repositories on a single shared connection
+        conn = get_db()
+        crl_repo = CRLRepository(conn)
+        summary_repo = SummaryRepository(conn)
         summary_service = SummarizationService(settings)
+        initial_summaries = summary_repo.count()
 
         # Check OpenAI configuration
         if not settings.openai_api_key:
@@ -530,7 +650,9 @@ def main():
             summary_service,
             summary_repo,
             batch_size=args["batch_size"],
-            sequential=args["sequential"]
+            sequential=args["sequential"],
+            dedup=args["dedup"],
+            verbose=args["verbose"]
         )
 
         # Display results
@@ -544,10 +666,8 @@ def main():
         logger.info(f"✗ Failed:              {stats['failed']}")
         logger.info(f"⊘ Skipped (no text):   {stats['skipped']}")
 
-        # Get summary statistics
-        total_summaries = summary_repo.conn.execute(
-            "SELECT COUNT(*) FROM crl_summaries"
-        ).fetchone()[0]
+        # Derive the total from the starting count instead of re-counting
+        total_summaries = initial_summaries + stats["added"]
 
         logger.info(f"\n📊 Total summaries in database: {total_summaries}")
         logger.info(f"💾 Database location: {settings.database_path}")
@@ -570,6 +690,12 @@ def main():
         return 1
 
 
+def run(argv: Optional[List[str]] = None) -> int:
+    """Run this pipeline step in-process and return its exit code."""
+    return main(argv)
+
+
 if __name__ == "__main__":
-    exit_code = main()
-    sys.exit(exit_code)
+    # Setup logging; the ingest pipelines configure it once for all steps
+    setup_logging(log_level="INFO", enable_file_logging=True)
+    sys.exit(run())
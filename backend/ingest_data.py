@@ -8,9 +8,9 @@ It handles downloading FDA data, generating AI summaries, and enriching the data
 Total estimated time: ~30 minutes
 """
 
+import importlib
 import os
 import sys
-import subprocess
 from pathlib import Path
 from datetime import datetime
 
@@ -74,30 +74,34 @@ def confirm(message, default=False):
 
 
 def run_script(script_name, description, estimated_time):
-    """Run a Python script and handle errors"""
+    """Run a pipeline script in-process and handle errors"""
     print_info(f"{description} (estimated: {estimated_time})")
 
     start_time = datetime.now()
     try:
-        result = subprocess.run(
-            [sys.executable, script_name],
-            check=True,
-            capture_output=False,
-            text=True
-        )
-
-        elapsed = (datetime.now() - start_time).total_seconds()
-        print_success(f"Completed in {elapsed:.1f}s")
-        return True
-
-    except subprocess.CalledProcessError as e:
+        # Import the step as a module so all steps share one interpreter
+        # (and one database connection) instead of spawning a subprocess each
+        module = importlib.import_module(Path(script_name).stem)
+        exit_code = module.run([])
+    except SystemExit as e:
+        exit_code = e.code
+    except KeyboardInterrupt:
+        print_warning("\nProcess interrupted by user")
+        return False
+    except Exception as e:
         print_error(f"Failed to run {script_name}")
         print_error(f"Error: {str(e)}")
         return False
-    except KeyboardInterrupt:
-        print_warning("\nProcess interrupted by user")
+
+    if exit_code:
+        print_error(f"Failed to run {script_name}")
+        print_error(f"Error: exited with status {exit_code}")
         return False
 
+    elapsed = (datetime.now() - start_time).total_seconds()
+    print_success(f"Completed in {elapsed:.1f}s")
+    return True
+
 
 def check_environment():
     """Check if required environment variables are set"""
@@ -124,13 +128,15 @@ def cleanup_old_data():
     raw_dir = backend_dir / "data" / "raw"
 
     files_to_delete = []
+    raw_files = []
 
     if db_path.exists():
         files_to_delete.append(str(db_path))
 
     if raw_dir.exists():
-        raw_files = list(raw_dir.glob("*"))
-        files_to_delete.extend([str(f) for f in raw_files if f.is_file()])
+        with os.scandir(raw_dir) as entries:
+            raw_files = [entry.path for entry in entries if entry.is_file()]
+        files_to_delete.extend(raw_files)
 
     if not files_to_delete:
         print_info("No old data files found to clean up")
@@ -149,10 +155,9 @@ def cleanup_old_data():
         db_path.unlink()
         print_success(f"Deleted {db_path}")
 
-    if raw_dir.exists():
-        for f in raw_dir.glob("*"):
-            if f.is_file():
-                f.unlink()
+    for f in raw_files:
+        os.unlink(f)
+    if raw_files:
         print_success(f"Deleted {len(raw_files)} files from {raw_dir}")
 
     return True
@@ -186,6 +191,10 @@ def main():
     if not cleanup_old_data():
         return 1
 
+    # Configure logging once for all steps, which run in this process
+    from app.utils.logging_config import setup_logging
+    setup_logging(log_level="INFO", enable_file_logging=True)
+
     # Define pipeline steps
     steps = [
         ("load_data.py", "Loading CRL data from openFDA API", "~2 minutes"),
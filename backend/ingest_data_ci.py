@@ -8,9 +8,11 @@ No prompts, no confirmations - just runs the pipeline.
 Total estimated time: ~30 minutes
 """
 
+import asyncio
+import importlib
 import os
 import sys
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -22,28 +24,57 @@ def log(message: str, level: str = "INFO"):
 
 
 def run_script(script_name: str, description: str) -> bool:
-    """Run a Python script and handle errors."""
+    """Run a pipeline script in-process and handle errors."""
     log(f"Starting: {description}")
 
     start_time = datetime.now()
     try:
-        result = subprocess.run(
-            [sys.executable, script_name],
-            check=True,
-            capture_output=False,
-            text=True
-        )
-
-        elapsed = (datetime.now() - start_time).total_seconds()
-        log(f"Completed: {description} ({elapsed:.1f}s)")
-        return True
-
-    except subprocess.CalledProcessError as e:
-        log(f"Failed: {script_name} - {str(e)}", "ERROR")
-        return False
+        # Import the step as a module so all steps share one interpreter
+        # (and one database connection) instead of spawning a subprocess each
+        module = importlib.import_module(Path(script_name).stem)
+        exit_code = module.run([])
+    except SystemExit as e:
+        exit_code = e.code
     except KeyboardInterrupt:
         log("Process interrupted", "WARN")
         return False
+    except Exception as e:
+        log(f"Failed: {script_name} - {str(e)}", "ERROR")
+        return False
+
+    if exit_code:
+        log(f"Failed: {script_name} - exited with status {exit_code}", "ERROR")
+        return False
+
+    elapsed = (datetime.now() - start_time).total_seconds()
+    log(f"Completed: {description} ({elapsed:.1f}s)")
+    return True
+
+
+def store_fda_hash() -> bool:
+    """
+    Store the current FDA data hash so the next scheduled run can skip unchanged data.
+
+    Runs in-process so it reuses the pipeline's database connection; a child
+    process could not open the DuckDB file while this one holds its lock.
+    """
+    from check_for_updates import fetch_fda_metadata, get_stored_metadata, store_metadata
+
+    try:
+        content_hash, last_updated = asyncio.run(fetch_fda_metadata())
+    except Exception as e:
+        log(f"Warning: Could not store hash: {e}", "WARN")
+        return False
+
+    # store_metadata logs and swallows database errors, so read the hash back
+    store_metadata(content_hash, last_updated)
+    stored_hash, _ = get_stored_metadata()
+    if stored_hash != content_hash:
+        log("Warning: Could not store hash", "WARN")
+        return False
+
+    log("Hash stored successfully")
+    return True
 
 
 def check_environment() -> bool:
@@ -70,9 +101,10 @@ def cleanup_old_data():
         log(f"Deleted old database: {db_path}")
 
     if raw_dir.exists():
-        for f in raw_dir.glob("*"):
-            if f.is_file():
-                f.unlink()
+        with os.scandir(raw_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    os.unlink(entry.path)
         log(f"Cleaned raw data directory: {raw_dir}")
 
 
@@ -92,36 +124,41 @@ def main() -> int:
     log("Cleaning up old data...")
     cleanup_old_data()
 
-    # Define pipeline steps
-    steps = [
-        ("load_data.py", "Loading CRL data from openFDA API"),
-        ("generate_summaries.py", "Generating AI summaries"),
-        ("extract_indications.py", "Extracting product indications"),
-        ("extract_product_name.py", "Extracting product names"),
-        ("classify_crl_reasons.py", "Classifying deficiency reasons"),
-        ("classify_crl_tx_category.py", "Classifying therapeutic categories"),
-        ("set_last_update.py", "Setting last update timestamp"),
+    # Configure logging once for all steps, which run in this process
+    from app.utils.logging_config import setup_logging
+    setup_logging(log_level="INFO", enable_file_logging=True)
+
+    # Define pipeline stages; steps within a stage only depend on earlier
+    # stages and write disjoint columns, so they run concurrently
+    stages = [
+        [("load_data.py", "Loading CRL data from openFDA API")],
+        [("generate_summaries.py", "Generating AI summaries")],
+        [
+            ("extract_indications.py", "Extracting product indications"),
+            ("extract_product_name.py", "Extracting product names"),
+            ("classify_crl_reasons.py", "Classifying deficiency reasons"),
+            ("classify_crl_tx_category.py", "Classifying therapeutic categories"),
+        ],
+        [("set_last_update.py", "Setting last update timestamp")],
     ]
 
-    # Run each step
-    for i, (script, description) in enumerate(steps, start=1):
-        log(f"[{i}/{len(steps)}] {description}")
-        if not run_script(script, description):
-            log(f"Pipeline failed at step {i}", "ERROR")
+    # Run each stage
+    for i, stage in enumerate(stages, start=1):
+        log(f"[{i}/{len(stages)}] " + ", ".join(description for _, description in stage))
+
+        if len(stage) > 1:
+            with ThreadPoolExecutor(max_workers=len(stage)) as executor:
+                results = list(executor.map(lambda step: run_script(*step), stage))
+        else:
+            results = [run_script(*step) for step in stage]
+
+        if not all(results):
+            log(f"Pipeline failed at stage {i}", "ERROR")
             return 1
 
     # Store the hash after successful ingestion
     log("Storing FDA data hash...")
-    try:
-        result = subprocess.run(
-            [sys.executable, "check_for_updates.py", "--store-hash"],
-            check=True,
-            capture_output=True,
-            text=True
-        )
-        log("Hash stored successfully")
-    except subprocess.CalledProcessError as e:
-        log(f"Warning: Could not store hash: {e}", "WARN")
+    store_fda_hash()
 
     # Success
     total_elapsed = (datetime.now() - overall_start).total_seconds()
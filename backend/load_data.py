@@ -7,41 +7,45 @@ Usage:
 
 Options:
     --no-cache    Force re-download even if cached data exists
-    --help, -h    Show this help message and exit
 
 Example:
     python load_data.py              # Use cached data if available
     python load_data.py --no-cache   # Force fresh download
 """
 
+import argparse
 import asyncio
 import sys
 from pathlib import Path
-
-# Check for help first
-if "--help" in sys.argv or "-h" in sys.argv:
-    print(__doc__)
-    sys.exit(0)
+from typing import Any, Dict, List, Optional
 
 # Add app to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from app.config import settings
-from app.database import init_db, CRLRepository, MetadataRepository
+from app.database import init_db, get_db, CRLRepository, MetadataRepository
 from app.services.data_ingestion import fetch_crl_data
 from app.services.data_processor import process_crl_data
 from app.utils.logging_config import get_logger, setup_logging
 
-# Setup logging
-setup_logging(log_level="INFO", enable_file_logging=True)
 logger = get_logger(__name__)
 
 
-async def main():
+def parse_args(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--no-cache", action="store_true")
+    return vars(parser.parse_args(argv))
+
+
+async def main(argv: Optional[List[str]] = None) -> int:
     """Main function to load CRL data."""
     try:
         # Parse command line arguments
-        use_cache = "--no-cache" not in sys.argv
+        use_cache = not parse_args(argv)["no_cache"]
 
         logger.info("=" * 60)
         logger.info("FDA CRL Data Loading Script")
@@ -50,6 +54,7 @@ async def main():
         # Step 1: Initialize database
         logger.info("\n[Step 1/3] Initializing database...")
         init_db()
+        conn = get_db()
         logger.info("✓ Database initialized")
 
         # Step 2: Fetch CRL data
@@ -76,8 +81,8 @@ async def main():
         logger.info(f"Total in database:   {stats['total_in_db']}")
 
         # Get some statistics
-        repo = CRLRepository()
-        db_stats = repo.get_stats()
+        repo = CRLRepository(conn)
+        db_stats = repo.get_basic_stats()
 
         logger.info("\n" + "-" * 60)
         logger.info("DATABASE STATISTICS")
@@ -98,7 +103,7 @@ async def main():
         logger.info(f"\nDatabase location: {settings.database_path}")
 
         # Update last data update timestamp
-        metadata_repo = MetadataRepository()
+        metadata_repo = MetadataRepository(conn)
         from datetime import datetime
         current_date = datetime.now().strftime("%Y-%m-%d")
         metadata_repo.set("last_data_update", current_date)
@@ -111,6 +116,12 @@ async def main():
         return 1
 
 
+def run(argv: Optional[List[str]] = None) -> int:
+    """Run this pipeline step in-process and return its exit code."""
+    return asyncio.run(main(argv))
+
+
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
-    sys.exit(exit_code)
+    # Setup logging; the ingest pipelines configure it once for all steps
+    setup_logging(log_level="INFO", enable_file_logging=True)
+    sys.exit(run())
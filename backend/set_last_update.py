@@ -11,17 +11,21 @@ If no date is provided, uses today's date.
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import List, Optional
 
 # Add app to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from app.database import MetadataRepository, init_db
+from app.database import MetadataRepository, get_db, init_db
 
 
-def main():
+def main(argv: Optional[List[str]] = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
     # Get date from command line or use today
-    if len(sys.argv) > 1:
-        date_str = sys.argv[1]
+    if argv:
+        date_str = argv[0]
         # Validate date format
         try:
             datetime.strptime(date_str, "%Y-%m-%d")
@@ -36,7 +40,7 @@ def main():
         init_db()
 
         # Set the metadata
-        repo = MetadataRepository()
+        repo = MetadataRepository(get_db())
         repo.set("last_data_update", date_str)
 
         print(f"✓ Set last_data_update to {date_str}")
@@ -49,5 +53,10 @@ def main():
         return 1
 
 
+def run(argv: Optional[List[str]] = None) -> int:
+    """Run this pipeline step in-process and return its exit code."""
+    return main(argv)
+
+
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(run())
@@ -7,113 +7,335 @@ This file contains:
 - Common test utilities
 """
 
-import os
-import tempfile
+import copy
+import uuid
+from contextlib import ExitStack
+from datetime import datetime
+from types import MappingProxyType, SimpleNamespace
 from typing import Generator
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
+import numpy as np
 import pytest
 import duckdb
 
+# Constant 1536-dimension test embedding, matching the FLOAT[1536] column
+TEST_EMBEDDING = np.full(1536, 0.1, dtype=np.float32)
 
-@pytest.fixture(scope="session")
-def test_env_vars():
+# Letter text shared by every seeded CRL row
+TEST_CRL_TEXT = "This is test CRL content with deficiencies."
+
+# Canned answer returned by the RAG service mock behind the API client
+MOCK_RAG_ANSWER = MappingProxyType({
+    "question": "What are common deficiencies?",
+    "answer": "Common deficiencies include CMC issues, clinical trial design problems, and manufacturing concerns.",
+    "relevant_crls": ("test_crl_0", "test_crl_1"),
+    "confidence": 0.85,
+    "model": "gpt-4o-mini"
+})
+
+# Dry-run embeddings are shrunk from the model's 3072 dims to keep payloads small
+DRY_RUN_EMBEDDING_DIMS = 16
+
+# Fixed created_at/updated_at for seeded rows, so test data is deterministic
+SEED_TIMESTAMP = datetime(2024, 1, 1)
+
+# Test connections never need extensions beyond those built into duckdb, and
+# the seed tables are small enough that one thread beats the parallel scheduler
+DUCKDB_TEST_CONFIG = {
+    "autoinstall_known_extensions": False,
+    "autoload_known_extensions": False,
+    "threads": 1,
+    "memory_limit": "256MB",
+}
+
+
+# Environment variables the app is configured with under test
+TEST_ENV = MappingProxyType({
+    "OPENAI_API_KEY": "sk-test1234567890abcdefghijklmnopqrstuvwxyz",
+    "DATABASE_PATH": ":memory:",  # In-memory database for tests
+    "LOG_LEVEL": "DEBUG",
+    "CORS_ORIGINS": "http://localhost:3000,http://localhost:5173",
+})
+
+
+@pytest.fixture
+def test_env_vars(monkeypatch, fresh_settings):
     """
     Fixture to set up test environment variables.
 
-    This fixture sets required environment variables for testing
-    and cleans them up after tests complete.
+    This fixture sets required environment variables for one test;
+    monkeypatch restores them afterwards.
+    """
+    for key, value in TEST_ENV.items():
+        monkeypatch.setenv(key, value)
+
+
+@pytest.fixture(scope="session")
+def _session_env():
+    """
+    Fixture that sets the test environment variables for session-scoped fixtures.
+
+    The app modules read their settings once at import, so the variables
+    stay set until the session ends and are then restored.
+    """
+    from app.config import get_settings
+
+    with pytest.MonkeyPatch.context() as mp:
+        for key, value in TEST_ENV.items():
+            mp.setenv(key, value)
+        # Drop settings cached before the variables were set, so the app
+        # modules imported after this point see the in-memory database path
+        get_settings.cache_clear()
+
+        yield
+
+    get_settings.cache_clear()
+
+
+@pytest.fixture
+def fresh_settings():
     """
-    original_env = os.environ.copy()
+    Fixture that clears the get_settings() cache before and after a test.
 
-    # Set test environment variables
-    os.environ["OPENAI_API_KEY"] = "sk-test1234567890abcdefghijklmnopqrstuvwxyz"
-    os.environ["DATABASE_PATH"] = ":memory:"  # In-memory database for tests
-    os.environ["LOG_LEVEL"] = "DEBUG"
-    os.environ["CORS_ORIGINS"] = "http://localhost:3000,http://localhost:5173"
+    Request it from tests (or fixtures) that change settings through the
+    environment, so neither they nor later tests see a stale instance.
+    """
+    from app.config import get_settings
 
+    get_settings.cache_clear()
     yield
+    get_settings.cache_clear()
+
+
+@pytest.fixture
+def clean_env(monkeypatch, fresh_settings):
+    """
+    Fixture that provides a helper to unset environment variables.
+
+    The variables are restored by monkeypatch after the test, and the
+    settings cache is cleared so get_settings() sees the change.
+
+    Returns:
+        Callable: clean(*keys) removing each key from the environment
+    """
+    from app.config import get_settings
+
+    def clean(*keys: str) -> None:
+        for key in keys:
+            monkeypatch.delenv(key, raising=False)
+        get_settings.cache_clear()
 
-    # Restore original environment
-    os.environ.clear()
-    os.environ.update(original_env)
+    return clean
 
 
 @pytest.fixture(scope="function")
-def temp_db_path() -> Generator[str, None, None]:
+def temp_db_path(tmp_path) -> str:
     """
     Fixture that provides a temporary database file path.
 
-    Creates a temporary file for the database and cleans it up after the test.
+    The file lives in pytest's per-test tmp_path, which pytest cleans up.
 
-    Yields:
+    Returns:
         str: Path to temporary database file
     """
-    with tempfile.NamedTemporaryFile(suffix=".duckdb", delete=False) as tmp:
-        db_path = tmp.name
+    return str(tmp_path / "test.duckdb")
+
 
-    yield db_path
+@pytest.fixture(scope="session")
+def _shared_duckdb() -> Generator[duckdb.DuckDBPyConnection, None, None]:
+    """
+    Fixture that provides one in-memory DuckDB instance for the whole session.
 
-    # Cleanup
-    try:
-        os.unlink(db_path)
-    except OSError:
-        pass
+    Yields:
+        duckdb.DuckDBPyConnection: Session-wide database connection
+    """
+    conn = duckdb.connect(":memory:", config=DUCKDB_TEST_CONFIG)
+
+    yield conn
+
+    conn.close()
 
 
 @pytest.fixture(scope="function")
-def test_db_connection() -> Generator[duckdb.DuckDBPyConnection, None, None]:
+def test_db_connection(_shared_duckdb) -> Generator[duckdb.DuckDBPyConnection, None, None]:
     """
-    Fixture that provides an in-memory DuckDB connection for testing.
+    Fixture that provides an isolated in-memory DuckDB connection for testing.
+
+    Each test gets a cursor on the shared session instance, switched to its
+    own attached in-memory catalog that is detached again afterwards.
 
     Yields:
         duckdb.DuckDBPyConnection: Database connection
     """
-    conn = duckdb.connect(":memory:")
+    conn = _shared_duckdb.cursor()
+    catalog = f"test_{uuid.uuid4().hex}"
+    conn.execute(f"ATTACH ':memory:' AS {catalog}")
+    conn.execute(f"USE {catalog}")
 
     yield conn
 
+    conn.execute("USE memory")
+    conn.execute(f"DETACH {catalog}")
     conn.close()
 
 
-@pytest.fixture(scope="function")
-def mock_openai_client(mocker):
+class _StubEndpoint:
+    """Minimal stand-in for an OpenAI endpoint whose create() returns a fixed response."""
+
+    def __init__(self, response):
+        self.response = response
+
+    def create(self, *args, **kwargs):
+        return self.response
+
+
+@pytest.fixture(scope="session")
+def mock_openai_client():
     """
-    Fixture that provides a mocked OpenAI client.
+    Fixture that provides a stubbed OpenAI client.
 
-    This prevents actual API calls during testing.
+    This prevents actual API calls during testing. The stub is built from
+    plain namespaces and shared by the whole session.
 
     Returns:
-        MagicMock: Mocked OpenAI client
+        SimpleNamespace: Stubbed OpenAI client
     """
-    mock_client = MagicMock()
+    # Stub chat completions
+    completion = SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content="Test summary"))],
+        usage=SimpleNamespace(total_tokens=100),
+    )
 
-    # Mock chat completions
-    mock_completion = MagicMock()
-    mock_completion.choices = [MagicMock()]
-    mock_completion.choices[0].message.content = "Test summary"
-    mock_completion.usage.total_tokens = 100
-    mock_client.chat.completions.create.return_value = mock_completion
+    # Stub embeddings
+    embedding = SimpleNamespace(
+        data=[SimpleNamespace(embedding=TEST_EMBEDDING.tolist())],  # 1536 dimensions
+        usage=SimpleNamespace(total_tokens=50),
+    )
 
-    # Mock embeddings
-    mock_embedding = MagicMock()
-    mock_embedding.data = [MagicMock()]
-    mock_embedding.data[0].embedding = [0.1] * 1536  # 1536 dimensions
-    mock_embedding.usage.total_tokens = 50
-    mock_client.embeddings.create.return_value = mock_embedding
+    return SimpleNamespace(
+        chat=SimpleNamespace(completions=_StubEndpoint(completion)),
+        embeddings=_StubEndpoint(embedding),
+    )
 
-    return mock_client
 
+@pytest.fixture(scope="session")
+def dry_run_settings(_session_env):
+    """Settings with dry-run mode enabled."""
+    from app.config import Settings
 
-@pytest.fixture(scope="function")
+    return Settings(
+        openai_api_key="sk-dummy-key-for-testing-purposes",
+        ai_dry_run=True,
+        ai_dry_run_summary_chars=500,
+        ai_dry_run_embedding_dims=DRY_RUN_EMBEDDING_DIMS,
+        openai_summary_model="gpt-5-nano",
+        openai_qa_model="gpt-5-nano",
+        openai_embedding_model="text-embedding-3-large"  # 3072 dims
+    )
+
+
+# Services are built once per session and shallow-copied per test, so
+# attributes a test replaces on its copy never leak into other tests
+
+@pytest.fixture(scope="session")
+def _summarization_proto(dry_run_settings):
+    from app.services.summarization import SummarizationService
+
+    return SummarizationService(dry_run_settings)
+
+
+@pytest.fixture(scope="session")
+def _embeddings_proto(dry_run_settings):
+    from app.services.embeddings import EmbeddingsService
+
+    return EmbeddingsService(dry_run_settings)
+
+
+@pytest.fixture(scope="session")
+def _rag_proto(dry_run_settings):
+    from app.services.rag import RAGService
+
+    return RAGService(dry_run_settings)
+
+
+@pytest.fixture
+def summarization_service(_summarization_proto):
+    """Summarization service in dry-run mode."""
+    return copy.copy(_summarization_proto)
+
+
+@pytest.fixture
+def embeddings_service(_embeddings_proto):
+    """Embeddings service in dry-run mode, with an empty embedding cache."""
+    service = copy.copy(_embeddings_proto)
+    service.clear_cache()
+    return service
+
+
+@pytest.fixture
+def rag_service(_rag_proto):
+    """RAG service in dry-run mode."""
+    return copy.copy(_rag_proto)
+
+
+@pytest.fixture(scope="session")
+def real_embeddings_by_dim():
+    """Real sample embeddings keyed by dimension, filtered once per session."""
+    from tests.fixtures.sample_embeddings import get_sample_embeddings
+
+    return MappingProxyType({
+        dim: get_sample_embeddings(dimension=dim) for dim in (1536, 3072)
+    })
+
+
+@pytest.fixture(scope="session")
+def real_embeddings_3072(real_embeddings_by_dim):
+    """Real 3072-dimension sample embeddings."""
+    return real_embeddings_by_dim[3072]
+
+
+@pytest.fixture(scope="session")
+def real_embeddings_matrix(real_embeddings_3072):
+    """Real 3072-dimension sample embeddings as (crl_ids, float32 matrix)."""
+    crl_ids = [sample["crl_id"] for sample in real_embeddings_3072]
+    matrix = np.array(
+        [sample["embedding"] for sample in real_embeddings_3072], dtype=np.float32
+    )
+    return crl_ids, matrix
+
+
+@pytest.fixture(scope="session")
+def normalized_real_embeddings(real_embeddings_matrix):
+    """Real 3072-dimension sample embeddings as a unit-length (N, 3072) matrix."""
+    _, matrix = real_embeddings_matrix
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+
+    # OpenAI embeddings are already unit length; this only removes rounding error
+    assert np.max(np.abs(norms - 1.0)) < 1e-4
+    return matrix / norms
+
+
+@pytest.fixture(scope="session")
+def real_crl_lookup():
+    """CRL data for every real sample embedding, keyed by CRL ID."""
+    from tests.fixtures.sample_embeddings import SAMPLE_EMBEDDINGS, get_sample_crl_data
+
+    return MappingProxyType({
+        sample["crl_id"]: get_sample_crl_data(sample["crl_id"])
+        for sample in SAMPLE_EMBEDDINGS
+    })
+
+
+@pytest.fixture(scope="session")
 def sample_crl_data():
     """
     Fixture that provides sample CRL data for testing.
 
     Returns:
-        dict: Sample CRL data matching the expected structure
+        MappingProxyType: Read-only sample CRL data matching the expected structure
     """
-    return {
+    return MappingProxyType({
         "application_number": ["NDA 215818"],
         "letter_date": "01/15/2024",
         "letter_year": "2024",
@@ -127,16 +349,16 @@ def sample_crl_data():
         "approver_title": "Director, Division of Drug Evaluation",
         "file_name": "test_crl_2024.pdf",
         "text": "Dear Applicant: We have completed our review of your application... [deficiencies listed]"
-    }
+    })
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def sample_crl_list():
     """
     Fixture that provides a list of sample CRL data for testing.
 
     Returns:
-        list: List of sample CRL dictionaries
+        tuple: Read-only sample CRL mappings
     """
     base_data = {
         "application_number": ["NDA 000000"],
@@ -158,9 +380,20 @@ def sample_crl_list():
         crl["letter_year"] = "2024"
         crl["approval_status"] = "Approved" if i % 2 == 0 else "Unapproved"
         crl["company_name"] = f"Test Pharmaceutical {i} Inc."
-        crls.append(crl)
+        crls.append(MappingProxyType(crl))
 
-    return crls
+    return tuple(crls)
+
+
+@pytest.fixture(scope="session")
+def sample_crl_id() -> str:
+    """
+    Fixture that provides the ID of a CRL seeded into test_db.
+
+    Returns:
+        str: ID of the first seeded CRL, which also has a summary and embedding
+    """
+    return "test_crl_0"
 
 
 @pytest.fixture(scope="function", autouse=True)
@@ -181,10 +414,18 @@ def reset_db_singleton():
     DatabaseConnection._connection = None
 
 
-@pytest.fixture(scope="function")
-def test_db():
-    """Create an in-memory test database with sample data."""
-    conn = duckdb.connect(":memory:")
+@pytest.fixture(scope="session")
+def test_db() -> Generator[duckdb.DuckDBPyConnection, None, None]:
+    """
+    Create a test database with sample data once per session.
+
+    Each test using it runs inside a transaction that _txn rolls back, so
+    writes never leak between tests.
+
+    Yields:
+        duckdb.DuckDBPyConnection: Session-wide seeded database connection
+    """
+    conn = duckdb.connect(":memory:", config=DUCKDB_TEST_CONFIG)
 
     # Create tables (matching app/schemas.py structure)
     conn.execute("""
@@ -255,11 +496,11 @@ def test_db():
         )
     """)
 
-    # Insert sample CRL data
-    for i in range(10):
-        conn.execute("""
-            INSERT INTO crls VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-        """, [
+    # Insert sample CRL data in a single batch
+    conn.executemany("""
+        INSERT INTO crls VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, [
+        [
             f"test_crl_{i}",
             [f"NDA {215818 + i}"],  # Array, not JSON string
             f"2024-01-{15 + i:02d}",
@@ -273,104 +514,116 @@ def test_db():
             ["Center for Drug Evaluation and Research"],  # Array, not JSON string
             "Director",
             f"test_file_{i}.pdf",
-            f"This is test CRL content {i} with deficiencies.",
+            TEST_CRL_TEXT,
             "Small molecules" if i % 3 == 0 else None,  # therapeutic_category
             f"Test Product {i}" if i < 5 else None,  # product_name
             "Test indication" if i % 2 == 0 else None,  # indications
             "Clinical" if i % 2 == 0 else "CMC / Quality",  # deficiency_reason
-            '{}'  # raw_json
-        ])
+            None,  # raw_json: no test reads it back
+            SEED_TIMESTAMP,
+            SEED_TIMESTAMP,
+        ]
+        for i in range(10)
+    ])
 
     # Insert sample summary
     conn.execute("""
-        INSERT INTO crl_summaries VALUES (1, 'test_crl_0', 'Test summary', 'gpt-4o-mini', 100, CURRENT_TIMESTAMP)
-    """)
+        INSERT INTO crl_summaries VALUES (1, 'test_crl_0', 'Test summary', 'gpt-4o-mini', 100, ?)
+    """, [SEED_TIMESTAMP])
 
     # Insert sample embedding
-    embedding = [0.1] * 1536
     conn.execute("""
-        INSERT INTO crl_embeddings VALUES (1, 'test_crl_0', ?, 'text-embedding-3-small', CURRENT_TIMESTAMP)
-    """, [embedding])
+        INSERT INTO crl_embeddings VALUES (1, 'test_crl_0', ?, 'text-embedding-3-small', ?)
+    """, [TEST_EMBEDDING, SEED_TIMESTAMP])
 
     yield conn
     conn.close()
 
 
-@pytest.fixture
-def client(test_db, test_env_vars):
-    """FastAPI test client with mocked database."""
+@pytest.fixture(scope="function", autouse=True)
+def _txn(request):
+    """Wrap each test that uses test_db in a transaction that is rolled back."""
+    if "test_db" not in request.fixturenames:
+        yield
+        return
+
+    conn = request.getfixturevalue("test_db")
+    conn.execute("BEGIN")
+    yield
+    conn.execute("ROLLBACK")
+
+
+@pytest.fixture(scope="session")
+def app_modules(_session_env):
+    """
+    Import the FastAPI app once per session.
+
+    Returns:
+        SimpleNamespace: The app and the API modules whose repositories the
+        client fixture points at the test database (None if not loaded)
+    """
     import sys
     from app.main import app
+
+    # Keep module references on a namespace rather than in local scope
+    # This prevents the modules from being visible to DuckDB's replacement scan
+    return SimpleNamespace(
+        app=app,
+        crls=sys.modules.get('app.api.crls'),
+        export=sys.modules.get('app.api.export'),
+        stats=sys.modules.get('app.api.stats'),
+        qa=sys.modules.get('app.api.qa'),
+    )
+
+
+@pytest.fixture(scope="session")
+def client(test_db, app_modules):
+    """
+    FastAPI test client with mocked database, shared by the whole session.
+
+    The repository patches are entered once and stay active until the session
+    ends; per-test isolation comes from the test_db transaction rollback.
+    """
     from fastapi.testclient import TestClient
 
-    # Patch get_db where it's used (in main.py) to return our test database
-    with patch('app.main.get_db', return_value=test_db):
-        # Get module references from sys.modules to avoid creating new references in local scope
-        # This prevents the modules from being visible to DuckDB's replacement scan
-        crls_module = sys.modules.get('app.api.crls')
-        export_module = sys.modules.get('app.api.export')
-        stats_module = sys.modules.get('app.api.stats')
-        qa_module = sys.modules.get('app.api.qa')
-
-        patches = []
-        if crls_module:
-            patches.extend([
-                patch.object(crls_module.crl_repo, 'conn', test_db),
-                patch.object(crls_module.summary_repo, 'conn', test_db),
-            ])
-        if export_module:
-            patches.extend([
-                patch.object(export_module.crl_repo, 'conn', test_db),
-                patch.object(export_module.summary_repo, 'conn', test_db),
-            ])
-        if stats_module:
-            patches.append(patch.object(stats_module.crl_repo, 'conn', test_db))
-        if qa_module:
-            patches.append(patch.object(qa_module.qa_repo, 'conn', test_db))
-
-        # Apply all patches
-        if patches:
-            with patches[0], patches[1], patches[2] if len(patches) > 2 else patch('unittest.mock.MagicMock'), \
-                 patches[3] if len(patches) > 3 else patch('unittest.mock.MagicMock'), \
-                 patches[4] if len(patches) > 4 else patch('unittest.mock.MagicMock'), \
-                 patches[5] if len(patches) > 5 else patch('unittest.mock.MagicMock'):
-                # Mock RAG service to avoid OpenAI API calls
-                with patch('app.api.qa.rag_service') as mock_rag:
-                    mock_rag.answer_question.return_value = {
-                        "question": "What are common deficiencies?",
-                        "answer": "Common deficiencies include CMC issues, clinical trial design problems, and manufacturing concerns.",
-                        "relevant_crls": ["test_crl_0", "test_crl_1"],
-                        "confidence": 0.85,
-                        "model": "gpt-4o-mini"
-                    }
-
-                    yield TestClient(app)
-        else:
-            # Fallback if modules aren't loaded yet
-            with patch('app.api.qa.rag_service') as mock_rag:
-                mock_rag.answer_question.return_value = {
-                    "question": "What are common deficiencies?",
-                    "answer": "Common deficiencies include CMC issues, clinical trial design problems, and manufacturing concerns.",
-                    "relevant_crls": ["test_crl_0", "test_crl_1"],
-                    "confidence": 0.85,
-                    "model": "gpt-4o-mini"
-                }
-
-                yield TestClient(app)
+    with ExitStack() as stack:
+        # Patch get_db where it's used (in main.py) to return our test database
+        stack.enter_context(patch('app.main.get_db', return_value=test_db))
 
+        if app_modules.crls:
+            stack.enter_context(patch.object(app_modules.crls.crl_repo, 'conn', test_db))
+            stack.enter_context(patch.object(app_modules.crls.summary_repo, 'conn', test_db))
+        if app_modules.export:
+            stack.enter_context(patch.object(app_modules.export.crl_repo, 'conn', test_db))
+            stack.enter_context(patch.object(app_modules.export.summary_repo, 'conn', test_db))
+        if app_modules.stats:
+            stack.enter_context(patch.object(app_modules.stats.crl_repo, 'conn', test_db))
+        if app_modules.qa:
+            stack.enter_context(patch.object(app_modules.qa.qa_repo, 'conn', test_db))
 
-@pytest.fixture(autouse=True)
-def reset_settings_cache():
+        # Mock RAG service to avoid OpenAI API calls
+        mock_rag = stack.enter_context(patch('app.api.qa.rag_service'))
+        mock_rag.answer_question.return_value = MOCK_RAG_ANSWER
+
+        # Enter the client once so the app lifespan starts and stops only once
+        yield stack.enter_context(TestClient(app_modules.app))
+
+
+@pytest.fixture
+def mock_rag(client, app_modules):
     """
-    Fixture to reset the settings cache between tests.
+    The RAG service mock behind the client's /api/qa endpoints.
 
-    The get_settings function uses lru_cache, so we need to clear it
-    between tests to ensure a fresh settings instance.
+    Tests may reconfigure it freely; calls and the default answer are
+    restored afterwards.
     """
-    from app.config import get_settings
-    get_settings.cache_clear()
-    yield
-    get_settings.cache_clear()
+    rag = app_modules.qa.rag_service
+    rag.reset_mock()
+
+    yield rag
+
+    rag.reset_mock(return_value=True, side_effect=True)
+    rag.answer_question.return_value = MOCK_RAG_ANSWER
 
 
 @pytest.fixture(autouse=True)
@@ -6,65 +6,57 @@ realistic RAG testing without requiring OpenAI API access.
 
 Generated from: 1558 total embeddings
 Sample size: 5
-Embedding dimensions: 3072
+Embedding dimensions: 1536 and 3072
 Seed: 42 (for reproducibility)
+
+Vectors are stored as float32 matrices in sample_embeddings_<dim>.npy and
+memory-mapped on import, so each sample's "embedding" is a read-only view
+into the file. Metadata lives in sample_embeddings_meta.json.
 """
 
+import json
+from pathlib import Path
 from typing import List, Dict, Any
 
+import numpy as np
 
-# Real embedding samples from production database
-SAMPLE_EMBEDDINGS: List[Dict[str, Any]] = [
-    {
-        "crl_id": "BL125845_20250707_08bdd1",
-        "company": "Ultragenyx Pharmaceutical Inc.",
-        "app_number": "BL 125845",
-        "date": "2025-07-07",
-        "text_preview": 'Our STN:\n\ng YN U.S. FOOD & DRUG\n\nADMINISTRATION\n\nBL 125845/0 COMPLETE RESPONSE\nJuly 7, 2025\n\nUltragenyx Pharmaceutical Inc.\n\nAttention:\n5000 Mari\nBrisbane,\n\nJad Adaimi\nna Blvd.\nCA 94005\n\nDear Jad Adai',
-        "embedding": [0.00373804266564548, 0.023933103308081627, -0.016260385513305664, 0.005381336435675621, 0.026758205145597458, -0.03316283971071243, -0.029133858159184456, 0.015530032105743885, 0.004265742842108011, 0.03380490839481354, 0.013274766504764557, -0.02683846279978752, 0.017111126333475113, -0.016404850408434868, -0.013009913265705109, 0.018668141216039658, -0.050883930176496506, 0.010995423421263695, -0.030706925317645073, -0.005702370777726173, 0.004855643026530743, 0.00578664243221283, 0.06545888632535934, 0.013074119575321674, 0.008892648853361607, 0.04128500446677208, -0.026084033772349358, 0.009085269644856453, -0.024767791852355003, 0.009261838160455227, 0.02719160169363022, 0.03791414573788643, 0.0007178125088103116, -0.009879829362034798, -0.0008397052297368646, 0.00784126203507185, 0.02427018992602825, 0.0011145907919853926, 0.02009674347937107, -0.032071322202682495, -0.024109672755002975, -0.0023014142643660307, 0.005674280226230621, 0.05065920576453209, 0.006874145939946175, -0.02781761810183525, -0.04311490058898926, -0.013355025090277195, -0.0013513535959646106, 0.04969610273838043, -0.04680679365992546, 0.02199084684252739, -0.0158590916544199, -0.009486562572419643, 0.045554760843515396, -0.009518665261566639, 0.04526583105325699, 0.041991278529167175, 0.02081907168030739, 0.017079021781682968, -0.026693997904658318, 0.026019826531410217, 0.012327714823186398, 0.03563480079174042, 0.007251361384987831, 0.010586104355752468, -0.017656883224844933, -0.01593935117125511, -0.02390100061893463, -0.013499489985406399, -0.06247326359152794, -0.06054706126451492, -0.006284245289862156, 0.028331272304058075, 0.005092405714094639, 0.0025221253745257854, -0.0034290470648556948, 0.03730418160557747, 0.07171905040740967, -0.0023616082035005093, 0.00928591564297676, 0.04256914183497429, -0.016565367579460144, 0.006789874285459518, -0.004374091513454914, 0.02886097878217697, 0.001010756241157651, -0.07345263659954071, -0.01212706882506609, 0.03984035179018974, 0.022440293803811073, 0.03621266409754753, 0.006821977905929089, -0.02125246822834015, 0.01679009199142456, -0.015176894143223763, 0.03467169776558876, 0.005662241484969854, -0.03467169776558876, 0.015650419518351555, 0.027336066588759422, -0.015192946419119835, 0.005405414383858442, -0.0023274982813745737, -0.015449773520231247, 0.03316283971071243, 0.01396499015390873, 0.019213899970054626, -0.012135094963014126, 0.15473851561546326, -0.033965423703193665, -0.04247283190488815, 0.02995249629020691, -0.044687967747449875, -0.003146135713905096, -0.04963189363479614, -0.008057959377765656, 0.016741937026381493, -0.03736838698387146, -0.0022071104031056166, 0.02333918958902359, -0.01314635295420885, 0.009855751879513264, -0.004923862870782614, -0.012135094963014126, 0.03528166562318802, -0.0006114699062891304, -0.016469057649374008, 0.010401509702205658, 0.032938115298748016, -0.038556214421987534, 0.0068821716122329235, -0.016918504610657692, -0.016019608825445175, -0.023868896067142487, 0.04436693340539932, -0.005903017241507769, 0.004177458118647337, 0.000701259181369096, 0.0056582288816571236, -0.00958287250250578, -0.019695451483130455, 0.009237760677933693, 0.001009251456707716, 0.01065833680331707, 0.007632589433342218, -0.02555432729423046, 0.028684411197900772, -0.0009626011596992612, 0.022440293803811073, -0.005020173266530037, -0.03842779994010925, -5.931609484832734e-05, -0.02720765210688114, 0.012761111371219158, 0.009301966987550259, -0.01648510806262493, -0.02651742845773697, 0.03075508214533329, 0.010610181838274002, 0.010706492699682713, 0.03297021612524986, 0.0010644291760399938, 0.054928962141275406, 0.02653348073363304, 0.029133858159184456, -0.03130083903670311, -0.016806142404675484, -0.050883930176496506, 0.029984598979353905, 0.009157502092421055, -0.032681286334991455, -0.020177002996206284, -0.018780503422021866, -0.001618213253095746, 0.002726784674450755, 0.049471378326416016, 0.02707923948764801, -0.023002104833722115, 0.0023415435571223497, -0.0111238369718194, 0.00011455655476311222, 0.02390100061893463, 0.038138870149850845, 0.009855751879513264, -0.010714517906308174, 0.01746426336467266, -0.009005011059343815, -0.0011356587056070566, 0.039776142686605453, -0.010682414285838604, 0.005931107793003321, 0.0031662003602832556, 0.028459686785936356, 0.018973125144839287, 0.022327931597828865, -0.02081907168030739, 0.014663239009678364, 0.004113251343369484, 0.023692328482866287, -0.013651981949806213, 0.00548567296937108, -0.017656883224844933, 0.03260102868080139, -0.011934448033571243, 0.013001887127757072, 0.06263378262519836, 0.026372963562607765, 0.007279451470822096, -0.025008568540215492, -0.017255591228604317, -0.027239756658673286, -0.014245894737541676, 0.007303529419004917, 0.01579488441348076, -0.000586389098316431, -0.048668794333934784, -0.02444675751030445, -0.011180018074810505, -0.002243226859718561, -0.03993666172027588, -0.03260102868080139, 0.06282640248537064, -0.0038624433800578117, 0.042537037283182144, 0.04478427767753601, -0.023692328482866287, 0.0435001403093338, -0.0001281628938158974, -0.0012550433166325092, -0.0022251687478274107, 0.046646278351545334, -0.004506518132984638, -0.009823648259043694, -0.026453223079442978, -0.00976746715605259, -0.005365285091102123, -0.027127394452691078, -0.03890934959053993, -0.04308279603719711, 0.012263508513569832, 0.012335740961134434, -0.025329602882266045, 0.002477983245626092, -0.011412767693400383, 0.012199301272630692, 0.018892865628004074, 0.09277889877557755, 0.034158043563365936, -0.005293052177876234, 0.039358798414468765, -0.004081147722899914, 0.0024559120647609234, 0.01783345267176628, 0.0175284706056118, 0.044142208993434906, -0.004317910876125097, 0.005136548075824976, -0.010192837566137314, -0.00020378151384647936, 0.046164724975824356, 0.0033086591865867376, 0.007989739999175072, -0.02077091671526432, -0.005549879744648933, 0.012696905061602592, 0.020738812163472176, 0.02211925946176052, 0.029486995190382004, -0.027223704382777214, -0.013491464778780937, -0.004558686167001724, 0.04276176169514656, -0.03309863060712814, -0.03691893815994263, -0.005004121456295252, 0.030706925317645073, -0.0004634931974578649, 0.02138088084757328, 0.007006572559475899, 0.02677425742149353, 0.024045465514063835, -0.026758205145597458, -0.012720982544124126, -0.028411531820893288, 0.00722728343680501, 0.007985726930201054, -0.028154704719781876, -0.02266501821577549, 0.022311881184577942, -0.015971453860402107, -0.03316283971071243, -0.033227045089006424, -0.04067504033446312, -0.007548317778855562, -0.01744821108877659, -0.007773041725158691, 0.012696905061602592, 0.019149692729115486, -0.021236415952444077, -0.026565583422780037, -0.04295438155531883, -0.020369622856378555, 0.013860654085874557, -0.007849287241697311, 0.02144508808851242, -0.029759874567389488, 0.05017765238881111, -0.04728834703564644, -0.015891196206212044, 0.017961867153644562, -0.045426346361637115, 0.03147740662097931, -0.02009674347937107, 0.0057063838467001915, 0.0330665297806263, 0.02112405374646187, -0.04632524400949478, 0.009438406676054, 0.0028772694058716297, -0.009277889505028725, 0.019085485488176346, -0.015538058243691921, -0.04465586319565773, 0.04590789973735809, -0.014960195869207382, 0.0004170937172602862, 0.03025747835636139, 0.014286024495959282, 0.02781761810183525, -0.025345653295516968, 0.03142925351858139, 0.02486410364508629, 0.024799896404147148, -0.013956964015960693, -0.02375653386116028, -0.058909785002470016, 0.009261838160455227, 0.013804472982883453, -0.015554109588265419, 0.026661895215511322, -0.04160603880882263, -0.04195917770266533, 0.013515542261302471, 0.004386130254715681, -0.03852410987019539, -0.0016503167571499944, 0.0058227586559951305, 0.04561896622180939, -0.029567254707217216, 0.0010634259087964892, -0.029920391738414764, 0.01955098658800125, 0.02131667360663414, 0.03614845499396324, 0.003214355558156967, 0.012207327410578728, -0.038748834282159805, 0.012977809645235538, 0.02179822511970997, 0.04369276016950607, -0.023676276206970215, -0.05348430573940277, 0.029422789812088013, 0.009237760677933693, 0.010730570182204247, 0.011220146901905537, 0.021477190777659416, 0.025409860536456108, -0.017929762601852417, -0.0340617336332798, 0.027287911623716354, 0.040032971650362015, 0.014430489391088486, 0.02523329295217991, -0.02014489844441414, 0.010802802629768848, 0.02953515201807022, -0.0330665297806263, 0.05512158200144768, -0.01722348853945732, 0.002004457637667656, 0.0032324136700481176, 0.03313073515892029, 0.0001692954101599753, 0.037336282432079315, 0.007106895558536053, 0.03282575309276581, 0.003226394299417734, -0.015056506730616093, -0.02192663960158825, 0.014286024495959282, 0.0067176418378949165, 0.021236415952444077, -0.03232814744114876, 0.008627795614302158, 0.0364052839577198, 0.03900566324591637, 0.012913602404296398, -0.024157827720046043, 0.027978135272860527, 0.020353572443127632, -0.005044250749051571, 0.0128975510597229, -0.011525129899382591, 0.005999327637255192, 0.012913602404296398, -0.04208759218454361, 0.02083512209355831, -0.021043796092271805, -0.01286544743925333, 0.0006480878801085055, 0.036469489336013794, -0.03313073515892029, 0.030064858496189117, -0.002676623174920678, -0.0011747847311198711, 0.018427366390824318, -0.033965423703193665, 0.007090844213962555, -0.0077489642426371574, -0.000520175788551569, -0.0048636686988174915, 0.01396499015390873, 0.034639596939086914, 0.007231296505779028, 0.008150257170200348, 0.015947377309203148, 0.012512310408055782, -0.04613262042403221, 0.015184920281171799, 0.02236003614962101, -0.018941020593047142, -0.011300405487418175, 0.04821934551000595, 0.014045248739421368, -0.015473851002752781, -0.023981258273124695, -0.008852519094944, 0.022071104496717453, -0.012552439235150814, 0.0492466539144516, -0.04863668978214264, 0.005140561144798994, -0.02849178947508335, -0.022472398355603218, -0.02549012005329132, -0.018090279772877693, -0.025714844465255737, 0.028331272304058075, -0.02475174143910408, 0.05245699733495712, -0.005088393110781908, 0.02977592684328556, -0.009085269644856453, -0.011340535245835781, -0.0055900090374052525, -0.04411010444164276, 0.04895772412419319, -0.02125246822834015, -0.02788182534277439, -0.004963992163538933, 0.0058107199147343636, -0.03650159388780594, 0.01764083281159401, 0.028684411197900772, -0.06632567942142487, -0.020658554509282112, 0.03412594273686409, 0.01418168842792511, -0.027833670377731323, 0.012849396094679832, -0.017865555360913277, -0.028877031058073044, 0.021669812500476837, -0.010826880112290382, 0.016300514340400696, -0.028925186023116112, 0.008065985515713692, 0.020353572443127632, 0.04106028005480766, 0.007010585628449917, -0.008009804412722588, 0.0018449437338858843, 0.003643738804385066, -0.01764083281159401, -0.01305004209280014, 0.019872020930051804, 0.0140853775665164, 0.009502613916993141, -0.011677620932459831, 0.005256935954093933, -0.02903754822909832, -0.03020932339131832, 0.008820416405797005, 0.0005497711827047169, 0.007604498881846666, -0.01898917555809021, 0.018603933975100517, -0.01050584577023983, 0.060065507888793945, -0.017351901158690453, 0.010706492699682713, 0.024719636887311935, -0.015530032105743885, 0.04073924571275711, -0.01607578992843628, 0.02890913374722004, -0.05483264848589897, 0.02751263603568077, 0.0015981486067175865, -0.0056542158126831055, -0.03884514421224594, 0.019647296518087387, -0.007901455275714397, 0.0029434827156364918, 0.002632480813190341, 0.03865252435207367, 0.011894319206476212, 0.010224941186606884, -0.0010554001200944185, -0.02321077696979046, -0.034703802317380905, 0.0017646851483732462, -0.021766122430562973, -0.03264918178319931, -0.006990520749241114, -0.020449882373213768, 0.059198714792728424, -0.019454674795269966, 0.006886184681206942, 0.0217500701546669, 0.042601246386766434, 0.030113013461232185, -0.007676731329411268, 0.004337975289672613, -0.0030478190165013075, -0.017544521018862724, 0.00034686748404055834, 0.0029254246037453413, -0.013250689022243023, 0.02346760407090187, -0.019246002659201622, -0.027400273829698563, -0.036533698439598083, 0.00891672633588314, 0.03162187337875366, 0.008988958783447742, 0.021717967465519905, 0.01010455284267664, -0.00032805686350911856, -0.007383788004517555, 0.028411531820893288, 0.009606949985027313, -0.0013332953676581383, -0.004113251343369484, 0.024960413575172424, -0.012407973408699036, -0.023082362487912178, -0.030594564974308014, 0.0048636686988174915, -0.018427366390824318, -0.0009992191335186362, 0.000619495811406523, -0.031108219176530838, 0.004739268217235804, 0.010112578980624676, 0.03669421374797821, 0.00998416543006897, 0.02314656972885132, 0.0001872281718533486, 0.009414329193532467, 0.008049934171140194, 0.01807422749698162, -0.023226827383041382, 0.02401336282491684, -0.003812281647697091, 0.021734019741415977, -0.036597903817892075, 0.0048395912162959576, 0.013563697226345539, -0.019518882036209106, -0.04276176169514656, 0.02842758223414421, 0.022311881184577942, 0.006336413323879242, 0.04263334721326828, -0.028379427269101143, 0.03380490839481354, 0.0006536056753247976, -0.014960195869207382, 0.026726100593805313, -3.922793894162169e-06, 0.002269310876727104, -0.005204767920076847, 0.004125290084630251, -0.01685429736971855, 0.01874840073287487, 0.012817292474210262, -0.020080693066120148, -0.006649421993643045, 0.01947072707116604, 0.012271534651517868, 0.01187826693058014, -0.00022622881806455553, -0.004980043973773718, -0.007492136675864458, -0.005361272022128105, -0.010361380875110626, -0.02977592684328556, 0.03081928752362728, -0.009189605712890625, 0.001888082711957395, -0.02205505222082138, 0.015554109588265419, -0.015505954623222351, -0.0027307975105941296, -0.02701503224670887, 0.0067657968029379845, -0.00435001403093338, 0.011982602998614311, 0.007524240296334028, 0.007684757467359304, 0.010947268456220627, 0.01794581487774849, 0.013218585401773453, -0.03630897402763367, 0.0009746399009600282, 0.004097199533134699, -0.011485000140964985, -0.023917051032185555, -0.021220363676548004, 0.015353462658822536, -0.025281447917222977, -0.006091624964028597, -0.040097177028656006, 0.0007117931381799281, -0.04337172582745552, 0.018411314114928246, 0.0264692734926939, -0.04452745243906975, 0.026661895215511322, 0.00699854688718915, 0.06253746896982193, -0.019502831622958183, -0.013178455643355846, 0.0038183010183274746, 0.0448484867811203, 0.012327714823186398, 0.0048235394060611725, -0.023307086899876595, 0.03282575309276581, -0.0019793768879026175, 0.014912040904164314, 0.004161406308412552, -0.02303420752286911, -0.0027950045187026262, 0.02118826098740101, 0.015233075246214867, -0.005184703040868044, 0.020000433549284935, 0.003641732269898057, 0.0021709941793233156, -0.004422246944159269, 0.016364721581339836, 0.010040346533060074, -0.018459469079971313, -0.009719312191009521, -0.00597123708575964, -0.03473590686917305, -0.02321077696979046, -0.022263726219534874, 0.00494392728433013, 0.028700461611151695, -0.020257260650396347, 0.003922637086361647, 0.011252250522375107, -0.02053014002740383, -0.02738422155380249, -0.027271859347820282, -0.01744821108877659, -0.003970792517066002, 0.013692110776901245, 0.021236415952444077, 0.010642285458743572, 0.012030758894979954, 0.022343983873724937, -0.0008146244217641652, -0.0032845817040652037, 0.013531593605875969, 0.0011446877615526319, -0.009374200366437435, 0.021091951057314873, -0.014189713634550571, 0.011533155106008053, 0.032617080956697464, -0.037207867950201035, -0.06353268027305603, -0.018973125144839287, 0.018475521355867386, -0.03215157985687256, 0.009205657057464123, -0.005397388245910406, -0.004047038033604622, -0.018908917903900146, 0.024302292615175247, 0.0210758987814188, -0.032745495438575745, 0.020594347268342972, 0.0023616082035005093, -0.01215917244553566, 0.009173553436994553, -0.028459686785936356, -0.00755233084782958, -0.01892496831715107, -0.0023876922205090523, 0.010257044807076454, -0.011645517311990261, -0.035410076379776, 0.0028592112939804792, -0.020481985062360764, 0.018491573631763458, 0.003828333457931876, -0.019374417141079903, 0.0204017274081707, -0.0016081809299066663, 0.008130192756652832, 0.00331668509170413, -0.011380664072930813, 0.00040028957300819457, 0.006641395855695009, 0.015160842798650265, 0.004691112786531448, 0.014839808456599712, -0.027063187211751938, 0.036662112921476364, -0.0011356587056070566, -0.013668033294379711, -0.01558621320873499, 0.011155940592288971, -0.004253703635185957, 0.0046469708904623985, 0.01283334381878376, -0.0046951258555054665, -0.025008568540215492, -0.039166178554296494, 0.009021062403917313, 0.04626103490591049, -0.013940912671387196, -0.003950727637857199, 0.03351597487926483, -0.021220363676548004, 0.0014175669057294726, -0.032199736684560776, 0.005634150933474302, -6.458306597778574e-05, 0.035859525203704834, 0.01759267784655094, 0.015377541072666645, -0.01219127606600523, -0.005072341300547123, 0.05855664610862732, 0.02719160169363022, 0.0018429371993988752, 0.02260081097483635, -0.023371294140815735, -0.0011677620932459831, 0.004558686167001724, 0.010409535840153694, -0.010586104355752468, 0.01160538848489523, 0.017255591228604317, 0.0038504046387970448, -0.030674822628498077, 0.0049760309047997, -0.01448667049407959, -0.000953572045546025, -0.008467278443276882, -0.017014814540743828, 0.03069087490439415, -0.001919182832352817, 0.015233075246214867, 0.015417669899761677, 0.015538058243691921, 0.007271425798535347, -0.03290601074695587, 0.049342963844537735, -0.03566690534353256, -0.014542851597070694, 0.01825079694390297, -0.025586429983377457, -0.03756100684404373, -0.008322812616825104, -0.022697120904922485, -0.003001670353114605, -0.025040671229362488, 0.007564369589090347, -0.016998764127492905, -0.0004614867502823472, -0.010232966393232346, -0.00523687107488513, -0.01942257210612297, -0.02181427739560604, 0.01455087773501873, 0.02284158766269684, 0.02218346670269966, -0.0045948028564453125, 0.008459252305328846, -0.0005422469112090766, 0.04343593493103981, -0.03804256021976471, 0.0067657968029379845, 0.01602763496339321, 0.016220254823565483, 0.00163928116671741, -0.014879937283694744, -0.003314678557217121, 0.008451227098703384, -0.018941020593047142, 0.015554109588265419, -0.021782174706459045, 0.015867117792367935, -0.007761002983897924, -0.0215735025703907, -0.015249126590788364, -0.019872020930051804, 0.008435174822807312, 0.012119042687118053, 0.020305415615439415, -0.005690332036465406, 0.020867226645350456, -0.0011838137870654464, -0.008531485684216022, 0.0025762999430298805, -0.025345653295516968, 0.0037681395187973976, 0.011693672277033329, 0.006059521343559027, 0.014237869530916214, 0.007118934765458107, -0.03419014811515808, -0.01246415451169014, -0.026308756321668625, 0.025618532672524452, 0.0371115580201149, -0.05727250874042511, -0.009639053605496883, -0.024302292615175247, 0.004341988358646631, 0.014029196463525295, -0.0055258022621273994, -0.04638944938778877, 0.0029053599573671818, 0.01855577901005745, -0.009783518500626087, 0.004486453719437122, 0.023323139175772667, 0.016324590891599655, -0.012640723958611488, -0.007921520620584488, 0.018347106873989105, 0.03467169776558876, -0.014277998358011246, 0.032199736684560776, 0.009446432814002037, -0.0016613522311672568, -0.009895880706608295, -0.04035400599241257, 0.028812823817133904, -0.0033588209189474583, -0.0027608945965766907, -0.027978135272860527, -0.00271073286421597, -0.024912258610129356, 0.00729149067774415, 0.004835578612983227, -0.0034290470648556948, -0.0023997309617698193, -0.011926422826945782, -0.0033889177720993757, -0.010433613322675228, -0.001506854547187686, 0.002049603033810854, 0.001620219787582755, 0.011693672277033329, -0.02836337685585022, 0.012014706619083881, 0.010891087353229523, -0.013346998952329159, -0.041991278529167175, -0.007536279037594795, 0.04134920984506607, -0.00453460868448019, -0.021717967465519905, 0.014775601215660572, -0.003248465247452259, -0.005260949023067951, 0.0057826293632388115, -0.025040671229362488, -0.018636038526892662, -0.0163566954433918, -0.01473547238856554, -0.03656580299139023, 0.014615084044635296, -0.022713173180818558, -0.02751263603568077, 0.005774603690952063, -0.011870241723954678, 0.029390685260295868, 0.04141341894865036, -0.021284570917487144, -0.01191037055104971, -0.008061972446739674, -0.014944144524633884, 0.016693780198693275, 0.025153033435344696, -0.0492466539144516, -0.008627795614302158, 0.01084293145686388, -0.013025964610278606, -0.015754755586385727, 0.028764668852090836, -0.009526691399514675, -0.0014416443882510066, 0.014526800252497196, -0.0015499935252591968, 0.009261838160455227, -0.015385566279292107, 0.03168608248233795, -2.111489993694704e-05, 0.011565258726477623, -0.0014586993493139744, 0.01013665646314621, -0.02879677154123783, -3.26442295772722e-06, -0.034639596939086914, -0.0337085947394371, 0.023258931934833527, -0.002622448606416583, -0.024591224268078804, -0.05165440961718559, -0.012086939997971058, 0.004289820324629545, -0.0647847130894661, -0.013981041498482227, 0.021974794566631317, 0.016059737652540207, -0.00430587213486433, 0.0014366282848641276, -0.011043578386306763, -0.02081907168030739, -0.013130300678312778, 0.018218694254755974, -0.01648510806262493, -0.015016376972198486, 0.00030548416543751955, -0.026437170803546906, -0.009141450747847557, 0.010995423421263695, 0.01013665646314621, -0.0204017274081707, -0.01314635295420885, 0.018491573631763458, -0.004951953422278166, 0.031204529106616974, -0.0066654738038778305, -0.012014706619083881, 0.00042537038098089397, -0.015273204073309898, 0.02120431326329708, -0.012456129305064678, 0.003101993352174759, 0.004486453719437122, 0.04632524400949478, -0.011661569587886333, 0.022408191114664078, 0.016501160338521004, -0.018234744668006897, -0.013724214397370815, 0.024976463988423347, -0.009085269644856453, -0.004285807255655527, 0.006761783733963966, -0.004935901612043381, 0.00848332978785038, -0.031011909246444702, 0.015538058243691921, 0.0251209307461977, -0.04500900208950043, 0.0057304613292217255, -0.004590789787471294, 0.0007484111119993031, 0.01069044042378664, -0.03791414573788643, -0.014406411908566952, -0.01801002211868763, 0.007303529419004917, 0.004137328825891018, 0.0014556896639987826, 9.442921873414889e-05, 0.03325914964079857, -0.02022515796124935, -0.014743497595191002, -0.008595691993832588, -0.01948677934706211, -0.01764083281159401, 0.022520553320646286, 0.04427062347531319, -0.02651742845773697, 0.004562699235975742, 0.011043578386306763, 0.00401292834430933, -0.0170308668166399, -0.0056180995889008045, -0.020803019404411316, -0.007383788004517555, -0.005598034709692001, 0.013387128710746765, 0.0022372074890881777, -0.033227045089006424, -0.009823648259043694, 0.028074445202946663, 0.015698574483394623, -0.027592893689870834, 0.014318127185106277, 0.03192685544490814, 0.002217142842710018, -0.008459252305328846, 0.0057063838467001915, -0.0077770547941327095, 0.0391019731760025, -0.016404850408434868, 0.003392930841073394, -0.014871912077069283, 0.009839699603617191, -0.0022492462303489447, 0.008908700197935104, -0.020979588851332664, -0.016043687239289284, 0.015120713040232658, 0.007680744398385286, 0.025024620816111565, -0.013194507919251919, -0.01090713869780302, 0.015513979829847813, 0.0001660349080339074, -0.010618207976222038, 0.0017526464071124792, -0.01507255807518959, -0.03272944316267967, 0.017656883224844933, -0.002752868691459298, 0.006115702446550131, 0.007580421399325132, 0.012399948202073574, 0.015337411314249039, -0.009277889505028725, -0.035249561071395874, 0.027721308171749115, 0.009149475954473019, -0.0013985054101794958, -0.0070426887832582, -0.0046710483729839325, 0.008370968513190746, -0.029503047466278076, -0.019711503759026527, 0.009358148090541363, 0.003573512425646186, -0.014478644356131554, -0.007973688654601574, 0.0056542158126831055, -0.00821045134216547, -0.02683846279978752, -0.02688661776483059, 0.012102991342544556, -0.0077529773116111755, -0.0252974983304739, -0.00943038146942854, 0.004891759250313044, -0.013924860395491123, 0.004099206067621708, -0.0047352551482617855, 0.00018534711853135377, 0.010610181838274002, -0.03086744248867035, -0.0030879483092576265, 0.0013413212727755308, 0.00385241094045341, 0.022873690351843834, 0.014414438046514988, -0.019037330523133278, 0.005433504935353994, -0.0018369178287684917, 0.0021308648865669966, -0.013507516123354435, -0.026918722316622734, -0.01874840073287487, 0.05476844310760498, -0.01609184220433235, 0.01175787951797247, -0.013282791711390018, -0.026677945628762245, 0.0067417193204164505, 0.021059846505522728, -0.009606949985027313, 0.015666471794247627, -0.010979371145367622, -0.005365285091102123, -0.0215735025703907, -0.012969783507287502, 0.00017782287613954395, 0.007319580763578415, 0.0025983708910644054, 0.013740265741944313, 0.003473189426586032, -0.002080703154206276, 0.020433830097317696, -0.005959198344498873, 0.0215735025703907, -0.0281707551330328, 0.006914275232702494, -0.0004098202916793525, 0.007387800607830286, -0.016629574820399284, 0.015505954623222351, -0.002752868691459298, 0.0007288480992428958, 0.0017987950704991817, 0.019278107210993767, 0.01942257210612297, 0.03168608248233795, -0.01426997222006321, 0.027223704382777214, 0.003671829355880618, 0.015883170068264008, 0.004026973620057106, -0.010481768287718296, -0.01593935117125511, 0.010626234114170074, 0.011268301866948605, -0.0034611504524946213, -0.02977592684328556, 0.0163566954433918, -0.0009289928711950779, -0.006444762460887432, 0.015417669899761677, -0.0002573290257714689, 0.012720982544124126, 0.001637274632230401, 0.008804364129900932, 0.00324043957516551, 0.01274506002664566, -0.001708504161797464, -0.04237652197480202, 0.020449882373213768, -0.023676276206970215, -0.004968005232512951, -0.0017997982213273644, 0.032809700816869736, 0.03553849086165428, 0.003707945579662919, 0.002463937969878316, -0.019197847694158554, -0.008266632445156574, -0.0016503167571499944, -0.001888082711957395, 0.032681286334991455, 0.0018770471215248108, -0.00026635811082087457, -0.0002658564771991223, -0.010618207976222038, -0.014599032700061798, -0.004446324426680803, 0.009446432814002037, 0.013523567467927933, -0.023547861725091934, 0.023387344554066658, 0.008940803818404675, 0.010224941186606884, 0.025955619290471077, -0.00663337018340826, 0.015979479998350143, 0.024093620479106903, -0.012391922064125538, -0.024896206334233284, 0.016613522544503212, 0.0033106657210737467, -0.0019934221636503935, -0.038074661046266556, -0.006336413323879242, 0.018636038526892662, 0.00032931091845966876, -0.0014687316725030541, 0.006384568754583597, 0.007997766137123108, 0.012720982544124126, 0.013130300678312778, 0.017961867153644562, 0.01093924231827259, 0.02242424339056015, 0.018475521355867386, 0.003089954610913992, 0.0028732565697282553, 0.004626906011253595, -0.009936010465025902, -0.003984837792813778, -0.013828550465404987, -0.0003057349531445652, -0.005634150933474302, 0.010481768287718296, 0.02272922545671463, -0.012793214991688728, -0.0030598577577620745, 0.005594021640717983, -0.007431942969560623, -0.016035661101341248, 0.002152936067432165, -0.008017830550670624, 0.009478536434471607, 0.006681525148451328, 0.015818962827324867, 0.01127632800489664, 0.01789765991270542, 0.010192837566137314, -0.008061972446739674, 0.016035661101341248, 0.01764083281159401, 0.016774039715528488, 0.017656883224844933, 0.0007408868405036628, 0.01212706882506609, 0.05778616666793823, 0.005172664299607277, -0.004855643026530743, 0.018908917903900146, 0.014534825459122658, -0.014005118981003761, 0.0012349786702543497, 0.0056823063641786575, 0.005152599886059761, 0.006107676774263382, -0.02316262200474739, -0.005509750451892614, -0.03202316537499428, -0.024848051369190216, -0.00419752299785614, 0.017608728259801865, -0.006906249560415745, 0.02051408961415291, 0.029390685260295868, 0.006107676774263382, 0.016059737652540207, -0.01916574500501156, -0.0111238369718194, -0.011661569587886333, 0.021461140364408493, -0.026693997904658318, 0.001322259777225554, -0.00888462271541357, -3.586554521461949e-05, 0.0015961421886458993, 0.026758205145597458, -0.004903797991573811, -0.024719636887311935, -0.03175028786063194, 0.02020910568535328, -0.008045921102166176, 0.006661460734903812, 0.012183249928057194, -0.028877031058073044, -0.0026244549080729485, 0.04102817922830582, 0.011701698414981365, -0.0021308648865669966, 0.038813039660453796, 0.00016352682723663747, -0.0033487884793430567, 0.008009804412722588, 0.0105379493907094, 0.0033487884793430567, 0.01715928129851818, 0.022761328145861626, -0.03454328700900078, -0.0008637827704660594, -0.014615084044635296, -0.02744842879474163, 0.01028914749622345, -0.011139888316392899, 0.03142925351858139, -0.0008667924557812512, 0.010232966393232346, 0.020786967128515244, 0.017191383987665176, -0.017656883224844933, -0.011163965798914433, 0.009903906844556332, -0.039968762546777725, 0.0038724755868315697, -0.006946378853172064, 0.01589922048151493, 0.0024438733235001564, 0.014687317423522472, -0.003904578974470496, 0.002068664412945509, 0.012022732757031918, 0.023612068966031075, -0.0005382340168580413, -0.014502722769975662, 0.025281447917222977, 0.01683824695646763, 0.010666362941265106, 0.026677945628762245, -0.0017115138471126556, 0.0031521550845354795, 0.00014408920833375305, -0.036983147263526917, -0.007167089730501175, -0.036052145063877106, -0.022456346079707146, -0.019711503759026527, 0.008206438273191452, 0.003944708500057459, 0.02088327892124653, 0.016436953097581863, -0.00486768176779151, -0.01855577901005745, 0.012504284270107746, -0.025955619290471077, -0.016364721581339836, -0.03319494053721428, 0.012632697820663452, -0.011388690210878849, -0.012271534651517868, 0.02033752016723156, 0.012303637340664864, 0.011918396688997746, -0.007985726930201054, -0.004277781583368778, -0.014984273351728916, 0.01411748118698597, 0.00020001939265057445, -0.01476757600903511, -0.00030247445101849735, 0.02260081097483635, -0.00394872110337019, -0.01751241832971573, -0.011485000140964985, 0.004590789787471294, -0.02542591281235218, 0.008740157820284367, -0.00038549190503545105, 0.0066534350626170635, 0.020177002996206284, 0.02083512209355831, -0.008908700197935104, -0.03215157985687256, 0.019406519830226898, -0.012399948202073574, -0.012199301272630692, 0.012030758894979954, -0.021637707948684692, -0.038492005318403244, -0.02070670947432518, 0.003101993352174759, -0.00891672633588314, 0.016774039715528488, -0.009390251711010933, -0.018234744668006897, 0.006183922290802002, 0.004927875939756632, 0.01485585980117321, 0.0036357128992676735, 0.010040346533060074, 0.010634259320795536, -0.0029374633450061083, 0.009494587779045105, 0.008467278443276882, -4.912701842840761e-05, 0.03062666766345501, 0.031830545514822006, 0.009462484158575535, 0.0020646515768021345, -0.03425435349345207, -0.015345437452197075, -0.028218910098075867, 0.011741828173398972, -0.004562699235975742, -0.010457690805196762, 0.013218585401773453, 0.01861998625099659, 0.00035263606696389616, -0.00626418087631464, 0.0015108674997463822, 0.015634367242455482, 0.0057585518807172775, -0.006027418188750744, -0.011236199177801609, 0.009751415811479092, -0.003816294716671109, 0.02573089487850666, -0.006874145939946175, -0.02505672350525856, -0.028941238299012184, -0.010931216180324554, -0.02003253810107708, -0.006127741187810898, 0.010224941186606884, 0.0003744563437066972, 0.003986844327300787, 7.718616689089686e-05, 0.005321142729371786, -0.03019327111542225, 0.023724431172013283, 0.041509728878736496, -0.009502613916993141, 0.005389362573623657, -0.0014988286420702934, -0.03643738850951195, 0.0029153923969715834, -0.005903017241507769, 0.018090279772877693, 0.006597253959625959, -0.0016302521107718349, 0.003248465247452259, -0.00040931865805760026, -0.019936226308345795, 0.004795449320226908, 0.0019563024397939444, 0.009358148090541363, -0.0027709268033504486, 0.023788638412952423, 0.023612068966031075, 0.0015389579348266125, -0.006946378853172064, -0.0031521550845354795, 0.011316457763314247, 0.02077091671526432, -0.010826880112290382, -0.027576841413974762, -0.02401336282491684, 0.011862215586006641, -0.03569900989532471, 0.001814846764318645, -0.02094748429954052, 0.026324808597564697, -0.008282683789730072, -0.018652090802788734, -0.03454328700900078, -0.016709832474589348, -0.015265178866684437, 0.0016824201447889209, 0.006031430792063475, -0.011212121695280075, 0.01359580084681511, 0.007869351655244827, -0.010000216774642467, 0.017014814540743828, -0.02634086087346077, 0.002644519554451108, 0.011781957000494003, -0.007126960437744856, -0.011412767693400383, 0.005866901017725468, -0.01087503507733345, -0.00430587213486433, 0.000523687107488513, -0.01905338279902935, -0.0034531247802078724, -0.008876597508788109, 0.017961867153644562, 0.007652653846889734, 0.05072341114282608, 0.024944361299276352, 0.00943038146942854, 0.003065877128392458, -0.0006606283131986856, 0.011308431625366211, -0.019502831622958183, -0.007303529419004917, -0.0252974983304739, 0.058460336178541183, 0.010176786221563816, -0.009944035671651363, -0.00799375306814909, 0.010810828767716885, -0.0034872344695031643, 0.01038545835763216, 0.015321359969675541, -0.047320447862148285, 0.027175549417734146, -0.012985835783183575, -0.012424025684595108, -0.007508188486099243, 0.004045031499117613, 0.011340535245835781, -0.013098197057843208, 0.0036858743987977505, 0.0026284679770469666, 0.005919069051742554, 0.015826988965272903, 0.0068179648369550705, -0.012849396094679832, 0.025891412049531937, 0.012183249928057194, 0.0045305960811674595, 0.02781761810183525, -0.0019322249572724104, 0.030417995527386665, -0.024173879995942116, -0.001821869402192533, 0.021348778158426285, -0.017993969842791557, 0.02211925946176052, -0.021894536912441254, 0.0008146244217641652, -0.007247348316013813, -0.005260949023067951, 0.027368169277906418, 0.01504045445472002, 0.04478427767753601, -0.013443308882415295, 0.016645625233650208, 0.0017265623901039362, 0.010554000735282898, -0.0022211556788533926, 0.008772260509431362, -0.0026385001838207245, -0.023371294140815735, -0.004043024964630604, 0.027608945965766907, 0.013218585401773453, -0.00626418087631464, -0.01672588475048542, -0.0011456910287961364, -0.003950727637857199, 0.0068420423194766045, 0.02762499824166298, -0.0036076223477721214, -0.017977917566895485, -0.01087503507733345, 0.01947072707116604, -0.003041799645870924, -0.011155940592288971, 0.01175787951797247, 0.024799896404147148, -0.014101429842412472, 0.014310101978480816, 0.02033752016723156, 0.00013769359793514013, -0.003760113613680005, -0.008475304581224918, -0.010096527636051178, -0.00670961569994688, -0.008852519094944, 0.007415891159325838, -0.018941020593047142, -0.021910587325692177, 0.016581419855356216, -0.004026973620057106, 0.022087156772613525, 0.006063534412533045, -0.0037159714847803116, 0.009879829362034798, 0.015184920281171799, 0.004137328825891018, -0.03332335501909256, 0.00542146572843194, -0.015995532274246216, 0.007612524554133415, -0.010305199772119522, -0.039358798414468765, -0.0001750639930833131, -0.034703802317380905, -0.004370078910142183, 0.01892496831715107, -0.013764343224465847, -0.012295612134039402, 0.01001626905053854, 0.0013322921004146338, 0.00037019263254478574, 0.010513871908187866, 0.014061300083994865, 0.06825188547372818, 0.004831565544009209, 0.002231188118457794, -0.0009234750759787858, -0.008659899234771729, 0.007195180281996727, -0.006099650636315346, -0.03287390619516373, 0.02610008418560028, -0.0007825209759175777, -0.0011306424858048558, -0.008182360790669918, 0.02033752016723156, 0.012014706619083881, -0.003944708500057459, 0.00833083875477314, 0.001364395604468882, -0.023050259798765182, -0.013796446844935417, -0.00309396767988801, 0.0003965274663642049, 0.014727446250617504, 0.0015178900212049484, 0.004510531201958656, 0.005874926690012217, -0.011228173039853573, -0.01075464766472578, 0.007034663110971451, 0.0034912475384771824, 0.021172208711504936, 0.018234744668006897, 0.010682414285838604, -0.01972755417227745, 0.0036357128992676735, -0.006095638033002615, 0.009061192162334919, -0.018475521355867386, -0.0018539727898314595, 0.01807422749698162, 0.013948937878012657, -0.002150929532945156, 0.019278107210993767, 0.004859656095504761, -0.004257716704159975, 0.012544413097202778, -0.019085485488176346, 0.022103209048509598, -0.010265070013701916, -0.0020295383874326944, -0.0002283606881974265, 0.0068460553884506226, -0.01881260797381401, 0.0008753199363127351, -0.01455087773501873, -0.02101169154047966, -0.016998764127492905, 0.009566821157932281, 0.003842378733679652, 0.011838138103485107, 0.01007244922220707, 0.0047232164070010185, -0.013306870125234127, -0.01093924231827259, -0.023387344554066658, 0.00600334070622921, 0.014318127185106277, 0.01020086370408535, 0.0047593326307833195, -0.004141341894865036, -0.019406519830226898, -0.004518556874245405, -0.008322812616825104, -0.007303529419004917, 0.015200971625745296, -0.01979176141321659, 0.008443200960755348, -0.017079021781682968, -0.0033768790308386087, 0.014631136320531368, -0.015377541072666645, -0.006091624964028597, -0.00137141824234277, -0.014944144524633884, -0.0003273044421803206, 0.013732240535318851, -0.01574672944843769, 0.011621439829468727, -0.004107231739908457, -0.02523329295217991, 0.013178455643355846, 0.013611852191388607, -0.015754755586385727, 0.010826880112290382, 0.00604748260229826, 0.003507299115881324, -0.010240992531180382, 0.01855577901005745, -0.02475174143910408, 0.0026244549080729485, 0.01187826693058014, -0.0003847394837066531, -0.00800579134374857, 0.005441530607640743, -0.004065096378326416, 0.029117805883288383, -0.007716860622167587, 0.013732240535318851, -0.027608945965766907, -0.0010102546075358987, 0.020995639264583588, 4.1163864807458594e-05, -0.006850068457424641, -0.00626418087631464, -0.0014386347029358149, -0.03138109669089317, -0.008772260509431362, 0.002869243733584881, 0.008643846958875656, 0.002435847418382764, -0.012488231994211674, 0.0066133057698607445, 0.016188152134418488, -0.022921845316886902, -0.00028792759985662997, -0.005000108387321234, -0.023563914000988007, 0.012536387890577316, -0.0140853775665164, 0.012448103167116642, 0.011565258726477623, 0.001554006477817893, -0.003455131081864238, -0.00022447317314799875, 0.0067056030966341496, -0.010682414285838604, -0.013338972814381123, 0.0028150691650807858, 0.016645625233650208, -0.029743824154138565, 0.0015901228180155158, -0.014566929079592228, -0.03093164972960949, -0.0046710483729839325, -0.0044784280471503735, -0.010698466561734676, 0.02162165753543377, 0.001244007726199925, 0.004779397509992123, 0.006697576958686113, 0.00022434776474256068, 0.009679182432591915, -0.012391922064125538, 0.005248909816145897, 0.023981258273124695, 0.0034792087972164154, -0.003212349023669958, 0.005790655501186848, 0.021043796092271805, -0.022392138838768005, -0.018828658387064934, -0.0009144460200332105, -0.013627903535962105, -0.014904014766216278, -0.006942365784198046, 0.001049380749464035, 0.01714322902262211, 0.005148586817085743, 0.003027754370123148, 0.01035335473716259, 0.016757987439632416, 0.017961867153644562, -0.003342769108712673, -0.0034772022627294064, -0.00424166489392519, 0.01142881903797388, 0.024960413575172424, 0.004887746647000313, 0.003274549264460802, 0.023323139175772667, 0.010369406081736088, -0.0076285763643682, -0.023387344554066658, 0.013130300678312778, 0.008078024722635746, -0.013499489985406399, -0.012488231994211674, 0.0199041236191988, -0.012793214991688728, 0.0007920516654849052, 0.0007318577845580876, 0.004406195133924484, -0.01783345267176628, 0.0023395370226353407, 0.014912040904164314, -0.0013944925740361214, 0.006553111597895622, -0.009446432814002037, 0.0015269191935658455, -0.01252836175262928, 0.004466388840228319, -0.003655777545645833, 0.014109455049037933, 0.003342769108712673, 0.014534825459122658, 0.002124845515936613, -0.011188043281435966, 0.011621439829468727, -0.0034009565133601427, -0.011188043281435966, -0.005774603690952063, -0.05011344701051712, -0.013740265741944313, 0.01751241832971573, -0.022697120904922485, -0.015818962827324867, -0.010594130493700504, -0.007528253365308046, 0.019085485488176346, 0.0010644291760399938, 0.001016274094581604, 0.005469621159136295, -0.0037962300702929497, 0.030289581045508385, 0.007255373988300562, 0.0056060608476400375, -0.024799896404147148, 0.005890978500247002, 0.012295612134039402, -0.002845166018232703, 0.012327714823186398, -0.012552439235150814, -0.01013665646314621, -0.01918179728090763, 0.006982495076954365, 0.017608728259801865, 0.0007704821764491498, 0.0035855513997375965, 0.022697120904922485, -0.007030650041997433, -0.02216741442680359, -0.008110127411782742, 0.004538621753454208, 0.00405105110257864, -0.0017115138471126556, 0.012199301272630692, 0.01874840073287487, 0.006468840409070253, 0.010891087353229523, 0.0023174660746008158, -2.4610535547253676e-05, -0.004105225671082735, 0.0031762325670570135, -0.032135527580976486, -0.010056397877633572, 0.014021171256899834, -0.0005703374044969678, -0.024783844128251076, -0.003041799645870924, -0.018427366390824318, -0.0076887705363333225, 0.02370837889611721, -0.0014958189567551017, 0.0008602714515291154, 0.006107676774263382, 0.006825990974903107, 0.007122947368770838, -0.00163928116671741, 0.0013724213931709528, 0.004984056577086449, 0.006978482007980347, 0.015281230211257935, -0.0011978590628132224, 0.022889742627739906, 0.004121277015656233, 0.009623001329600811, 0.021108001470565796, 0.015048480592668056, 0.0023555888328701258, -0.002883288776502013, -0.003655777545645833, -0.03358018398284912, -0.010955293662846088, 0.0158590916544199, 0.00020227665663696826, -0.022327931597828865, -0.0011165972100570798, 0.008467278443276882, 0.016412876546382904, 0.010056397877633572, 0.002056625671684742, -0.0019111570436507463, -0.009157502092421055, -0.008226502686738968, -0.005224832333624363, 0.012704930268228054, 0.00752022722736001, -0.004161406308412552, -0.017046919092535973, 0.007122947368770838, 0.003116038627922535, -0.003539402736350894, -0.002037564292550087, 0.034639596939086914, 0.01589922048151493, -0.006300297100096941, -0.035313766449689865, 0.016148023307323456, 0.013828550465404987, -0.010489794425666332, -0.005349233280867338, -0.0035694995895028114, -0.007612524554133415, 0.029358582571148872, 0.006212012842297554, -0.0007398836314678192, -0.014679291285574436, -0.018732348456978798, -0.005959198344498873, 0.002150929532945156, -0.007311555091291666, -0.002108793705701828, 0.0026385001838207245, -0.012488231994211674, 0.013435283675789833, -0.019695451483130455, -0.012207327410578728, 0.01898917555809021, -0.002160961739718914, -0.009478536434471607, -0.030899547040462494, 0.012472180649638176, 0.0015479869907721877, -0.027287911623716354, -0.002604390261694789, -0.015513979829847813, -0.011958525516092777, -0.012704930268228054, -0.006316348910331726, 0.00848332978785038, 0.028716513887047768, -0.006027418188750744, -0.009510640054941177, -0.02897334098815918, -0.005148586817085743, -0.011388690210878849, 0.008354916237294674, -0.00046499804011546075, -0.0007143011898733675, -0.012488231994211674, -0.01010455284267664, 0.016067763790488243, 0.013716188259422779, -0.003930663224309683, 0.009165528230369091, 0.013306870125234127, 0.009807595983147621, -0.012953732162714005, 0.028443634510040283, -0.00401894748210907, -0.018170539289712906, -0.00010653070057742298, 0.013563697226345539, 0.0128975510597229, -0.02142903581261635, 0.010642285458743572, -0.022408191114664078, -0.013884731568396091, 0.0019492798019200563, -0.008198412135243416, 0.010361380875110626, 0.0033849049359560013, 0.011452896520495415, -0.009173553436994553, 0.006260167807340622, 0.00041207755566574633, -0.003011702559888363, -0.00973536353558302, 0.0010574065381661057, -4.467517646844499e-05, -0.01246415451169014, 0.015602264553308487, 0.02382074110209942, -0.0033869114704430103, -0.023419449105858803, 0.015883170068264008, 0.00042637361912056804, 0.004325936548411846, 0.008724105544388294, 0.003549434943124652, -0.0014777608448639512, 0.014904014766216278, 0.004201535601168871, 0.008820416405797005, 0.0026003774255514145, 0.004650983493775129, -0.014237869530916214, 0.010112578980624676, -0.02120431326329708, 0.00961497612297535, 0.01069044042378664, 0.024334397166967392, 0.0199041236191988, 0.01482375618070364, 0.005309103988111019, 0.01683824695646763, -0.020722761750221252, -0.00391059834510088, -0.014847834594547749, 0.0056943451054394245, 0.006930327042937279, 0.0019131634617224336, 0.0010774711845442653, -0.009759441018104553, -0.001480770530179143, 0.010666362941265106, 0.026308756321668625, -0.0020174996461719275, 0.002319472376257181, 0.01579488441348076, 0.010305199772119522, -0.009462484158575535, 0.008314787410199642, -0.014390360563993454, -0.01314635295420885, -0.014839808456599712, 0.015168868005275726, 0.01740005612373352, -0.001338311587460339, -0.01807422749698162, -0.0023896987549960613, 0.015578187070786953, -0.013973015360534191, 0.0170308668166399, -0.023868896067142487, 0.01874840073287487, 0.017175331711769104, -0.015538058243691921, -0.02014489844441414, 0.0024137762375175953, 0.002973579801619053, -0.013130300678312778, -0.01601158268749714, 0.01583501510322094, 0.00044744147453457117, -0.012367844581604004, 0.008499382063746452, 0.009221709333360195, 0.018973125144839287, 0.004550660494714975, -0.0032685298938304186, 0.006336413323879242, 0.005136548075824976, 0.02744842879474163, 0.007215244695544243, -0.003750081406906247, 0.027528686448931694, -0.0010654324432834983, -0.00802585668861866, -0.014245894737541676, -0.013660007156431675, -0.018668141216039658, 0.007624563295394182, 0.0076727187260985374, -0.011147914454340935, 0.009374200366437435, 0.007985726930201054, -0.00479143625125289, -0.006456801202148199, -0.014310101978480816, -0.0028230948373675346, 0.008346890099346638, 0.009751415811479092, -0.021284570917487144, -0.00811414048075676, -0.01084293145686388, -0.005196741782128811, -0.010979371145367622, 0.008427148684859276, 0.010529923252761364, 0.001802808023057878, -0.0029093727935105562, -0.004325936548411846, 0.012472180649638176, -0.010834906250238419, 0.005100431852042675, -0.017111126333475113, 0.004679074045270681, 0.011501052416861057, 0.00018334065680392087, 0.020433830097317696, -0.007054727524518967, -0.019711503759026527, -0.005726448260247707, 0.0014576961984857917, 0.003525357460603118, 0.0046590096317231655, -0.0014416443882510066, 0.007359710056334734, -0.001428602379746735, 0.014398385770618916, -0.017384003847837448, -0.0068179648369550705, 0.00792954582720995, 0.01744821108877659, 0.005397388245910406, 0.017175331711769104, -0.025008568540215492, 0.008836467750370502, 0.015433721244335175, -0.0068300035782158375, 0.015168868005275726, 0.012672826647758484, -0.012520335614681244, 0.008218476548790932, -0.010192837566137314, 0.0010574065381661057, 0.01445456687361002, -0.02860415168106556, -0.007331619504839182, -0.013427257537841797, 0.0015700581716373563, 0.004037005826830864, -0.006585215218365192, -0.0005577970296144485, 0.008964881300926208, 0.020449882373213768, 0.01277716364711523, -0.021284570917487144, 0.0035313768312335014, -0.010730570182204247, 0.008226502686738968, 0.01696665957570076, 0.002632480813190341, 0.007171102799475193, -0.012616646476089954, 0.014992299489676952, -0.016806142404675484, -0.020594347268342972, 0.0016804136103019118, 0.001019785413518548, 0.0009836689569056034, -0.01430207584053278, 0.013828550465404987, 0.013868679292500019, -0.013668033294379711, -0.0005949165788479149, 0.0016633587656542659, 0.003509305650368333, 0.005778616759926081, -0.0018900891300290823, 0.019213899970054626, -0.0014245895436033607, -0.020562244579195976, 0.007415891159325838, -0.012143120169639587, -0.008306761272251606, 0.011485000140964985, -0.00464295782148838, 0.0007674724911339581, 0.0015810936456546187, 0.008338864892721176, 0.007355697453022003, 0.0007489126874133945, -0.014422464184463024, 0.0024298280477523804, -0.01445456687361002, -0.0291659627109766, -0.014093403704464436, -0.02518513798713684, 0.019149692729115486, -0.0017406075494363904, 0.023596016690135002, 0.014751523733139038, -0.0026023839600384235, -0.013956964015960693, -0.00696644326671958, 0.003459144150838256, -0.0019934221636503935, -0.0009189605480059981, 0.006958417594432831, -3.069263038923964e-05, -0.005012147128582001, -0.022135311737656593, -0.008242554031312466, 0.017480315640568733, 0.02181427739560604, -0.006862107198685408, -0.016035661101341248, 0.005979262758046389, 0.0006586218369193375, 0.013796446844935417, -0.028700461611151695, -0.0015148803358897567, -0.007046701852232218, 0.004719203338027, -0.000460232695331797, 0.013322921469807625, 0.027464481070637703, 0.002959534525871277, 0.02253660373389721, -0.01605171337723732, 0.011589336208999157, -0.01109173335134983, 0.012440077029168606, 0.018491573631763458, 0.013892757706344128, 0.031268734484910965, 0.002542190020903945, -0.006256155204027891, 0.0023134530056267977, -0.032199736684560776, -0.006175896618515253, 0.01905338279902935, -0.025377757847309113, 0.013523567467927933, 0.0005482662818394601, -0.003011702559888363, 0.00851543340831995, -0.0002368881687289104, -0.010024294257164001, -0.015513979829847813, -0.0011777944164350629, 0.003158174455165863, -0.020305415615439415, 0.003774158889427781, -0.0021810263860970736, -0.00086127471877262, -0.019197847694158554, 0.002921411767601967, 0.0007077801856212318, -0.011653543449938297, -0.0018680180655792356, -0.02131667360663414, 0.004638944752514362, -0.004988069646060467, -0.008182360790669918, 0.007480097934603691, 0.010706492699682713, 0.03842779994010925, -0.023323139175772667, 0.001222939812578261, -0.024639379233121872, 0.014831782318651676, 0.009269864298403263, 0.011541181243956089, -0.01801002211868763, -0.0031240645330399275, -0.0019703477155417204, 0.007692783139646053, -0.008643846958875656, -0.035987939685583115, 0.0017827433766797185, -0.008860545232892036, 0.017801349982619286, -0.000560305081307888, 0.0048235394060611725, -0.022408191114664078, -0.004281794186681509, 0.004955966491252184, 0.011597362346947193, -0.015730679035186768, -0.006071560084819794, -0.0024438733235001564, -0.008996984921395779, -0.0029896313790231943, -0.01102752611041069, 0.02218346670269966, 0.01611591875553131, 0.015241101384162903, -0.006007353309541941, 0.005333181470632553, 0.005272987764328718, -0.004891759250313044, -0.0020646515768021345, -5.57107305212412e-05, -0.013860654085874557, 0.010465716943144798, -0.004947940353304148, -0.012448103167116642, -0.008900674991309643, -0.000990190077573061, 0.012215353548526764, 0.014607058838009834, -0.022632915526628494, -1.2407158465066459e-05, 0.0027307975105941296, 0.01807422749698162, -0.02120431326329708, -0.0011446877615526319, -0.012359818443655968, -0.03252077102661133, -0.008274657651782036, -0.018058177083730698, 0.0011547200847417116, 0.0017897658981382847, 0.0027488558553159237, -0.004209561739116907, 0.016741937026381493, -0.003842378733679652, 0.020481985062360764, -0.011950500309467316, -0.016870349645614624, 0.004293832927942276, -0.024398602545261383, -0.02614823915064335, -0.019952278584241867, 0.03971193730831146, -0.013940912671387196, -0.002843159483745694, -0.007327606901526451, -0.0055900090374052525, 0.014029196463525295, -0.022953949868679047, 0.018475521355867386, -0.011733802035450935, 0.0004983555409125984, 0.006107676774263382, 0.010738595388829708, -0.011348560452461243, -0.00034586424590088427, 0.015979479998350143, 0.012383895926177502, 0.005750526208430529, 0.0008998991106636822, -0.0016262391582131386, 0.013635929673910141, 0.0005297065363265574, 0.01622828096151352, -0.00021368842863012105, 0.0022251687478274107, 0.0019894090946763754, 0.0007408868405036628, 0.0009395268280059099, 0.018042124807834625, 0.014558902941644192, -0.007223270833492279, -0.010642285458743572, -0.015674497932195663, -0.006051495671272278, -0.009197630919516087, -0.012086939997971058, -0.00578664243221283, -0.004855643026530743, -0.0008397052297368646, 0.02142903581261635, 0.003067883662879467, 0.007114921696484089, 0.01093924231827259, -0.008403071202337742, -0.0007734919199720025, -0.004153380636125803, -0.0046830871142446995, 0.005927094724029303, 0.018491573631763458, 0.014863885939121246, 0.007761002983897924, 0.005076353903859854, 0.0128975510597229, 0.004980043973773718, -0.014165636152029037, 0.015337411314249039, 0.021717967465519905, 0.007676731329411268, 0.031027959659695625, 0.008772260509431362, -0.010867009870707989, 0.005349233280867338, -0.0016954621532931924, -0.007861326448619366, 0.008057959377765656, 0.005064315162599087, -0.014069326221942902, 0.011139888316392899, -0.005738487467169762, -0.005305090919137001, 0.0022352009546011686, 0.012825318612158298, -0.003924643620848656, 0.010594130493700504, 0.013660007156431675, -0.00821045134216547, 3.884388934238814e-05, -0.012255482375621796, 0.0078854039311409, -0.015522005967795849, 0.00232147891074419, 0.005337194539606571, 0.002592351520434022, -0.01093924231827259, 0.018475521355867386, 0.01972755417227745, -0.008354916237294674, 0.007195180281996727, 0.009598923847079277, 0.015000325627624989, -0.00019525403331499547, -0.007921520620584488, -0.0057063838467001915, -0.023114467039704323, -0.0056782932952046394, 0.004562699235975742, -0.009791544638574123, 0.013956964015960693, 0.00377616542391479, -0.026421118527650833, 0.02229582890868187, 0.004333962220698595, 0.01722348853945732, -0.01311424933373928, -0.0027368171140551567, 0.014374308288097382, 0.010738595388829708, 0.004442311357706785, 0.004980043973773718, -0.007102882955223322, 0.03756100684404373, -0.05155809968709946, -0.006761783733963966, 0.00670961569994688, 0.007163076661527157, -0.011765905655920506, 0.0066534350626170635, 0.008724105544388294, 0.008756209164857864, -0.013884731568396091, -0.00453460868448019, 0.0018900891300290823, 0.020064640790224075, -0.00800579134374857, -0.01683824695646763, -0.015513979829847813, -0.012424025684595108, -0.01359580084681511, 0.001821869402192533, -0.008049934171140194, 0.00707479240372777, 0.013908809050917625, -0.019262054935097694, -0.014727446250617504, -0.017432160675525665, 0.0035052928142249584, -0.013282791711390018, 0.0030197284650057554, -0.021766122430562973, 0.010449664667248726, -0.0016864330973476171, -0.0024278215132653713, -0.014687317423522472, -0.009309993125498295, -0.0014035216299816966, -0.01918179728090763, -0.011597362346947193, -0.006581202149391174, 0.008619769476354122, 0.006023405119776726, -0.006280232686549425, -0.0009691221639513969, -0.003778171958401799, 0.01844341866672039, -0.012263508513569832, 0.013274766504764557, -0.0003704434202518314, 0.01642090268433094, 0.0002648532681632787, 9.693729225546122e-05, -0.04699941352009773, -0.014245894737541676, 0.0028130626305937767, 8.972656360128894e-05, 0.013387128710746765, 0.004032992757856846, 0.005722435656934977, -0.005991301499307156, 0.01740005612373352, -0.002191058825701475, 0.02236003614962101, 0.007456020452082157, 0.026758205145597458, 0.00988785456866026, 0.0023997309617698193, -0.009205657057464123, -0.008266632445156574, 0.013218585401773453, -0.005381336435675621, 0.02255265600979328, 0.000746404635719955, -0.013668033294379711, -0.003986844327300787, -0.00607958622276783, -0.005317129660397768, 0.012696905061602592, -0.01818658970296383, -0.0024197956081479788, -0.014310101978480816, -0.0024197956081479788, 0.015305307693779469, 0.006733693648129702, -0.017303746193647385, 0.00026334839640185237, -0.0005748519324697554, -0.0010915164602920413, 0.00670961569994688, 0.0013092177687212825, 0.0068059260956943035, -0.004526583012193441, 0.019149692729115486, -0.007187154144048691, -0.004004902206361294, -0.010393483564257622, -0.007363723125308752, -0.01666167750954628, 0.005044250749051571, -0.0006114699062891304, -0.0003812281647697091, 0.01911759003996849, -0.011284354142844677, -0.006761783733963966, -0.024414654821157455, 0.01418168842792511, -0.009510640054941177, -0.001980380155146122, -0.018700245767831802, -0.010995423421263695, 9.223464439855888e-05, 0.00663337018340826, -0.002035557758063078, 0.012440077029168606, 0.003912604879587889, -0.020963536575436592, 0.01510466169565916, -0.017961867153644562, -0.01227955985814333, -0.01788160763680935, 0.004518556874245405, 0.006087611895054579, -0.00405707024037838, -0.00715103792026639, 0.01109173335134983, 0.0027709268033504486, 0.008021843619644642, 0.024366499856114388, -0.0028592112939804792, -0.009446432814002037, -0.028315221890807152, 0.0068701328709721565, -0.02088327892124653, 0.01311424933373928, 0.0025241319090127945, 0.0012078913860023022, -0.007632589433342218, -0.0023676275741308928, -0.001388473086990416, -0.01683824695646763, 0.021284570917487144, -0.011870241723954678, 0.006240103393793106, 0.018636038526892662, 0.01850762404501438, -0.0012751079630106688, -0.006982495076954365, 0.004161406308412552, 0.013732240535318851, 0.015843041241168976, -0.03695104271173477, -0.0075964732095599174, -0.011236199177801609, 0.0044904667884111404, -0.024767791852355003, -0.015337411314249039, -0.006075573153793812, -0.00430587213486433, -0.004663022700697184, -1.9241676909587113e-06, 0.001914166728965938, -0.029198065400123596, -0.023868896067142487, 2.3685681298957206e-05, -0.02229582890868187, -0.008411097340285778, -0.00021042792650405318, -0.008411097340285778, 0.005951172672212124, 0.013651981949806213, -0.009149475954473019, 0.024045465514063835, -0.00836294237524271, -0.0034631569869816303, -0.00377616542391479, 0.015048480592668056, -0.009269864298403263, 0.002473970176652074, -0.006813951767981052, 0.0020536158699542284, -0.005244897212833166, -0.0016954621532931924, 0.02853994444012642, -0.003721990855410695, -0.002608403330668807, 0.0007042688666842878, 0.012303637340664864, -0.008900674991309643, 0.004101212602108717, -0.020449882373213768, 0.00012383644934743643, -0.0003571505949366838, 0.0028893083799630404, 0.00453460868448019, -0.016677729785442352, -0.018427366390824318, 0.010979371145367622, -0.02621244639158249, 0.018298951908946037, -0.023387344554066658, 0.0087642353028059, -0.01642090268433094, 0.0035052928142249584, 0.014863885939121246, 0.001658342545852065, 0.024286240339279175, 0.0140853775665164, -0.03221578896045685, 0.018154487013816833, -0.00516062555834651, -0.025987721979618073, 0.004047038033604622, -0.007399839349091053, -0.011476974934339523, 0.02738422155380249, -0.009334070608019829, 0.0058227586559951305, -0.004301859065890312, 0.00438211765140295, 0.012656775303184986, -0.02216741442680359, -0.004687100183218718, -0.027095291763544083, -0.03390121832489967, 0.018475521355867386, -0.005060302559286356, 0.02255265600979328, 0.014968222007155418, -0.010770699009299278, 0.02046593278646469, -0.01942257210612297, -0.019278107210993767, -0.006175896618515253, 0.005144573748111725, -0.002437853952869773, -0.006874145939946175, -0.010401509702205658, -0.0012971790274605155, -0.0077369255013763905, -0.006761783733963966, -0.004117264412343502, -0.0030859417747706175, -5.288913962431252e-05, 0.0011105778394266963, -0.001525915926322341, 0.0014115474186837673, -0.009903906844556332, 0.005766577553004026, 0.02187848463654518, 0.010056397877633572, 0.010545975528657436, -0.0010624227579683065, -0.006825990974903107, 0.009647078812122345, -0.01918179728090763, 0.007925532758235931, -0.007829222828149796, -0.014912040904164314, -0.0014948156895115972, -0.008972907438874245, 0.015947377309203148, -0.00810210220515728, 0.007383788004517555, 0.017688987776637077, 0.032617080956697464, -0.008427148684859276, 0.009911932982504368, -0.001945266965776682, 0.0027207653038203716, -0.019037330523133278, 0.01292965468019247, 0.00453460868448019, 0.002433840883895755, 0.044078003615140915, -0.01227955985814333, 2.6609161523083458e-06, -0.009125398471951485, -0.0020887290593236685, -0.03319494053721428, 0.004217587411403656, -0.0067938873544335365, 0.03256892412900925, 0.013194507919251919, -0.00016703813162166625, 0.010224941186606884, 0.006629357114434242, 0.0008191389497369528, -0.004903797991573811, 0.01414958480745554, 0.010810828767716885, -0.0046830871142446995, 0.01844341866672039, -0.01898917555809021, -0.0023555888328701258, 0.018266849219799042, -0.00424166489392519, 0.016099868342280388, 0.008804364129900932, -0.02155745029449463, -0.004370078910142183, -0.007203205954283476, 0.005826771724969149, 0.0012871467042714357, 0.013218585401773453, -0.004301859065890312, 0.0077369255013763905, -0.007756989914923906, -0.02138088084757328, -0.005497711710631847, -0.006095638033002615, 0.0022211556788533926, 0.018973125144839287, 0.008162295445799828, 0.005461595021188259, 0.012672826647758484, -0.03093164972960949, 0.001800801488570869, -0.011717749759554863, -0.0033708596602082253, -0.007484111003577709, 0.028154704719781876, 0.004498492460697889, 0.022376086562871933, -0.008619769476354122, -0.0009997207671403885, 0.01157328486442566, -0.008812390267848969, -0.00020578797557391226, 0.008370968513190746, -0.0005658228765241802, 0.006488904822617769, 0.004474414978176355, -0.012391922064125538, -0.016308540478348732, 0.03186265006661415, 0.013868679292500019, -0.008322812616825104, 0.008306761272251606, 0.002395718125626445, 0.0029274311382323503, 0.01659747026860714, 0.010032320395112038, -0.018395261839032173, 0.030177218839526176, -0.007263400126248598, -0.0046830871142446995, 0.011814060620963573, 0.008844493888318539, 0.009149475954473019, -0.01801002211868763, 0.014976248145103455, 0.00011367873230483383, -0.008980933576822281, 0.00278095924295485, -0.0005161628942005336, 0.02205505222082138, 0.009703259915113449, -7.927884325908963e-06, 0.015730679035186768, -0.0030698899645358324, -0.013924860395491123, 0.017014814540743828, -0.009711286053061485, -0.002473970176652074, -0.0013353017857298255, -0.0038584303110837936, 0.007283464539796114, 0.01759267784655094, -0.03325914964079857, -0.013892757706344128, 0.00430587213486433, 0.007251361384987831, -0.0199041236191988, -0.014759549871087074, -0.020626449957489967, 0.002582319313660264, 0.008659899234771729, -0.027336066588759422, -0.00839504599571228, -0.03499273210763931, -0.02438255213201046, -0.011019500903785229, 0.020995639264583588, 0.011749853380024433, 0.018491573631763458, -0.0016814168775454164, -0.008924752473831177, -0.01605171337723732, -0.02431834489107132, 0.018026072531938553, 0.01605171337723732, -0.02046593278646469, 0.001023296732455492, -0.011589336208999157, -0.004358040168881416, 0.0029535151552408934, -0.0022994077298790216, -0.032745495438575745, -0.01918179728090763, 0.02964751236140728, 0.0001613949571037665, 0.0011777944164350629, 0.006661460734903812, -0.00894882995635271, 0.0038243206217885017, 0.016709832474589348, 0.003864449914544821, -0.0007669709157198668, -0.00976746715605259, -0.004598815459758043, -0.024334397166967392, 0.0038183010183274746, -0.002203097566962242, -0.005838810466229916, 0.009679182432591915, -0.0016683748690411448, 0.01271295640617609, 0.008130192756652832, 0.0029254246037453413, 0.006749744992703199, -0.01323463674634695, 0.0069865076802670956, 0.01881260797381401, -0.008820416405797005, 0.01831500418484211, 0.006015379447489977, -0.0008527472382411361, 0.001080480869859457, -0.005389362573623657, 0.01720743626356125, -0.006292271427810192, -0.009486562572419643, -0.028507841750979424, 0.0027990173548460007, 0.0019964317325502634, -0.005212793592363596, 0.00043740918044932187, 0.004992082715034485, -0.0058227586559951305, -0.008587665855884552, -0.002544196555390954, 0.014871912077069283, -0.005646189674735069, 0.009679182432591915, 0.01160538848489523, 0.018282901495695114, -0.00471519073471427, -0.015570160932838917, -0.002369634108617902, -0.009029088541865349, -0.012600594200193882, 0.0045827641151845455, 0.018491573631763458, -0.006464827340096235, 0.028154704719781876, -0.015505954623222351, 0.002307433634996414, 0.003950727637857199, -0.0009600930497981608, -0.005762564949691296, -0.011171991936862469, 0.0012098978040739894, 0.0016643619164824486, -0.005762564949691296, -0.0017516431398689747, 0.0411565899848938, 0.006685538217425346, -0.003457137616351247, -0.0033989502117037773, -0.0016001551412045956, -0.008860545232892036, 0.018716296181082726, 0.013330947607755661, 0.06260167807340622, -0.011653543449938297, 0.014446541666984558, -0.007010585628449917, 0.011902345344424248, 0.010208888910710812, -0.0018650083802640438, 0.008451227098703384, -0.0018068208592012525, 0.03569900989532471, -0.000247923715505749, -0.012078913860023022, 0.02488015405833721, 0.005341207142919302, -0.009005011059343815, -0.009751415811479092, 0.007652653846889734, 0.02223162166774273, -0.004972017835825682, -0.007118934765458107, -0.00586288794875145, 0.0029495020862668753, 0.004028979688882828, -0.010096527636051178, -0.022745275869965553, 0.002566267503425479, 0.003774158889427781, 0.009366174228489399, 0.0007017608149908483, -0.035570595413446426, 0.027849720790982246, -0.0002977091062348336, 0.0023114467039704323, 0.01624433323740959, -0.013210559263825417, 0.007608511950820684, 2.4924045646912418e-05, 0.026565583422780037, 0.004394156392663717, 7.818939775461331e-05, -0.021091951057314873, 0.001265075639821589, 0.0011577297700569034, 0.019888071343302727, 0.0023034207988530397, -0.0045827641151845455, 0.01001626905053854, 0.0005266967928037047, -0.008635821752250195, -0.013940912671387196, 0.014125507324934006, 0.002831120742484927, 0.0032825751695781946, -0.008603718131780624, 0.029085703194141388, -0.00479143625125289, -0.023178672417998314, -0.020498037338256836, 0.011661569587886333, 0.016067763790488243, -0.02677425742149353, -0.027962082996964455, 0.0006837026448920369, -0.00172254943754524, -0.023018155246973038, 0.005048263818025589, -0.04112448915839195, 0.005911043379455805, -0.005838810466229916, -0.01047374214977026, -0.02346760407090187, -0.00022397155407816172, 0.003222381230443716, 0.0033507950138300657, 0.015578187070786953, 0.011043578386306763, 0.023435499519109726, 0.01197457779198885, -0.011485000140964985, -0.01916574500501156, 0.0020867225248366594, -0.009205657057464123, -0.01683824695646763, -0.012761111371219158, -0.004626906011253595, -0.00891672633588314, 0.0077650160528719425, -0.005754538811743259, -0.02284158766269684, -0.003264517057687044, 0.0015409643528982997, 0.0023917052894830704, -0.015385566279292107, -0.01237587071955204, 0.021027743816375732, -0.00839504599571228, -0.010899112559854984, 0.02223162166774273, 0.006320361979305744, -0.007456020452082157, -0.021669812500476837, 0.02027331292629242, -0.013162404298782349, 0.0020506063010543585, 0.013001887127757072, -0.001985396258533001, -0.005702370777726173, -0.017046919092535973, -0.0030337737407535315, -0.005188716109842062, -0.001852969522587955, 0.005634150933474302, 0.016757987439632416, -0.0012219366617500782, -0.005838810466229916, 0.0024438733235001564, -0.00031727211899124086, 0.013218585401773453, 0.016043687239289284, 0.009438406676054, 0.0011456910287961364, 0.002632480813190341, -0.006569163408130407, -0.0016683748690411448, 0.0010443645296618342, 0.008836467750370502, -0.014607058838009834, 0.016501160338521004, -0.0018018047558143735, 0.024334397166967392, -0.012576516717672348, -0.018764451146125793, 0.024976463988423347, -0.007086831144988537, -0.015979479998350143, -0.00018936004198621958, -0.003800242906436324, 0.003954740706831217, -0.0068701328709721565, -0.0028230948373675346, 0.00811414048075676, 0.004518556874245405, 0.01374829187989235, 0.012367844581604004, -0.0004512036102823913, -0.0014426476554945111, -0.005874926690012217, 0.030417995527386665, -0.017367953434586525, 0.02370837889611721, 0.008643846958875656, 0.009518665261566639, -0.00648087915033102, -0.02775341086089611, -0.008619769476354122, -0.011565258726477623, 0.039968762546777725, 0.01607578992843628, -0.002030541654676199, 0.003984837792813778, -0.0046710483729839325, -0.017496366053819656, 0.010128630325198174, -0.0001948778226505965, -0.0010273095685988665, 0.005541853606700897, 0.0009791544871404767, 0.00385241094045341, 0.0009937012800946832, -0.015802910551428795, 0.001284137018956244, -0.004093186929821968, 0.020594347268342972, -0.01589922048151493, 0.005136548075824976, -0.007026636973023415, 0.012046810239553452, 0.002528144745156169, 0.006597253959625959, 0.01789765991270542, 0.010610181838274002, -0.011220146901905537, -0.0011948493774980307, 0.0014576961984857917, 0.01060215663164854, 0.01831500418484211, -0.010240992531180382, -0.007439968641847372, 0.020851174369454384, 0.01078675128519535, 0.0029153923969715834, -0.005329168401658535, 0.011765905655920506, -0.0066534350626170635, -0.008740157820284367, -0.011541181243956089, 0.001421579741872847, -0.0012530367821455002, 0.013274766504764557, -0.010682414285838604, 0.019101537764072418, -0.02218346670269966, 0.007933558896183968, 0.021027743816375732],
-    },
-    {
-        "crl_id": "NDA215244_20250515_bd8cc4",
-        "company": "Stealth BioTherapeutics Inc.",
-        "app_number": "NDA 215244",
-        "date": "2025-05-15",
-        "text_preview": 'i Lk YN U.S. FOOD & DRUG\n\nADMINISTRATION\n\nNDA 215244\nCOMPLETE RESPONSE\n\nStealth BioTherapeutics Inc.\nAttention: Jim Carr\n\nChief Clinical Development Officer\n123 Highland Avenue, Suite 201\nNeedham, MA ',
-        "embedding": [0.006535165011882782, 0.006062611006200314, 0.01686541549861431, 0.041936419904232025, -0.048969779163599014, 0.02466072328388691, 0.005557088181376457, 0.021700851619243622, 0.04173127934336662, -0.025232184678316116, 0.027254275977611542, -0.05913884937763214, -0.0395626574754715, 0.019415007904171944, -0.018154865130782127, -0.03900584951043129, 0.030712345615029335, -0.0027547331992536783, 0.0019030371913686395, 0.020308831706643105, 0.05357076972723007, 0.02149571105837822, -0.020132998004555702, -0.015268255956470966, -0.015663882717490196, -0.045042820274829865, -0.012828558683395386, -0.07074389606714249, 0.037716399878263474, -0.004095467738807201, 0.030858874320983887, -0.021188002079725266, -0.014579572714865208, 0.015458742156624794, -0.037218205630779266, 0.015663882717490196, 0.019766677170991898, -0.008623193949460983, -0.03247068449854851, -0.006590113043785095, -0.0020001120865345, -0.03097609616816044, 0.037950847297906876, 0.030712345615029335, -0.010440145619213581, 0.0011273525888100266, -0.004894047509878874, -0.057908009737730026, 0.01557596493512392, -0.02463141828775406, -0.005494813900440931, 0.05371730029582977, -0.03267582505941391, 0.06851666420698166, -0.021964602172374725, -0.012513522058725357, 0.004974638111889362, 0.020367443561553955, -0.02781108394265175, 0.0398850217461586, -0.013026371598243713, -0.036983758211135864, 0.053981050848960876, -0.0802975445985794, -0.0712713971734047, -0.034815140068531036, -0.03264651820063591, 0.031503599137067795, 0.0318845734000206, -0.01548804808408022, -0.03112262487411499, 0.001987291034311056, 0.013868909329175949, -0.006956434343010187, -0.031620822846889496, 0.0011566582834348083, 0.0019323427695780993, 0.02952546626329422, 0.024265097454190254, -0.0023481170646846294, -0.06476553529500961, 0.007773329969495535, -0.021012168377637863, 0.0016090646386146545, 0.0016173068434000015, -0.0025642463006079197, -0.016249995678663254, -0.01660166308283806, -0.059285376220941544, -0.06036968529224396, -0.04155544564127922, 0.007582842838019133, -0.07924254238605499, 0.08170421421527863, -0.0011740585323423147, 0.012909148819744587, -0.003915970679372549, -0.0006607513641938567, -0.0317087396979332, 0.03651486709713936, -0.003196150064468384, -0.009282572194933891, 0.0026503317058086395, -0.011795533820986748, 0.05242785066366196, 0.0029323988128453493, -0.008923577144742012, 0.04055904969573021, 0.03340846672654152, 0.008989514783024788, 0.06705138087272644, -0.03282235562801361, 4.249895027896855e-06, 0.03663209080696106, -0.0321483239531517, -0.022975647822022438, -0.0721505656838417, -0.040353912860155106, -0.0119347358122468, 0.00797114335000515, -0.03935752063989639, 0.049936868250370026, 0.009304551407694817, -0.01661631651222706, 0.021935297176241875, 0.0008645173511467874, 0.049057696014642715, -0.0068135689944028854, -0.00456802174448967, -0.040940023958683014, 0.012850537896156311, -0.021026819944381714, 0.0954192727804184, -0.02556920051574707, -0.05257437750697136, 0.012975086458027363, -0.01686541549861431, -0.03118123672902584, -0.03821459785103798, 0.0045423791743814945, -0.04600990563631058, 0.022799814119935036, -0.01196404080837965, 0.0002747406833805144, -0.0478561632335186, -0.03422902524471283, 0.004000224173069, 0.0099126435816288, 0.019795982167124748, -0.008161629550158978, 0.0031338753178715706, 0.06271413713693619, 0.011348621919751167, -0.0037914214190095663, 0.02466072328388691, -0.05412757769227028, -0.02161293476819992, 0.06124885752797127, -0.0014835996553301811, -0.02218439429998398, 0.0006080926978029311, 0.0030276423785835505, 0.012667377479374409, -0.024968434125185013, 0.004077151883393526, 0.023400580510497093, -0.01231570914387703, -0.028411850333213806, -0.09295759350061417, 0.00884298700839281, -0.020396748557686806, 0.0069454447366297245, -0.02627253532409668, -0.041174471378326416, -0.0016072329599410295, 0.013854256831109524, 0.034756530076265335, -0.026887955144047737, -0.0035533129703253508, -0.04155544564127922, 0.01676284521818161, 0.03502028062939644, 0.007612148765474558, -0.00047988040023483336, -0.023576414212584496, -0.011517129838466644, -0.039504047483205795, 0.030741650611162186, -0.02086563967168331, -0.00026054575573652983, 0.027430109679698944, 0.0027419121470302343, 0.0477682463824749, -0.020484665408730507, -0.027430109679698944, -0.019371049478650093, -0.0007344734040088952, -0.036280423402786255, 0.019590841606259346, -0.0054252129048109055, -0.019664106890559196, -0.03496166691184044, -0.004729202948510647, -0.042756978422403336, -0.026023438200354576, -0.03903515636920929, -0.019532231613993645, -0.016235342249274254, 0.006667040754109621, -0.026463022455573082, 0.02216974087059498, 0.010447472333908081, 0.006091916933655739, 0.01989855244755745, -0.002324306173250079, 0.0009597608004696667, -0.013224184513092041, 0.020938903093338013, 0.042639754712581635, 0.05975426733493805, 0.00883566029369831, -0.020206261426210403, 0.004465451929718256, 0.01123139914125204, -0.01900472864508629, 0.04565823823213577, 0.029027268290519714, -0.0013874404830858111, -0.021290572360157967, 0.005828165914863348, -0.010901710018515587, -0.0016044855583459139, -0.024118568748235703, -0.0037657790817320347, -0.018521185964345932, -0.02940824255347252, 0.05483091250061989, -0.025320101529359818, 0.011290010996162891, -0.03645625710487366, 0.03683723136782646, 0.026155313476920128, -0.009245939552783966, -0.008967535570263863, -0.006212802603840828, 0.026887955144047737, -0.019371049478650093, -0.0793011486530304, -0.017231736332178116, 0.00953899696469307, -0.03332054987549782, -0.018755631521344185, 0.05650133639574051, -0.0396505743265152, -0.04606851935386658, 0.005886777304112911, -0.00617983378469944, -0.05351215973496437, -0.026829343289136887, -0.0057768807746469975, -0.024279750883579254, 0.029891787096858025, 0.019356397911906242, -0.018814241513609886, -0.02625788375735283, 0.0239427350461483, 0.03903515636920929, -0.016176732257008553, -0.014945893548429012, -0.016411177814006805, 0.02634580060839653, 0.019356397911906242, 0.01123872585594654, 0.027459416538476944, -0.01746618188917637, -0.03118123672902584, 0.016572358086705208, 0.032206933945417404, -0.06124885752797127, 0.0031448649242520332, 0.007590169552713633, -0.0158397164195776, -0.027459416538476944, -0.04222947359085083, 0.0032437716145068407, 0.045921988785266876, 0.058552734553813934, -0.030741650611162186, -0.020426053553819656, -0.012044631876051426, -0.022770507261157036, -0.027459416538476944, 0.038683488965034485, -0.020191607996821404, 0.01920986920595169, -0.03288096562027931, 0.014506308361887932, 0.00042172695975750685, 0.019546883180737495, 0.023429885506629944, 0.023429885506629944, 0.049673113971948624, 0.02322474680840969, -0.009604934602975845, 0.00023020980006549507, 0.025686422362923622, 0.005362938158214092, -0.041760582476854324, -0.028485113754868507, 0.02470468170940876, 0.024162527173757553, -0.057878702878952026, 0.03601667284965515, -0.009216634556651115, 0.04161405563354492, -0.04152613878250122, 0.03894723951816559, -0.01840396225452423, 0.04126238822937012, -0.01674819178879261, 0.00912871677428484, -0.017070554196834564, -0.011590393260121346, -0.012616092339158058, -0.0023810858838260174, -0.030653733760118484, -0.026887955144047737, 0.015781104564666748, 0.02060188725590706, 0.0007015045266598463, 0.008894272148609161, -0.01309230923652649, 0.03883001580834389, -0.004231006372720003, 0.012594113126397133, -0.008073712699115276, 0.03370152413845062, -0.018843548372387886, 0.034815140068531036, 0.045921988785266876, -0.024968434125185013, -0.03361360728740692, -0.008923577144742012, 0.057116758078336716, 0.0018902159063145518, -0.00885031372308731, -0.05081603676080704, 0.01240362599492073, 0.0016649285098537803, 0.04958519712090492, -0.020411401987075806, -0.013817625120282173, 0.01586902141571045, 0.007993122562766075, -9.490000957157463e-05, -0.028441155329346657, -0.016147425398230553, -0.057702869176864624, -0.05163659527897835, 0.03885932266712189, -0.021993907168507576, 0.012337688356637955, -0.017231736332178116, 0.03024345450103283, 0.013817625120282173, 0.008483991958200932, -0.02000112272799015, -0.02965734153985977, -0.030888179317116737, -0.022623980417847633, 0.0010623306734487414, 0.013561200350522995, -0.018975423648953438, 0.03765778988599777, -0.06529303640127182, 0.024059956893324852, -0.011297336779534817, 0.022037865594029427, 0.04129169508814812, 0.017744585871696472, 0.015326866880059242, 0.0099126435816288, -0.011216746643185616, -0.008154303766787052, -0.015781104564666748, 0.03358430042862892, 0.025173572823405266, 0.015634575858712196, -0.0795355960726738, 0.00874041672796011, -0.045834071934223175, -0.03121054172515869, 0.0066120922565460205, 0.0029580413829535246, -0.053863827139139175, 0.03021414950489998, -0.020279524847865105, 0.033789440989494324, 0.06687554717063904, -0.012572133913636208, -0.030565816909074783, -0.05676508694887161, -0.03100540116429329, -0.017993682995438576, -0.003502027830109, -0.0014671152457594872, -0.015649229288101196, 0.0035991030745208263, -0.0017381927464157343, 0.02869025431573391, -0.016132773831486702, -0.0034196057822555304, 0.030917484313249588, -0.06218663975596428, 0.05632550269365311, -0.030536511912941933, -0.02618461847305298, 0.04255183786153793, -0.01828674040734768, 0.024089263752102852, 0.02934963069856167, -0.042024336755275726, -0.03751126304268837, -0.023327315226197243, -0.03935752063989639, -0.009070105850696564, 0.009634239599108696, -0.04436878859996796, -0.021012168377637863, 0.004842762369662523, -0.035577088594436646, 0.05160728842020035, 0.02315148152410984, 0.02315148152410984, -0.010454799048602581, 0.03024345450103283, -0.013619811274111271, -0.02060188725590706, -0.015649229288101196, -0.004981964360922575, -0.05831829085946083, -0.01680680364370346, -0.004296944476664066, -0.06072135642170906, -0.049936868250370026, -0.011788207106292248, -0.009267918765544891, 0.04650810360908508, -0.008535277098417282, 0.04047113284468651, -0.0073300814256072044, -0.013773666694760323, 0.009385141544044018, -0.027298234403133392, -0.06259691715240479, -0.04642018675804138, 0.0059087565168738365, -0.048207830637693405, -0.006637734826654196, 0.018902158364653587, 0.06242108345031738, 0.021012168377637863, 0.018110906705260277, 0.0399729385972023, -0.00031824130564928055, -0.01680680364370346, 0.030595121905207634, 0.03935752063989639, -0.02488051727414131, -0.06113163381814957, -0.03844904154539108, -0.015165685676038265, -0.02869025431573391, -0.011714942753314972, -0.015019157901406288, 0.052984658628702164, -0.015165685676038265, -0.023415232077240944, 0.013392692431807518, 0.052926044911146164, -0.01035955548286438, 0.02707844227552414, 0.00259172054938972, 0.008769722655415535, 0.07572586089372635, 0.08557256311178207, 0.03569430857896805, -0.0062604243867099285, -0.04861811175942421, 0.0018462573643773794, 0.04038321599364281, -0.01919521577656269, 0.033965274691581726, -0.018887506797909737, -0.03756987303495407, -0.007978469133377075, 0.029041921719908714, -0.027620596811175346, -0.027781778946518898, 0.012117896229028702, 0.033818747848272324, 0.02312217652797699, 0.02145175263285637, 0.05515327677130699, 0.03604597970843315, -0.011517129838466644, -0.03847834840416908, 0.026843996718525887, 0.022755855694413185, 0.024294402450323105, -0.02726892940700054, 0.036251116544008255, -0.00396359246224165, -0.02080702781677246, -0.03443416580557823, 0.03762848302721977, -0.011641678400337696, -0.008777049370110035, -0.028954004868865013, -0.02073376439511776, 0.0025587514974176884, -0.0002470376784913242, -0.00840340182185173, 0.003835379844531417, -0.00417239498347044, -0.043372396379709244, -0.03504958376288414, -0.018535837531089783, -0.009949276223778725, -0.042493224143981934, -0.0005068965838290751, 0.0012949444353580475, -0.019444314762949944, 0.02307821810245514, -0.0317087396979332, 0.021246612071990967, -0.004813456907868385, 0.008132324554026127, -0.009319203905761242, 0.004274965263903141, 0.0002493271604180336, -0.014586898498237133, 0.03915238007903099, -0.014235231094062328, 0.01909264549612999, -0.045746155083179474, 0.018887506797909737, 0.03044859506189823, -0.02080702781677246, -0.03249999135732651, -0.0034763854928314686, 0.022931689396500587, 0.036339033395051956, 0.01664562150835991, -0.024059956893324852, 0.004754845518618822, -0.025100309401750565, -0.019752023741602898, -0.0011639846488833427, -0.010454799048602581, 0.02080702781677246, -0.0001471007417421788, -0.00418338505551219, -0.0401487722992897, -0.03578222543001175, -0.010828446596860886, 0.0067476313561201096, -0.007670759689062834, -0.019473619759082794, 0.04530657082796097, -0.05049367621541023, 0.020894944667816162, 0.0005700869369320571, -0.053981050848960876, 0.02641906403005123, 0.0047035603784024715, -0.00012374778452795, -0.008762395940721035, 0.01920986920595169, -0.02318078652024269, -0.00919465534389019, -0.0321776308119297, -0.03367221727967262, -0.0012189327972009778, -0.01925382763147354, 0.05635480955243111, 0.005245715379714966, 0.009355836547911167, -0.01767132058739662, 0.009824726730585098, -0.020982861518859863, -0.02071911096572876, 0.012520848773419857, 0.008821007795631886, 0.0032236240804195404, 0.013077656738460064, 0.025012392550706863, 0.00618349714204669, -0.03540125489234924, 0.011253378354012966, 0.024484889581799507, -0.010139762423932552, 0.0003741052350960672, -0.05981287732720375, -0.02954011783003807, 0.05444994196295738, -0.006659714039415121, -0.0009171759593300521, 0.017407570034265518, 0.026990525424480438, 0.022140435874462128, 0.0397384911775589, -0.03487375006079674, -0.010718549601733685, 0.0022418838925659657, 0.015370825305581093, 0.002155798487365246, -0.002249210374429822, 0.031474292278289795, -0.03252929821610451, -0.004304270725697279, -0.00041027943370863795, -0.002337127458304167, 0.031386375427246094, 0.025876909494400024, -0.0011566582834348083, 0.004040519706904888, -0.028016222640872, 0.007824614644050598, 0.008945556357502937, 0.0035807869862765074, -0.014389085583388805, -0.020411401987075806, 0.03847834840416908, 0.008549930527806282, 0.014931240119040012, 0.017290346324443817, -0.011663657613098621, -0.0043848613277077675, 0.004201700910925865, 0.00029511729371733963, -0.012125222012400627, 0.04650810360908508, -0.04328447952866554, -0.00913604348897934, 0.010447472333908081, -0.01833069883286953, -0.020938903093338013, -0.0317966565489769, -0.00461930688470602, -0.028148099780082703, -0.020470011979341507, 0.009670872241258621, 0.015268255956470966, 0.028192058205604553, -0.004927016329020262, -0.027635250240564346, 0.012718661688268185, 0.0019140267977491021, 0.03337915986776352, 0.010044519789516926, 0.008872292935848236, 0.018154865130782127, -0.011099523864686489, -0.02628718875348568, 0.02710774727165699, 0.015473395586013794, -0.004417830146849155, 0.013509915210306644, -0.012235118076205254, 0.037804316729307175, 0.016249995678663254, -0.0007816372672095895, -0.016132773831486702, 0.022711897268891335, -0.041086554527282715, -0.02542267180979252, -0.03452208265662193, -0.05729259178042412, 0.046713244169950485, 0.003342678304761648, 0.0007340155425481498, -0.036163199692964554, -0.011290010996162891, -0.010007887147367, -0.005707279779016972, 0.009399794973433018, 0.038654182106256485, -0.009333856403827667, 0.024426277726888657, 0.024030651897192, 0.01441839151084423, 0.025832951068878174, -0.002359106671065092, -0.0061029065400362015, 0.008095691911876202, -0.0006786094745621085, 0.004428819753229618, -0.014652836136519909, -0.03334985673427582, 0.004263975657522678, 0.00919465534389019, 0.02634580060839653, -0.010960321873426437, 0.004981964360922575, 0.00019941595382988453, 0.005666984710842371, -0.008952883072197437, 0.03651486709713936, -0.028338585048913956, -0.01031559705734253, -0.03926960006356239, -0.028983309864997864, 0.009560976177453995, 0.03768709674477577, -0.008015101775527, 0.010718549601733685, 0.02155432291328907, 0.019546883180737495, 0.017935071140527725, 0.031503599137067795, -0.02322474680840969, -0.02722497098147869, -0.014953219331800938, 0.04363614693284035, 0.0278403889387846, -0.002928735688328743, 0.04372406378388405, 0.06687554717063904, -0.011268030852079391, 0.023356622084975243, 0.006091916933655739, -0.008418054319918156, -0.002091692527756095, -0.032412074506282806, 0.026638856157660484, -0.014850649982690811, -0.034844446927309036, -0.018975423648953438, -0.0013095972826704383, 0.02482190541923046, -0.03249999135732651, -0.056208282709121704, 0.005645005498081446, -0.002714437898248434, -0.018931465223431587, 0.02869025431573391, 0.03918168321251869, 0.012418278492987156, -0.04850088804960251, -0.013795645907521248, 0.014579572714865208, -0.00021761751850135624, 0.0024195497389882803, -0.00678792642429471, -0.03894723951816559, -0.003754789475351572, 0.002683300757780671, -0.026931913569569588, -0.040998637676239014, 0.012498869560658932, -0.00836677011102438, 0.005315316375344992, -0.00109987857285887, -0.00739968242123723, 0.009150695987045765, 0.012843211181461811, -0.000973497808445245, 0.0011914587812498212, 0.03818529099225998, -0.019429661333560944, -0.02555454708635807, 0.0024396972730755806, -0.00831548497080803, 0.03921099007129669, -0.032441381365060806, -0.0278696957975626, -0.01995716243982315, 0.02397204004228115, 0.027312887832522392, -0.013165573589503765, -0.00517977774143219, 0.0119347358122468, 0.004996617324650288, -0.024484889581799507, -0.011714942753314972, -0.03417041525244713, 0.007238501217216253, -0.02388412319123745, -0.011678311042487621, 0.0022986638359725475, 0.034697916358709335, -0.03112262487411499, 0.042024336755275726, 0.01825743354856968, 0.0006598355248570442, 0.01035955548286438, -0.111185722053051, -0.049936868250370026, 0.009429099969565868, -0.011465844698250294, 0.006912475451827049, -0.003518512472510338, -0.010952995158731937, 0.033848050981760025, 0.04706491157412529, -0.014205925166606903, 0.04375337064266205, -0.031474292278289795, 0.03041928820312023, -0.01597159169614315, 0.0045497058890759945, 0.01913660392165184, -0.014132660813629627, -0.04152613878250122, 0.05022992193698883, 0.004604653920978308, 0.008557256311178207, 0.013363386504352093, 0.019620148465037346, 0.012139875441789627, -0.003252929775044322, -0.0024342024698853493, -0.008557256311178207, 0.016279300674796104, -0.01435977965593338, 0.006846537813544273, -0.0002495561202522367, 0.015370825305581093, -0.034697916358709335, 0.017876461148262024, -0.00718355318531394, -0.06892694532871246, -0.030155537649989128, -0.005927072372287512, -0.020382095128297806, 0.008916251361370087, -0.001877394737675786, 0.00518344109877944, 0.01035955548286438, 0.004714549984782934, -0.016557704657316208, -0.018638407811522484, 0.007736697793006897, -0.000833837955724448, -0.017773890867829323, -0.02082168124616146, -0.01680680364370346, -0.019752023741602898, 0.016030203551054, -0.009282572194933891, -0.04067627340555191, -0.018066948279738426, 0.0009309130255132914, -0.023693636059761047, -0.007319091819226742, 0.01276262104511261, -0.033877357840538025, 0.03651486709713936, 0.01838931068778038, -0.009158022701740265, -0.00319981318898499, 0.019385702908039093, -0.03762848302721977, 0.03651486709713936, -0.012931128032505512, -0.010213026776909828, 0.0010220353724434972, 0.01036688219755888, -0.023532455787062645, 0.0031485282815992832, -0.01751014031469822, 0.026580246165394783, -0.008154303766787052, -0.016381870955228806, -0.00557540450245142, 0.013407345861196518, 0.011099523864686489, -0.014469675719738007, 0.012271750718355179, -0.004307934083044529, 0.0006685356493107975, 0.022550715133547783, 0.035459864884614944, 0.0198545940220356, 0.05263298749923706, -0.012110569514334202, -0.00015351135516539216, -0.03537194803357124, -0.006253098137676716, 0.02643371745944023, 0.01440373808145523, 0.014455023221671581, 0.02945220097899437, -0.020367443561553955, 0.01673354022204876, 0.0020129333715885878, 0.016953332349658012, 0.0017455191118642688, -0.03422902524471283, -0.0479147769510746, -0.0319724902510643, 0.0019176899222657084, 0.04208294674754143, -0.007802635431289673, -0.0198252871632576, 0.016425829380750656, 0.01909264549612999, 0.011905429884791374, 0.027708513662219048, 0.008542603813111782, -0.01318022608757019, 0.013627137988805771, 0.02397204004228115, -0.02247745171189308, 0.024909822270274162, 0.019722718745470047, 0.02153966948390007, 0.01828674040734768, -0.06646526604890823, 0.0055497619323432446, -0.016997290775179863, -0.02624323032796383, 0.029642688110470772, -0.0064582377672195435, -0.01318755280226469, 0.012125222012400627, 0.015414783731102943, -0.003267582505941391, -0.014198598451912403, -0.03329124301671982, 0.01196404080837965, 0.01989855244755745, 0.05102117732167244, -0.015400131233036518, 0.012044631876051426, 0.00500760693103075, 0.004201700910925865, -8.342386536241975e-06, 0.008520624600350857, -0.007388692814856768, 0.0017171292565762997, 0.017217082902789116, -0.07607752829790115, -0.0031302121933549643, -0.034580692648887634, -0.006703672930598259, 0.0017629193607717752, -0.014667489565908909, -0.0158543698489666, 0.028133446350693703, -0.013429325073957443, 0.04155544564127922, -0.005531445611268282, -0.031503599137067795, -0.06406220048666, 0.035489171743392944, 0.012769946828484535, 0.020279524847865105, -0.02565711736679077, -0.05046436935663223, -0.02798691764473915, 0.000795832194853574, -0.06763749569654465, -0.013348734006285667, 0.012623419053852558, 0.013759013265371323, 0.031503599137067795, -0.018565144389867783, 0.03422902524471283, -0.013942173682153225, 0.0013050182024016976, 0.014887281693518162, -0.01114348229020834, 0.020880291238427162, 0.01685076206922531, 0.002912251278758049, -0.022023214027285576, -0.003000168362632394, 0.008462012745440006, -0.005531445611268282, 0.03900584951043129, 0.003110064659267664, 0.027737818658351898, -0.009729483164846897, 0.03522541746497154, 0.009788095019757748, -0.013678423129022121, 0.0479733869433403, 0.019590841606259346, 0.032265547662973404, 0.006073600612580776, -0.01152445562183857, 0.0318845734000206, 0.003287730272859335, -0.02325405180454254, -0.0030624428763985634, -0.037950847297906876, 0.06265553086996078, 5.343134034774266e-05, -0.017187777906656265, 0.020924249663949013, 0.011209419928491116, 0.054655078798532486, -0.02301960624754429, -0.02945220097899437, 0.02139314077794552, 0.012769946828484535, 0.014396412298083305, -0.024294402450323105, 0.05433271825313568, 0.0017043080879375339, -0.008498645387589931, -0.029701299965381622, -0.00884298700839281, -0.06083857640624046, -0.025041697546839714, -0.020308831706643105, -0.029935745522379875, -0.0019378375727683306, 0.012865190394222736, -0.0018654892919585109, 0.028397196903824806, -0.02797226421535015, -0.007597495801746845, 0.014132660813629627, 0.013275469653308392, 0.0034727223683148623, 0.02949615940451622, -0.012667377479374409, 0.0004789645900018513, -0.016997290775179863, -0.02715170569717884, 0.018843548372387886, -0.013795645907521248, 0.003379310481250286, 0.02788434736430645, 0.03830251470208168, -0.012015325948596, 0.004406840540468693, -0.011290010996162891, -0.013671096414327621, 0.010264311917126179, 0.05899231880903244, 0.015722492709755898, -0.029877133667469025, -0.010205700993537903, -0.010557368397712708, -0.014828670769929886, -0.03657348081469536, 0.004930679686367512, 0.022975647822022438, 0.011319315992295742, -0.00841072853654623, 0.011040912009775639, -0.006377647165209055, -0.012418278492987156, -0.01441839151084423, 0.01241095270961523, 0.009700178168714046, 0.01432314794510603, -0.0034397533163428307, -0.0050625549629330635, -0.005253042094409466, 0.013048350811004639, 0.009070105850696564, 0.04167266562581062, 0.004945332184433937, -0.013348734006285667, -0.013011719100177288, 0.04404642805457115, -0.0032236240804195404, 0.0006950939423404634, 0.0028847772628068924, 0.02216974087059498, 0.01989855244755745, -0.02321009337902069, 0.015268255956470966, 0.027635250240564346, 0.012689356692135334, 0.006982076447457075, 0.011986020021140575, -0.016176732257008553, -0.01679215021431446, -0.008037080988287926, 0.002038575941696763, 0.0003436547995079309, 0.029261713847517967, 0.011077544651925564, 0.00027771704480983317, -0.015297560952603817, -0.00919465534389019, -0.013759013265371323, -0.010513409972190857, -0.0072678071446716785, 0.025056350976228714, 0.003328025573864579, 0.01753944531083107, 0.028426503762602806, -0.001257396535947919, -0.010198374278843403, 0.009458405897021294, 0.010967648588120937, -0.025876909494400024, -0.024089263752102852, 0.0041907113045454025, 0.013421998359262943, -0.036397647112607956, -0.02008903957903385, 0.019327091053128242, -0.03777501359581947, 0.009546322748064995, 0.03885932266712189, -0.0015074105467647314, 0.024353014305233955, -0.002338959136977792, 0.002945220097899437, -0.026624204590916634, 0.0007170732133090496, -0.012169180437922478, -0.0021924306638538837, -0.02067515254020691, 0.0025440987665206194, 0.014425717294216156, 0.006447248160839081, -0.006509522441774607, -0.0013031866401433945, 0.008293505758047104, 0.02389877662062645, -0.03109331987798214, -0.046654630452394485, 0.009319203905761242, 0.061834968626499176, -0.01840396225452423, 0.019752023741602898, 0.02703448385000229, -0.022814465686678886, -0.03270513191819191, -0.011158134788274765, -0.033906664699316025, 0.030683038756251335, 0.013356060720980167, -0.02306356467306614, -0.01078448724001646, -0.00795648992061615, -0.01912195235490799, -0.02237488143146038, 0.0712713971734047, 0.021114736795425415, 0.00914337020367384, 0.00830815825611353, -0.009868685156106949, -0.01313626766204834, 0.02070445753633976, 0.028382543474435806, -0.011158134788274765, 0.02464607171714306, 0.005674310959875584, 0.025012392550706863, -0.015693187713623047, -0.00919465534389019, 0.00517611438408494, -0.02230161800980568, 0.006373983807861805, 0.005238389130681753, -0.027356846258044243, -0.0031521914061158895, 0.026858650147914886, 0.02388412319123745, -0.001124605187214911, -0.004110120702534914, 0.01828674040734768, -0.0062970565631985664, 0.03329124301671982, 0.013158246874809265, 0.004333576187491417, 0.02398669347167015, 0.004637622740119696, 0.008527951315045357, 0.0057732174172997475, 0.039474740624427795, -0.0049050371162593365, -0.03129845857620239, 0.004139426164329052, -0.024470236152410507, 0.0015623586950823665, -0.022785160690546036, 0.013993458822369576, -0.017803195863962173, -0.001510157948359847, -0.018843548372387886, 0.019737370312213898, -0.004099131096154451, -0.010762508027255535, 0.00839607510715723, 0.012520848773419857, -0.022506756708025932, -0.04067627340555191, 0.018799589946866035, 0.010044519789516926, 0.008322810754179955, -0.001706139650195837, -0.003324362216517329, -0.008440033532679081, 0.022726548835635185, -0.003696178086102009, -0.0071395947597920895, -0.03507889062166214, 0.0014094196958467364, -0.029628034681081772, 0.013165573589503765, -0.011641678400337696, 0.003428763709962368, -0.005051565356552601, 0.013744360767304897, -0.040969330817461014, 0.0034397533163428307, 0.022990301251411438, 0.008945556357502937, 0.0074546304531395435, -0.010586674325168133, 0.017041249200701714, 0.012286403216421604, 0.021905990317463875, 0.04243461415171623, 0.01196404080837965, 0.012528175488114357, -0.015693187713623047, -0.007275133393704891, 0.030126232653856277, -0.017949724569916725, 0.0028133445885032415, 0.0317380428314209, 0.016513746231794357, 0.016425829380750656, 0.007436314597725868, 0.013846930116415024, -0.003393963212147355, 0.017187777906656265, 0.037071675062179565, 0.020250219851732254, -0.010220353491604328, 0.0036339035723358393, -0.01436710637062788, 0.0020953556522727013, 0.0070113823749125, 0.0022418838925659657, 0.003012989414855838, 0.03018484264612198, -0.021114736795425415, -0.017348958179354668, -0.04360684007406235, 0.009883338585495949, -0.020543277263641357, -0.028880741447210312, 0.0239280816167593, 0.001403924892656505, 0.005516793113201857, -0.012689356692135334, -0.030829567462205887, -0.007407008670270443, 0.017891112715005875, -0.012147201225161552, -0.0005091860657557845, -0.005853808019310236, 0.004245659336447716, -0.005718269385397434, -0.033027492463588715, 0.03349638357758522, 0.008769722655415535, 0.02083633281290531, 0.002716269576922059, -0.03777501359581947, 0.009348509833216667, -0.014916587620973587, -0.02074841596186161, 0.03751126304268837, -0.01746618188917637, 0.0033829736057668924, 0.008542603813111782, 0.019268479198217392, 0.003967255353927612, 0.016557704657316208, -0.0049563217908144, -0.017964377999305725, -0.0008017849177122116, 0.0030111579690128565, -0.026785384863615036, -0.014828670769929886, 0.028397196903824806, 0.004754845518618822, 0.005538772325962782, -0.014088702388107777, -0.028192058205604553, -0.02224300615489483, -0.014074049890041351, 0.028455808758735657, -0.024147873744368553, 0.022448144853115082, -0.016499094665050507, -0.01919521577656269, 0.022008560597896576, -0.016411177814006805, -0.004699897486716509, -0.01396415289491415, 0.01310696266591549, 0.02477794699370861, -0.04879394546151161, -0.014967872761189938, -0.00961958710104227, -0.028236016631126404, 0.0317673496901989, -0.024499543011188507, -0.0011859639780595899, 0.021686198189854622, 0.01605950854718685, -0.016264649108052254, 0.010432819835841656, -0.012652724049985409, 0.042610447853803635, -0.017788544297218323, -0.032294850796461105, 0.0008420802187174559, -0.012088590301573277, 0.03504958376288414, -0.041789889335632324, 0.025964826345443726, 0.0019250164041295648, -0.002252873731777072, 0.03841973841190338, 0.003908643964678049, 0.021231960505247116, -0.015663882717490196, 0.01997181586921215, 0.00461198017001152, -0.019649453461170197, -0.04407573118805885, 0.015707841143012047, -0.013319428078830242, -0.0079271849244833, 0.03109331987798214, 0.03836112469434738, 0.006721988786011934, 0.013282796368002892, 0.012183833867311478, 0.005132155958563089, -0.004729202948510647, -0.02233092300593853, -0.0032547612208873034, -0.0037731053307652473, 0.011121503077447414, -0.025730380788445473, 0.001589832711033523, -0.008066386915743351, -0.0024744977708905935, 0.0014075881335884333, -0.006373983807861805, 0.00961226038634777, 0.014843323267996311, -0.0319431833922863, 0.0099199702963233, -0.015795757994055748, 0.02142244763672352, -0.017788544297218323, 0.019444314762949944, 0.016381870955228806, 0.022946342825889587, -0.013414671644568443, 0.0023298009764403105, 0.0022089150734245777, -0.0019506588578224182, -0.017876461148262024, -0.0316501259803772, 0.020572582259774208, 0.027239622548222542, -0.036397647112607956, -0.0009689187863841653, -0.01674819178879261, -0.03815598785877228, -0.017114512622356415, -0.026477675884962082, 0.003989234566688538, -0.033789440989494324, -0.007238501217216253, -0.0011090366169810295, 0.014557593502104282, -0.027752472087740898, -0.030770957469940186, -0.032206933945417404, -0.00831548497080803, -0.018755631521344185, -0.02068980596959591, 0.0039599291048944, -0.000333123083692044, 0.005798859987407923, -0.02876351773738861, -0.0005151387886144221, -0.0068099056370556355, 0.012550154700875282, 0.027371497824788094, -0.015312214381992817, -0.010066499002277851, -0.0016282964497804642, -0.01604485511779785, -0.028148099780082703, 0.014455023221671581, -0.004436146467924118, -0.014022764749825, -0.008872292935848236, 0.0024744977708905935, 0.04477906972169876, -0.021305223926901817, -0.013854256831109524, -0.004696234129369259, -0.0028499767649918795, 0.015385478734970093, 0.000973497808445245, -0.004846425727009773, 0.04700629785656929, 0.016484441235661507, -0.023341968655586243, 0.02071911096572876, -8.631436503492296e-05, 0.020132998004555702, 0.004271301906555891, 0.012132548727095127, 1.0531725820328575e-05, -0.025188226252794266, 0.015400131233036518, 0.022902384400367737, 0.02561315894126892, 0.012103242799639702, -0.016132773831486702, -0.01153178233653307, -0.0012519017327576876, -0.021891336888074875, -0.005333632696419954, -0.0010064666857942939, 0.015180339105427265, -0.009897991083562374, -0.022682590410113335, -0.013172900304198265, 0.0479147769510746, 0.01664562150835991, -0.06482414901256561, -0.009077432565391064, -0.01123872585594654, -0.014469675719738007, 0.01553200650960207, 0.03346708044409752, 0.006659714039415121, 0.003360994393005967, 0.03293957561254501, -0.018975423648953438, -0.0009299972443841398, 0.010117783211171627, -0.012594113126397133, 0.029247062280774117, 0.0099272970110178, -0.0021924306638538837, -0.02300495281815529, 0.005897766910493374, 0.02558385208249092, -0.056999534368515015, -0.02153966948390007, -0.020426053553819656, 0.03739403933286667, -0.006121222395449877, 0.010249659419059753, -0.005630352534353733, -0.01746618188917637, 0.0953606590628624, 0.006802579388022423, -0.02076306939125061, 0.026946566998958588, 0.0014048407319933176, -0.04853019490838051, 0.0159276332706213, 7.183324487414211e-05, -0.010242332704365253, -0.014052070677280426, 0.01679215021431446, -0.001528474036604166, -0.013473283499479294, 0.03346708044409752, 0.007157910615205765, -0.012418278492987156, -0.007817287929356098, 0.02467537671327591, 0.00778798246756196, -0.015268255956470966, -0.029232408851385117, 0.00884298700839281, 0.004088141489773989, 0.00046041960013099015, 0.02936428412795067, -0.009245939552783966, 0.04091072082519531, -0.0004553826875053346, -0.017085207626223564, 0.022741202265024185, -0.018506532534956932, 0.0013105131220072508, 0.013319428078830242, -0.0034067844972014427, 0.026492329314351082, -0.006055284757167101, -0.026712121441960335, -0.014989851973950863, -0.007447304204106331, -0.015048462897539139, -0.005762227810919285, 0.011744248680770397, -0.019737370312213898, 0.024206485599279404, -0.0319138765335083, 0.031239846721291542, -0.0317966565489769, 0.023444538936018944, -0.006736641749739647, -0.036339033395051956, 0.010645286180078983, 0.017099861055612564, 0.003926960285753012, -0.004278628155589104, -0.014242556877434254, 0.0043518925085663795, -0.002912251278758049, -0.0015358004020527005, -0.004476441536098719, -0.03334985673427582, 0.006652387790381908, -0.001071488717570901, 0.03654417395591736, 0.007245827466249466, -0.008711111731827259],
-    },
-    {
-        "crl_id": "NDA022517_20150130_32d041",
-        "company": "Ferring Pharmaceuticals Inc.",
-        "app_number": "NDA 022517",
-        "date": "2015-01-30",
-        "text_preview": 'pute,\n\nMie\n\nOAL\n\n4 DEPARTMENT OF HEALTH AND HUMAN SERVICES\n\nNDA 022517\n\nFood and Drug Administration\nSilver Spring MD 20993\n\nCOMPLETE RESPONSE\n\nFerring Pharmaceuticals Inc.\n\nAttention: Brenda Marczi, ',
-        "embedding": [0.005389914382249117, 0.03422844037413597, 0.01555192656815052, 0.0336887389421463, -0.04192629083991051, 0.021673278883099556, 0.039057351648807526, 0.010367951355874538, 0.029655180871486664, 0.023079343140125275, 0.022823695093393326, -0.012100677005946636, -0.03718259930610657, 0.028433751314878464, 0.04010834917426109, -0.0275815911591053, 0.028107089921832085, -0.00544317439198494, -0.01975591853260994, 0.018761731684207916, 0.010431863367557526, 0.04598825424909592, 0.0063770003616809845, -0.027936657890677452, 0.019741715863347054, -0.048800382763147354, -0.006895397789776325, -0.034427277743816376, 0.04817546531558037, -0.007225609850138426, 0.019940553233027458, -0.02668682299554348, -0.02276688441634178, 0.01508323848247528, -0.0058799064718186855, 0.021857913583517075, 0.04652795568108559, -0.011837927624583244, -0.031956013292074203, -0.03357511758804321, -0.011489962227642536, -0.06470737606287003, 0.042579613626003265, -0.03962545841932297, -0.031189069151878357, 0.017199436202645302, -0.006785327102988958, -0.043914664536714554, 0.03581914305686951, -0.03229687735438347, -0.03996632248163223, 0.026487985625863075, -0.011014172807335854, 0.023803679272532463, 0.01620524935424328, -0.014969617128372192, 0.01954287849366665, 0.03229687735438347, -0.022440223023295403, -0.00950158853083849, -0.03570552170276642, -0.03590435907244682, 0.055077966302633286, -0.019670702517032623, 0.002341665793210268, -0.020991550758481026, -0.015921195968985558, 0.020778510719537735, 0.018520286306738853, 0.028135495260357857, -0.010453167371451855, 0.004612318240106106, 0.03107544779777527, -0.019230419769883156, -0.009693324565887451, 0.019116798415780067, -0.0036163555923849344, 0.01562293991446495, -0.027269132435321808, 0.02689986303448677, -0.04735171049833298, 0.005081006325781345, -0.06641169637441635, 0.025749446824193, -0.029172290116548538, -0.027141308411955833, -0.053288429975509644, -0.01957128383219242, -0.029541559517383575, -0.035677116364240646, -0.039710674434900284, 0.04479523003101349, -0.05632780119776726, 0.07339941710233688, -0.05308959260582924, 0.00964361522346735, -0.01065200474113226, 0.02398831397294998, 0.01781015284359455, 0.014010936953127384, -0.01731305755674839, -0.030734583735466003, -0.007726253941655159, 0.017369868233799934, 0.013876011595129967, 0.024513812735676765, -0.03655768185853958, 0.029797207564115524, 0.04155702143907547, 0.037949543446302414, 0.06317348778247833, -0.022866303101181984, -0.015097441151738167, 0.017753342166543007, 0.021204590797424316, -0.061980463564395905, -0.03610319644212723, -0.023036735132336617, 0.0030660019256174564, -0.004385075066238642, -0.030876610428094864, 0.02011098526418209, 2.7365111236576922e-05, 0.018406664952635765, 0.02442859672009945, 0.03275136277079582, 0.03337628021836281, 0.032524120062589645, -0.013769491575658321, -0.029655180871486664, 0.047607358545064926, 0.00043451302917674184, 0.0251387320458889, -0.0610714927315712, -0.09402169287204742, 0.02363324724137783, -0.020167795941233635, -0.0016421840991824865, -0.023263977840542793, -0.003081980161368847, 0.008024509996175766, 0.0021818855311721563, 0.007300173863768578, 0.00926724448800087, -0.03408641368150711, -0.03371714428067207, 0.045306526124477386, 0.0356203056871891, 0.026104513555765152, 0.031558338552713394, -0.012910230085253716, 0.03473973646759987, 0.04320453107357025, -0.0008384015527553856, 0.021502846851944923, -0.06771834194660187, 0.010410559363663197, 0.05124324560165405, -0.002377172466367483, -0.007854077965021133, -0.02863258868455887, -0.02442859672009945, 0.014756577089428902, -0.0223408043384552, 0.017682328820228577, -0.01735566556453705, -0.026416972279548645, -0.06703661382198334, -0.08720441162586212, -0.0033624828793108463, 0.006487071048468351, 0.030194882303476334, -0.025579014793038368, -0.013329208828508854, 0.014231078326702118, -0.019869539886713028, 0.015963803976774216, -0.0006848351331427693, 0.0034494742285460234, -0.01910259574651718, 0.03232528269290924, 0.022965721786022186, 0.022582249715924263, -0.04354539513587952, 0.014713969081640244, -0.05431102216243744, -0.017440881580114365, 0.02410193532705307, -0.02596248686313629, -0.03380236029624939, 0.012320819310843945, -0.0035488929133862257, 0.04385785385966301, -0.04292047768831253, -0.03763708472251892, -0.02704188972711563, 0.021602265536785126, -0.019855337217450142, 0.020139390602707863, -0.051811352372169495, -0.01222850102931261, -0.004342467058449984, 0.00660069240257144, -0.027254929766058922, -0.023732665926218033, -0.039994727820158005, -0.003919937647879124, -0.018520286306738853, 0.025294961407780647, -0.024059327319264412, 0.05362929403781891, 0.060503385961055756, 0.014302091673016548, 0.017724936828017235, -0.041216157376766205, -0.022724276408553123, -0.020125187933444977, 0.01874752901494503, 0.01778174750506878, 0.005823095794767141, 0.0478346012532711, -0.004498696886003017, 0.007641037926077843, 0.015367291867733002, 0.00869203545153141, 0.04314772039651871, -0.02431497536599636, -0.016389884054660797, -0.024627435952425003, 0.007477707229554653, 0.020522862672805786, 0.008060016669332981, 0.007335680536925793, -0.016730748116970062, -0.008372475393116474, -0.03900054097175598, 0.04962414130568504, -0.0366428978741169, 0.011106490157544613, -0.01968490518629551, -0.0017779971240088344, 0.038631271570920944, -0.027865644544363022, 0.032921794801950455, 0.01156807690858841, 0.00478630093857646, -0.04334655776619911, -0.08265955746173859, 0.004452538210898638, -0.005652663763612509, -0.009182028472423553, 0.0009329380700364709, 0.04715287312865257, -0.02119038812816143, -0.03527944162487984, -0.008216246031224728, 0.021275604143738747, -0.012505454011261463, -0.03187079727649689, 0.02208515629172325, 0.011092287488281727, -0.032240066677331924, 0.02226979099214077, 0.007612632587552071, -0.011837927624583244, 0.018648110330104828, 0.02607610821723938, -0.016318870708346367, 0.014742374420166016, 0.02823491394519806, 0.00817363802343607, -0.031160663813352585, -0.0017407151171937585, 0.030478935688734055, -0.030876610428094864, -0.016489302739501, 0.008060016669332981, 0.0026789791882038116, -0.023036735132336617, 0.0062385243363678455, 0.014152963645756245, -0.00716524850577116, -0.01975591853260994, -0.0605601966381073, 0.004559058230370283, 0.04113094136118889, 0.019741715863347054, -0.0007141281384974718, 0.006153308320790529, -0.009934769943356514, -0.021687481552362442, -0.05470869690179825, 0.015537723898887634, -0.03826200217008591, -0.022227182984352112, -0.03831881284713745, -0.02001156657934189, 0.007261116523295641, 0.013144574128091335, 0.034285251051187515, 0.0028760412242263556, 0.06232132762670517, 0.02920069545507431, -0.02985401824116707, -0.01853448897600174, 0.011610684916377068, 0.053430456668138504, -0.05976484715938568, -0.008983191102743149, -0.005826646462082863, 0.044056691229343414, -0.04036399722099304, 0.01778174750506878, 0.013932822272181511, 0.04919806122779846, -0.04681200906634331, 0.05436783283948898, -0.0066610537469387054, -0.021062564104795456, 0.014309193007647991, 0.02643117494881153, -0.010169113986194134, 0.025096124038100243, -0.013961227610707283, -0.014266584999859333, -0.030081260949373245, -0.00739959254860878, -0.0035435669124126434, 0.020139390602707863, -0.024513812735676765, -0.02015359327197075, -0.015452507883310318, 0.021105172112584114, 0.0015001572901383042, 0.004768547601997852, 0.019315635785460472, 0.012505454011261463, -0.026345958933234215, 0.0385744608938694, 0.003902184311300516, -0.021133577451109886, -0.038489244878292084, -0.003948342986404896, -0.003873778972774744, 0.019116798415780067, -0.0281923059374094, -0.04709606245160103, 0.0030500239226967096, 0.016191046684980392, 0.05732198804616928, -0.06465056538581848, 0.012576467357575893, 0.046897225081920624, 0.009146521799266338, 0.022426020354032516, -0.003431720891967416, 0.00490347295999527, -0.048260681331157684, -0.02887403406202793, 0.03337628021836281, -0.023448612540960312, -0.03667130321264267, 0.010616498067975044, 0.032666146755218506, -0.002148154191672802, 0.006132003851234913, -0.020054174587130547, -0.03312063217163086, -0.010190417990088463, -0.03803475946187973, 0.006430260371416807, -0.02158806286752224, -0.04047761857509613, 0.026928268373012543, -0.08674992620944977, 0.057918500155210495, -0.012093575671315193, 0.030876610428094864, 0.04655636101961136, 0.010978666134178638, -0.008095523342490196, -0.017071612179279327, -0.024513812735676765, -0.022283993661403656, 0.033205848187208176, 0.04124456271529198, 0.003018067916855216, 0.008613920770585537, -0.06152597814798355, -0.03016647696495056, -0.02988242357969284, -0.02158806286752224, 0.017398273572325706, 0.011695900931954384, -0.06521867215633392, 0.05053311213850975, -0.038773298263549805, 0.03880170360207558, 0.055333614349365234, -0.01788116618990898, -0.00845769140869379, -0.001229418907314539, -0.018775934353470802, 0.035932764410972595, -0.04485204070806503, 0.034966979175806046, 0.0062314230017364025, -0.02873200736939907, 0.03874489292502403, -0.005347306374460459, -0.034427277743816376, -0.02525235339999199, 0.03624522313475609, -0.024144543334841728, 0.06266219168901443, 0.017582910135388374, -0.01702900417149067, 0.05502115562558174, -0.0066823577508330345, 0.06567315757274628, 0.021687481552362442, -0.010126505978405476, 0.0008881108951754868, -0.020679092034697533, -0.01025433000177145, -0.014983819797635078, -0.04277845099568367, -0.03067777305841446, -0.0186765156686306, -0.04007994383573532, -0.04916965588927269, 0.05161251500248909, 0.00919623114168644, 0.007989003323018551, 0.018804339691996574, 0.005432522390037775, -0.0305357463657856, 0.003255962859839201, -0.00197949749417603, 0.007683645933866501, -0.04348858445882797, -0.025976689532399178, -0.07771702855825424, -0.03422844037413597, -0.044198717921972275, 0.008074219338595867, -0.012200095690786839, 0.059537604451179504, 0.01813681423664093, 0.02194312959909439, -0.03135950118303299, -0.0017859861254692078, 0.03178558126091957, -0.03138790652155876, -0.052890755236148834, -0.03581914305686951, 0.03380236029624939, -0.018917961046099663, -0.011369239538908005, -0.0008858917281031609, 0.026786241680383682, 0.021687481552362442, -0.004196889698505402, 0.026189729571342468, -0.00502064498141408, -0.044056691229343414, -0.0026292698457837105, 0.03394438698887825, -0.010992868803441525, -0.0815233439207077, -0.004370872396975756, -0.022369209676980972, -0.027212321758270264, -0.002515648491680622, 0.017909571528434753, 0.012434440664947033, 0.021744292229413986, -0.004630071576684713, 0.016787558794021606, 0.06629807502031326, 0.03178558126091957, 0.01681596413254738, 0.007083583157509565, -0.025451190769672394, 0.06970671564340591, 0.06641169637441635, 0.023903097957372665, 0.03820519149303436, -0.04240918159484863, 0.029229100793600082, 0.02158806286752224, 0.005958021152764559, 0.04755054786801338, -0.017469286918640137, -0.033319469541311264, -0.020466051995754242, 0.03479654714465141, 0.015310481190681458, -0.0610714927315712, -0.0024677144829183817, 0.02772361785173416, 0.025919878855347633, 0.03610319644212723, 0.0354214683175087, 0.026772039011120796, -0.014216875657439232, -0.006646851077675819, 0.0011530795600265265, 0.0021676828619092703, -0.00955129787325859, 0.005066803656518459, 0.05448145419359207, -0.03644406050443649, -0.005922514479607344, -0.03516582027077675, 0.04181266948580742, 0.010240127332508564, -0.03422844037413597, -0.042579613626003265, -0.005563897080719471, -0.005173323675990105, 0.01355645153671503, -0.006270480342209339, 0.0274821724742651, 0.018690718337893486, -0.03121747449040413, -0.01834985427558422, 0.014969617128372192, 0.02830592729151249, -0.00648352038115263, 0.002567133167758584, 0.03206963464617729, -0.015225265175104141, 0.04627230763435364, -0.042437586933374405, -0.002348767127841711, -0.008755947463214397, 0.0013829852687194943, 0.014671361073851585, 0.01792377419769764, 0.0072717685252428055, -0.006448013707995415, 0.013982531614601612, -0.07095655798912048, 0.026516390964388847, -0.004576811566948891, 0.02471265196800232, 0.009160724468529224, -0.003263064194470644, -0.013442830182611942, -0.031160663813352585, 0.04292047768831253, 0.008486096747219563, 0.021389225497841835, 0.004186237696558237, 0.0033749102149158716, -0.029285911470651627, -0.011248516850173473, 0.016063222661614418, -0.020750105381011963, 0.017795950174331665, 0.00660069240257144, 0.0004846662050113082, -0.024272367358207703, -0.02144603617489338, -0.039852701127529144, 0.01590699329972267, -0.012796608731150627, -0.0392845943570137, 0.014813387766480446, -0.041897885501384735, -0.021389225497841835, -0.009700425900518894, -0.05354407802224159, 0.0024535118136554956, 0.006888296455144882, -0.005219482351094484, -0.008301462046802044, -0.014067747630178928, 0.007520315237343311, 0.03982429578900337, -0.020963145419955254, -0.010083897970616817, -0.004037109669297934, -0.08015988767147064, 0.04206831753253937, 0.05010703206062317, -0.0027091598603874445, -0.02474105730652809, 0.014955414459109306, -0.012256906367838383, -0.01695799082517624, 0.0040300083346664906, 0.03630203381180763, -0.0069593098014593124, -0.016262060031294823, 0.01630466803908348, 0.010282735340297222, -0.016716545447707176, 0.014451219700276852, 0.009011596441268921, -0.009316953830420971, 0.021034158766269684, -0.04238077625632286, 0.016787558794021606, 0.021346617490053177, 0.02065068669617176, 0.009160724468529224, -0.003087306162342429, 0.012548062019050121, 0.008088422007858753, -0.012540960684418678, -0.005471579730510712, 0.00810262467712164, -0.0235622338950634, 0.029229100793600082, -0.009615209884941578, 0.01724204421043396, 0.020409241318702698, -0.005993527825921774, -0.016716545447707176, 0.033205848187208176, 0.0036891442723572254, 0.019415054470300674, 0.023974111303687096, 0.03397279232740402, -0.023647449910640717, -0.0171000175178051, -0.00948028452694416, -0.02755318582057953, -0.014898603782057762, -0.048828788101673126, -0.010524180717766285, 0.007641037926077843, -0.018690718337893486, 0.002836983883753419, 0.03584754839539528, -0.020025769248604774, 0.0031210375018417835, -0.04252280294895172, 0.0028192305471748114, -0.0065438817255198956, 0.01825043559074402, 0.020750105381011963, -0.025564812123775482, -0.01147575955837965, -0.03434206172823906, -0.02802187390625477, 0.0062101189978420734, -0.03522263094782829, -0.018846947699785233, -0.02506771869957447, -0.009047103114426136, -0.0033678088802844286, 0.002318586455658078, -0.0223408043384552, -0.0366428978741169, 0.02245442569255829, -0.015424102544784546, 0.02988242357969284, -0.013442830182611942, -0.006572287064045668, 0.014543537050485611, -0.0017087591113522649, -0.019883742555975914, -0.0027677458710968494, 0.012342123314738274, 0.025976689532399178, 0.007683645933866501, 0.03303541615605354, 0.025763649493455887, 0.005627809092402458, 0.015850182622671127, 0.010261431336402893, 0.04465320333838463, -0.006526128388941288, 0.019954755902290344, -0.026033500209450722, -0.05499275028705597, 0.02518134005367756, -0.005073904991149902, 0.013520944863557816, -0.004747243598103523, -0.0017646821215748787, -0.013655870221555233, -0.0058586024679243565, 0.027681009843945503, 0.0152678731828928, -0.027950860559940338, 0.052748728543519974, 0.010453167371451855, -0.011823724955320358, 0.031842391937971115, -0.013939923606812954, -0.0016262060962617397, 0.001967070158571005, 0.013748187571763992, -0.0012853419175371528, 0.01950027048587799, -0.04666998237371445, -0.025337569415569305, -0.005791139788925648, 0.0027659705374389887, 0.0034352715592831373, -0.004885719623416662, 0.0045200008898973465, 0.00862102210521698, 0.00732857920229435, 0.03954024240374565, 0.0015214612940326333, 0.001835695467889309, -0.026772039011120796, -0.011220111511647701, -0.0005605617770925164, 0.02898765541613102, -0.007477707229554653, 0.015225265175104141, 0.03834721818566322, 0.03766549006104469, 0.010907652787864208, 0.028135495260357857, 0.009253041818737984, -0.004275004379451275, 0.002457062480971217, 0.009061305783689022, 0.03854605555534363, -0.002494344487786293, 0.010147809982299805, 0.03178558126091957, 0.004353119060397148, -0.026175526902079582, 0.013073560781776905, -0.002226269105449319, -0.004764996934682131, -0.05868544429540634, -0.0017593561206012964, -0.02245442569255829, 0.02858998067677021, 0.0014966066228225827, -0.012903128750622272, 0.002806803211569786, -0.02539438009262085, -0.044624797999858856, -0.016645532101392746, 0.007349883206188679, -0.010509978048503399, 0.016034817323088646, 0.013982531614601612, -0.004910574294626713, 0.013655870221555233, -0.04857314005494118, 0.013471235521137714, -0.049368493258953094, 0.01573656126856804, -0.01124141551554203, -0.023832084611058235, 0.009416372515261173, -0.006945107132196426, -0.01681596413254738, -0.030081260949373245, -0.013158776797354221, 0.00046691286843270063, -0.010893450118601322, 0.008926380425691605, 0.011951548978686333, -0.005826646462082863, -0.015140049159526825, 0.009387967176735401, -0.018761731684207916, 0.02015359327197075, 0.000975546077825129, -0.029967639595270157, -0.0014131659409031272, 0.01641828939318657, 0.0035080602392554283, -0.04249439761042595, -0.0347113311290741, -0.005301147699356079, 0.04127296805381775, 0.046783603727817535, -0.02245442569255829, -0.02449961006641388, 0.020948942750692368, -0.01168879959732294, -0.012938635423779488, -0.000420754193328321, -0.031302690505981445, 0.005002891644835472, -0.01208647433668375, 0.002654124516993761, 0.007254015188664198, 0.008038712665438652, -0.01888955570757389, 0.041755858808755875, 0.04845951870083809, 0.005372161045670509, 0.021531252190470695, -0.08248912543058395, -0.012313717976212502, 0.004083268344402313, -0.02985401824116707, 0.008748846128582954, -0.009451879188418388, -0.005034847650676966, -0.022397615015506744, 0.04973776265978813, -0.010126505978405476, 0.04277845099568367, 0.011610684916377068, 0.004796952940523624, -0.031189069151878357, 0.018378259614109993, 0.04843111336231232, -0.008876671083271503, -0.017682328820228577, 0.05178294703364372, -0.013549350202083588, -0.020750105381011963, -0.03405800834298134, -0.050305869430303574, 0.0032648395281285048, -0.0417274534702301, -0.004867966286838055, 0.0035648709163069725, -0.01590699329972267, 0.0025209744926542044, -0.00443478487432003, 0.005226583685725927, 0.05203859508037567, -0.04544855281710625, -0.0006985939689911902, 0.006345044355839491, -0.06964990496635437, -0.003145892173051834, -0.022241385653614998, -0.049794573336839676, -0.006132003851234913, 0.049368493258953094, -0.0008943245629779994, -0.012491251341998577, -0.011816623620688915, -0.02144603617489338, -0.016475100070238113, 0.022312398999929428, -0.03152993321418762, -0.06584358960390091, -0.006749820429831743, 0.016787558794021606, -0.02036663331091404, -0.015750763937830925, -0.03459770977497101, -0.04371582716703415, 0.0014921682886779308, -0.025777852162718773, 0.012917331419885159, -0.009657817892730236, 0.002185436198487878, 0.002966583240777254, 0.022539641708135605, 0.03814838081598282, -0.03658608719706535, -0.02126140147447586, -0.005265641026198864, -0.01907419040799141, 0.013939923606812954, -0.001986598828807473, 0.0022653264459222555, -0.012349224649369717, 0.0446816086769104, -0.025550609454512596, 0.00134925392922014, 0.012192994356155396, 0.0046655782498419285, 0.010921855457127094, -0.02790825255215168, 0.014174267649650574, 0.020096782594919205, 0.00852870475500822, -0.009473183192312717, -0.02011098526418209, 0.008919279091060162, 0.004083268344402313, 0.023974111303687096, 0.01613423600792885, 0.00039035160443745553, 0.006838587112724781, -0.026772039011120796, 0.00165017310064286, -0.03766549006104469, -0.006050338502973318, 0.02090633474290371, -0.029768802225589752, -0.008052915334701538, -0.017341462895274162, -0.0368417352437973, 0.00912521779537201, -0.0004236391105223447, -0.002284855116158724, -0.0020221055019646883, -0.012455744668841362, -0.03164355456829071, -0.0002540946879889816, 0.014969617128372192, 0.01820782758295536, 0.010048391297459602, 0.010389255359768867, 0.01602061465382576, 0.041755858808755875, -0.006579388398677111, 0.04306250438094139, 0.01435180101543665, -0.015225265175104141, 0.017582910135388374, 0.020025769248604774, -0.0005681069451384246, 0.004214643035084009, -0.001765569788403809, 0.017724936828017235, 0.06385521590709686, -0.04002313315868378, 0.008585515432059765, -0.016475100070238113, 0.008826961740851402, 0.0158785879611969, -0.0007669443148188293, -0.01533888652920723, -0.01327239815145731, -0.006029034499078989, -0.0011610685614868999, -0.04073326662182808, -0.020892132073640823, 0.026459580287337303, -0.018619704991579056, 0.04249439761042595, 0.024897286668419838, 0.0007558484794571996, 0.015296278521418571, 0.014586145058274269, 0.015381494536995888, 0.005801791790872812, -0.019059987738728523, 0.02511032670736313, 0.026644214987754822, -0.043261341750621796, 0.005911862477660179, -0.04070486128330231, -0.007513213902711868, 0.02675783634185791, -0.02151704952120781, 0.009764337912201881, 0.020991550758481026, 0.012093575671315193, 0.03232528269290924, -0.015097441151738167, -0.01566554792225361, -0.028107089921832085, 0.03650087118148804, 0.009047103114426136, 0.010843740776181221, -0.04644273966550827, 0.010261431336402893, 0.01320138480514288, -0.030223287642002106, -0.055901721119880676, -0.01192314364016056, -0.0075700245797634125, -0.020210403949022293, 0.026303350925445557, 0.0069593098014593124, -0.007499011233448982, 0.0032896941993385553, 0.00978564191609621, 0.0029790105763822794, 0.0024038024712353945, 0.023249775171279907, 0.03110385313630104, -0.02589147351682186, -0.012647480703890324, -0.009615209884941578, 0.005251438356935978, -0.021786900237202644, 0.05800371617078781, 0.010247228667140007, 0.0013039829209446907, -0.009423473849892616, 0.044056691229343414, -0.00577338645234704, -0.004143629688769579, 0.008585515432059765, 0.010474471375346184, 0.030365314334630966, 0.0032896941993385553, -1.407784475304652e-05, 0.02542278543114662, 0.004871516954153776, 0.004690432921051979, -0.026587404310703278, 0.0011681698961183429, 0.02086372673511505, 0.007655240595340729, 0.022369209676980972, 0.006195916328579187, 0.0027819485403597355, 0.036046385765075684, -0.0016537237679585814, -0.018577096983790398, 0.05118643492460251, 0.024840475991368294, 0.025025110691785812, -0.03758027404546738, 0.034285251051187515, 0.013478336855769157, 0.019315635785460472, -0.046215496957302094, 0.013002547435462475, -0.02959837019443512, -0.026956673711538315, 0.014884401112794876, -0.003998052328824997, -0.017369868233799934, 0.019855337217450142, -0.012306616641581059, 0.009608108550310135, 0.014202672988176346, 0.01109938882291317, 0.02535177208483219, 0.023406004533171654, -0.017625518143177032, 0.0317571759223938, 0.010687511414289474, 0.013187182135879993, -0.008521603420376778, -0.009281447157263756, -0.0041755856946110725, 0.02001156657934189, 0.011042578145861626, -0.005340205039829016, 0.019045785069465637, -0.020167795941233635, -0.013052256777882576, -0.014515131711959839, -0.02367585524916649, 0.01910259574651718, 0.027354348450899124, 0.0031956015154719353, -0.02065068669617176, 0.010176215320825577, -0.021857913583517075, -0.008897975087165833, 0.003062451258301735, 0.013428627513349056, -0.001652836101129651, 0.01425948366522789, 0.007364085875451565, 0.0065083750523626804, 0.02711290307343006, 0.01702900417149067, -0.02506771869957447, 0.0281923059374094, 0.0011504165595397353, 0.0366428978741169, -0.0002142606390407309, -0.019798526540398598, 0.011667495593428612, -0.03241049870848656, -0.0033607075456529856, 0.006998367141932249, -0.022497033700346947, 0.010360850021243095, -0.010311140678822994, 0.03204122930765152, -0.009565500542521477, -0.01224980503320694, -0.008109726011753082, 0.03650087118148804, -0.010360850021243095, -0.005716575775295496, 0.02424396201968193, 0.06311667710542679, 0.002357643796131015, 0.014827590435743332, 0.04235237091779709, -0.040534429252147675, -0.02391730062663555, 0.002728688530623913, 0.037835922092199326, 0.019230419769883156, 0.02840534597635269, 0.02898765541613102, 0.0003450805670581758, -0.016489302739501, -0.011610684916377068, -0.018917961046099663, -0.0033891128841787577, 0.011184604838490486, 0.029371127486228943, 0.004768547601997852, 0.01334341149777174, 0.013989632949233055, 0.00584439979866147, -0.00544317439198494, 0.0256500281393528, 0.013897315599024296, 0.006444463040679693, -0.044482771307229996, -0.0368417352437973, 0.025877270847558975, 6.189397481648484e-06, -0.05666866526007652, 0.023036735132336617, -0.041500210762023926, -0.016148438677191734, 0.020423443987965584, 0.0021357268560677767, 0.015566129237413406, 0.007062279153615236, 0.007967699319124222, -0.008748846128582954, 0.022184574976563454, 0.021786900237202644, 0.002311485121026635, -0.007626835256814957, 0.008273056708276272, 0.029143884778022766, -0.026246540248394012, 0.005507086403667927, 0.030365314334630966, 0.011482860893011093, 0.003756606951355934, -0.025635825470089912, -0.033319469541311264, 0.00808132067322731, 0.013520944863557816, -0.007832773961126804, 0.031416311860084534, 0.020707497373223305, -0.022568047046661377, -0.028064481914043427, -0.029371127486228943, -0.018094206228852272, 0.0336887389421463, -0.017071612179279327, -0.018577096983790398, -0.01046737004071474, -0.00509165832772851, 0.009885060600936413, -0.01695799082517624, 0.07408114522695541, 0.02452801540493965, -0.0032879188656806946, 0.007051627151668072, 0.004061964340507984, 0.020054174587130547, -0.018165219575166702, 0.023519625887274742, -0.020054174587130547, -0.013137472793459892, 0.0023381151258945465, 0.04524971544742584, -0.033859170973300934, 0.016830166801810265, 0.03229687735438347, -0.005258539691567421, -0.004580362234264612, 0.03354671224951744, -0.04255120828747749, -0.012484150007367134, 0.016588721424341202, 0.028249116614460945, -0.013712680898606777, -0.010233025997877121, 0.009977377951145172, -0.0020416341722011566, 0.005084556993097067, 0.0003082423936575651, 0.040676455944776535, 0.012114879675209522, 0.00808132067322731, 0.0012161039048805833, -0.01940085180103779, -0.02769521251320839, 0.011014172807335854, -0.015509318560361862, 0.029939234256744385, -0.0020132288336753845, -0.019514473155140877, -0.03792113810777664, 0.022511236369609833, -0.003197376849129796, 0.03314903751015663, 0.023533828556537628, 0.004196889698505402, 0.03437046706676483, -0.019415054470300674, 0.008521603420376778, 0.02708449773490429, 0.0005805342807434499, 0.01627626270055771, 0.021147780120372772, 0.021559657528996468, -0.003069552592933178, -0.014927009120583534, 0.0007243363070301712, 0.03624522313475609, -0.006455115042626858, 0.020281417295336723, -0.004768547601997852, -0.01620524935424328, 0.014742374420166016, -0.005876355804502964, 0.0373530313372612, -0.01039635669440031, -0.016617126762866974, 0.002400251803919673, 0.020522862672805786, -0.03581914305686951, 0.009799844585359097, 0.02086372673511505, 0.012611974030733109, 0.025152934715151787, -6.0583275626413524e-05, -0.012271109037101269, 0.03732462599873543, 0.023690057918429375, 0.02830592729151249, 0.03817678615450859, 0.025664230808615685, 0.009231737814843655, 0.006046787835657597, 0.018704921007156372, -0.028462156653404236, 0.02255384437739849, 0.000507745542563498, 0.012597771361470222, 0.016460897400975227, -0.02633175626397133, -0.021786900237202644, -0.02036663331091404, 0.028476359322667122, 0.031842391937971115, -0.024045124650001526, -0.0033749102149158716, 0.023363396525382996, -0.015537723898887634, 0.0038418229669332504, -0.0016874551074579358, -0.025096124038100243, -0.019940553233027458, 0.035790737718343735, -0.04695403575897217, 0.01411745697259903, -0.029825612902641296, -0.00395899498835206, 0.0008539357222616673, -0.011092287488281727, 0.029172290116548538, -0.0011344385566189885, -0.013932822272181511, -0.020267214626073837, -0.034682925790548325, 0.008038712665438652, 0.01126271951943636, -0.022568047046661377, 0.005499985069036484, -0.02248283103108406, -0.01508323848247528, 0.024883083999156952, -0.04686881974339485, -0.0035950515884906054, -0.010999970138072968, -0.003041147254407406, -0.012143285013735294, -0.006724965758621693, -0.016191046684980392, 0.002938177902251482, -0.020551268011331558, 0.01820782758295536, 0.027169713750481606, 0.02647378295660019, -0.002938177902251482, 0.021971534937620163, -0.03300701081752777, 0.0417274534702301, -0.004118775017559528, -0.029172290116548538, -0.018648110330104828, -0.0002616398560348898, -0.01435180101543665, -0.007314376533031464, -0.005595853086560965, 0.020451849326491356, 0.030194882303476334, 0.012136183679103851, -0.03201282396912575, -0.03363192826509476, 0.018222030252218246, 0.018733326345682144, 0.013932822272181511, 0.046897225081920624, -0.03502378985285759, 0.011070983484387398, 0.024897286668419838, -0.052748728543519974, 0.0013146349228918552, -0.043801043182611465, 0.0032169055193662643, 0.02165907621383667, -0.03777911141514778, -0.01418847031891346, -0.0069948164746165276, -0.030734583735466003, 0.02151704952120781, -0.026445377618074417, 0.003728201612830162, 0.01271139271557331, 0.0305357463657856, -0.01048867404460907, 0.015282075852155685, -0.011575178243219852, -0.009693324565887451, 0.006547432392835617, -0.01771073415875435, 0.007527416571974754, -0.018520286306738853, 0.009686223231256008, -0.007044525817036629, 0.013087763451039791, -0.018903758376836777, 0.020636484026908875, 0.03181398659944534, 0.01756870746612549, 0.0192872304469347, -0.008251752704381943, 0.02313615381717682, -0.010999970138072968, -0.022752681747078896, -0.04249439761042595, 0.024414394050836563, -0.0029186492320150137, -0.01364876888692379, 0.025848865509033203, 0.03922778367996216, 0.003664289601147175, 0.008280158042907715, -0.001986598828807473, -0.0038631269708275795, -0.012292413972318172, -0.017696531489491463, 0.008777252398431301, -0.029072871431708336, -0.022184574976563454, 0.002742891199886799, -0.010950260795652866, 0.008308563381433487, 0.008493198081851006, 0.0146571584045887, -0.000723892473615706, -0.01910259574651718, -0.01641828939318657, 0.010737220756709576, 0.02715551108121872, -0.004967384971678257, 0.025493798777461052, -0.00690604979172349, 0.03493857383728027, -0.015168454498052597, 0.04036399722099304, -0.024414394050836563, -0.007754659280180931, 0.011589380912482738, -0.004235947038978338, -0.0013075335882604122, -0.03107544779777527, 0.049368493258953094, 0.04817546531558037, -0.03584754839539528, 0.001098044216632843, -0.008464792743325233, -0.029229100793600082, -0.036131601780653, -0.023519625887274742, -0.018832745030522346, -0.017256246879696846, 0.014571942389011383, -0.0008339632186107337, 0.009870857931673527, -0.025749446824193, -0.004999340977519751, -0.02485467866063118, -0.008393779397010803, -0.011418948881328106, -0.008670731447637081, -0.0037992149591445923, -0.002384273800998926, 0.006526128388941288, -0.020466051995754242, 0.0017025454435497522, -0.02165907621383667, -0.007626835256814957, 0.016716545447707176, -0.017753342166543007, -9.414818487130105e-05, 0.00919623114168644, 0.022170372307300568, -0.012768203392624855, 0.02184371091425419, -0.017483489587903023, -0.04874357208609581, -0.009132319130003452, -0.03417162969708443, 0.016546113416552544, 0.00770494993776083, -0.007406693883240223, -0.022568047046661377, -0.009217535145580769, 0.014912806451320648, 0.012306616641581059, 0.008060016669332981, 0.03874489292502403, 0.0673774778842926, -0.0021872115321457386, 0.02866099402308464, -0.029569964855909348, 0.03147312253713608, -0.012697190046310425, 0.021346617490053177, 0.014138760976493359, -0.024116137996315956, -0.0017238494474440813, -0.008138131350278854, -0.0032541875261813402, -0.009586804546415806, -0.010644903406500816, -0.03451249375939369, -0.01479918509721756, 0.007484808564186096, -0.02180110290646553, -0.0019244621507823467, 0.02633175626397133, -0.012370528653264046, -0.0007301061414182186, 0.008074219338595867, 0.01487019844353199, 0.012391832657158375, -0.0689113661646843, -0.031700365245342255, 0.016176844015717506, -0.04698244109749794, 0.017483489587903023, 0.0152678731828928, -0.004037109669297934, -0.008684934116899967, 0.012491251341998577, -0.023505423218011856, 0.014998022466897964, -0.010616498067975044, -0.015438305214047432, -0.011816623620688915, 0.0006240299553610384, 0.0046726795844733715, -0.019273027777671814, -0.004867966286838055, 0.03300701081752777, -0.02823491394519806, -0.0065367803908884525, -0.034398872405290604, 0.01886115036904812, 0.016659734770655632, 0.0027890498749911785, -0.008365374058485031, -0.020466051995754242, 0.06572996824979782, -0.006462216377258301, -0.04544855281710625, 0.008060016669332981, -0.013606160879135132, -0.0293143168091774, 0.03192760795354843, 0.011269820854067802, -0.005876355804502964, 0.02816390059888363, 0.00876304879784584, 0.01609162800014019, 0.0269708763808012, 0.047863006591796875, 0.008166536688804626, -0.011816623620688915, -0.004395727533847094, 0.008613920770585537, 0.0075842272490262985, 0.028547372668981552, -0.005386363714933395, 0.007598429918289185, 6.208121340023354e-05, -0.004864415619522333, 0.0005343755474314094, 0.02201414294540882, -0.0065083750523626804, -0.009636513888835907, -0.049084436148405075, 0.026701025664806366, 0.003305672202259302, 0.005475130397826433, 0.018108408898115158, -0.00881986040621996, 0.0011885862331837416, 0.007925091311335564, 0.014912806451320648, 0.001534776296466589, -0.04255120828747749, 0.005393465049564838, -0.001878303475677967, -0.010012884624302387, 0.012832115404307842, 0.00443478487432003, -0.018690718337893486, 0.042437586933374405, -0.03187079727649689, 0.006735617760568857, 0.0006835036328993738, -0.03107544779777527, 0.04550536349415779, 0.001617329427972436, 0.0014557739486917853, -0.00919623114168644, -0.01742667891085148, -0.015580331906676292, 0.008067118003964424, 0.0035062849055975676, -0.00220496510155499, 0.009700425900518894, 0.024045124650001526, 0.030507341027259827, 0.026885660365223885, 0.01881854236125946, -0.020948942750692368],
-    },
-    {
-        "crl_id": "NDA214927_20210617",
-        "company": "Orphazyme A/S",
-        "app_number": "NDA 214927",
-        "date": "2021-06-17",
-        "text_preview": 'a SERVIC,\n” Gy\n\nSERVICES\n\nj 4 DEPARTMENT OF HEALTH & HUMAN Public Health Service\n\nFood and Drug Administration\nRockville, MD 20857\n\nNDA 214927\nCOMPLETE RESPONSE\n\nOrphazyme A/S\n\nc/o Orphazyme US Inc.\n\n',
-        "embedding": [-0.002712292829528451, 0.02839760296046734, -0.016880154609680176, 0.01534559577703476, 0.00911660399287939, -0.0373244509100914, -0.03607039898633957, 0.01395129133015871, -0.026368023827672005, 0.046003784984350204, -0.0028587360866367817, 0.008588583208620548, 0.00044654859811998904, -0.010156144388020039, -0.008031686767935753, 0.019701765850186348, -0.059039290994405746, 0.007404662668704987, -0.017919695004820824, 0.01655014231801033, -0.018678724765777588, -0.011253437027335167, 0.04468373581767082, 0.013555276207625866, 0.03920552134513855, 0.02917313203215599, -0.007784177083522081, 0.01793619617819786, -0.02597200870513916, 0.0285131074488163, -0.010230396874248981, 0.020097780972719193, 0.026896044611930847, 0.02179734595119953, 0.008382325060665607, 0.01174845639616251, 0.016632646322250366, -0.009908635169267654, 0.02120332419872284, -0.029255636036396027, -0.02029578760266304, -0.0026834167074412107, -0.01998227648437023, 0.04910590872168541, 0.011484446004033089, -0.030476683750748634, -0.024965468794107437, -0.01546110026538372, 0.014033795334398746, 0.02463545650243759, -0.016690397635102272, 0.014718571677803993, -0.01404204498976469, -0.04669681191444397, 0.03527836874127388, -0.0013489273842424154, 0.01169070415198803, 0.03966753929853439, 0.026681536808609962, 0.020097780972719193, -0.024272441864013672, -0.00876183994114399, 0.03689543157815933, 0.037357449531555176, 0.003551763016730547, 0.022457372397184372, -0.02524598129093647, -0.02465195767581463, -0.02192935161292553, -0.04897390305995941, -0.050161946564912796, -0.033859316259622574, -0.030856197699904442, 0.012457983568310738, 0.012367229908704758, -0.023595916107296944, 5.1757870096480474e-05, 0.03031167760491371, 0.05649819225072861, 0.004933691583573818, 0.024717960506677628, 0.004739808849990368, -0.024272441864013672, -0.011847459711134434, 0.015485851094126701, 0.03140071779489517, 0.02555949240922928, -0.06550754606723785, -0.02778707817196846, 0.021912850439548492, 0.024684958159923553, 0.021846847608685493, -0.018167205154895782, -0.007561418693512678, 0.004380919970571995, 0.009644624777138233, 0.03475034981966019, -0.002780358074232936, -0.00165006413590163, -0.009347612969577312, 0.029668152332305908, -0.004224163945764303, 0.016038622707128525, 0.0029061753302812576, -0.03696143627166748, 0.007544917985796928, 0.01993277482688427, 0.03376030921936035, 0.01920674555003643, 0.17398275434970856, 0.005799975246191025, -0.01603037305176258, 0.016426388174295425, -0.04095458984375, -0.0013860538601875305, -0.03623540699481964, -0.03080669604241848, 0.0028360476717352867, -0.03209374472498894, -0.013679031282663345, 0.022440871223807335, 0.004121034871786833, -0.007181903813034296, -0.002147145802155137, -0.0013530525611713529, 0.034585341811180115, -0.013679031282663345, -0.0030814947094768286, -0.01552710309624672, 0.0025637871585786343, -0.030229173600673676, -0.004356169141829014, -0.004752184730023146, -0.04161461442708969, -0.051250990480184555, 0.041944630444049835, -0.02669803611934185, -0.05785124748945236, -0.023084396496415138, 0.011484446004033089, -0.019305748865008354, -0.001092136139050126, -0.002910300623625517, -0.03164822980761528, 0.018398214131593704, -0.017985697835683823, -0.01159995049238205, 0.011137932538986206, -0.009850882925093174, 0.024189939722418785, -0.013604777865111828, 0.007091150153428316, 0.003743582870811224, -0.03646641597151756, -0.005395709536969662, 0.026351522654294968, -0.01187221147119999, -0.02488296665251255, 0.0058866036124527454, -0.014570065774023533, 0.016591394320130348, 0.0212528258562088, -0.014644318260252476, 0.012301228009164333, 0.02361241728067398, 0.01527959294617176, -0.04115259647369385, -0.02356291562318802, -0.021648840978741646, 0.03257226571440697, 0.004040594212710857, 0.013522274792194366, 0.012301228009164333, -0.008299821987748146, -0.008378200232982635, -0.010370653122663498, 0.03653241693973541, 0.03442033752799034, -0.020873310044407845, 0.01178145781159401, -0.008378200232982635, -0.003023742465302348, -0.00013432552805170417, 0.008233820088207722, 0.0037497705779969692, -0.007916182279586792, 0.026929045096039772, -0.0051316991448402405, -0.007054023910313845, 0.047257836908102036, -0.019619261845946312, 0.0019996713381260633, 0.01510633621364832, 0.01198771595954895, 0.00896809808909893, 0.021582838147878647, -0.0036012649070471525, -0.01186396088451147, 0.008039937354624271, 0.04389170557260513, -0.025113975629210472, 0.019239747896790504, -0.03405732288956642, 0.011014177463948727, -0.029734155163168907, 0.03521236777305603, 0.050953980535268784, 0.019487256184220314, 0.04154861345887184, -0.005639093928039074, -0.009727127850055695, -0.014429810456931591, -0.025031471624970436, 0.008089439012110233, 0.010708916001021862, 0.0018934485269710422, -0.04837987944483757, -0.03795147314667702, -0.0034651346504688263, -0.02537798509001732, -0.02760557271540165, -0.017309172078967094, 0.05174601078033447, 0.004174662288278341, 0.017672186717391014, 0.04669681191444397, -0.03966753929853439, 0.0708867534995079, 0.008679336868226528, -0.010205646045506, 0.013035506010055542, 0.02755606919527054, -0.015362096950411797, 0.008415326476097107, -0.0046573057770729065, -0.005403959657996893, 0.012375480495393276, -0.0080358125269413, -0.025889504700899124, -0.01552710309624672, -0.009174356237053871, 0.004888314753770828, 0.011038928292691708, -0.004562427289783955, -0.011467945761978626, 0.010849171318113804, 0.017738189548254013, 0.05012894794344902, 0.051184989511966705, 0.00900109950453043, 0.03976654261350632, -0.017655685544013977, -0.010997677221894264, 0.03352930024266243, 1.2729986337944865e-05, 0.04016255959868431, 0.0042076632380485535, 0.01045315619558096, -0.011583450250327587, 0.004314917605370283, 0.005775224417448044, -0.0019047927344217896, 0.029866158962249756, -0.005403959657996893, -0.010048890486359596, 0.01679765246808529, 0.013588277623057365, 0.02935463935136795, 0.04234064370393753, -0.01437205821275711, -0.05290105566382408, -0.0019109804416075349, 0.050953980535268784, -0.005981482099741697, -0.03328179195523262, -0.01843121647834778, 0.04042657092213631, -0.00015392004570458084, 0.027259059250354767, 0.017837192863225937, 0.002192522631958127, 0.0012262038653716445, -0.04927091300487518, -0.020856810733675957, -0.058016251772642136, 0.022094357758760452, -0.012276477180421352, -0.04474973678588867, -0.022242864593863487, 0.027325060218572617, -0.031928740441799164, -0.03275377303361893, -0.032407257705926895, -0.03448633849620819, -0.013555276207625866, -0.025443987920880318, -0.008246195502579212, 0.02501497231423855, 0.020757805556058884, -0.013877038843929768, -0.03768746182322502, -0.03970054164528847, -0.008827842772006989, 0.01032940112054348, 0.002200772985816002, 0.00525545421987772, -0.022391369566321373, 0.05527714639902115, -0.05498013645410538, -0.008407076820731163, 0.021846847608685493, -0.020015276968479156, 0.044980745762586594, -0.05465012043714523, 0.0020429855212569237, 0.011467945761978626, 0.005927855148911476, -0.05055796355009079, 0.02222636342048645, -0.011979465372860432, -0.0005744285299442708, -0.00040839085704647005, -0.007206654641777277, -0.06656358391046524, 0.015535353682935238, -0.03135121613740921, -0.025823503732681274, 0.028001587837934494, -0.02699504792690277, 0.007916182279586792, -0.02892562374472618, 0.017292670905590057, 0.0024936592672020197, 0.017012160271406174, -0.01950375735759735, -0.008811342529952526, -0.04395770654082298, -0.012309477664530277, 0.027259059250354767, 0.0008642210741527379, 0.026714537292718887, -0.06950069963932037, -0.012490984983742237, -0.004628429654985666, -0.013712032698094845, -0.057422228157520294, -0.009595122188329697, 0.026615533977746964, 0.06699260324239731, -0.019124243408441544, 0.0011395754991099238, -0.01770518720149994, 0.023942429572343826, 0.0178206916898489, 0.044419724494218826, -0.0010483063524588943, -0.026863044127821922, -0.028315098956227303, 0.010106642730534077, 0.01045315619558096, 0.04306667298078537, -0.024717960506677628, -0.010461405850946903, -0.012061968445777893, -0.012606489472091198, 0.05705921724438667, 0.008171942085027695, 0.018645724281668663, 0.02983315847814083, -0.03418932855129242, -0.01009014155715704, -0.0009719908703118563, 0.015015583485364914, 0.032770272344350815, 0.006695135030895472, 0.0006765262805856764, 0.036268409341573715, 0.043033670634031296, -0.005408084951341152, 0.048709891736507416, 0.00017802644288167357, -0.0071901543997228146, 0.0036157029680907726, 0.013943041674792767, -0.03593839704990387, 0.006864266470074654, 0.04425472021102905, -0.010494407266378403, 0.002796858549118042, -0.0178866945207119, -0.028018087148666382, 0.014273053966462612, 0.004636680241674185, 0.015634357929229736, -0.013588277623057365, -0.042604655027389526, -0.010024139657616615, -0.009281610138714314, 0.0479508638381958, -0.015865366905927658, -0.0015995309222489595, 0.0003395522362552583, -0.011591699905693531, 0.01914074271917343, 0.010354151949286461, 0.012490984983742237, -0.025394486263394356, -0.03943653032183647, -0.015230091288685799, 0.004752184730023146, -0.030476683750748634, 0.01657489314675331, 0.02440444752573967, -0.024717960506677628, 0.008077063597738743, -0.020609300583600998, 0.007091150153428316, 0.006072235759347677, -0.022424370050430298, 0.02197885327041149, -0.002390530426055193, 0.005890728905797005, 0.03399131819605827, 0.011971214786171913, 0.03798447549343109, 0.007041648495942354, -0.008638085797429085, 0.0038962138351053, 0.034222327172756195, -0.029932161793112755, -0.014124548062682152, 0.010725416243076324, -0.0031186211854219437, -0.01640988700091839, 0.0014159611891955137, -0.007825428619980812, -0.06563954800367355, -0.002382280072197318, -0.012754995375871658, 0.02910713106393814, -0.0014087421586737037, -0.004269540775567293, -0.039469532668590546, 0.019355252385139465, -0.039172522723674774, -0.02983315847814083, -0.0026256644632667303, -0.01395129133015871, -0.0177546888589859, 0.022968892008066177, -0.030938701704144478, 0.04016255959868431, -0.011608201079070568, -0.0008224538178183138, -0.007965683937072754, -0.004368544556200504, -0.03465134650468826, -0.04408971220254898, 0.046894822269678116, -0.04088858887553215, 0.006847765762358904, -0.003308378392830491, 0.02016378380358219, -0.016789402812719345, -0.012499235570430756, 0.015815863385796547, -0.053363073617219925, -0.008737089112401009, 0.04831387475132942, 0.007425288204103708, -0.015428098849952221, 4.1058236092794687e-05, -0.02881011925637722, -0.0032217500265687704, 0.03239075839519501, -0.028958624228835106, 0.021599339321255684, -0.02361241728067398, 0.01621188037097454, 0.022803885862231255, 0.038743503391742706, 0.0067652626894414425, -0.009776629507541656, 0.020741306245326996, -0.0006234148168005049, -0.016591394320130348, 0.006592005956918001, 0.035542380064725876, 0.0375884585082531, -0.002161583863198757, -0.011946463957428932, -0.004092158749699593, -0.034585341811180115, -0.018530219793319702, 0.0037786467000842094, -0.0014881514944136143, 0.0022874013520777225, -0.03643341362476349, 0.03341379761695862, 0.0004493846499826759, 0.06276843696832657, -0.03890851140022278, -0.0014912454644218087, 0.001199390273541212, -0.018563220277428627, 0.030575687065720558, -0.010494407266378403, -0.0026256644632667303, -0.023843426257371902, 0.04422171786427498, 0.009768378920853138, -0.015205340459942818, -0.024849964305758476, 0.002833985025063157, 0.010791419073939323, 0.006983896251767874, -0.009314611554145813, 0.027589071542024612, 0.028282098472118378, 0.02138482965528965, 0.005350332707166672, -0.009529120288789272, -0.03334779664874077, 0.013522274792194366, -0.028546107932925224, -0.029800157994031906, -0.026797041296958923, -0.03333129361271858, 0.03689543157815933, -0.008481329306960106, 0.013118009082973003, 0.031978242099285126, 0.04257165268063545, 0.006022734101861715, -0.02156633697450161, 2.732918619585689e-05, -0.01909124106168747, -0.037786468863487244, 0.008580333553254604, 0.01153394766151905, 0.014066795818507671, 0.03593839704990387, -0.01422355230897665, -0.02753956988453865, -0.04326467961072922, 0.00014644318434875458, 0.012210474349558353, -0.003176373429596424, 0.023331906646490097, 0.027028050273656845, -0.004756309557706118, -0.0034878228325396776, 0.037357449531555176, 0.01640988700091839, -0.00522657809779048, -0.03026217594742775, 0.03534437343478203, -0.0156178567558527, -0.01195471454411745, -0.003817835822701454, 0.0008136878605000675, 0.0007327315979637206, 0.0004710417415481061, -0.006592005956918001, -0.024734459817409515, 0.015073335729539394, -6.216745532583445e-05, 0.0276715736836195, 0.01630263216793537, 0.044551730155944824, 0.008386450819671154, -0.0023265902418643236, 0.021879849955439568, 0.02646702714264393, 0.014000793918967247, 0.03475034981966019, -0.006563129834830761, 0.015749862417578697, -0.04633380100131035, -0.02433844469487667, -0.003199061844497919, -0.016104625537991524, -0.02022978477180004, 0.0008920658729039133, 0.0043520438484847546, 0.015081585384905338, 0.03907351568341255, -0.04567377269268036, 0.0019151056185364723, -0.011071929708123207, 0.008506080135703087, 0.025146976113319397, -0.001070479047484696, 0.003978717140853405, -0.004102471750229597, 0.016682147979736328, -0.004065345507115126, 0.006323870737105608, -0.0025617245119065046, -0.02664853446185589, -0.02555949240922928, 0.01945425570011139, -0.002842235378921032, -0.008320447988808155, 0.011500946246087551, -0.014726822264492512, -0.02065880224108696, 0.001541778678074479, -0.006637382786720991, -0.015650857239961624, 0.04861088842153549, -0.0037229571025818586, -0.009174356237053871, -0.033743809908628464, 0.0029309263918548822, -0.01890973374247551, -0.006278493907302618, -0.021335327997803688, -0.003347567515447736, 0.015428098849952221, 0.016352135688066483, -0.017408175393939018, 0.022242864593863487, 0.013093258254230022, 0.04022856056690216, 0.00999938789755106, -0.02826559729874134, 0.007206654641777277, 0.003186686197295785, -0.01138544175773859, -0.039238523691892624, 0.011014177463948727, 0.026599032804369926, -0.0213188286870718, -0.010081891901791096, -0.03217624872922897, -0.01727617159485817, -0.02821609564125538, -0.0016614082269370556, 0.012424982152879238, -0.020213285461068153, 0.02894212305545807, 0.0015541540924459696, 0.04646580293774605, -0.010073641315102577, 0.016401637345552444, 0.01192996371537447, 0.03504735976457596, 0.02451995201408863, 0.0014850576408207417, -0.029948662966489792, 0.026962047442793846, -0.012152722105383873, 0.016541892662644386, -0.009801380336284637, -0.011995965614914894, 0.033182788640260696, 0.02018028311431408, 0.015964370220899582, -0.0021285826805979013, 0.011797958053648472, 0.013654280453920364, 0.002759732073172927, 0.023282404989004135, 0.017589682713150978, 0.01757318153977394, -0.036334410309791565, -0.006794138811528683, -0.009289860725402832, -0.023100897669792175, -0.026236018165946007, -0.009801380336284637, -0.02120332419872284, 0.03768746182322502, -0.012614740058779716, -0.030823197215795517, 0.004298416897654533, -0.012309477664530277, -0.0005189967341721058, -0.028100591152906418, -0.031186211854219437, -0.005684470757842064, 0.006224866956472397, 0.014000793918967247, -0.005618468392640352, 0.017540181055665016, 0.004044719506055117, 0.008143066428601742, 0.005898979026824236, -0.009347612969577312, 0.008935096673667431, -0.0036404537968337536, 0.018744727596640587, -0.006410499103367329, 0.03696143627166748, 0.010156144388020039, -0.02404143288731575, -0.04719183221459389, -0.008353449404239655, -0.006835390347987413, -0.005981482099741697, 0.026500029489398003, -0.020460793748497963, -0.023034894838929176, -0.0018573533743619919, 0.013588277623057365, 0.01829921081662178, -0.01657489314675331, -0.0008781434735283256, -0.019190244376659393, 0.0030588062945753336, 0.006868391763418913, -0.04573977738618851, 0.013530525378882885, 0.0048470632173120975, 0.005457587074488401, 0.011113181710243225, -0.002116207266226411, -0.027506567537784576, -0.005498838610947132, -0.006983896251767874, 0.03425532951951027, -0.01171545498073101, 0.00037513175630010664, 0.012961253523826599, -0.0008570020436309278, -0.026351522654294968, 0.007536667864769697, 0.006134113296866417, 0.0067405118606984615, 0.015147588215768337, -0.0055813416838645935, 0.03897451236844063, 0.014726822264492512, -0.0320112444460392, 0.026434026658535004, 0.014834076166152954, 0.008514330722391605, -0.007103526033461094, 0.01144319400191307, 0.005507088731974363, -0.001329332822933793, 0.01612112671136856, -0.002635977463796735, -0.010263398289680481, -0.00660025654360652, 0.008951597847044468, 0.04791786149144173, -0.015675608068704605, 0.0035785764921456575, -0.004941941704601049, -0.016698649153113365, 0.002485408913344145, -0.04633380100131035, 0.013233513571321964, -0.013943041674792767, -0.00010222662967862561, -0.01011489238590002, 0.01204546820372343, -0.01811770349740982, -0.011542198248207569, 0.04867688938975334, 0.025873005390167236, -0.004401545971632004, 0.04036056622862816, -0.05392409488558769, -0.028678113594651222, -0.0009219733183272183, -0.011236936785280704, 0.00811831559985876, 0.022737883031368256, 0.0038900261279195547, 0.02265537902712822, -0.01169070415198803, -0.011286438442766666, -0.010230396874248981, -0.014149299822747707, 0.013456272892653942, 0.014512313529849052, 0.023463910445570946, -0.006777638103812933, -0.0053462074138224125, 0.01630263216793537, 0.025955507531762123, 0.007953308522701263, -0.018497217446565628, 0.04920491203665733, -0.016624394804239273, -0.014669070020318031, -0.0005548340268433094, -0.016335634514689445, -0.018282709643244743, -0.00661263195797801, -0.025394486263394356, -0.01407504640519619, -0.01183921005576849, 0.006843640934675932, -0.00523895351216197, 0.004112784750759602, -0.007070524618029594, 0.004517050459980965, -0.01579936407506466, 0.01153394766151905, 0.02065880224108696, -0.010684165172278881, -0.026236018165946007, 0.02211085893213749, -0.006377497687935829, -0.046960823237895966, 0.033925317227840424, -0.036334410309791565, -0.016599643975496292, 0.029668152332305908, 0.0011055428767576814, 0.015626106411218643, -0.0079698096960783, -0.01612112671136856, -0.0010534627363085747, -0.03399131819605827, 0.027110552415251732, -0.017606183886528015, 0.024321945384144783, 0.0019718266557902098, 0.0013386145001277328, -0.01752367988228798, -0.010906923562288284, 0.04191162809729576, 0.0039230273105204105, 0.03976654261350632, -0.005680345464497805, -0.0009101134492084384, -0.0038941511884331703, -0.019107742235064507, -0.004743934143334627, -0.048478882759809494, -0.012903501279652119, -0.00201514083892107, -0.008341073989868164, -0.026021510362625122, 0.018497217446565628, -0.019833769649267197, -0.0035476377233862877, -0.032341256737709045, 0.007998685352504253, 0.06118437647819519, -0.020972315222024918, 0.0027164178900420666, -0.009883883409202099, -0.0024730334989726543, 0.00896809808909893, -0.009751878678798676, -0.03762146085500717, 0.02730856090784073, 0.03455234318971634, 0.010461405850946903, -0.0025184103287756443, 0.046894822269678116, 0.003306315978989005, 0.01147619541734457, -0.0065053775906562805, 0.02192935161292553, 0.033727310597896576, -0.03468434512615204, 0.0008044062415137887, -0.007268532179296017, 0.024783963337540627, -0.015147588215768337, -0.05105298385024071, 0.020213285461068153, -0.011682453565299511, 0.013217013329267502, -0.027952086180448532, -0.0018150705145671964, -0.020262787118554115, -0.012433232739567757, 0.015881866216659546, -0.017870193347334862, -0.009380614385008812, 0.016055123880505562, 0.0151970898732543, -0.00330012827180326, -0.010230396874248981, 0.02168184146285057, -0.023645417764782906, 0.01280449703335762, -0.03442033752799034, 0.010593411512672901, 0.006534253712743521, -0.014050295576453209, -0.042307641357183456, 0.004595428239554167, 0.012581738643348217, 0.0032258753199130297, -0.013192262500524521, 0.03438733518123627, 0.008555581793189049, -0.004298416897654533, -0.0017913507763296366, -0.02699504792690277, -0.008605084381997585, -0.009669375605881214, -0.013794535771012306, -0.0355093777179718, 0.01655014231801033, -0.038083478808403015, -0.01630263216793537, 0.012094969861209393, -0.02778707817196846, 0.020675303414463997, 0.027820080518722534, -0.013604777865111828, -0.01265599112957716, -0.018167205154895782, -0.02494896948337555, -0.00649300217628479, 0.028018087148666382, -0.02356291562318802, 0.032407257705926895, 0.017688686028122902, -0.02501497231423855, -0.019355252385139465, -0.0021966476924717426, -0.02894212305545807, 0.0060763610526919365, 0.001367490622214973, 0.0011498883832246065, 0.014297804795205593, -0.012845749035477638, 0.020394792780280113, -0.01056866068392992, -0.001428336719982326, 0.018216706812381744, 0.005399834830313921, -0.02687954343855381, 0.029816657304763794, -0.046168792992830276, -0.01909124106168747, 0.005036820657551289, -0.03389231488108635, -0.03166472911834717, -0.031252212822437286, 0.0031289339531213045, 0.006109362468123436, -0.0357733890414238, 0.005243078805506229, 0.02978365682065487, -0.00024132187536451966, 0.0037848344072699547, 0.015683859586715698, -0.01198771595954895, -0.021467333659529686, 0.01003238931298256, 0.038017477840185165, -0.006162989418953657, -0.00927336048334837, -0.009166105650365353, -0.02138482965528965, -0.014149299822747707, 0.024668458849191666, -0.007268532179296017, -0.010989426635205746, -0.016178878024220467, 0.009702377021312714, -0.007615045644342899, 0.016896655783057213, 0.017375174909830093, 0.01525484211742878, -0.00021773111075162888, -0.01337376981973648, 0.00641874922439456, 0.007606795523315668, 0.007594420108944178, 0.02247387357056141, 0.024189939722418785, 0.010139644145965576, 0.004562427289783955, 0.020378291606903076, -0.02077430672943592, -0.0336943082511425, 0.03267126902937889, 0.024387946352362633, -0.010395403951406479, 0.014784574508666992, -0.02272138185799122, 0.014182300306856632, -0.046894822269678116, 0.02349691279232502, 0.03209374472498894, -0.03847949579358101, -0.009991138242185116, 0.0034898854792118073, -0.0027370438911020756, 0.011789707466959953, -0.030427182093262672, 0.017424676567316055, 0.00522245280444622, -0.005362708121538162, 0.001543841208331287, -0.004100409336388111, -0.0005125511670485139, -0.012845749035477638, -0.02179734595119953, 0.0012643615482375026, 0.003906526602804661, 0.004048844799399376, -0.021912850439548492, 0.031565725803375244, 0.028529608622193336, -0.019173745065927505, -0.00902585033327341, 0.004261290654540062, 0.019107742235064507, -0.02004827931523323, 0.016063373535871506, -0.02361241728067398, -0.03357880562543869, -0.008580333553254604, -0.012160972692072392, -0.017441177740693092, -0.03557538241147995, -0.018200207501649857, 0.03166472911834717, 0.010345901362597942, -0.027325060218572617, 0.019041739404201508, 0.016492391005158424, 0.019586261361837387, -0.0047233086079359055, 0.01895923539996147, 0.017919695004820824, 0.01968526467680931, 0.003345504868775606, 0.019586261361837387, -0.01716066710650921, -0.0056060925126075745, -0.0025988509878516197, 0.004356169141829014, -0.01752367988228798, -0.0015098085859790444, 0.002330715535208583, 0.011591699905693531, 0.01872822642326355, -0.009537369944155216, 0.010816169902682304, 0.016682147979736328, -0.011467945761978626, -0.013852288015186787, 0.014025544747710228, -0.022424370050430298, -0.020807307213544846, -0.0038013351149857044, 0.00763979647308588, 0.03321579098701477, 0.01823320798575878, -0.007186029106378555, 0.0036548918578773737, 0.031912241131067276, -0.023348405957221985, 0.025080973282456398, 0.003683767979964614, -0.008378200232982635, -0.006658008787781, 0.005036820657551289, 0.032225750386714935, -0.023529913276433945, -0.038875509053468704, -0.019074739888310432, 0.017952697351574898, -0.01823320798575878, -0.015172339044511318, 0.03050968423485756, -0.0005037852097302675, -0.016566643491387367, -0.02821609564125538, 0.024569453671574593, -0.016566643491387367, -0.014058546163141727, 0.002916488330811262, 0.00768517330288887, -0.0044180466793477535, 0.001207640627399087, 0.01014789380133152, -0.012705493718385696, 0.01534559577703476, -0.017952697351574898, -0.003428008174523711, -0.007965683937072754, -0.00918260682374239, 0.027160054072737694, 0.024305444210767746, -0.018464216962456703, 0.008262695744633675, -0.009413615800440311, 0.03857849910855293, -0.003062931355088949, -0.022391369566321373, -0.010502657853066921, 0.052406035363674164, -0.011608201079070568, -0.0026937297079712152, -0.0020832058507949114, -0.031120209023356438, 0.004587178118526936, 0.0022317117545753717, 0.015040334314107895, 0.015378597192466259, -0.012053717859089375, 0.0036404537968337536, -0.0010390246752649546, 0.0005981482099741697, 0.02730856090784073, 0.01800219900906086, 0.018018700182437897, -0.005420460365712643, -0.0011406068224459887, -0.007648047059774399, 0.019173745065927505, -0.03050968423485756, 0.02445394918322563, -0.020312288776040077, -0.011830959469079971, 0.0037043937481939793, -0.00013600137026514858, -0.025526491925120354, 0.015353846363723278, -0.021549837663769722, -0.009075351990759373, 0.005263704340904951, 0.02621951885521412, 0.006761137396097183, 0.03206074610352516, -0.03146672248840332, -0.0017212231177836657, -0.023051396012306213, -0.002749419305473566, 0.014916579239070415, 0.00791205745190382, -0.013497523963451385, -0.004995569121092558, -0.0013509899144992232, -0.0024338446091860533, -0.028001587837934494, 0.03164822980761528, 0.007313909009099007, -0.009784880094230175, 0.0013540838845074177, 0.011014177463948727, 0.006249617785215378, -0.0038095854688435793, 0.013126259669661522, 0.012540486641228199, -0.0016015934525057673, 0.0004633070493582636, -0.0461357906460762, 0.027952086180448532, -0.026714537292718887, 0.003461009357124567, -0.012400231324136257, 0.03527836874127388, 0.027985086664557457, 0.006096986588090658, -0.021780846640467644, -0.015502352267503738, -0.0004027187533210963, 0.0024730334989726543, -0.0019377940334379673, 0.04590478166937828, -0.009966387413442135, -0.007058149203658104, -0.012103220447897911, 0.001925418502651155, 0.00634449627250433, -0.020328789949417114, 0.01283749844878912, 0.011979465372860432, -0.026434026658535004, -0.006241367198526859, 0.004409796092659235, 0.008143066428601742, 0.033727310597896576, -0.00763979647308588, 0.011773207224905491, 0.01727617159485817, 0.0016150001902133226, 0.006732261274009943, 0.013819286599755287, -0.02367842011153698, -0.0037167693953961134, -0.046894822269678116, -0.009875633753836155, 0.008448327891528606, -0.012177472934126854, -0.00891034584492445, -0.004525300581008196, 0.007082900032401085, -0.00014515407383441925, 0.006662133615463972, 0.025807002559304237, -0.007961559109389782, 0.023166900500655174, 0.013464522548019886, -0.006303244736045599, 8.68217321112752e-05, 0.005738097708672285, -0.02145083248615265, -0.00019053083087783307, -0.0024647831451147795, 0.006868391763418913, -0.022011855617165565, 0.02006477862596512, 0.001497433171607554, -0.011170933954417706, -0.02247387357056141, -0.0006461032317019999, 0.007846054621040821, -0.024008432403206825, 0.009817881509661674, 0.004698557313531637, 0.03166472911834717, 0.005465837195515633, 0.008794841356575489, -0.014891828410327435, 0.011632951907813549, 0.027589071542024612, 6.716276402585208e-05, 0.012466234154999256, 0.02374442294239998, 0.02633502334356308, 0.013679031282663345, -0.015840616077184677, 0.017424676567316055, 0.03884250670671463, 0.00019349579815752804, -0.005494713317602873, 0.006002108100801706, 0.027193056419491768, -0.002483346499502659, 0.006352746859192848, -0.0004988865694031119, -0.017292670905590057, 0.008860844187438488, -0.011946463957428932, -0.007309783715754747, -0.048709891736507416, -0.01666564680635929, 0.014825825579464436, 0.005667970050126314, 0.0027679824270308018, 0.021335327997803688, 0.046729814261198044, -0.011022428050637245, 0.02192935161292553, -0.002675166353583336, -0.01183921005576849, -0.02615351602435112, 0.028760617598891258, -0.008431827649474144, 0.009702377021312714, -0.01879422925412655, -0.005667970050126314, -0.03673042729496956, 0.009009350091218948, -0.005424585659056902, -0.024437449872493744, -0.040921587496995926, 0.02676403895020485, -0.011096680536866188, 0.002161583863198757, 0.012961253523826599, -0.013910040259361267, -0.006072235759347677, 0.04052557423710823, -0.0006589943659491837, 0.003048493294045329, 0.010015889070928097, 0.006814764812588692, -0.006294994615018368, 0.0021863349247723818, 0.021368330344557762, 0.023991931229829788, 0.01806820183992386, 0.004962567705661058, -0.020691802725195885, 0.008143066428601742, 0.016063373535871506, -0.038446493446826935, 0.020015276968479156, -0.014297804795205593, 0.01409979723393917, 0.012994254939258099, 0.029552647843956947, 0.010651163756847382, 0.010304650291800499, -0.027391063049435616, -0.025097474455833435, 0.005758723709732294, -0.010213896632194519, -0.0008647366776131094, -0.007400537375360727, 0.0007213873905129731, -0.0012994254939258099, 0.008976348675787449, -0.008654586039483547, 0.004966692999005318, 0.002299776766449213, 0.02451995201408863, -0.023529913276433945, -0.015023833140730858, 0.016682147979736328, 0.0038467119447886944, 0.0007280907593667507, 0.01283749844878912, -0.0018996362341567874, 0.028364600613713264, 0.008184317499399185, -0.030344678089022636, 0.003580639138817787, -0.02765507437288761, -0.014141049236059189, -0.018563220277428627, -0.002392592839896679, -0.010576910339295864, 0.012243475764989853, 0.008031686767935753, -0.008229694329202175, -0.011162683367729187, 0.0017459740629419684, -0.006889017298817635, -0.005956731270998716, -0.017358673736453056, 0.04861088842153549, 0.016022121533751488, -0.0053874594159424305, 0.008737089112401009, 0.010288149118423462, 0.017424676567316055, -0.006080486346036196, -0.013761534355580807, -0.006286744028329849, 0.02633502334356308, -0.020939312875270844, -0.02036179043352604, -0.0003001053992193192, 0.010675914585590363, -0.016286132857203484, -0.005168825853615999, -0.01395129133015871, 4.6859240683261305e-05, -0.01560960616916418, -0.006092861760407686, -0.0016335634281858802, -0.0024132186081260443, -0.010692414827644825, 0.01909124106168747, -0.014627818018198013, -0.03178023546934128, 0.032159749418497086, -0.017969198524951935, -0.013613028451800346, 0.003644579090178013, -0.011665953323245049, -0.03351280093193054, 0.007891431450843811, 0.0017531930934637785, -0.012202223762869835, 0.010956425219774246, -0.0015386847080662847, -0.031433720141649246, 0.003110370831564069, -0.003560013137757778, 0.007384036667644978, 0.013613028451800346, 0.011245186440646648, 0.004537675995379686, -0.010172644630074501, 0.014083296991884708, 0.009405365213751793, 0.011583450250327587, 0.04996393993496895, -0.0071901543997228146, 0.008180192671716213, -0.014537064358592033, -0.024866465479135513, -0.008299821987748146, -0.005474087782204151, 0.015593105927109718, 0.005610217805951834, 0.0010756355477496982, -0.0023018394131213427, 0.01622837968170643, 0.010461405850946903, 0.014768073335289955, 0.015601355582475662, -0.004052970092743635, 0.025460489094257355, 0.007293283008038998, -0.01872822642326355, 0.0178866945207119, -0.012977753765881062, 0.04719183221459389, -0.018200207501649857, -0.015700358897447586, -0.00499969394877553, -0.014355557039380074, -0.024866465479135513, 0.0033413798082619905, -0.0026462902314960957, 0.01141844317317009, 0.021219823509454727, -0.004706807900220156, -0.002842235378921032, -0.013745034113526344, 0.036994434893131256, -0.0002362943341722712, -0.02065880224108696, -0.0053462074138224125, -0.005944355856627226, -0.027589071542024612, 0.004661431070417166, -0.002658665645867586, 0.004842937923967838, -0.001435555750504136, 0.03432133421301842, 0.011129681952297688, 0.004805811680853367, -0.014627818018198013, 0.0016376886051148176, 0.0038838384207338095, 0.009372363798320293, -0.01525484211742878, 0.012383731082081795, 0.00025601775269024074, -0.005486463196575642, -0.0390075147151947, -0.01630263216793537, -0.00761092035099864, 0.037786468863487244, 0.0013262389693409204, -0.014825825579464436, -0.03521236777305603, -0.005049196071922779, -0.016517141833901405, 0.01165770273655653, -0.026912545785307884, 0.014858826994895935, 0.004050907213240862, -0.013901789672672749, -0.029222635552287102, -0.01623663119971752, -0.0029206133913248777, -0.0004517050401773304, 0.0028958625625818968, 0.0033125036861747503, 0.017441177740693092, -0.02290288917720318, -0.013588277623057365, -0.007078774739056826, -0.012334229424595833, 0.006307370029389858, -0.02252337522804737, -0.00780892837792635, 0.0031000578310340643, -0.011814459227025509, -0.0032485637348145247, 0.007037523202598095, -0.01933875121176243, -0.031796734780073166, -0.0025761625729501247, 0.001322113792411983, 0.03182973712682724, -0.01455356553196907, 0.009166105650365353, 0.0062702433206140995, -0.0016108750132843852, 0.007874931208789349, 0.010552159510552883, 0.010246898047626019, -0.013959541916847229, 0.01763918437063694, -0.024734459817409515, 0.06943469494581223, 0.009958136826753616, 0.012556987814605236, -0.016451139003038406, 0.01132768951356411, -0.007676923181861639, -0.01920674555003643, 0.019107742235064507, -0.022622378543019295, 0.014207052066922188, 0.008902095258235931, 0.0024689084384590387, -0.007928557693958282, -0.020411292091012, 0.0024647831451147795, -0.025047972798347473, 0.007928557693958282, -0.003873525420203805, 0.025212978944182396, 0.025229480117559433, 0.019421253353357315, -0.0030753070022910833, 0.008638085797429085, -0.01056866068392992, 0.011278187856078148, 0.01575811207294464, -0.013151010498404503, 0.0051358244381845, -0.033743809908628464, -0.002879361854866147, -0.013332517817616463, -0.014990831725299358, 0.023760922253131866, -0.00885259360074997, 0.004269540775567293, -0.003034055233001709, -0.008374075405299664, 0.02253987453877926, 0.02211085893213749, 0.06257043033838272, -0.004591303411871195, 0.010337651707231998, -0.01691315695643425, 0.025113975629210472, 0.007008647080510855, -0.019437754526734352, -0.01890973374247551, -0.032225750386714935, 0.011641202494502068, 0.010667663998901844, 0.024866465479135513, -0.02917313203215599, -0.011756706982851028, 0.001428336719982326, 0.002675166353583336, 0.0028174843173474073, 0.01824970915913582, -0.003409444820135832, -0.01968526467680931, 0.0028546107932925224, 0.011682453565299511, 0.014867077581584454, -0.014809325337409973, 0.01265599112957716, 0.016541892662644386, -0.012672492302954197, -0.00025137694319710135, 0.016673898324370384, 0.012325978837907314, -0.0012963316403329372, -0.016673898324370384, 0.001848071813583374, -0.007062274031341076, -0.007276782765984535, 0.007021022494882345, -0.04270365834236145, -0.023397909477353096, 0.02016378380358219, -0.002545223804190755, 0.013769784942269325, -0.016269631683826447, 0.007936808280646801, -0.004323167726397514, 0.01165770273655653, -0.01003238931298256, -0.025295482948422432, -0.017589682713150978, -0.031136708334088326, 0.002163646509870887, -0.03498135879635811, -0.02712705358862877, 0.0019666701555252075, -0.014924829825758934, -0.018167205154895782, 0.005969106685370207, -0.006682759616523981, 0.0016531579894945025, 0.0028546107932925224, -4.7310430090874434e-05, 0.011220435611903667, 0.014504062943160534, 0.001489182817749679, 0.058148257434368134, 0.002712292829528451, 0.012507486157119274, -0.014388558454811573, -0.007697548717260361, -0.00019800769223365933, 0.013794535771012306, -0.03247326239943504, 0.02905762754380703, -0.016294382512569427, 0.0036033273208886385, -0.0005259579047560692, 0.008646335452795029, -0.002277088351547718, 0.006868391763418913, 0.006835390347987413, -0.022209862247109413, -0.017919695004820824, -0.015139337629079819, -5.211237657931633e-05, 0.0015077460557222366, 0.014801074750721455, 0.015337345190346241, 0.0026009134016931057, 0.0060309842228889465, 0.0006935425335541368, -0.007318034302443266, 0.0036074526142328978, -0.009553871117532253, -0.012202223762869835, 0.02772107720375061, 0.009075351990759373, -0.00022391884704120457, -0.002605038695037365, 0.0075201671570539474, 0.012548737227916718, -0.019800769165158272, 0.004574802704155445, -0.0016428451053798199, 0.0056473445147275925, 0.007681048475205898, 0.019305748865008354, 0.010048890486359596, -0.007470665033906698, 0.0038075228221714497, -0.012383731082081795, 0.012169222347438335, -0.00526782963424921, 0.0027473566588014364, 0.007586169522255659, -0.005527714733034372, -0.00532970717176795, 0.005333831999450922, -0.02760557271540165, 0.007008647080510855, 0.007161278277635574, 0.0069343941286206245, -0.011121432296931744, 0.020823808386921883, 0.007623296231031418, -0.0006461032317019999, -0.016946157440543175, -0.007511916570365429, -0.01915724389255047, -0.016591394320130348, 0.014231802895665169, 0.01283749844878912, -0.007635671645402908, -0.024734459817409515, -0.008217318914830685, -0.009916884824633598, 0.007619170937687159, -0.00038131949258968234, 0.00016152580792549998, 0.008143066428601742, 0.016880154609680176, -0.021467333659529686, 0.004776935558766127, 0.0065053775906562805, -0.006381622981280088, -0.011179184541106224, -0.00401790626347065, -0.004616054240614176, -0.0023637167178094387, 0.00033723184606060386, -0.008378200232982635, 0.015246592462062836, 0.0028236722573637962, -0.027160054072737694, 0.008662836626172066, 0.002679291646927595, -0.00881959218531847, 0.013753283768892288, -0.012647741474211216, 0.011005927808582783, 0.006303244736045599, 0.005812350660562515, -0.03788547217845917, 0.024717960506677628, 0.006534253712743521, 0.0044634235091507435, -0.0038694003596901894, -0.008155441842973232, 0.010882172733545303, 0.012037217617034912, 0.005251328926533461, 0.01259823888540268, -0.02458595484495163, -0.006171239539980888, 0.014660819433629513, 0.005552465561777353, 0.005172950681298971, -0.01036240253597498, -0.008039937354624271, -0.01999877579510212, 0.009908635169267654, 0.0077924276702106, 0.0026875417679548264, 0.008378200232982635, -0.012887000106275082, 0.011938213370740414, 0.009809630922973156, -0.0002696823503356427, -0.00048780019278638065, -0.017606183886528015, -0.003906526602804661, -0.008357574231922626, -0.012796247377991676, 0.01811770349740982, 0.015056834556162357, 0.0018191956914961338, -0.010164394974708557, -0.007606795523315668, -0.028463605791330338, -0.009133104234933853, 0.010519158095121384, -0.0036157029680907726, -0.006195990834385157, 0.00773055013269186, 0.005577216390520334, 0.0036548918578773737, -0.017738189548254013, -0.004884189460426569, -0.009545620530843735, -0.02240787073969841, 0.026137014850974083, 0.031367719173431396, 0.00938886497169733, 0.005498838610947132, 0.002016172045841813, -0.007883180864155293, -0.01316751167178154, -0.003390881698578596, 0.007813053205609322, -0.022919390350580215, 0.0030753070022910833, -0.010997677221894264, 0.02783658169209957, -0.010593411512672901, -0.02161583863198757, -0.007256156764924526, -0.01416580006480217, -0.009776629507541656, 0.011187434196472168, 0.004199413117021322, -0.002239961875602603, 0.02234186790883541, -0.013316017575562, 0.0035187616012990475, 0.00792443286627531, 0.02113732136785984, -0.01793619617819786, -0.01178145781159401, 0.006006233394145966, 0.02778707817196846, 0.013184011913836002, 0.004248914774507284, 0.0035723887849599123, 0.007016897667199373, 0.011302938684821129, 0.0025885379873216152, 0.007507791742682457, 0.023232901468873024, -0.00646412605419755, -0.003324879100546241, 0.007235530763864517, 0.008827842772006989, -0.015089835971593857, -0.004644930362701416, -0.007742925547063351, 0.0030072417575865984, -0.007202529814094305, 0.009438366629183292, 0.0026875417679548264, -0.004686181899160147, 0.0037043937481939793, -0.009949886240065098, 0.012053717859089375, -0.010964675806462765, 0.010576910339295864, 0.004801686387509108, 0.007008647080510855, -0.008596833795309067, 0.00914960540831089, -0.010948175564408302, -0.027077551931142807, -0.0005004334961995482, -0.022803885862231255, 0.013687281869351864, -0.017012160271406174, -0.06573855131864548, -0.01902523823082447, 0.003108308184891939, -0.013580027036368847, -0.02338140830397606, -0.008530830964446068, -0.011542198248207569, -0.0005599904689006507, 0.003048493294045329, 0.004966692999005318, -0.00048341721412725747, 0.0020233909599483013, 0.00905885174870491, 0.00011105704470537603, -0.012119720689952374, -0.016871904954314232, -0.008258570916950703, -0.005960856564342976, -0.009892133995890617, -0.005766973830759525, -0.0021069254726171494, 0.004904815461486578, -0.014231802895665169, -0.010378902778029442, 0.02372792176902294, 0.0041829124093055725, 0.023628918454051018, 0.025262480601668358, 0.014875327236950397, -0.01307675801217556, -0.0031186211854219437, -0.0008291571866720915, 0.010923423804342747, -0.014999082311987877, 0.002206960693001747, 0.0239754319190979, 0.014693820849061012, 0.022127360105514526, 0.001421117689460516, -2.5218265363946557e-05, 0.00033388016163371503, -0.013943041674792767, -0.02608751319348812, -0.024420948699116707, -0.007289158180356026, -0.0024627207312732935, -0.012697243131697178, -0.015560104511678219, 0.0031124334782361984, -0.014339056797325611, 0.012845749035477638, -0.022737883031368256, 0.010098392143845558, 0.005490588024258614, 0.008770090527832508, 0.02090631239116192, 0.006377497687935829, 0.0009348644525744021, 0.005474087782204151, 0.013175761327147484, 0.006757012568414211, -0.010164394974708557, 0.011038928292691708, 0.024932468309998512, 0.02881011925637722, 0.0030918074771761894, 0.015032083727419376, -0.005115198437124491, 0.008077063597738743, -0.002396718133240938, -0.030575687065720558, -0.003413570113480091, 0.018216706812381744, 0.00994163565337658, -0.012787996791303158, 0.01409979723393917, -0.004331418313086033, 0.010939924977719784, 0.005201826803386211, -0.017309172078967094, -0.014545314945280552, -0.004125160165131092, -0.0009673500899225473, -0.004760434851050377, 0.012672492302954197, 0.01702866144478321, -0.01999877579510212, -0.0038467119447886944, -0.004368544556200504, 0.016475889831781387, 0.0024359070230275393, 0.00509044760838151, 0.017787691205739975, 0.012276477180421352, -0.0007188091403804719, -0.01933875121176243, 0.015155838802456856, 0.0010364465415477753, 0.008563832379877567, -0.015444600023329258, -0.004525300581008196, 0.0007270594942383468, 0.01927274838089943, -0.008184317499399185, -0.004809936974197626, -0.01963576301932335, -0.003409444820135832, 0.0102386474609375, 0.0010111798765137792, -0.017837192863225937, 0.005676220636814833, 0.004521175753325224, -0.02349691279232502, 0.019701765850186348, -0.0021883975714445114, -0.01981727033853531, 0.004727433435618877, -0.0026566032320261, -0.006278493907302618, -0.00806056335568428, 0.0024359070230275393, -0.009685875847935677, -0.028117092326283455, 0.012061968445777893, -0.010246898047626019, -0.027935585007071495, -0.005564840976148844, 0.004104534164071083, 0.0060557350516319275, 0.020708303898572922, -0.004331418313086033, -0.028843119740486145, -0.019470756873488426, -0.014834076166152954, -0.012276477180421352, -0.012936502695083618, 0.005474087782204151, 0.006319745443761349, 0.004578927997499704, 0.008316323161125183, 0.014669070020318031, 0.019239747896790504, 0.025691498070955276, 0.004628429654985666, 0.004298416897654533, -0.0004988865694031119, -0.007091150153428316, 0.029569149017333984, -0.005288455169647932, -0.00021193010616116226, -0.0009529120288789272, -0.004199413117021322, -0.002489534206688404, -0.02724255807697773, 0.009933385998010635, 0.003912714309990406, -0.004364419262856245, 0.01573336124420166, -0.002262650290504098, 0.008712338283658028, -0.0036177653819322586, 0.011740205809473991, -0.0026607282925397158, -0.013786285184323788, -0.010164394974708557, 0.00532970717176795, -0.005049196071922779, 0.003108308184891939, -0.006880767177790403, -0.0011870148591697216, 0.019899772480130196, 0.030773695558309555, 0.0018965423805639148, -0.02803458832204342, 0.010865671560168266, 0.003539387369528413, 0.005742223002016544, 0.002248212229460478, -0.0013643967686221004, -0.01310975942760706, -0.0010209771571680903, 0.006818889640271664, 0.01268899254500866, -0.010634662583470345, 0.01337376981973648, -0.003347567515447736, 0.0230678953230381, -0.01609637588262558, -0.002819546964019537, -0.0019625448621809483, 0.009174356237053871, 0.028364600613713264, 0.004628429654985666, -0.005453461781144142, 0.005997982807457447, -0.021368330344557762, -0.006926144007593393, -0.00761092035099864, 0.007074649911373854, 0.017078163102269173, -0.010865671560168266, -0.010222147218883038, -0.013481023721396923, -0.012903501279652119, 0.021368330344557762, 0.027028050273656845, 0.00933111272752285, 0.0018088826909661293, 0.010502657853066921, 0.010634662583470345, -0.005676220636814833, 0.019652262330055237, 0.0026566032320261, 0.003279502270743251, -0.0036425164435058832, 0.014924829825758934, 0.01582411490380764, -0.0002610452938824892, -0.002856673439964652, 0.018942736089229584, 0.011236936785280704, -0.011632951907813549, 0.008056437596678734, -0.0106264129281044, 0.018629223108291626, 0.01271374337375164, -0.007033397909253836, -0.015452849678695202, -0.0019058240577578545, -0.0011199809378013015, 0.024239441379904747, -0.006303244736045599, 0.017738189548254013, -0.010164394974708557, -0.009570371359586716, -0.0007064336678013206, 0.0048470632173120975, 0.006802388932555914, 0.011154432781040668, -0.006105237174779177, 0.0008698931778781116, 0.0010828545782715082, 0.01036240253597498, -0.004244789946824312, -0.005375083535909653, 0.029090629890561104, 0.01053565926849842, 0.013571777381002903, -0.00994163565337658, -0.02517997846007347, -0.017853694036602974, 0.010989426635205746, 0.020279288291931152, 0.0007832648116163909, 0.019668763503432274, 0.02338140830397606, -0.01734217256307602, 0.012606489472091198, -0.011030678637325764, -0.00896809808909893, -0.0025617245119065046, 0.013910040259361267, -0.018744727596640587, -0.009925135411322117, -0.01449581328779459, -0.005024445243179798, -0.013266514986753464, -0.008291572332382202, 0.015032083727419376, 0.007961559109389782, 0.0033702559303492308, 0.009372363798320293, 0.0058412267826497555, -0.010073641315102577, 0.015593105927109718, -0.008902095258235931, -0.008489579893648624, 0.009925135411322117, 0.008411201648414135, 0.0034733847714960575, -4.805167191079818e-05, -0.013497523963451385, -0.015048583969473839, -0.007837804034352303, -0.002108988119289279, -0.015353846363723278, 0.010428405366837978, 0.01005714014172554, -0.010684165172278881, 0.029569149017333984, -0.01198771595954895, -0.010246898047626019, 0.0156178567558527, 0.001565498299896717, -0.0009436304098926485, 0.012523986399173737, 0.0024400323163717985, -0.004533551167696714, 0.01307675801217556, -0.005519464146345854, -0.012680742889642715, 0.017622685059905052, 0.0012117658043280244, 0.018992237746715546, -0.010741917416453362, 0.013118009082973003, 0.011113181710243225, -0.009974637068808079, -0.003475447418168187, -0.00887734442949295, -0.01716066710650921, 0.007219030521810055, 0.0005409116274677217, -0.02295239083468914, 0.006983896251767874, 0.012911751866340637, 0.009949886240065098, -0.01963576301932335, 0.00511932373046875, 0.004335543140769005, -0.005531840026378632, -0.00768517330288887, -0.012754995375871658, -0.012936502695083618, 0.00927336048334837, 0.014537064358592033, -0.02415693737566471, 0.004191162530332804, 0.0047026826068758965, -0.02150033414363861, 0.0035971396137028933, -0.0044427975080907345, 0.013151010498404503, 0.01180620864033699, -0.017474178224802017, -0.013646029867231846, -0.0023657793644815683, 0.008555581793189049, -0.004125160165131092, -0.005069822072982788, 0.003531137015670538, -0.003293940331786871, -0.0065755052492022514, -0.0010529471328482032, -0.01573336124420166, 0.0027556070126593113, -0.007751176133751869, 0.003339317161589861, 0.003535262309014797, -0.02077430672943592, -0.0010204615537077188, -0.0013004567008465528, 0.01005714014172554, -0.011773207224905491, 0.003079432062804699, -0.00326918950304389, -0.018761228770017624, 0.0009988044621422887, -0.004554176703095436, 0.03993155062198639, 0.004446922801434994, 0.008394701406359673, 0.0074541643261909485, 0.0031413096003234386, -0.0006089767557568848, -0.0029371140990406275, 0.011393692344427109, 0.008415326476097107, 0.01884373091161251, 0.009281610138714314, 0.0031516223680227995, 0.01566735841333866, -0.0017696936847642064, -0.004277790896594524, 0.013142760843038559, 0.02392592839896679, -0.006856016349047422, -0.016946157440543175, 0.0063114953227341175, 0.014669070020318031, 0.0010900736087933183, -0.022688381373882294, 0.020097780972719193, -0.007091150153428316, 0.022275865077972412, 0.0077924276702106, 0.016038622707128525, 0.006658008787781, 0.01552710309624672, 0.02065880224108696, -0.007722300011664629, 0.007293283008038998, -0.0041829124093055725, 0.030955202877521515, 0.011847459711134434, 0.013621279038488865, 0.02730856090784073, 0.00905885174870491, 0.025509990751743317, 0.004106597043573856, -0.019107742235064507, -0.01407504640519619, 0.010015889070928097, -0.012680742889642715, -0.0015252779703587294, -0.013885289430618286, -0.01045315619558096, -0.019437754526734352, -0.0128952506929636, 0.0005579279386438429, -0.02211085893213749, 0.004583052825182676, 0.005408084951341152, -0.022572876885533333, 0.01060166209936142, -0.0029845533426851034, 0.015931367874145508, -0.013679031282663345, -3.4870496165240183e-05, -0.013101508840918541, -0.0038013351149857044, -0.015395097434520721, -0.01999877579510212, 0.004706807900220156, -0.019107742235064507, -0.022127360105514526, 0.01051090843975544, 0.014083296991884708, 0.03176373243331909, -0.014207052066922188, 0.004253040067851543, -0.006901393178850412, 0.015395097434520721, 0.019256247207522392, -0.004570677410811186, 0.002889674622565508, -0.006018608808517456, 0.0010297431144863367, 0.0071901543997228146, -0.007161278277635574, -0.01975126750767231, 0.0008121409337036312, -0.01986677199602127, 0.011434944346547127, -0.013340768404304981, -0.008064688183367252, -0.010618162341415882, 0.007219030521810055, 0.023661918938159943, 0.0033826313447207212, -0.018282709643244743, -0.010502657853066921, 0.006233117077499628, 0.0011756706517189741, 0.0026710412930697203, 0.004220038652420044, 0.01650064066052437, 0.007367535959929228, 0.012581738643348217, -0.00021992260008119047, 0.010494407266378403, 0.006142363417893648, -0.0017676311545073986, -0.0030361178796738386, 0.009157855994999409, -0.014561815187335014, 0.026351522654294968, -0.010857421904802322, -0.015807613730430603, -0.007412912789732218, -0.0034630720037966967, -0.0064806267619132996, 0.015180589631199837, -0.02077430672943592, -1.2407708709361032e-05, -0.012433232739567757, 0.010824420489370823, -0.0338263139128685, -0.018266208469867706, -0.01047790702432394, -0.008242069743573666, -0.010007638484239578, 0.003687893273308873, -0.01183921005576849, 0.0017459740629419684, 0.009479617699980736, -0.002016172045841813, 0.0012550799874588847, -0.007243781350553036, 0.010618162341415882, -0.01909124106168747, -0.02608751319348812, -0.0013458335306495428, 0.0003013945242855698, -0.041350606828927994, 0.010527408681809902, 0.025873005390167236, 0.007021022494882345, -0.0006352746859192848, -0.014025544747710228, -0.016442889347672462, 0.0071489023976027966, -0.029024627059698105, 0.0015603417996317148, -0.01666564680635929, -0.018216706812381744, -0.010882172733545303, 0.0037683339323848486, -0.005383334122598171, -0.0035414500162005424, 0.008324572816491127, -0.009652874432504177, -0.004665556363761425, -0.003069119295105338, -0.011789707466959953, 0.008869094774127007, -0.004686181899160147, 0.010024139657616615, -0.008580333553254604, -0.005812350660562515, 0.020081279799342155, -0.00894334726035595, 0.001734629855491221, -0.001435555750504136, 0.007573794107884169, 0.0013994605978950858, 0.004995569121092558, -0.006946769542992115, 0.004364419262856245, -0.02488296665251255, -0.012375480495393276, -0.01716066710650921, 0.005502963904291391, -0.007887306623160839, 0.03220925107598305, 0.000393437163438648, 0.019800769165158272, 0.004929566290229559, -0.004110722336918116, 0.008213194087147713, -0.005507088731974363, 0.0005697877495549619, 0.012622990645468235, 0.016170628368854523, 0.006191865541040897, 0.022556375712156296, 0.006261993199586868, 0.009306360967457294, 0.003246501088142395, -0.021582838147878647, 0.007082900032401085, 0.011707204394042492, -0.011995965614914894, 0.013728532940149307, 0.006806514225900173, -0.015155838802456856, 0.019074739888310432, 0.00660025654360652, 0.005523589439690113, 0.008204943500459194, 0.0029763029888272285, 0.012903501279652119, 0.01945425570011139, 0.013720282353460789, 0.006286744028329849, 0.009067102335393429, -0.0026483528781682253, 0.0030505559407174587, 0.016789402812719345, 0.021186823025345802, -0.010585160925984383, -0.0013943040976300836, -0.007602670229971409, 0.029684653505682945, -0.010642913170158863, -0.016451139003038406, 0.01304375659674406, -0.013769784942269325, -0.009322862140834332, 0.019058240577578545, 0.02301839366555214, -0.019190244376659393, -0.00891034584492445, 0.01156694907695055, 0.021912850439548492, -0.00938886497169733, -0.00783367920666933, -0.007660422474145889, -0.012977753765881062, -0.009487868286669254, 0.0032052495516836643, -0.0039931549690663815, 0.018101202324032784, -0.014471061527729034, -0.01675640046596527, 0.02501497231423855, -0.009067102335393429, -0.004966692999005318, -0.011311189271509647, 0.0019212933257222176, 0.002718480536714196, 0.002679291646927595, 0.0005455524078570306, 0.0007667641621083021, -0.006063985638320446, 0.007087025325745344, -0.037126440554857254, -0.017358673736453056, 0.02179734595119953, 0.006414623931050301, -0.04712583124637604, 0.014215301722288132, -0.00776355154812336, 0.004100409336388111, -0.016335634514689445, 0.0072396560572087765, -0.014339056797325611, -0.014528813771903515, 0.013415020890533924, 0.009372363798320293, -0.007606795523315668, -0.012622990645468235, -0.0015520915621891618, -0.002745294012129307, -0.0063362461514770985, 0.009603372775018215, 0.002856673439964652, -0.024783963337540627, -0.019256247207522392, -0.0025864753406494856, -0.02331540547311306, -0.019124243408441544, -0.0034259455278515816, -0.013910040259361267, 0.006472376175224781, -0.014669070020318031, 0.004921316169202328, -0.003056743647903204, -0.00016126797709148377, -0.020081279799342155, 0.004636680241674185, -0.012367229908704758, -0.001214859657920897, 0.0026029760483652353, 0.007590294815599918, 0.0023884677793830633, 0.00010009959078161046, 0.00026272115064784884, 0.020196784287691116, -0.009801380336284637, 0.013184011913836002, -0.0010560409864410758, 0.011632951907813549, 9.853653864411172e-06, 0.00021579743770416826, -0.03755545988678932, -0.014116298407316208, -0.00021180119074415416, 0.00018937063578050584, 0.011055429466068745, -0.0155188525095582, 0.005643219221383333, 0.022011855617165565, 0.006897267885506153, 0.006063985638320446, 0.014487562701106071, 0.01655014231801033, 0.01732567325234413, -0.00795743428170681, -0.0025101599749177694, -0.006996271666139364, -0.024272441864013672, 0.005049196071922779, 0.0015624044463038445, 0.0257905013859272, 0.021153820678591728, -0.00391065189614892, 0.005787599831819534, 0.015089835971593857, -0.00167172122746706, 0.012499235570430756, -0.024684958159923553, 0.012037217617034912, -0.03050968423485756, -0.005787599831819534, -0.005997982807457447, -0.005003819242119789, 0.007066399324685335, -0.0012066093040630221, -0.0028690488543361425, -0.00016552205488551408, 0.009446617215871811, 0.006261993199586868, -0.0025885379873216152, -0.005548340268433094, -0.008860844187438488, -0.00867108628153801, 0.002017203252762556, -0.000526989228092134, 0.00066054129274562, -0.01416580006480217, -0.010560410097241402, -0.0035476377233862877, -0.0014799012569710612, -0.020559798926115036, -0.005808225367218256, 0.00037229570443741977, -0.019536757841706276, -0.0060557350516319275, 0.018464216962456703, 0.0065755052492022514, -0.0038694003596901894, -0.025625495240092278, -0.0033372545149177313, 0.0005373021122068167, -0.008778341114521027, 0.008369949646294117, -0.006158864125609398, -0.018464216962456703, 0.0030216798186302185, -0.008629835210740566, -0.023051396012306213, -0.016946157440543175, 0.008662836626172066, 0.011740205809473991, 0.0051523251459002495, -0.0013427396770566702, -0.0015242466470226645, -0.0036796429194509983, 0.009372363798320293, 0.014009043574333191, -0.002270900644361973, -0.010271648876369, -0.009784880094230175, 0.005721597000956535, -0.006975645665079355, 0.015320844948291779, 0.008638085797429085, 0.004545926582068205, -0.005276079755276442, 0.008902095258235931, 0.009826131165027618, -0.02481696382164955, 0.013852288015186787, -3.719089727383107e-05, 0.01549410168081522, 0.030971702188253403, 0.015815863385796547, 0.0128952506929636, 0.011080180294811726, 0.0076645477674901485, 0.018084703013300896, 0.0018511656671762466, -0.02821609564125538, 0.012515735812485218, 0.00047980769886635244, -0.003017554758116603, -0.016657397150993347, -0.010939924977719784, -0.004347919020801783, -0.01044490560889244, -0.019899772480130196, -0.00867108628153801, -0.002893799915909767, -0.011731955222785473, -0.01174845639616251, 0.0003555372531991452, -0.0186622254550457, -0.009306360967457294, 0.0035228868946433067, -0.01709466427564621, 0.0031206835992634296, -0.008072938770055771, -0.012499235570430756, 0.022506874054670334, 0.0026834167074412107, 0.01009014155715704, 0.004154036287218332, -0.0020130781922489405, -0.0019078865880146623, 0.00891034584492445, -0.016673898324370384, 0.017061661928892136, -0.014776323921978474, -0.0057917251251637936, 0.028496606275439262, -0.005527714733034372, -0.003599202260375023, -0.0077140494249761105, 0.011121432296931744, -0.004191162530332804, -0.011938213370740414, -0.022374868392944336, -0.014545314945280552, -0.01277149561792612, 0.007573794107884169, 2.4122518880176358e-05, -0.029948662966489792, -0.025939008221030235, -0.013431522063910961, -0.010494407266378403, 0.0036404537968337536, -0.009347612969577312, -0.007280907593667507, 0.0074294134974479675, 0.0058659776113927364, 0.008778341114521027, -0.003974591847509146, 0.005251328926533461, 0.005362708121538162, -0.018992237746715546, 0.009562121704220772, -0.015139337629079819, -0.01525484211742878, -0.006026858929544687, -0.005882478319108486, -0.009644624777138233, 0.016855403780937195, -0.014512313529849052, 0.011179184541106224, -0.011938213370740414, 0.009405365213751793, 0.008992848917841911, -0.013934791088104248, -0.0068106395192444324, -0.026731038466095924, -0.023892927914857864, 0.011855710297822952, -0.012920001521706581, 0.028595609590411186, 0.007029273081570864, -0.006922018714249134, 0.021912850439548492, -0.002809234196320176, -0.0005151293589733541, -0.0012643615482375026, 0.018563220277428627, -0.00039782014209777117, 0.006200115662068129, 0.012977753765881062, 0.01428955513983965, -0.004343793727457523, -0.0016284070443361998, 0.012408481910824776, -0.013324267230927944, 0.014693820849061012, 0.005478212609887123, 0.008266820572316647, 0.0042282892391085625, -0.009446617215871811, -0.006340371444821358, 0.014050295576453209, -0.003034055233001709, 0.014322556555271149, 0.0012385793961584568, -0.0020832058507949114, -0.0050821974873542786, -0.026780540123581886, -0.002270900644361973, -0.015155838802456856, -0.009067102335393429, -0.008200818672776222, -0.0009663187665864825, 0.01688840612769127, -0.009809630922973156, 0.015032083727419376, 0.009471368044614792, 0.008893845602869987, -0.02881011925637722, 0.025344984605908394, -0.004661431070417166, 0.0033372545149177313, -0.026797041296958923, 0.0063114953227341175, 0.008336949162185192, -0.016269631683826447, 0.015040334314107895, -0.0011045116698369384, 0.002788608195260167, -0.009982887655496597, 0.02095581404864788, -0.02912363037467003, 0.0011333877919241786, -0.01298600435256958, 0.01697915978729725, 0.01915724389255047, -0.00920735765248537, 0.008006935939192772, 0.0025555368047207594, -0.001521152793429792, -0.00763979647308588, 0.0017408175626769662, 0.0037600835785269737, 7.525194632762577e-06, 0.01739167608320713, -0.01455356553196907, 0.010741917416453362, 0.012499235570430756, 0.008077063597738743, -0.0006177427130751312, 0.017952697351574898, -0.004269540775567293, 0.0029144256841391325, -0.01745767705142498, -0.008704087696969509, -0.01042015478014946, -0.007441788911819458, 0.002811296610161662, -0.002520472975447774, -0.0034341958817094564, -0.005779349245131016, 0.000622383551672101, -0.0053915842436254025, -0.00017789752746466547, 0.008572082966566086, 0.020427793264389038, -0.014702070504426956, 0.024866465479135513, -0.02948664501309395, 0.007186029106378555, -0.0024915968533605337, -0.023513413965702057, -0.015931367874145508, 0.02006477862596512, 0.009050601162016392, 0.005325581878423691, 0.004364419262856245, 0.01195471454411745, 0.0001294269022764638, -0.002850485732778907, 0.009702377021312714, 0.0037085190415382385, 0.0074995411559939384, 0.015287843532860279, 0.015337345190346241, -0.01204546820372343, -0.006711635738611221, 0.003147497307509184, 0.004624304361641407, -0.007742925547063351, -0.01691315695643425, 0.005102823022753, -0.00035192773793824017, 0.017787691205739975, 0.005156450439244509, -0.02379392459988594, 0.02531198225915432, 0.0015263092936947942, -0.0029598025139421225, 0.009867383167147636, -0.002978365635499358, 0.0015324970008805394, 0.0025534741580486298, 0.02229236625134945, 0.006633257493376732, 0.009619873948395252, 0.0026689786463975906, -0.004533551167696714, 0.02819959446787834, 0.005746348295360804, 0.007660422474145889, 0.008827842772006989, 0.0014809324638918042, -0.004401545971632004, 0.004032344091683626, -0.019355252385139465, 5.9524772950680926e-05, -0.005469962488859892, -0.010197396390140057, -0.013769784942269325, 0.0017439114162698388, -0.02156633697450161, -0.004550051875412464, -0.01573336124420166, -0.00521007739007473, -0.013588277623057365, -0.008130691014230251, -0.019355252385139465, -0.005894853733479977, -0.009347612969577312, -0.015873616561293602, -0.009562121704220772, -0.030526185408234596, -0.015749862417578697, -0.010651163756847382, 0.004888314753770828, -0.012812747620046139, 0.024899467825889587, -0.000939505232963711, -0.024123936891555786, -0.018035199493169785, -0.00811831559985876, 0.016352135688066483, 0.013497523963451385, -0.017787691205739975, 0.007903806865215302, 0.006006233394145966, 0.01793619617819786, -0.005799975246191025, -0.002466845791786909, -0.01431430596858263, -0.029090629890561104, 0.004735684022307396, -0.0036322034429758787, -0.0018274459289386868, 0.01734217256307602, -0.017441177740693092, 0.006241367198526859, -0.006682759616523981, 0.00773055013269186, -0.0031804984901100397, -0.01645938865840435, 0.0009606466628611088, -0.02102181687951088, 0.014825825579464436, 0.006864266470074654, -0.00388177577406168, 0.026549531146883965, -0.0009529120288789272, -0.004752184730023146, 0.002030610106885433, -0.014875327236950397, 0.00887734442949295, -0.022688381373882294, -0.0033970694057643414, 0.010213896632194519, -0.01271374337375164, 0.008151316083967686, 0.010411904193460941, 0.015791112557053566, 0.0106594143435359, 0.017556682229042053, 0.015626106411218643, -0.010609911754727364, -0.029734155163168907, -0.01750718057155609, 0.017837192863225937, -0.006035109516233206, -0.007157152984291315, 0.0001336809655185789, 0.014446310698986053, 0.013769784942269325, -0.013382019475102425, -0.00401790626347065, 0.02120332419872284, 9.926166967488825e-05, 0.011591699905693531, 0.012515735812485218, 0.0058412267826497555, 0.00920735765248537, -0.012268226593732834, -0.0005966012831777334, 0.014693820849061012, -0.000140384363476187, 0.00881959218531847, 0.012037217617034912, -0.00161190633662045, 0.012449733912944794, 0.007062274031341076, -0.0031681230757385492, -0.001749067916534841, -0.007099400740116835, -0.00497081782668829, -0.02120332419872284, 0.01156694907695055, -0.0038859008345752954, 0.004170536994934082, -0.007511916570365429, 0.022787384688854218, 0.005746348295360804, -0.002268837997689843, -0.0020440169610083103, 0.00012633303413167596, -0.008196692913770676, 0.01546110026538372, -0.009908635169267654, 0.06590355932712555, -0.023595916107296944, 0.0047026826068758965, -0.004244789946824312, -0.003799272468313575, 0.006938519421964884, -0.012523986399173737, 0.012911751866340637, 0.0017923820996657014, 0.021335327997803688, 0.0015314656775444746, 0.0020821746438741684, 0.017474178224802017, -0.012383731082081795, 0.0003996248997282237, -0.006658008787781, -0.0026215394027531147, 0.022143859416246414, -0.010065390728414059, -0.006319745443761349, 0.005172950681298971, -0.0013778035063296556, 0.011121432296931744, -0.00189551105722785, -0.0178866945207119, 0.0011705141514539719, -0.0005543184233829379, -0.0012488922802731395, -0.019701765850186348, -0.06108537316322327, 0.002223461400717497, 0.0023410283029079437, -0.0002475096262060106, 0.01174845639616251, -0.0004016874881926924, 0.01655014231801033, 0.008192568086087704, 0.028463605791330338, 4.827726661460474e-05, 0.00502857007086277, -0.018761228770017624, -0.006670384202152491, 0.007891431450843811, 0.016022121533751488, -0.001627375721000135, -0.00501619465649128, 0.008151316083967686, -0.002534911036491394, 0.008258570916950703, -0.017309172078967094, 0.0015500289155170321, 0.011129681952297688, 0.0036383913829922676, -0.027589071542024612, 0.03013017028570175, -0.011962964199483395, -0.005370958708226681, 0.0007574825431220233, 0.013687281869351864, 0.028183095157146454, -0.02282038703560829, -0.009405365213751793, 0.000615164521150291, 0.01968526467680931, -0.0038446492981165648, 0.018332211300730705, -0.0055359648540616035, 0.012169222347438335, -0.0067900135181844234, 0.013679031282663345, -0.006303244736045599, -0.005985607393085957, 0.00383639894425869, 0.015362096950411797, 0.008720588870346546, 0.014273053966462612, 0.011030678637325764, 0.0023884677793830633, -0.00256791221909225, -0.019602760672569275, -0.0009859133278951049, -0.0017356611788272858, 0.00783367920666933, -0.0032588765025138855, 0.006674509029835463, -0.017045162618160248, -0.008431827649474144, -0.01639338582754135, -0.01274674478918314, 0.01522184070199728, 0.003034055233001709, -0.002825734671205282, 0.00325475144200027, -0.020625801756978035, 0.015296094119548798, -0.0005883509875275195, -0.012284726835787296, 0.031928740441799164, 0.011740205809473991, 0.0016459389589726925, -0.024932468309998512, 0.02282038703560829, -0.0024503450840711594, -0.007136526983231306, -0.008196692913770676, -0.002549349097535014, -0.005634968634694815, -0.014966080896556377, 0.005428710952401161, -0.0038487743586301804, -0.002745294012129307, 0.023331906646490097, 0.010733666829764843, -0.009537369944155216, -0.003176373429596424, 0.02022978477180004, 0.004974943120032549, 0.013596528209745884, 0.021335327997803688, 0.01192996371537447, 0.005156450439244509, 0.0151970898732543, -0.015428098849952221, -0.01029639970511198, -0.0009451773366890848, 0.018134204670786858, 0.0003441930457483977, 0.011921713128685951, -0.01398429274559021, 0.01999877579510212, -0.00903410091996193, -0.01009014155715704, 0.014388558454811573, -0.010098392143845558, -0.005738097708672285, -0.010502657853066921, 0.014058546163141727, -0.021533336490392685, -0.02011428028345108, -0.000429790117777884, -0.01145144458860159, 0.018678724765777588, 0.007247906643897295, -0.0029680528677999973, -0.0002490565530024469, -0.0070457737892866135, -0.0011932025663554668, 0.019074739888310432, -0.023034894838929176, 0.03013017028570175, 0.02163233980536461, 0.004401545971632004, 0.010972926393151283, -0.004545926582068205, -0.012094969861209393, -0.004776935558766127, 0.023348405957221985, 0.0017129727639257908, -0.014693820849061012, -0.0020502046681940556, -0.007066399324685335, -0.003306315978989005, 0.011847459711134434, -0.013910040259361267, 0.006063985638320446, -0.0053874594159424305, -0.0064806267619132996, 0.012639490887522697, 0.00514819985255599, -0.01153394766151905, -0.021120820194482803, 0.011022428050637245, 0.011979465372860432, -0.011426693759858608, 0.009174356237053871, -0.00021773111075162888, 0.023348405957221985, 0.018398214131593704, 0.00662913266569376, -0.0025431611575186253, -0.004314917605370283, -0.01180620864033699, -0.007115901447832584, 0.006963270250707865, 0.01650064066052437, 0.009438366629183292, 0.01071716658771038, 0.015683859586715698, 0.013415020890533924, 0.01573336124420166, 0.00649300217628479, -0.015815863385796547, 0.00519357668235898, -0.0010127268033102155, -0.01383578684180975, 0.0007033398142084479, 0.008151316083967686, -0.009603372775018215, 0.026417525485157967, -0.0048718140460550785, -0.002400843193754554, -0.0006677603232674301, 0.010733666829764843, -0.0036940809804946184],
-    },
-    {
-        "crl_id": "BLA761126_20190924_aef41f",
-        "company": "Tanvex BioPharma USA, Inc.",
-        "app_number": "BLA 761126",
-        "date": "2019-09-24",
-        "text_preview": 'g YN U.S. FOOD & DRUG\n\nADMINISTRATION\n\nBLA 761126\nCOMPLETE RESPONSE\n\nTanvex BioPharma USA, Inc.\n\nAttention: Bonnie J. Mills, PhD\n\nVice-President, Clinical Development & Regulatory Affairs\n2030 Main St',
-        "embedding": [-0.040570929646492004, 0.020650714635849, 0.041807159781455994, 0.029304347932338715, -0.014125369489192963, -0.030652966350317, 0.008407791145145893, 0.008021468296647072, 0.040683314204216, -0.014469548128545284, 0.036440785974264145, -0.04388628154993057, -0.057990577071905136, 0.009018884040415287, -0.03186110407114029, -0.018880654126405716, 0.02067881077528, 0.004456761293113232, -0.031327273696660995, -0.005545489490032196, 0.017883237451314926, 0.0015119273448362947, -0.0008560564019717276, -0.009313893504440784, -0.019175663590431213, -0.04186335206031799, 0.005836987867951393, -0.07619692385196686, 0.003958053886890411, -0.009124244563281536, 0.014336091466248035, -0.041554294526576996, 0.011048834770917892, 0.01958305947482586, -0.043689608573913574, 0.015874359756708145, 0.04647113382816315, 0.008485055528581142, 0.008744945749640465, -0.008836258202791214, 0.014778606593608856, -0.02365700900554657, 0.035541705787181854, 0.031242987141013145, -0.030990120023489, 0.03312543407082558, -0.029051482677459717, -0.06855475157499313, 0.01942852884531021, -0.011189315468072891, 0.009489495307207108, 0.04801642522215843, -0.05051698535680771, 0.06434032320976257, -0.023052940145134926, -0.006679873913526535, 0.004421641118824482, 0.02160598523914814, -0.03256350755691528, 0.032338738441467285, 0.004116094671189785, -0.03365926072001457, 0.030287714675068855, -0.051977988332509995, -0.041554294526576996, -0.016056984663009644, -0.01340891607105732, -0.0036525074392557144, 0.020763099193572998, 0.009201508946716785, -0.005067854188382626, -0.009559735655784607, -0.005113510414958, 0.013036641292273998, -0.018712075427174568, 0.036525074392557144, 0.031186792999505997, 0.038604192435741425, -0.016028888523578644, -0.011786360293626785, -0.040458545088768005, 0.017995622009038925, -0.004421641118824482, -0.009615927934646606, -0.005921276286244392, 0.004231991712003946, -0.02452799119055271, -0.013120930641889572, -0.05310183763504028, -0.010887281969189644, -0.07063387334346771, 0.015846263617277145, -0.05408520624041557, 0.059901122003793716, -0.009377110749483109, 0.008372670970857143, -0.026874026283621788, 0.014083225280046463, -0.01748989149928093, 0.030681062489748, 0.01945662498474121, 0.00319594400934875, -0.02773096039891243, -0.014722414314746857, 0.05349518358707428, 0.011526470072567463, -0.0025058307219296694, 0.04509441927075386, 0.02357272058725357, 0.010550127364695072, 0.061867855489254, -0.04947742819786072, -0.005728114861994982, 0.061249740421772, -0.03835132718086243, -0.02969769388437271, -0.06602609157562256, 0.004723675549030304, 0.0027235765010118484, 0.05540572851896286, -0.01732131466269493, 0.02756238356232643, 0.009145316667854786, 0.0024601744953542948, 0.014694318175315857, -0.004095022566616535, 0.09985393285751343, -0.0053488160483539104, -0.036440785974264145, -0.046808287501335144, 0.026340197771787643, -0.0153264831751585, 0.03981233015656471, -0.02885480783879757, -0.08839067816734314, 0.020299512892961502, -0.01335974782705307, -0.005801867693662643, 0.0008433253387920558, -0.012587102130055428, -0.02656496688723564, 0.017672516405582428, -0.022898411378264427, 0.020594522356987, -0.029557213187217712, 0.004467297345399857, -0.025455167517066002, 0.018122056499123573, 0.015509108081459999, -0.0005614851834252477, -0.022378630936145782, 0.03396831825375557, 0.005457689054310322, -0.016871774569153786, 0.04281862452626228, -0.09738146513700485, -0.028180498629808426, 0.09367276728153229, -0.0010527299018576741, -0.005668410565704107, -0.005067854188382626, 0.020130934193730354, -0.011182291433215141, -0.015186001546680927, 0.014975280500948429, -0.006026637274771929, -0.005622754339128733, -0.04385818541049957, -0.0821533203125, -0.04028996452689171, -0.0205523781478405, -0.00024101280723698437, -0.025075867772102356, -0.02981008030474186, -0.024078452959656715, 0.00244963844306767, 0.02149360068142414, -0.02166217751801014, -0.014694318175315857, -0.011617783457040787, 0.01941448077559471, 0.0035401226487010717, 0.035288840532302856, -0.010859185829758644, -0.019920213147997856, -0.0013082297518849373, -0.014624077826738358, 0.02153574489057064, -0.008337550796568394, -0.0018262537196278572, 0.01963925175368786, 0.003979125991463661, 0.030990120023489, -0.010662511922419071, -0.012713535688817501, -0.04501013085246086, 0.0076421694830060005, -0.015424819663167, 0.008063612505793571, -0.004140679258853197, -0.007698361761868, -0.0037473321426659822, 0.01640818640589714, -0.020763099193572998, -0.04298720136284828, -0.030231522396206856, -0.006005565170198679, 0.015874359756708145, 0.004593730438500643, -0.02368510514497757, 0.04486965015530586, 0.029304347932338715, -0.01021999679505825, 0.051753219217061996, -0.004727187566459179, -0.014694318175315857, -0.06765567511320114, 0.06793663650751114, 0.028995288535952568, 0.046667806804180145, 0.02660711109638214, -0.0049238610081374645, -0.0029255179688334465, 0.020749051123857498, -0.0012546713696792722, 0.019288048148155212, 0.02468252182006836, -0.027969777584075928, -0.016183417290449142, -0.03885705769062042, 0.008773041889071465, 0.02459823153913021, -0.014385259710252285, 0.0012494033435359597, -0.019779732450842857, -0.01642223447561264, 0.03689032420516014, -0.021296927705407143, -0.007417399436235428, -0.043436743319034576, -0.0010896062012761831, 0.03180491179227829, 0.0016181661048904061, -0.004281159956008196, 0.002574315294623375, -0.027941681444644928, -0.02357272058725357, -0.06029446795582771, 0.011870648711919785, 0.019864020869135857, -0.003789476351812482, -0.025820417329669, 0.048775020986795425, -0.03172062337398529, -0.029613405466079712, -0.020594522356987, 0.023109132423996925, -0.011231460608541965, -0.05312993377447128, -0.021774563938379288, -0.02344628795981407, 0.007824794389307499, -0.002626995788887143, -0.022224102169275284, -0.04694876819849014, 0.03998090699315071, 0.04722972959280014, 0.013001521117985249, 0.004288183990865946, 0.013521301560103893, 0.020159030333161354, -0.016618909314274788, 0.01737750694155693, 0.018079912289977074, -0.06248597428202629, -0.029613405466079712, 0.024935387074947357, 0.013837384060025215, -0.04293100908398628, 0.027534285560250282, 0.01956901140511036, -0.025244444608688354, -0.008716849610209465, -0.04725782573223114, -0.020791195333003998, 0.0051872627809643745, 0.02870027907192707, 0.0010641439585015178, -0.018796365708112717, -0.01647842675447464, 0.004249551799148321, -0.005102974362671375, 0.007923131808638573, -0.013254387304186821, 0.023895828053355217, -0.05967635288834572, 0.002641043858602643, -0.031242987141013145, -4.527221608441323e-05, 0.006848451215773821, 0.0020211711525917053, -0.007206677924841642, 0.041779063642024994, -0.03464262932538986, 0.011547542177140713, 0.007066196762025356, -0.023319855332374573, -0.05518095940351486, -0.041020467877388, 0.02888290397822857, 0.011041810736060143, -0.04012138769030571, 0.009356037713587284, -0.05838392674922943, 0.03798607736825943, -0.01941448077559471, 0.04135762155056, -0.0038843010552227497, -0.013886552304029465, -0.020425945520401, -0.030119137838482857, -0.0008938107057474554, 0.004565634299069643, -0.02367105707526207, -0.047735460102558136, -0.0256658885627985, -0.014581933617591858, 0.012460669502615929, 0.05360756814479828, 0.005745674949139357, 0.0076140728779137135, -0.01496123243123293, 0.0713081806898117, -0.027070699259638786, 0.02891100011765957, -0.009054004214704037, 0.029191963374614716, 0.049786485731601715, 0.032451122999191284, -0.014567885547876358, -0.045796822756528854, -0.06889190524816513, -0.015424819663167, 0.02670544758439064, 0.004744747653603554, -0.01955496333539486, -0.004874692764133215, 0.020594522356987, -0.005510369315743446, 0.020777147263288498, -0.025595648214221, 0.003308328799903393, 0.01843111403286457, 0.02676163986325264, 0.055068571120500565, -0.024261077865958214, 0.024162741377949715, -0.026494726538658142, -0.025230396538972855, 0.016590813174843788, -0.013163074851036072, 0.018122056499123573, -0.012439597398042679, 0.004653434734791517, -0.0008068880415521562, -0.0032714526169002056, 0.0010711679933592677, -0.019751636311411858, -0.040458545088768005, -0.030624870210886, 0.023909876123070717, 0.002634019823744893, -0.021718371659517288, 0.012994497083127499, -0.07923131436109543, -0.002709528198465705, 0.003782452316954732, 0.028489558026194572, 0.017658468335866928, 0.008492079563438892, 0.04189145192503929, -0.011856600642204285, -0.0009069807711057365, -0.021170495077967644, -0.013717974536120892, 0.0017252829857170582, 0.007234774064272642, -0.008569343946874142, -0.054000917822122574, 0.013914648443460464, -0.05782200023531914, -0.02169027552008629, 0.004551586229354143, 0.013029617257416248, -0.02770286425948143, 0.04590920731425285, -0.007670265622437, 0.07703980803489685, 0.04630255699157715, 0.011147171258926392, -0.019976405426859856, -0.03568218648433685, -0.04338055104017258, -0.01494718436151743, -0.029107674956321716, -0.022139813750982285, 0.021044062450528145, 0.009974154643714428, 0.029978657141327858, 0.011463253758847713, -0.01496123243123293, -0.005872108042240143, 0.019063279032707214, -0.034305471926927567, 0.07647788524627686, -0.006560465320944786, 0.005973957013338804, 0.052933260798454285, -0.015930552035570145, 0.06523939967155457, 0.052905164659023285, -0.040599025785923004, -0.020819291472434998, 0.00028601064695976675, -0.031130600720643997, -0.048775020986795425, 0.0038210847415030003, -0.05745675042271614, -0.040851891040802, -0.011020738631486893, -0.040908083319664, 0.03770511597394943, 0.02368510514497757, 0.01845921017229557, -0.017995622009038925, 0.05032031238079071, -0.030006753280758858, 0.03217016160488129, 0.002270525088533759, 0.007031076587736607, -0.05312993377447128, 0.003859716933220625, -0.028419317677617073, -0.0714205652475357, -0.03371545299887657, 0.03517645597457886, 0.024317270144820213, 0.032338738441467285, -0.0049308850429952145, 0.03158013895153999, 0.017883237451314926, -0.006848451215773821, 0.03261969983577728, 0.0015830458141863346, -0.03767701983451843, -0.0009227849077433348, 0.007326086983084679, -0.06580132246017456, -0.007227750029414892, -0.004670994821935892, 0.019203759729862213, 0.023952020332217216, 0.02464037761092186, 0.018950894474983215, -0.029248155653476715, -0.01232721284031868, 0.0021072158124297857, 0.025427071377635002, -0.013057714328169823, -0.02865813486278057, -0.03455834090709686, -0.00024101280723698437, -0.027435949072241783, -0.032338738441467285, -0.020159030333161354, 0.056051939725875854, -0.009117220528423786, 0.0006150436238385737, 0.004544562194496393, 0.05624861270189285, -0.0019298584666103125, -0.02264554612338543, -0.02756238356232643, -0.0029957585502415895, 0.046723999083042145, 0.041807159781455994, 0.013717974536120892, 0.011814456433057785, -0.06759948283433914, 0.016253657639026642, 0.04208812490105629, 0.002906201872974634, 0.051078911870718, -0.017054399475455284, -0.024050356820225716, 0.004565634299069643, 0.03211396932601929, -0.019245903939008713, -0.06585751473903656, 0.00821111723780632, 0.0008810795843601227, 0.04641494154930115, 0.012537933886051178, 0.02150764875113964, 0.03259160369634628, -0.032226353883743286, -0.0028184012044221163, 0.02771691232919693, -0.016801534220576286, 0.013886552304029465, 0.00332413287833333, 0.03284446895122528, 0.0023074012715369463, -0.012306139804422855, -0.017672516405582428, 0.054984282702207565, -0.011800408363342285, -0.0036314353346824646, -0.025272540748119354, -0.009721288457512856, 0.006971372291445732, 0.030287714675068855, -0.0005439250962808728, -0.01233423687517643, -0.022111717611551285, -0.042678143829107285, -0.028292883187532425, -0.023151278495788574, -0.011926840990781784, -0.040711410343647, 0.03458643704652786, -0.0025514871813356876, -0.02147955261170864, 0.011772312223911285, -0.004597242455929518, 0.016183417290449142, -0.014055129140615463, -0.03764892369508743, 0.006244382821023464, -0.019133519381284714, -0.005988005083054304, -0.026354245841503143, 0.049955062568187714, -0.053972821682691574, 0.022968651726841927, -0.030512485653162003, 0.024120597168803215, 0.007831818424165249, -0.0030291227158159018, -0.015790069475769997, 0.022912459447979927, 0.020482137799263, 0.01653461903333664, 0.0153826754540205, -0.016113176941871643, 0.014567885547876358, -0.031439658254384995, -0.014511692337691784, -0.016253657639026642, -0.02244887314736843, 0.030287714675068855, -0.02452799119055271, 0.018740173429250717, -0.0205242820084095, -0.027197131887078285, 0.01650652289390564, 0.0064480802975595, -0.041554294526576996, -0.015593396499752998, 0.030905831605196, -0.03281637281179428, 0.0033030607737600803, -0.007227750029414892, -0.053860437124967575, 0.022814122959971428, 0.03306923806667328, 0.006339207757264376, -0.031074408441781998, 0.013802263885736465, 0.0004903666558675468, 0.0024707105476409197, -0.03792988508939743, -0.02969769388437271, 0.023095084354281425, -0.04689257591962814, 0.032451122999191284, 0.00510648638010025, 0.03410879895091057, -0.011020738631486893, 0.03666555508971214, -0.021086206659674644, -0.021015966311097145, 0.015551252290606499, 0.023109132423996925, 0.008864354342222214, -0.004165263380855322, 0.021044062450528145, -0.0034540779888629913, -0.025047771632671356, 0.011575639247894287, 0.003845668863505125, -0.0026867000851780176, -0.013134978711605072, -0.02362891286611557, -0.02152169682085514, 0.062205009162425995, 0.04796023294329643, -0.019259952008724213, -0.01630984991788864, 0.017658468335866928, 0.04551586136221886, -0.0005557781551033258, -0.02857384644448757, 0.009145316667854786, -0.002151116030290723, 0.01965329982340336, 0.018290633335709572, -0.011673975735902786, 0.03408070281147957, -0.037452246993780136, 0.003754356177523732, -0.011147171258926392, 0.004196871537715197, 0.020833339542150497, 0.035541705787181854, 0.013682854361832142, -0.006855475250631571, -0.03261969983577728, 0.020861435681581497, 0.03304114192724228, 0.0027376245707273483, -0.016127225011587143, 0.004944933112710714, 0.022252198308706284, 0.008098732680082321, 0.027548333629965782, 0.01758822798728943, -0.02250506542623043, -0.02896719239652157, -0.007206677924841642, 0.00617063045501709, 0.01657676510512829, 0.02882671169936657, -0.03166443109512329, -0.032226353883743286, 0.011350869201123714, -0.04402676224708557, -0.015818167477846146, -0.0031485315412282944, -0.02360081672668457, -0.02770286425948143, -0.004723675549030304, 0.015958648175001144, 0.001177406869828701, 0.00816897302865982, -0.01734941080212593, -0.012046250514686108, 0.013724998570978642, 0.018122056499123573, 0.031523946672677994, -0.011098003014922142, -0.0029184939339756966, 0.005239943508058786, -0.013120930641889572, -0.0203838013112545, 0.0154669638723135, 0.002619971754029393, 0.005232919007539749, -0.004109070636332035, 6.672849849564955e-05, -0.0035383666399866343, 0.03278827667236328, 0.011673975735902786, -0.005457689054310322, 0.009875818155705929, -0.01287508849054575, 0.009531639516353607, -0.051781315356492996, -0.03270398825407028, 0.02170432358980179, 0.004685043357312679, 0.004010734148323536, -0.018754221498966217, -0.021142398938536644, -4.557403008220717e-05, -0.014581933617591858, -0.011737192049622536, 0.03304114192724228, -0.020959774032235146, 0.03910992667078972, -0.015593396499752998, 0.011470277793705463, 0.01642223447561264, -0.04694876819849014, 0.01843111403286457, -0.002902689855545759, -0.029388636350631714, 0.01328950747847557, -0.013071762397885323, -0.020187126472592354, 0.025258492678403854, -0.016759390011429787, 0.03197348862886429, -0.04295910522341728, -0.043745800852775574, -0.04815690591931343, -0.023095084354281425, -0.001803425489924848, 0.03717128559947014, 0.0004308817442506552, -0.0015654857270419598, 0.003468126058578491, -0.01869802735745907, -0.0011940889526158571, 0.04186335206031799, -0.035513609647750854, 0.009025908075273037, 0.051303680986166, 0.007262870669364929, 0.020959774032235146, 0.03610363230109215, -0.024261077865958214, -0.0029764422215521336, -0.02681783214211464, 0.031018216162919998, 0.008646609261631966, -0.0017525011207908392, 0.042734336107969284, 0.03835132718086243, -0.002797328867018223, -0.005201310850679874, 0.005250479560345411, -0.014652173966169357, -0.005145118571817875, -0.003051950829103589, 0.007445496041327715, -0.010992642492055893, -0.010943474248051643, -0.029501020908355713, 0.00011101295967819169, 0.006837915163487196, -0.041104756295681, -0.03191729635000229, 0.01727917045354843, -0.006103901658207178, -0.008520175702869892, 0.022027429193258286, 0.007108341436833143, 0.012629246339201927, -0.026171620935201645, -0.03776130825281143, 0.01335974782705307, -0.01633794605731964, -0.016197465360164642, 0.008337550796568394, -0.046667806804180145, 0.029079578816890717, 0.0036630434915423393, -0.026241861283779144, -0.029051482677459717, -0.007445496041327715, 0.025651840493083, -0.02374129742383957, -0.006578025408089161, 0.009559735655784607, -0.015045520849525928, -0.004846596159040928, 0.016942014917731285, 0.0009649292333051562, -0.00048685463843867183, -0.022153861820697784, 0.011926840990781784, 0.0016199221136048436, 0.02355867251753807, 0.017251072451472282, -0.04442010819911957, -0.03360306844115257, -0.03624411299824715, 0.019709492102265358, 0.03972804173827171, -0.022898411378264427, 0.0013653002679347992, 0.016197465360164642, 0.0042074075900018215, -0.031467754393815994, 0.028222642838954926, -0.021044062450528145, 0.018276585265994072, -0.054843802005052567, 0.012151611037552357, 0.0015066593186929822, 0.029220059514045715, -0.023052940145134926, 0.04028996452689171, 0.005829963833093643, 0.04191954806447029, -0.0005193409160710871, -0.09698811918497086, 0.00981260184198618, 0.023052940145134926, -0.023923924192786217, -0.01761632412672043, -0.012453645467758179, -0.004997613374143839, 0.03585076332092285, 0.039615657180547714, 0.013689878396689892, 0.04751069098711014, -0.0009175168816000223, -0.024359414353966713, -0.0017419650685042143, 0.016661053523421288, -0.0031871639657765627, -0.00816194899380207, -0.00645510433241725, 0.04287481680512428, -0.016899870708584785, -0.022898411378264427, 0.01740560308098793, 0.000493000668939203, 0.02039784938097, 0.0012186731910333037, 0.014497644267976284, -0.011926840990781784, -0.008653633296489716, -0.005257503595203161, -0.03405260667204857, 0.01083108875900507, 0.034417856484651566, -0.048746924847364426, -0.0154669638723135, 0.0102972611784935, -0.050882238894701004, -0.025736128911376, -0.01636604219675064, -0.0057562110014259815, -0.0021844804286956787, -0.01493313629180193, 0.008653633296489716, 0.012018154375255108, -0.0256377924233675, -0.010086539201438427, 0.0030326347332447767, -0.004537538159638643, -0.0056403144262731075, 0.019990453496575356, -0.03514835983514786, 0.014975280500948429, -0.021212639287114143, 0.002147604012861848, 0.010908354073762894, -0.04641494154930115, -0.010641439817845821, -0.03877276927232742, -0.021760515868663788, -0.01036047749221325, 0.0015742657706141472, 0.0002866691502276808, 0.027197131887078285, 0.018852557986974716, -0.02468252182006836, -0.018782317638397217, 0.01331057958304882, -0.031242987141013145, 0.04416724294424057, -0.01938638463616371, -0.003408421529456973, -0.007020540535449982, 0.01761632412672043, -0.04307148978114128, -0.003492710180580616, -0.013830360025167465, 0.03984042629599571, 0.01073977630585432, -0.015621493570506573, 0.026213765144348145, 0.005829963833093643, 0.024949435144662857, -0.008548271842300892, 0.015214097686111927, 0.022097669541835785, -0.03674984350800514, 0.02067881077528, 0.036496978253126144, -0.01338784396648407, 0.03211396932601929, -0.012678415514528751, 0.002288085175678134, -0.04135762155056, -0.001504025305621326, 0.03419308736920357, -0.031102504581212997, 0.012839968316257, -0.0006330427713692188, 0.020018549636006355, 0.020144982263445854, 0.007269894704222679, 0.010613343678414822, -0.0007331355009227991, 0.018838509917259216, -0.033294010907411575, -0.03975613787770271, -0.015691732987761497, 0.013191170990467072, -0.006244382821023464, -0.026368293911218643, 0.02347438409924507, 0.031523946672677994, 0.0025233908090740442, 0.024907290935516357, 0.022378630936145782, -0.005566561594605446, -0.0024601744953542948, 0.02760452777147293, -0.04765117168426514, 0.007536808494478464, 0.04234099015593529, 0.036384593695402145, 0.043773896992206573, -0.06743090599775314, -0.021943140774965286, -0.011393013410270214, -0.006707970518618822, 0.04411105066537857, 0.024331318214535713, -0.03253541141748428, -0.0028254252392798662, 0.011603735387325287, 0.01763037219643593, -0.025258492678403854, -0.05742865428328514, -0.003792988369241357, -0.009559735655784607, 0.005703530739992857, -0.015031472779810429, 0.008358622901141644, -0.021353119984269142, 0.01956901140511036, -0.0026217277627438307, -0.00818302109837532, -0.013542373664677143, 0.0030747789423912764, 0.013591541908681393, -0.05020792782306671, 0.020889531821012497, -0.05003935098648071, 0.01019190065562725, -0.001039559836499393, -0.005692994687706232, -0.014111321419477463, 0.04234099015593529, -0.0028219132218509912, 0.008639585226774216, -0.007888010703027248, -0.033490683883428574, -0.03770511597394943, 0.028545750305056572, 0.009461399167776108, 0.04846596345305443, -0.04857834801077843, -0.011041810736060143, -0.029135771095752716, -0.012467693537473679, -0.07838843017816544, -0.015284338966012001, 0.004200383555144072, -0.021030014380812645, 0.014610029757022858, -0.050938431173563004, 0.016885822638869286, -0.02274388261139393, 0.00017033328185789287, 0.029978657141327858, 0.0014855870977044106, 0.018824461847543716, 0.035345032811164856, -0.00980557780712843, 0.009573783725500107, 0.002920249942690134, -0.01024809293448925, -0.012945328839123249, 0.06799282878637314, -0.00015716317284386605, 0.0021054598037153482, 0.008857330307364464, 0.031018216162919998, 0.013774166814982891, 0.001504025305621326, 0.046752095222473145, 0.016787486150860786, 0.03261969983577728, 0.014286923222243786, -0.004467297345399857, -0.014090249314904213, 0.008590416051447392, 0.007094293367117643, -0.007466568145900965, -0.02475276216864586, 0.049814581871032715, 0.014378235675394535, -0.014132393524050713, 0.024190837517380714, 0.029023384675383568, 0.0254973117262125, -0.01748989149928093, -0.009426278993487358, -0.00031059482716955245, 0.008871378377079964, 0.022926507517695427, -0.005152142606675625, 0.06743090599775314, -0.021254783496260643, 0.011976010166108608, -0.015003376640379429, -0.013134978711605072, -0.03989661857485771, -0.03731176629662514, -0.008787089958786964, -0.014371211640536785, -0.014336091466248035, 0.008421839214861393, -0.003972101956605911, -0.004874692764133215, -0.005422568880021572, -0.010500959120690823, 0.009924986399710178, 0.00813385285437107, -0.017742756754159927, 0.029416732490062714, 0.012664366513490677, 0.032338738441467285, -0.01840301789343357, -0.016141273081302643, 0.010971570387482643, 0.0016190441092476249, -0.014188586734235287, -0.004284671973437071, 0.07411780208349228, 0.015733877196907997, 0.0040634144097566605, -0.006153069902211428, -0.017644420266151428, 0.022842219099402428, 0.05065746605396271, 0.009018884040415287, -0.018866606056690216, -0.005995029117912054, -0.00774753000587225, -0.01657676510512829, -0.027197131887078285, -0.031214889138936996, 0.029416732490062714, 0.015607444569468498, 0.017939429730176926, 0.01869802735745907, -0.006574513390660286, -0.0035682187881320715, -0.02371320128440857, 0.005840499885380268, 0.0031871639657765627, 0.03351878002285957, 0.036525074392557144, -0.019807828590273857, 0.0005628022481687367, 0.017658468335866928, 0.007431447505950928, 0.028166450560092926, 0.0014109566109254956, -0.02867218293249607, -0.014076201245188713, 0.05318612605333328, -0.005622754339128733, 0.02360081672668457, -0.0014557349495589733, 0.007164533715695143, 0.012896160595119, -0.0102129727602005, 0.023305807262659073, 0.05978873744606972, 0.0037297720555216074, -0.003280232660472393, -0.0047728437930345535, -0.01023404486477375, -0.001063265954144299, -0.024921339005231857, 0.00517672672867775, 0.0203838013112545, 0.019119471311569214, 0.04422343522310257, -0.008351598866283894, -0.011645879596471786, -0.0153264831751585, 0.01653461903333664, -0.010529055260121822, 0.026087330654263496, 0.027211179956793785, 0.013963816687464714, 0.020313560962677002, 0.004600754473358393, -0.011027762666344643, -0.010388573631644249, -0.011266580782830715, -0.007522760424762964, -0.025188252329826355, -0.031467754393815994, 0.0051942868158221245, 0.013760118745267391, -0.028995288535952568, -0.02466847375035286, 0.025300636887550354, -0.051022719591856, 0.0203838013112545, 0.01640818640589714, 0.010648463852703571, 0.03708699718117714, 0.00541203236207366, 0.01329653151333332, -0.030681062489748, 0.01023404486477375, -0.008948642760515213, -0.004825524054467678, 0.004087998531758785, 0.01338081993162632, 0.029248155653476715, -0.00101936561986804, -0.0027411365881562233, -0.004326816648244858, 0.037536539137363434, 0.01758822798728943, 0.001353008090518415, -0.01944257691502571, -0.009559735655784607, 0.05268039554357529, 0.027084747329354286, 0.008716849610209465, 0.009243653155863285, -0.010381549596786499, -0.03604744002223015, -0.010458813980221748, -0.007255846168845892, 0.0127978241071105, 0.019920213147997856, -0.019161615520715714, -0.029332444071769714, -0.028517654165625572, -0.01955496333539486, -0.01753203570842743, 0.07844462245702744, 0.003122191410511732, 0.0077615780755877495, 0.01861373893916607, -0.031495850533246994, -0.004590218421071768, 0.010107612237334251, 0.028419317677617073, 0.004028294235467911, 0.02344628795981407, -0.007600024808198214, 0.0257782731205225, 0.00814790092408657, 0.027941681444644928, 0.010170828551054, -0.012109466828405857, 0.005387448240071535, 0.012242923490703106, -0.036581266671419144, -0.033350203186273575, 0.01744774729013443, 0.023291759192943573, -0.005088926292955875, -0.009615927934646606, 0.008035516366362572, -0.005626266356557608, 0.02882671169936657, 0.007326086983084679, 0.002651579910889268, -0.009896890260279179, 0.038604192435741425, 0.014511692337691784, 0.003757868194952607, -0.013465109281241894, -0.017798949033021927, -0.023980116471648216, 0.011505397967994213, -0.02785739302635193, -0.013823335990309715, -0.013451061211526394, 0.015607444569468498, 0.0006966982036828995, 0.019274000078439713, -0.011596711352467537, 0.000687918160110712, 0.024148693308234215, 0.0051977988332509995, 0.019161615520715714, 0.015523156151175499, -0.011027762666344643, -0.03295685350894928, 0.01078192051500082, 0.010992642492055893, 0.003213504096493125, 0.006030149292200804, -0.0031309714540839195, 0.010866209864616394, 0.0012862796429544687, 0.007543832529336214, -0.002751672640442848, -0.033209722489118576, -0.0006589439581148326, -0.030428195372223854, 0.019765684381127357, -0.003968589939177036, -0.0012397452956065536, 0.02677568793296814, -0.0009096148423850536, -0.04413914680480957, -0.0102972611784935, 0.03158013895153999, 0.008829234167933464, -0.0006343597779050469, -0.0043549127876758575, 0.006936252117156982, 0.013057714328169823, 0.008829234167933464, 0.018880654126405716, 0.005331255961209536, 0.04838167503476143, -0.011716119945049286, -0.014034057036042213, 0.04486965015530586, -0.04214431717991829, -0.014652173966169357, 0.023404143750667572, -0.0011089222971349955, 0.007312038913369179, -0.023909876123070717, -0.010543103329837322, 0.015705781057476997, 0.015368627384305, 0.03669365122914314, 0.022870315238833427, -0.0067711868323385715, -0.004607778508216143, -0.0153264831751585, -0.0076843136921525, 0.025230396538972855, 0.009046980179846287, 0.004224967677146196, 0.01636604219675064, -0.010016298852860928, 0.009840697981417179, -0.03357497230172157, 0.0038070364389568567, -0.0054857851937413216, -0.01740560308098793, 0.022926507517695427, 0.012053274549543858, 0.002990490524098277, -0.003849180880934, -0.016984159126877785, -0.009054004214704037, 0.018164200708270073, -0.011484325863420963, -0.0013266679598018527, -0.022336486726999283, -0.021760515868663788, -0.0014250046806409955, -0.040936179459095, 0.00666231382638216, 0.004523490089923143, -0.019835924729704857, -0.009932010434567928, -0.034502144902944565, -0.0017042107647284865, -0.021325023844838142, 0.0012230632128193974, 0.002604167442768812, 0.017082495614886284, 0.009334965609014034, 0.00516970269382, -0.027000458911061287, 0.006167118437588215, 0.010227020829916, -0.03784559667110443, -0.019709492102265358, 0.020215224474668503, -0.0103253573179245, -0.017897285521030426, -0.014216682873666286, 0.014666222035884857, 0.01942852884531021, -0.02775905653834343, -0.010957522317767143, -0.013816311955451965, -0.01744774729013443, 0.0014109566109254956, 0.003580510849133134, -0.001857861876487732, 0.007161021698266268, -0.01865588314831257, -0.0153545793145895, 0.02381153777241707, -0.030400099232792854, -0.011659927666187286, -0.013900600373744965, 0.004523490089923143, 0.03517645597457886, -0.025904705747961998, -0.008358622901141644, -0.03315353021025658, -0.020159030333161354, 0.042565759271383286, -0.025103963911533356, -0.0019421505276113749, -0.026368293911218643, 0.005945860408246517, 0.00489225285127759, -0.0076562175527215, -0.011716119945049286, 0.017953477799892426, 0.008695777505636215, -0.032226353883743286, 0.020510233938694, 0.0013082297518849373, 0.013703926466405392, -0.013198195025324821, 0.00032069190638139844, 0.011189315468072891, -0.014469548128545284, 0.021240735426545143, -0.01081001665443182, 0.013212243095040321, -0.004948445130139589, 0.021100254729390144, 0.008007420226931572, -0.005366376135498285, -0.032451122999191284, 0.014876943081617355, -0.011414085514843464, -0.029472924768924713, 0.03478311002254486, 0.03902563825249672, -0.01286104042083025, 0.015733877196907997, 0.0042074075900018215, 0.026312101632356644, -0.011294676922261715, -0.02768881618976593, 0.007139949593693018, 0.01642223447561264, -0.018276585265994072, -0.018810413777828217, -0.007241798099130392, -0.0003685432602651417, -0.010065467096865177, -0.020833339542150497, 0.0009175168816000223, 0.009349013678729534, 0.014441451989114285, -0.0067817228846251965, -0.008548271842300892, 0.006507784593850374, -0.007888010703027248, -0.00814087688922882, 0.05366376414895058, 0.01629580184817314, 0.03832323104143143, 0.021044062450528145, 0.011926840990781784, 0.0035998269449919462, -0.02351652830839157, 0.014975280500948429, -0.015171953476965427, 0.03624411299824715, 0.02367105707526207, -0.02250506542623043, -0.02375534549355507, 0.013472133316099644, -0.032338738441467285, -0.008773041889071465, -0.014076201245188713, -0.01645033061504364, -0.03191729635000229, -0.019344240427017212, -0.03391212597489357, 0.0020264391787350178, -0.0153826754540205, -0.019274000078439713, -0.013668806292116642, -0.0050432696007192135, -0.0023899339139461517, -0.015424819663167, -0.01753203570842743, 0.024401558563113213, -0.012994497083127499, -0.00974938552826643, 0.011477301828563213, -0.012566030025482178, 0.00618467852473259, 0.007824794389307499, -0.02163408137857914, -0.018108008429408073, -0.0012757435906678438, -0.009271749295294285, -0.047679267823696136, 0.006848451215773821, -0.002331985393539071, -0.049646005034446716, -0.009988202713429928, -0.021015966311097145, 0.006992444396018982, -0.023937972262501717, -0.003922933246940374, 0.002200284507125616, -0.012306139804422855, 0.0019070303533226252, 0.00027415755903348327, 0.031495850533246994, 0.06844236701726913, 0.016717245802283287, -0.013212243095040321, 6.76065101288259e-05, 0.012432573363184929, 0.026944266632199287, -0.00666231382638216, 0.028180498629808426, 0.021999333053827286, -0.04790404066443443, 0.010634415782988071, 0.021212639287114143, 0.024345366284251213, 0.021381216123700142, -0.014195610769093037, -0.0032082360703498125, 0.0128821125254035, -0.03812655806541443, -0.00510648638010025, 0.008534223772585392, 0.022252198308706284, 0.0035998269449919462, -0.013879528269171715, -0.04332435503602028, 0.023418191820383072, 0.011568614281713963, -0.05554620921611786, -0.0102972611784935, 0.000666406995151192, -0.023081036284565926, -0.007059172727167606, 0.041245236992836, -0.015368627384305, 0.025876609608530998, 0.018093960359692574, -0.02781524881720543, 0.011877672746777534, -0.014076201245188713, -0.011849576607346535, 0.039447080343961716, -0.003905373392626643, -0.032198257744312286, -0.0028412293177098036, 0.013788215816020966, 0.003227552166208625, -0.015565300360321999, -0.014413355849683285, -0.014097273349761963, 0.022350534796714783, 0.0022090645506978035, 0.000928930938243866, -0.0077545540407299995, -0.018206344917416573, 0.13002926111221313, -0.007290966808795929, 0.011006690561771393, 0.012896160595119, -0.004874692764133215, -0.05419759079813957, 0.012411501258611679, -0.004144191276282072, -0.014286923222243786, -0.03514835983514786, 0.014975280500948429, -0.019316144287586212, -0.019737588241696358, 0.041020467877388, 0.003715723752975464, -0.027927633374929428, 0.015621493570506573, -0.006247894838452339, 0.004260087851434946, -0.023235566914081573, -0.031327273696660995, 0.022800074890255928, -0.030624870210886, 0.006044197361916304, 0.014083225280046463, 0.0007239164551720023, 0.02660711109638214, -0.011196339502930641, -0.04009329155087471, 0.040992371737957, 0.018065864220261574, 0.018276585265994072, 0.012544957920908928, 0.011217412538826466, 0.023923924192786217, 0.02274388261139393, -0.030540581792593002, -0.012523885816335678, 0.008330526761710644, -0.005717578809708357, 0.014652173966169357, -0.0254973117262125, 0.015031472779810429, -0.00980557780712843, -0.015031472779810429, 0.006806307006627321, -0.0204961858689785, 0.023207470774650574, -0.0207209549844265, -0.008126828819513321, 0.020622618496418, -0.012144587002694607, -0.010845137760043144, -0.014399307779967785, -0.025974946096539497, -0.010571199469268322, 0.0003604216908570379, 0.005966932512819767, -0.013254387304186821, -0.006009077187627554, 0.017138687893748283, 0.0004570024320855737, 0.030119137838482857, 0.016956062987446785, 0.013626662082970142],
+FIXTURES_DIR = Path(__file__).parent
+
+
+def _load_samples() -> List[Dict[str, Any]]:
+    """Load sample metadata and attach each embedding as a memory-mapped row."""
+    metadata = json.loads(
+        (FIXTURES_DIR / "sample_embeddings_meta.json").read_text(encoding="utf-8")
+    )
+
+    matrices = {
+        dim: np.load(FIXTURES_DIR / f"sample_embeddings_{dim}.npy", mmap_mode="r")
+        for dim in sorted({entry["dimension"] for entry in metadata})
     }
-]
+
+    samples = []
+    for entry in metadata:
+        sample = {
+            key: value for key, value in entry.items()
+            if key not in ("dimension", "row")
+        }
+        sample["embedding"] = matrices[entry["dimension"]][entry["row"]]
+        samples.append(sample)
+
+    return samples
+
+
+# Real embedding samples from production database
+SAMPLE_EMBEDDINGS: List[Dict[str, Any]] = _load_samples()
 
 
 def get_sample_embeddings(dimension: int = 3072) -> List[Dict[str, Any]]:
     """
     Get sample embeddings filtered by dimension.
-    
+
     Args:
         dimension: Embedding dimension (1536 or 3072)
-        
+
     Returns:
         List of sample embeddings with the specified dimension
     """
@@ -77,10 +69,10 @@ def get_sample_embeddings(dimension: int = 3072) -> List[Dict[str, Any]]:
 def get_sample_crl_data(crl_id: str) -> Dict[str, Any]:
     """
     Get mock CRL data for a sample embedding.
-    
+
     Args:
         crl_id: CRL identifier
-        
+
     Returns:
         Mock CRL data dictionary
     """
@@ -5,15 +5,26 @@ Uses FastAPI's TestClient for testing HTTP endpoints without
 needing to run the actual server.
 """
 
-import os
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import patch, MagicMock
-import duckdb
 
-from app.config import Settings
 
+class TestEndpointSmoke:
+    """Smoke-test that endpoints respond with the expected status."""
 
+    @pytest.mark.parametrize("path,expected_status", [
+        ("/", 200),
+        ("/health", 200),
+        ("/docs", 200),
+        ("/redoc", 200),
+        ("/openapi.json", 200),
+        ("/api/crls?limit=1", 200),
+        ("/api/unknown/endpoint", 404),
+    ])
+    def test_endpoint_status(self, client, path, expected_status):
+        """Test that each endpoint returns the expected status code."""
+        response = client.get(path)
+
+        assert response.status_code == expected_status
 
 
 class TestHealthAndRoot:
@@ -92,38 +103,21 @@ class TestCRLEndpoints:
         ids2 = {item["id"] for item in data2["items"]}
         assert ids1 != ids2  # Different pages should have different items
 
-    def test_list_crls_filter_by_status(self, client):
-        """Test filtering by approval status."""
-        response = client.get("/api/crls?approval_status=Approved&limit=10")
-
-        assert response.status_code == 200
-        data = response.json()
-
-        # All items should be approved
-        for item in data["items"]:
-            assert item["approval_status"] == "Approved"
-
-    def test_list_crls_filter_by_year(self, client):
-        """Test filtering by letter year."""
-        response = client.get("/api/crls?letter_year=2024&limit=10")
-
-        assert response.status_code == 200
-        data = response.json()
-
-        # All items should be from 2024
-        for item in data["items"]:
-            assert item["letter_year"] == "2024"
-
-    def test_list_crls_filter_by_company(self, client):
-        """Test filtering by company name."""
-        response = client.get("/api/crls?company_name=Pfizer&limit=10")
+    @pytest.mark.parametrize("query,field,matches", [
+        ("approval_status=Approved", "approval_status", lambda value: value == "Approved"),
+        ("letter_year=2024", "letter_year", lambda value: value == "2024"),
+        ("company_name=Pfizer", "company_name", lambda value: "pfizer" in value.lower()),
+    ], ids=["status", "year", "company"])
+    def test_list_crls_filters(self, client, query, field, matches):
+        """Test filtering by approval status, letter year and company name."""
+        response = client.get(f"/api/crls?{query}&limit=10")
 
         assert response.status_code == 200
         data = response.json()
 
-        # All items should have Pfizer in company name
+        # Every returned item should satisfy the filter
         for item in data["items"]:
-            assert "pfizer" in item["company_name"].lower()
+            assert matches(item[field])
 
     def test_list_crls_sorting(self, client):
         """Test sorting works correctly."""
@@ -134,7 +128,7 @@ class TestCRLEndpoints:
 
         # Check dates are in ascending order
         dates = [item["letter_date"] for item in data["items"]]
-        assert dates == sorted(dates)
+        assert all(a <= b for a, b in zip(dates, dates[1:]))
 
     def test_list_crls_invalid_limit(self, client):
         """Test that invalid limit is rejected."""
@@ -143,19 +137,14 @@ class TestCRLEndpoints:
         # Should return validation error
         assert response.status_code == 422
 
-    def test_get_crl_by_id(self, client):
+    def test_get_crl_by_id(self, client, sample_crl_id):
         """Test getting a specific CRL by ID."""
-        # First get a CRL ID
-        list_response = client.get("/api/crls?limit=1")
-        crl_id = list_response.json()["items"][0]["id"]
-
-        # Get that specific CRL using query parameter
-        response = client.get(f"/api/crls/detail?crl_id={crl_id}")
+        response = client.get(f"/api/crls/detail?crl_id={sample_crl_id}")
 
         assert response.status_code == 200
         data = response.json()
 
-        assert data["id"] == crl_id
+        assert data["id"] == sample_crl_id
         assert "company_name" in data
         assert "letter_date" in data
         # Should include summary if available
@@ -168,19 +157,14 @@ class TestCRLEndpoints:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
-    def test_get_crl_with_text(self, client):
+    def test_get_crl_with_text(self, client, sample_crl_id):
         """Test getting CRL with full text."""
-        # First get a CRL ID
-        list_response = client.get("/api/crls?limit=1")
-        crl_id = list_response.json()["items"][0]["id"]
-
-        # Get that CRL with text using query parameter
-        response = client.get(f"/api/crls/text?crl_id={crl_id}")
+        response = client.get(f"/api/crls/text?crl_id={sample_crl_id}")
 
         assert response.status_code == 200
         data = response.json()
 
-        assert data["id"] == crl_id
+        assert data["id"] == sample_crl_id
         assert "text" in data
         assert len(data["text"]) > 0
 
@@ -234,13 +218,13 @@ class TestStatisticsEndpoints:
 
         # Verify descending order by crl_count
         counts = [c["crl_count"] for c in data["companies"]]
-        assert counts == sorted(counts, reverse=True)
+        assert all(a >= b for a, b in zip(counts, counts[1:]))
 
 
 class TestQAEndpoints:
     """Test Q&A API endpoints."""
 
-    def test_ask_question_success(self, client):
+    def test_ask_question_success(self, client, mock_rag):
         """Test asking a question returns an answer."""
         response = client.post(
             "/api/qa/ask",
@@ -248,6 +232,7 @@ class TestQAEndpoints:
         )
 
         assert response.status_code == 200
+        mock_rag.answer_question.assert_called_once()
         data = response.json()
 
         assert "question" in data
@@ -261,36 +246,18 @@ class TestQAEndpoints:
         assert isinstance(data["relevant_crls"], list)
         assert 0.0 <= data["confidence"] <= 1.0
 
-    def test_ask_question_empty_raises_error(self, client):
-        """Test that empty question is rejected."""
-        response = client.post(
-            "/api/qa/ask",
-            json={"question": "", "top_k": 3}
-        )
-
-        # Should return validation error (422) or bad request (400)
-        assert response.status_code in [400, 422]
-
-    def test_ask_question_too_short(self, client):
-        """Test that too-short question is rejected."""
-        response = client.post(
-            "/api/qa/ask",
-            json={"question": "Hi", "top_k": 3}
-        )
+    @pytest.mark.parametrize("payload", [
+        {"question": "", "top_k": 3},
+        {"question": "Hi", "top_k": 3},
+        {"question": "What are common deficiencies?", "top_k": 100},  # top_k max is 20
+    ], ids=["empty", "too_short", "top_k_too_large"])
+    def test_ask_question_invalid_input(self, client, payload):
+        """Test that invalid questions and top_k values are rejected."""
+        response = client.post("/api/qa/ask", json=payload)
 
         # Should return validation error
         assert response.status_code == 422
 
-    def test_ask_question_invalid_top_k(self, client):
-        """Test that invalid top_k is rejected."""
-        response = client.post(
-            "/api/qa/ask",
-            json={"question": "What are common deficiencies?", "top_k": 100}
-        )
-
-        # Should return validation error (top_k max is 20)
-        assert response.status_code == 422
-
     def test_qa_history(self, client):
         """Test getting Q&A history."""
         # First ask a question
@@ -310,40 +277,9 @@ class TestQAEndpoints:
         assert isinstance(data["items"], list)
 
 
-class TestErrorHandling:
-    """Test error handling across endpoints."""
-
-    def test_404_for_unknown_endpoint(self, client):
-        """Test 404 error for non-existent endpoint."""
-        response = client.get("/api/unknown/endpoint")
-
-        assert response.status_code == 404
-
-    def test_cors_headers_present(self, client):
-        """Test that CORS headers are configured."""
-        # Make a regular GET request (TestClient doesn't fully simulate CORS preflight)
-        response = client.get("/api/crls?limit=1")
-
-        # CORS middleware should add allow-origin header
-        # (In TestClient, CORS headers may not appear, but the middleware is configured)
-        assert response.status_code == 200
-
-
 class TestAPIDocumentation:
     """Test API documentation endpoints."""
 
-    def test_openapi_docs_available(self, client):
-        """Test that OpenAPI documentation is accessible."""
-        response = client.get("/docs")
-
-        assert response.status_code == 200
-
-    def test_redoc_available(self, client):
-        """Test that ReDoc documentation is accessible."""
-        response = client.get("/redoc")
-
-        assert response.status_code == 200
-
     def test_openapi_json_schema(self, client):
         """Test that OpenAPI JSON schema is available."""
         response = client.get("/openapi.json")
@@ -5,7 +5,6 @@ Tests configuration management, environment variable loading,
 and validation of settings.
 """
 
-import os
 import pytest
 from pydantic import ValidationError
 
@@ -34,16 +33,18 @@ class TestSettings:
         assert settings.schedule_hour == 2
         assert settings.openai_summary_model == "gpt-5-nano"
         assert settings.openai_embedding_model == "text-embedding-3-large"  # Updated default
+        assert settings.openai_embedding_batch_size == 512
+        assert settings.embedding_cache_size == 1024
         assert settings.openai_qa_model == "gpt-5-nano"
         assert settings.rag_top_k == 5
         assert settings.ai_dry_run is False  # Default is production mode
         assert settings.ai_dry_run_summary_chars == 500
+        assert settings.ai_dry_run_embedding_dims is None
 
-    def test_openai_api_key_validation_missing(self, test_env_vars):
+    def test_openai_api_key_validation_missing(self, test_env_vars, clean_env):
         """Test that missing OpenAI API key uses default when not in dry-run mode."""
         # Remove the API key
-        original_key = os.environ.pop("OPENAI_API_KEY", None)
-        get_settings.cache_clear()
+        clean_env("OPENAI_API_KEY")
 
         # With the new dry-run support, missing API key doesn't raise error
         # It uses the default dummy key
@@ -51,203 +52,108 @@ class TestSettings:
         # Check it starts with sk- (could be dummy or from .env file)
         assert settings.openai_api_key.startswith("sk-")
 
-        # Restore the key
-        if original_key:
-            os.environ["OPENAI_API_KEY"] = original_key
-        get_settings.cache_clear()
-
-    def test_openai_api_key_validation_invalid_format(self, test_env_vars):
-        """Test that invalid OpenAI API key format raises ValidationError."""
-        # Set invalid API key (doesn't start with 'sk-', but is long enough)
-        os.environ["OPENAI_API_KEY"] = "invalid-key-format-1234567890"
-        get_settings.cache_clear()
-
-        with pytest.raises(ValidationError) as exc_info:
-            Settings()
-
-        assert "must start with 'sk-'" in str(exc_info.value)
-
-        # Restore valid key
-        os.environ["OPENAI_API_KEY"] = "sk-test1234567890abcdefghijklmnopqrstuvwxyz"
-        get_settings.cache_clear()
-
-    def test_openai_api_key_validation_too_short(self, test_env_vars):
-        """Test that too-short OpenAI API key raises ValidationError."""
-        # Set too-short API key
-        os.environ["OPENAI_API_KEY"] = "sk-short"
-        get_settings.cache_clear()
-
-        with pytest.raises(ValidationError) as exc_info:
-            Settings()
-
-        assert "at least 20 characters" in str(exc_info.value)
-
-        # Restore valid key
-        os.environ["OPENAI_API_KEY"] = "sk-test1234567890abcdefghijklmnopqrstuvwxyz"
-        get_settings.cache_clear()
-
-    def test_log_level_validation_valid(self, test_env_vars):
-        """Test that valid log levels are accepted."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-
-        for level in valid_levels:
-            os.environ["LOG_LEVEL"] = level
-            get_settings.cache_clear()
-            settings = Settings()
-            assert settings.log_level == level.upper()
+    @pytest.mark.parametrize("var,value,field,expected", [
+        ("LOG_LEVEL", "DEBUG", "log_level", "DEBUG"),
+        ("LOG_LEVEL", "INFO", "log_level", "INFO"),
+        ("LOG_LEVEL", "WARNING", "log_level", "WARNING"),
+        ("LOG_LEVEL", "ERROR", "log_level", "ERROR"),
+        ("LOG_LEVEL", "CRITICAL", "log_level", "CRITICAL"),
+        ("LOG_LEVEL", "debug", "log_level", "DEBUG"),  # Case-insensitive
+        ("SCHEDULE_HOUR", "0", "schedule_hour", 0),
+        ("SCHEDULE_HOUR", "12", "schedule_hour", 12),
+        ("SCHEDULE_HOUR", "23", "schedule_hour", 23),
+        ("RAG_TOP_K", "1", "rag_top_k", 1),
+        ("RAG_TOP_K", "5", "rag_top_k", 5),
+        ("RAG_TOP_K", "20", "rag_top_k", 20),
+    ])
+    def test_env_valid(self, test_env_vars, monkeypatch, var, value, field, expected):
+        """Test that valid environment values are accepted and normalized."""
+        monkeypatch.setenv(var, value)
 
-        # Test case-insensitive
-        os.environ["LOG_LEVEL"] = "debug"
-        get_settings.cache_clear()
         settings = Settings()
-        assert settings.log_level == "DEBUG"
-
-    def test_log_level_validation_invalid(self, test_env_vars):
-        """Test that invalid log level raises ValidationError."""
-        os.environ["LOG_LEVEL"] = "INVALID_LEVEL"
-        get_settings.cache_clear()
-
-        with pytest.raises(ValidationError) as exc_info:
-            Settings()
-
-        assert "log_level must be one of" in str(exc_info.value)
-
-        # Restore valid level
-        os.environ["LOG_LEVEL"] = "INFO"
-        get_settings.cache_clear()
-
-    def test_schedule_hour_validation_valid(self, test_env_vars):
-        """Test that valid schedule hours are accepted."""
-        for hour in [0, 12, 23]:
-            os.environ["SCHEDULE_HOUR"] = str(hour)
-            get_settings.cache_clear()
-            settings = Settings()
-            assert settings.schedule_hour == hour
-
-    def test_schedule_hour_validation_invalid(self, test_env_vars):
-        """Test that invalid schedule hours raise ValidationError."""
-        # Test hour > 23
-        os.environ["SCHEDULE_HOUR"] = "24"
-        get_settings.cache_clear()
-
-        with pytest.raises(ValidationError) as exc_info:
-            Settings()
-
-        assert "less than or equal to 23" in str(exc_info.value)
 
-        # Test hour < 0
-        os.environ["SCHEDULE_HOUR"] = "-1"
-        get_settings.cache_clear()
-
-        with pytest.raises(ValidationError) as exc_info:
-            Settings()
-
-        assert "greater than or equal to 0" in str(exc_info.value)
-
-        # Restore valid hour
-        os.environ["SCHEDULE_HOUR"] = "2"
-        get_settings.cache_clear()
-
-    def test_rag_top_k_validation_valid(self, test_env_vars):
-        """Test that valid RAG top_k values are accepted."""
-        for k in [1, 5, 20]:
-            os.environ["RAG_TOP_K"] = str(k)
-            get_settings.cache_clear()
-            settings = Settings()
-            assert settings.rag_top_k == k
-
-    def test_rag_top_k_validation_invalid(self, test_env_vars):
-        """Test that invalid RAG top_k values raise ValidationError."""
-        # Test k < 1
-        os.environ["RAG_TOP_K"] = "0"
-        get_settings.cache_clear()
-
-        with pytest.raises(ValidationError) as exc_info:
-            Settings()
-
-        assert "greater than or equal to 1" in str(exc_info.value)
-
-        # Test k > 20
-        os.environ["RAG_TOP_K"] = "21"
-        get_settings.cache_clear()
-
-        with pytest.raises(ValidationError) as exc_info:
+        assert getattr(settings, field) == expected
+
+    @pytest.mark.parametrize("var,value,message", [
+        ("OPENAI_API_KEY", "invalid-key-format-1234567890", "must start with 'sk-'"),
+        ("OPENAI_API_KEY", "sk-short", "at least 20 characters"),
+        ("LOG_LEVEL", "INVALID_LEVEL", "log_level must be one of"),
+        ("SCHEDULE_HOUR", "24", "less than or equal to 23"),
+        ("SCHEDULE_HOUR", "-1", "greater than or equal to 0"),
+        ("RAG_TOP_K", "0", "greater than or equal to 1"),
+        ("RAG_TOP_K", "21", "less than or equal to 20"),
+    ])
+    def test_env_invalid(self, test_env_vars, monkeypatch, var, value, message):
+        """Test that invalid environment values raise ValidationError."""
+        monkeypatch.setenv(var, value)
+
+        with pytest.raises(ValidationError, match=message):
             Settings()
 
-        assert "less than or equal to 20" in str(exc_info.value)
-
-        # Restore valid value
-        os.environ["RAG_TOP_K"] = "5"
-        get_settings.cache_clear()
-
-    def test_get_cors_origins_list(self, test_env_vars):
-        """Test that CORS origins are correctly parsed into a list."""
+    def test_cors_origins_list(self, test_env_vars):
+        """Test that CORS origins are correctly parsed into a tuple."""
         settings = get_settings()
-        origins = settings.get_cors_origins_list()
+        origins = settings.cors_origins_list
 
-        assert isinstance(origins, list)
+        assert isinstance(origins, tuple)
         assert len(origins) == 2
         assert "http://localhost:3000" in origins
         assert "http://localhost:5173" in origins
 
-    def test_get_cors_origins_list_single_origin(self, test_env_vars):
+    def test_cors_origins_list_single_origin(self, test_env_vars, monkeypatch):
         """Test CORS origins parsing with single origin."""
-        os.environ["CORS_ORIGINS"] = "http://localhost:3000"
-        get_settings.cache_clear()
+        monkeypatch.setenv("CORS_ORIGINS", "http://localhost:3000")
 
-        settings = get_settings()
-        origins = settings.get_cors_origins_list()
+        settings = Settings()
+        origins = settings.cors_origins_list
 
         assert len(origins) == 1
         assert origins[0] == "http://localhost:3000"
 
-    def test_get_cors_origins_list_with_spaces(self, test_env_vars):
+    def test_cors_origins_list_with_spaces(self, test_env_vars, monkeypatch):
         """Test CORS origins parsing handles spaces correctly."""
-        os.environ["CORS_ORIGINS"] = "http://localhost:3000 , http://localhost:5173"
-        get_settings.cache_clear()
+        monkeypatch.setenv("CORS_ORIGINS", "http://localhost:3000 , http://localhost:5173")
 
-        settings = get_settings()
-        origins = settings.get_cors_origins_list()
+        settings = Settings()
+        origins = settings.cors_origins_list
 
         # Should strip spaces
         assert "http://localhost:3000" in origins
         assert "http://localhost:5173" in origins
 
+    def test_cors_origins_list_cached(self, test_env_vars):
+        """Test that CORS origins are parsed once per settings instance."""
+        settings = Settings()
+
+        assert settings.cors_origins_list is settings.cors_origins_list
+
     def test_settings_cache(self, test_env_vars):
         """Test that get_settings uses caching correctly."""
+        get_settings.cache_clear()
         settings1 = get_settings()
         settings2 = get_settings()
 
-        # Should return the same instance due to lru_cache
+        # Should return the same instance due to functools.cache
         assert settings1 is settings2
 
-    def test_settings_extra_fields_ignored(self, test_env_vars):
+    def test_settings_extra_fields_ignored(self, test_env_vars, monkeypatch):
         """Test that extra environment variables are ignored."""
-        os.environ["UNKNOWN_FIELD"] = "some_value"
-        get_settings.cache_clear()
+        monkeypatch.setenv("UNKNOWN_FIELD", "some_value")
 
         # Should not raise an error due to extra='ignore' in model_config
         settings = Settings()
         assert not hasattr(settings, "unknown_field")
 
-        # Cleanup
-        os.environ.pop("UNKNOWN_FIELD", None)
-
     def test_fda_bulk_urls_defaults(self, test_env_vars):
         """Test that FDA JSON URL has correct default value."""
         settings = get_settings()
 
         assert settings.fda_json_url == "https://download.open.fda.gov/transparency/crl/transparency-crl-0001-of-0001.json.zip"
 
-    def test_settings_from_env_file(self, tmp_path):
+    def test_settings_from_env_file(self, tmp_path, clean_env):
         """Test that settings can be loaded from .env file."""
         # Clear environment variables to test .env file loading
-        original_env = {
-            "OPENAI_API_KEY": os.environ.pop("OPENAI_API_KEY", None),
-            "DATABASE_PATH": os.environ.pop("DATABASE_PATH", None),
-            "LOG_LEVEL": os.environ.pop("LOG_LEVEL", None),
-        }
-        get_settings.cache_clear()
+        clean_env("OPENAI_API_KEY", "DATABASE_PATH", "LOG_LEVEL")
 
         # Create a temporary .env file
         env_file = tmp_path / ".env"
@@ -263,9 +169,3 @@ class TestSettings:
         assert settings.openai_api_key == "sk-envfile1234567890abcdefghijklmn"
         assert settings.database_path == "/tmp/test.duckdb"
         assert settings.log_level == "ERROR"
-
-        # Restore environment variables
-        for key, value in original_env.items():
-            if value is not None:
-                os.environ[key] = value
-        get_settings.cache_clear()
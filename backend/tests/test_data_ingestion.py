@@ -4,14 +4,97 @@ Tests for data ingestion service.
 
 import json
 import zipfile
+from io import BytesIO
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import MappingProxyType
+from unittest.mock import patch
 import pytest
 import httpx
+from tenacity import wait_none
 
 from app.services.data_ingestion import DataIngestionService, fetch_crl_data
 
 
+# Sample FDA bulk payload, serialized once for tests that need it on disk
+SAMPLE_CRL_DATA = {
+    "meta": {
+        "disclaimer": "Test disclaimer",
+        "last_updated": "2025-11-10",
+        "results": {
+            "total": 2
+        }
+    },
+    "results": [
+        {
+            "application_number": ["NDA 123456"],
+            "letter_date": "01/15/2024",
+            "letter_year": "2024",
+            "letter_type": "COMPLETE RESPONSE",
+            "approval_status": "Approved",
+            "company_name": "Test Pharma Inc",
+            "company_address": "123 Test St",
+            "company_rep": "John Doe",
+            "approver_name": "FDA Reviewer",
+            "approver_center": ["CDER"],
+            "approver_title": "Director",
+            "file_name": "test_crl.pdf",
+            "text": "This is a test CRL letter."
+        },
+        {
+            "application_number": ["BLA 789012"],
+            "letter_date": "03/20/2024",
+            "letter_year": "2024",
+            "letter_type": "COMPLETE RESPONSE",
+            "approval_status": "Unapproved",
+            "company_name": "BioTest Corp",
+            "company_address": "456 Bio Ave",
+            "company_rep": "Jane Smith",
+            "approver_name": "FDA Reviewer 2",
+            "approver_center": ["CBER"],
+            "approver_title": "Senior Director",
+            "file_name": "test_crl2.pdf",
+            "text": "This is another test CRL letter with deficiencies."
+        }
+    ]
+}
+SAMPLE_CRL_JSON = json.dumps(SAMPLE_CRL_DATA).encode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def sample_crl_data():
+    """Provide a read-only view of the sample CRL data."""
+    return MappingProxyType(SAMPLE_CRL_DATA)
+
+
+@pytest.fixture(scope="session")
+def sample_zip_bytes():
+    """Build the test ZIP archive once, in memory."""
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as zf:
+        zf.writestr("test_data.json", SAMPLE_CRL_JSON)
+    return buffer.getvalue()
+
+
+@pytest.fixture(autouse=True)
+def no_retry_wait(monkeypatch):
+    """Skip the exponential backoff between download retries."""
+    monkeypatch.setattr(DataIngestionService.download_crl_json.retry, "wait", wait_none())
+
+
+@pytest.fixture
+def zip_transport(sample_zip_bytes):
+    """Serve the sample ZIP archive for every request."""
+    return httpx.MockTransport(lambda request: httpx.Response(200, content=sample_zip_bytes))
+
+
+def failing_transport(error: Exception) -> httpx.MockTransport:
+    """Build a transport that raises the given error for every request."""
+    def handler(request):
+        raise error
+
+    return httpx.MockTransport(handler)
+
+
 class TestDataIngestionService:
     """Test cases for DataIngestionService."""
 
@@ -27,129 +110,53 @@ class TestDataIngestionService:
             return service
 
     @pytest.fixture
-    def sample_crl_data(self):
-        """Create sample CRL data for testing."""
-        return {
-            "meta": {
-                "disclaimer": "Test disclaimer",
-                "last_updated": "2025-11-10",
-                "results": {
-                    "total": 2
-                }
-            },
-            "results": [
-                {
-                    "application_number": ["NDA 123456"],
-                    "letter_date": "01/15/2024",
-                    "letter_year": "2024",
-                    "letter_type": "COMPLETE RESPONSE",
-                    "approval_status": "Approved",
-                    "company_name": "Test Pharma Inc",
-                    "company_address": "123 Test St",
-                    "company_rep": "John Doe",
-                    "approver_name": "FDA Reviewer",
-                    "approver_center": ["CDER"],
-                    "approver_title": "Director",
-                    "file_name": "test_crl.pdf",
-                    "text": "This is a test CRL letter."
-                },
-                {
-                    "application_number": ["BLA 789012"],
-                    "letter_date": "03/20/2024",
-                    "letter_year": "2024",
-                    "letter_type": "COMPLETE RESPONSE",
-                    "approval_status": "Unapproved",
-                    "company_name": "BioTest Corp",
-                    "company_address": "456 Bio Ave",
-                    "company_rep": "Jane Smith",
-                    "approver_name": "FDA Reviewer 2",
-                    "approver_center": ["CBER"],
-                    "approver_title": "Senior Director",
-                    "file_name": "test_crl2.pdf",
-                    "text": "This is another test CRL letter with deficiencies."
-                }
-            ]
-        }
-
-    @pytest.fixture
-    def create_test_zip(self, tmp_path, sample_crl_data):
+    def create_test_zip(self, tmp_path, sample_zip_bytes):
         """Create a test ZIP file containing JSON data."""
         def _create_zip(filename="test_data.json.zip"):
             zip_path = tmp_path / filename
-            json_path = tmp_path / "test_data.json"
-
-            # Write JSON file
-            with open(json_path, 'w') as f:
-                json.dump(sample_crl_data, f)
-
-            # Create ZIP file
-            with zipfile.ZipFile(zip_path, 'w') as zf:
-                zf.write(json_path, "test_data.json")
-
-            # Clean up temporary JSON
-            json_path.unlink()
-
+            zip_path.write_bytes(sample_zip_bytes)
             return zip_path
 
         return _create_zip
 
     @pytest.mark.asyncio
-    async def test_download_crl_json_success(self, service, tmp_path, create_test_zip):
+    async def test_download_crl_json_success(self, service, zip_transport, sample_zip_bytes):
         """Test successful download of CRL JSON ZIP file."""
-        zip_path = create_test_zip()
+        service.transport = zip_transport
 
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_response = MagicMock()
-            mock_response.content = zip_path.read_bytes()
-            mock_response.raise_for_status = MagicMock()
+        result = await service.download_crl_json()
 
-            mock_context = AsyncMock()
-            mock_context.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
-            mock_client.return_value = mock_context
-
-            result = await service.download_crl_json()
-
-            assert result.exists()
-            assert result.name.endswith(".zip")
+        assert result.exists()
+        assert result.name.endswith(".zip")
+        assert result.read_bytes() == sample_zip_bytes
 
     @pytest.mark.asyncio
     async def test_download_crl_json_http_error(self, service):
         """Test download with HTTP error."""
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_context = AsyncMock()
-            mock_context.__aenter__.return_value.get = AsyncMock(
-                side_effect=httpx.HTTPError("Connection failed")
-            )
-            mock_client.return_value = mock_context
+        service.transport = failing_transport(httpx.HTTPError("Connection failed"))
 
-            with pytest.raises(httpx.HTTPError):
-                await service.download_crl_json()
+        with pytest.raises(httpx.HTTPError):
+            await service.download_crl_json()
 
     @pytest.mark.asyncio
     async def test_download_retry_logic(self, service):
-        """Test that retry logic works with exponential backoff."""
-        with patch('httpx.AsyncClient') as mock_client:
+        """Test that failed downloads are retried."""
+        calls = []
+
+        def handler(request):
             # Simulate 2 failures then success
-            mock_response = MagicMock()
-            mock_response.content = b"test data"
-            mock_response.raise_for_status = MagicMock()
-
-            mock_context = AsyncMock()
-            mock_get = AsyncMock(
-                side_effect=[
-                    httpx.HTTPError("First failure"),
-                    httpx.HTTPError("Second failure"),
-                    mock_response
-                ]
-            )
-            mock_context.__aenter__.return_value.get = mock_get
-            mock_client.return_value = mock_context
+            calls.append(request)
+            if len(calls) < 3:
+                raise httpx.HTTPError(f"Failure {len(calls)}")
+            return httpx.Response(200, content=b"test data")
 
-            result = await service.download_crl_json()
+        service.transport = httpx.MockTransport(handler)
 
-            # Should succeed after retries
-            assert result.exists()
-            assert mock_get.call_count == 3
+        result = await service.download_crl_json()
+
+        # Should succeed after retries
+        assert result.exists()
+        assert len(calls) == 3
 
     def test_extract_json_from_zip_success(self, service, create_test_zip):
         """Test successful extraction of JSON from ZIP."""
@@ -161,29 +168,35 @@ class TestDataIngestionService:
         assert json_path.suffix == ".json"
         assert json_path.stat().st_size > 0
 
-    def test_extract_json_from_zip_bad_zip(self, service, tmp_path):
+    def test_extract_json_from_zip_stream(self, service, sample_zip_bytes):
+        """Test extraction from an in-memory ZIP archive."""
+        json_path = service.extract_json_from_zip(BytesIO(sample_zip_bytes))
+
+        assert json_path.exists()
+        assert json_path.read_bytes() == SAMPLE_CRL_JSON
+
+    def test_extract_json_from_zip_bad_zip(self, service):
         """Test extraction with corrupted ZIP file."""
-        bad_zip = tmp_path / "bad.zip"
-        bad_zip.write_text("This is not a valid ZIP file")
+        bad_zip = BytesIO(b"This is not a valid ZIP file")
 
         with pytest.raises(zipfile.BadZipFile):
             service.extract_json_from_zip(bad_zip)
 
-    def test_extract_json_from_zip_no_json(self, service, tmp_path):
+    def test_extract_json_from_zip_no_json(self, service):
         """Test extraction when ZIP contains no JSON files."""
-        zip_path = tmp_path / "no_json.zip"
+        zip_buffer = BytesIO()
 
         # Create ZIP with no JSON files
-        with zipfile.ZipFile(zip_path, 'w') as zf:
+        with zipfile.ZipFile(zip_buffer, 'w') as zf:
             zf.writestr("readme.txt", "No JSON here")
 
         with pytest.raises(FileNotFoundError):
-            service.extract_json_from_zip(zip_path)
+            service.extract_json_from_zip(zip_buffer)
 
     def test_load_json_data_success(self, service, tmp_path, sample_crl_data):
         """Test successful loading and parsing of JSON data."""
         json_path = tmp_path / "test.json"
-        json_path.write_text(json.dumps(sample_crl_data))
+        json_path.write_bytes(SAMPLE_CRL_JSON)
 
         data = service.load_json_data(json_path)
 
@@ -191,50 +204,46 @@ class TestDataIngestionService:
         assert "results" in data
         assert len(data["results"]) == 2
         assert data["meta"]["last_updated"] == "2025-11-10"
+        assert data == dict(sample_crl_data)
+
+    def test_load_json_data_stream(self, service, sample_crl_data):
+        """Test loading JSON data from an in-memory stream."""
+        data = service.load_json_data(BytesIO(SAMPLE_CRL_JSON))
+
+        assert data == dict(sample_crl_data)
 
-    def test_load_json_data_invalid_structure(self, service, tmp_path):
+    def test_load_json_data_invalid_structure(self, service):
         """Test loading JSON with invalid structure."""
-        json_path = tmp_path / "invalid.json"
-        json_path.write_text(json.dumps({"invalid": "structure"}))
+        json_stream = BytesIO(b'{"invalid": "structure"}')
 
         with pytest.raises(ValueError, match="Invalid JSON structure"):
-            service.load_json_data(json_path)
+            service.load_json_data(json_stream)
 
-    def test_load_json_data_malformed(self, service, tmp_path):
+    def test_load_json_data_malformed(self, service):
         """Test loading malformed JSON."""
-        json_path = tmp_path / "malformed.json"
-        json_path.write_text("{ invalid json }")
+        json_stream = BytesIO(b"{ invalid json }")
 
         with pytest.raises(json.JSONDecodeError):
-            service.load_json_data(json_path)
+            service.load_json_data(json_stream)
 
     @pytest.mark.asyncio
-    async def test_download_and_extract_full_pipeline(self, service, create_test_zip, sample_crl_data):
+    async def test_download_and_extract_full_pipeline(self, service, zip_transport):
         """Test the complete download and extract pipeline."""
-        zip_path = create_test_zip()
-
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_response = MagicMock()
-            mock_response.content = zip_path.read_bytes()
-            mock_response.raise_for_status = MagicMock()
-
-            mock_context = AsyncMock()
-            mock_context.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
-            mock_client.return_value = mock_context
+        service.transport = zip_transport
 
-            data = await service.download_and_extract()
+        data = await service.download_and_extract()
 
-            assert "meta" in data
-            assert "results" in data
-            assert len(data["results"]) == 2
-            assert data["results"][0]["company_name"] == "Test Pharma Inc"
+        assert "meta" in data
+        assert "results" in data
+        assert len(data["results"]) == 2
+        assert data["results"][0]["company_name"] == "Test Pharma Inc"
 
-    def test_get_cached_json_exists(self, service, tmp_path, sample_crl_data):
+    def test_get_cached_json_exists(self, service):
         """Test getting cached JSON data."""
         # Create a cached JSON file in raw directory
         json_path = service.raw_dir / "cached.json"
         json_path.parent.mkdir(parents=True, exist_ok=True)
-        json_path.write_text(json.dumps(sample_crl_data))
+        json_path.write_bytes(SAMPLE_CRL_JSON)
 
         data = service.get_cached_json()
 
@@ -259,7 +268,7 @@ class TestDataIngestionService:
         assert data is None  # Should return None and log warning
 
     @pytest.mark.asyncio
-    async def test_fetch_crl_data_with_cache(self, tmp_path, sample_crl_data):
+    async def test_fetch_crl_data_with_cache(self, tmp_path):
         """Test fetch_crl_data function with cache."""
         with patch('app.services.data_ingestion.settings') as mock_settings:
             mock_settings.data_raw_dir = str(tmp_path / "raw")
@@ -269,7 +278,7 @@ class TestDataIngestionService:
             raw_dir = Path(tmp_path / "raw")
             raw_dir.mkdir(parents=True, exist_ok=True)
             cached_file = raw_dir / "cached.json"
-            cached_file.write_text(json.dumps(sample_crl_data))
+            cached_file.write_bytes(SAMPLE_CRL_JSON)
 
             data = await fetch_crl_data(use_cache=True)
 
@@ -277,28 +286,17 @@ class TestDataIngestionService:
             assert len(data["results"]) == 2
 
     @pytest.mark.asyncio
-    async def test_fetch_crl_data_no_cache(self, tmp_path, sample_crl_data, create_test_zip):
+    async def test_fetch_crl_data_no_cache(self, tmp_path, zip_transport):
         """Test fetch_crl_data function forcing download."""
         with patch('app.services.data_ingestion.settings') as mock_settings:
             mock_settings.data_raw_dir = str(tmp_path / "raw")
             mock_settings.data_processed_dir = str(tmp_path / "processed")
             mock_settings.fda_json_url = "https://example.com/data.json.zip"
 
-            zip_path = create_test_zip()
-
-            with patch('httpx.AsyncClient') as mock_client:
-                mock_response = MagicMock()
-                mock_response.content = zip_path.read_bytes()
-                mock_response.raise_for_status = MagicMock()
-
-                mock_context = AsyncMock()
-                mock_context.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
-                mock_client.return_value = mock_context
-
-                data = await fetch_crl_data(use_cache=False)
+            data = await fetch_crl_data(use_cache=False, transport=zip_transport)
 
-                assert data is not None
-                assert len(data["results"]) == 2
+            assert data is not None
+            assert len(data["results"]) == 2
 
 
 class TestDataIngestionEdgeCases:
@@ -312,17 +310,12 @@ class TestDataIngestionEdgeCases:
             mock_settings.data_processed_dir = "/tmp/test_processed"
             mock_settings.fda_json_url = "https://example.com/data.json.zip"
 
-            service = DataIngestionService()
-
-            with patch('httpx.AsyncClient') as mock_client:
-                mock_context = AsyncMock()
-                mock_context.__aenter__.return_value.get = AsyncMock(
-                    side_effect=httpx.TimeoutException("Request timed out")
-                )
-                mock_client.return_value = mock_context
+            service = DataIngestionService(
+                transport=failing_transport(httpx.TimeoutException("Request timed out"))
+            )
 
-                with pytest.raises(httpx.TimeoutException):
-                    await service.download_crl_json()
+            with pytest.raises(httpx.TimeoutException):
+                await service.download_crl_json()
 
     def test_disk_space_error(self, tmp_path):
         """Test handling of disk space error during extraction."""
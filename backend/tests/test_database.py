@@ -7,6 +7,8 @@ and all repository classes (CRUD operations).
 
 import pytest
 import duckdb
+import numpy as np
+import uuid
 from datetime import datetime
 from unittest.mock import patch, MagicMock
 
@@ -60,6 +62,18 @@ class TestDatabaseConnection:
         # Reinitialize for cleanup
         DatabaseConnection()
 
+    @pytest.mark.parametrize("repo_class", [
+        CRLRepository,
+        SummaryRepository,
+        EmbeddingRepository,
+        QARepository,
+        MetadataRepository,
+    ])
+    def test_repository_connection(self, test_env_vars, test_db_connection, repo_class):
+        """Test that repositories share the singleton unless given a connection."""
+        assert repo_class().conn is get_db()
+        assert repo_class(test_db_connection).conn is test_db_connection
+
 
 # ============================================================================
 # Schema Initialization Tests
@@ -287,10 +301,10 @@ class TestCRLRepository:
         for i, crl in enumerate(sample_crl_list):
             crl_id = f"NDA{215818 + i}_2024"
             year = "2024" if i < 3 else "2023"
-            crl["letter_year"] = year
             self.repo.create({
                 "id": crl_id,
                 **crl,
+                "letter_year": year,
                 "letter_date": f"{year}-01-15",
                 "raw_json": {},
             })
@@ -324,10 +338,10 @@ class TestCRLRepository:
         # Insert sample CRLs with unique text
         for i, crl in enumerate(sample_crl_list):
             crl_id = f"NDA{215818 + i}_20240115"
-            crl["text"] = f"Standard text. Unique word: unicorn{i}"
             self.repo.create({
                 "id": crl_id,
                 **crl,
+                "text": f"Standard text. Unique word: unicorn{i}",
                 "letter_date": "2024-01-15",
                 "raw_json": {},
             })
@@ -409,6 +423,28 @@ class TestCRLRepository:
         assert stats["by_status"]["Unapproved"] == 2  # indices 1, 3
         assert stats["by_year"]["2024"] == 5
 
+    def test_get_basic_stats_matches_get_stats(self, sample_crl_list):
+        """Test that the single-query stats agree with get_stats."""
+        assert self.repo.get_basic_stats() == {
+            "total_crls": 0, "by_status": {}, "by_year": {}
+        }
+
+        for i, crl in enumerate(sample_crl_list):
+            self.repo.create({
+                "id": f"NDA{215818 + i}_20240115",
+                **crl,
+                "letter_year": "2023" if i == 0 else "2024",
+                "letter_date": "2024-01-15",
+                "raw_json": {},
+            })
+
+        basic_stats = self.repo.get_basic_stats()
+        full_stats = self.repo.get_stats()
+
+        assert basic_stats["total_crls"] == full_stats["total_crls"] == 5
+        assert basic_stats["by_status"] == full_stats["by_status"]
+        assert basic_stats["by_year"] == {"2023": 1, "2024": 4}
+
 
 # ============================================================================
 # SummaryRepository Tests
@@ -460,6 +496,25 @@ class TestSummaryRepository:
         assert saved_summary is not None
         assert saved_summary["summary"] == "This is a test summary of the CRL."
 
+    def test_create_summary_generates_id(self, sample_crl_data):
+        """Test that a summary created without an ID gets a generated UUID."""
+        crl_id = "NDA215818_20240115"
+        self.crl_repo.create({
+            "id": crl_id,
+            **sample_crl_data,
+            "letter_date": "2024-01-15",
+            "raw_json": {},
+        })
+
+        summary_id = self.repo.create({
+            "crl_id": crl_id,
+            "summary": "This is a test summary of the CRL.",
+            "model": "gpt-4o-mini",
+        })
+
+        assert str(uuid.UUID(summary_id)) == summary_id
+        assert self.repo.get_by_crl_id(crl_id)["id"] == summary_id
+
     def test_get_by_crl_id_existing(self, sample_crl_data):
         """Test getting summary by CRL ID that exists."""
         crl_id = "NDA215818_20240115"
@@ -514,6 +569,26 @@ class TestSummaryRepository:
         """Test exists returns False for non-existing summary."""
         assert self.repo.exists("nonexistent_crl") is False
 
+    def test_count(self, sample_crl_data):
+        """Test counting stored summaries."""
+        assert self.repo.count() == 0
+
+        crl_id = "NDA215818_20240115"
+        self.crl_repo.create({
+            "id": crl_id,
+            **sample_crl_data,
+            "letter_date": "2024-01-15",
+            "raw_json": {},
+        })
+        self.repo.create({
+            "id": f"summary_{crl_id}",
+            "crl_id": crl_id,
+            "summary": "Test summary",
+            "model": "gpt-4o-mini",
+        })
+
+        assert self.repo.count() == 1
+
 
 # ============================================================================
 # EmbeddingRepository Tests
@@ -622,6 +697,45 @@ class TestEmbeddingRepository:
         for emb in embeddings:
             assert emb["embedding_type"] == "summary"
 
+    def test_get_embeddings_matrix(self, sample_crl_list):
+        """Test getting embeddings of one dimension stacked into a matrix."""
+        for i, crl in enumerate(sample_crl_list[:3]):
+            crl_id = f"NDA{215818 + i}_20240115"
+            self.crl_repo.create({
+                "id": crl_id,
+                **crl,
+                "letter_date": "2024-01-15",
+                "raw_json": {},
+            })
+
+            # The last CRL has an embedding of a different dimension
+            self.repo.create({
+                "id": f"emb_{crl_id}",
+                "crl_id": crl_id,
+                "embedding_type": "summary",
+                "embedding": [0.1 * (i + 1)] * (1536 if i < 2 else 3072),
+                "model": "text-embedding-3-small",
+            })
+
+        crl_ids, matrix = self.repo.get_embeddings_matrix("summary", dimension=1536)
+
+        assert sorted(crl_ids) == ["NDA215818_20240115", "NDA215819_20240115"]
+        assert matrix.shape == (2, 1536)
+        assert matrix.dtype == np.float32
+        assert matrix.flags["C_CONTIGUOUS"]
+
+        _, half_matrix = self.repo.get_embeddings_matrix(
+            "summary", dimension=1536, dtype=np.float16
+        )
+
+        assert half_matrix.dtype == np.float16
+        assert half_matrix.shape == (2, 1536)
+
+        crl_ids, matrix = self.repo.get_embeddings_matrix("full_text", dimension=1536)
+
+        assert crl_ids == []
+        assert matrix.shape == (0, 1536)
+
     def test_exists_true(self, sample_crl_data):
         """Test exists returns True for existing embedding."""
         crl_id = "NDA215818_20240115"
@@ -0,0 +1,77 @@
+"""
+Tests for the CI data ingestion pipeline script.
+"""
+
+from unittest.mock import AsyncMock, patch
+import pytest
+
+import check_for_updates
+import ingest_data_ci
+from app.database import init_db, MetadataRepository
+from app.utils import logging_config
+
+
+FDA_HASH = "a" * 64
+FDA_LAST_UPDATED = "2025-11-10"
+
+
+class TestIngestDataCI:
+    """Test cases for the ingest_data_ci pipeline."""
+
+    @pytest.fixture
+    def pipeline(self, test_env_vars):
+        """Stub out the pipeline steps, data cleanup, logging setup and FDA download."""
+        init_db()
+
+        with patch.object(ingest_data_ci, 'cleanup_old_data'), \
+             patch.object(ingest_data_ci, 'run_script', return_value=True) as run_script, \
+             patch.object(logging_config, 'setup_logging'), \
+             patch.object(
+                 check_for_updates, 'fetch_fda_metadata',
+                 AsyncMock(return_value=(FDA_HASH, FDA_LAST_UPDATED))
+             ):
+            yield run_script
+
+    def test_main_stores_fda_hash(self, pipeline):
+        """Test that a successful run stores the FDA data hash in-process."""
+        assert ingest_data_ci.main() == 0
+
+        metadata_repo = MetadataRepository()
+        assert metadata_repo.get(check_for_updates.LAST_FDA_HASH_KEY) == FDA_HASH
+        assert metadata_repo.get(check_for_updates.LAST_FDA_UPDATE_KEY) == FDA_LAST_UPDATED
+
+    def test_main_configures_logging_once(self, pipeline):
+        """Test that logging is set up once by the pipeline, not by each step."""
+        assert ingest_data_ci.main() == 0
+
+        logging_config.setup_logging.assert_called_once()
+
+    def test_main_skips_hash_when_pipeline_fails(self, pipeline):
+        """Test that a failed run does not store the FDA data hash."""
+        pipeline.return_value = False
+
+        assert ingest_data_ci.main() == 1
+
+        assert MetadataRepository().get(check_for_updates.LAST_FDA_HASH_KEY) is None
+
+    def test_store_fda_hash_download_error(self, pipeline):
+        """Test that a failed FDA download is reported without raising."""
+        check_for_updates.fetch_fda_metadata.side_effect = OSError("Network down")
+
+        assert ingest_data_ci.store_fda_hash() is False
+
+    def test_cleanup_old_data_deletes_files_only(self, tmp_path):
+        """Test that cleanup removes the database and raw files but keeps subdirectories."""
+        raw_dir = tmp_path / "data" / "raw"
+        (raw_dir / "archive").mkdir(parents=True)
+        (raw_dir / "archive" / "old.json").write_text("{}")
+        (raw_dir / "crls.json").write_text("{}")
+        db_path = tmp_path / "data" / "crl_explorer.duckdb"
+        db_path.write_bytes(b"")
+
+        with patch.object(ingest_data_ci, '__file__', str(tmp_path / "ingest_data_ci.py")):
+            ingest_data_ci.cleanup_old_data()
+
+        assert not db_path.exists()
+        assert not (raw_dir / "crls.json").exists()
+        assert (raw_dir / "archive" / "old.json").exists()
@@ -2,6 +2,9 @@
 Tests for OpenAI client wrapper.
 """
 
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
 import pytest
 from app.config import Settings
 from app.utils.openai_client import OpenAIClient
@@ -76,6 +79,13 @@ class TestOpenAIClientDryRun:
         assert all(isinstance(x, float) for x in embedding)
         assert all(x == 0.0 for x in embedding)  # All zeros in dry-run
 
+    def test_create_embeddings_dry_run(self, dry_run_client):
+        """Test batch embedding generation in dry-run mode."""
+        embeddings = dry_run_client.create_embeddings(["first", "second", "third"])
+
+        assert len(embeddings) == 3
+        assert all(len(embedding) == 3072 for embedding in embeddings)
+
     def test_generate_dummy_summary_short_text(self, dry_run_client):
         """Test dummy summary generation with short text."""
         text = "Short text"
@@ -133,6 +143,27 @@ class TestOpenAIClientConfiguration:
         assert client_real.dry_run is False
         assert client_real.client is not None
 
+    def test_create_embeddings_single_request_in_input_order(self):
+        """Test that create_embeddings sends one request and orders results by index."""
+        settings = Settings(
+            openai_api_key="sk-test-key-123456789012345678901234",
+            ai_dry_run=False
+        )
+        client = OpenAIClient(settings)
+        client.client = MagicMock()
+        client.client.embeddings.create.return_value = SimpleNamespace(data=[
+            SimpleNamespace(index=1, embedding=[0.2]),
+            SimpleNamespace(index=0, embedding=[0.1]),
+        ])
+
+        embeddings = client.create_embeddings(["first", "second"])
+
+        client.client.embeddings.create.assert_called_once_with(
+            input=["first", "second"],
+            model="text-embedding-3-large"
+        )
+        assert embeddings == [[0.1], [0.2]]
+
 
 class TestOpenAIClientGPT5Support:
     """Test GPT-5 API support."""
@@ -197,6 +228,20 @@ class TestOpenAIClientDynamicDimensions:
 
         assert len(embedding) == 1536
 
+    def test_embedding_dry_run_dims_override(self):
+        """Test that ai_dry_run_embedding_dims overrides the model's dimensions."""
+        settings = Settings(
+            openai_api_key="sk-dummy-key-for-testing-purposes",
+            ai_dry_run=True,
+            ai_dry_run_embedding_dims=16,
+            openai_embedding_model="text-embedding-3-large"
+        )
+        client = OpenAIClient(settings)
+
+        embedding = client.create_embedding("test text")
+
+        assert len(embedding) == 16
+
     def test_embedding_explicit_model_parameter(self, dry_run_client):
         """Test that explicit model parameter overrides default."""
         # Default is text-embedding-3-large (3072 dims)
@@ -10,7 +10,6 @@ from fastapi.testclient import TestClient
 from datetime import datetime
 from unittest.mock import patch, AsyncMock, MagicMock
 
-from app.main import app
 from app.database import CRLRepository, SummaryRepository, EmbeddingRepository, init_db, get_db
 
 
@@ -19,10 +18,10 @@ from app.database import CRLRepository, SummaryRepository, EmbeddingRepository,
 # ============================================================================
 
 @pytest.fixture(scope="function")
-def test_client(test_env_vars):
+def test_client(app_modules):
     """Create a test client for the FastAPI app."""
     init_db()
-    client = TestClient(app)
+    client = TestClient(app_modules.app)
     return client
 
 
@@ -4,8 +4,10 @@ Tests for vector utility functions.
 
 import pytest
 import math
+import numpy as np
 from app.utils.vector_utils import (
     cosine_similarity,
+    cosine_similarity_matrix,
     euclidean_distance,
     dot_product,
     normalize_vector,
@@ -50,6 +52,62 @@ class TestCosineSimilarity:
         with pytest.raises(ValueError):
             cosine_similarity([], [1.0, 2.0])
 
+    def test_numpy_arrays_match_lists(self):
+        """Test that NumPy arrays give the same result as lists."""
+        vec1 = [1.0, 2.0, 3.0]
+        vec2 = [4.0, -5.0, 6.0]
+        expected = cosine_similarity(vec1, vec2)
+
+        similarity = cosine_similarity(
+            np.asarray(vec1, dtype=np.float32),
+            np.asarray(vec2, dtype=np.float32)
+        )
+
+        assert isinstance(similarity, float)
+        assert abs(similarity - expected) < 1e-6
+
+
+class TestCosineSimilarityMatrix:
+    """Test batched cosine similarity function."""
+
+    def test_matches_pairwise_similarity(self):
+        """Test that each score matches cosine_similarity for that row."""
+        query = [1.0, 2.0, 3.0]
+        rows = [[1.0, 2.0, 3.0], [-1.0, -2.0, -3.0], [4.0, -5.0, 6.0]]
+
+        scores = cosine_similarity_matrix(query, np.asarray(rows, dtype=np.float32))
+
+        assert scores.shape == (3,)
+        for score, row in zip(scores, rows):
+            assert abs(score - cosine_similarity(query, row)) < 1e-6
+
+    def test_zero_row_scores_zero(self):
+        """Test that zero-magnitude rows score 0.0 instead of dividing by zero."""
+        matrix = np.asarray([[0.0, 0.0], [1.0, 0.0]], dtype=np.float32)
+
+        scores = cosine_similarity_matrix([1.0, 0.0], matrix)
+
+        assert scores[0] == 0.0
+        assert abs(scores[1] - 1.0) < 1e-6
+
+    def test_normalized_uses_dot_product(self):
+        """Test that normalized=True returns raw dot products."""
+        matrix = np.asarray([[2.0, 0.0], [0.0, 3.0]], dtype=np.float32)
+
+        scores = cosine_similarity_matrix([1.0, 1.0], matrix, normalized=True)
+
+        assert scores.tolist() == [2.0, 3.0]
+
+    def test_dimension_mismatch_raises_error(self):
+        """Test that mismatched dimensions raise ValueError."""
+        with pytest.raises(ValueError):
+            cosine_similarity_matrix([1.0, 2.0], np.ones((2, 3), dtype=np.float32))
+
+    def test_empty_query_raises_error(self):
+        """Test that an empty query raises ValueError."""
+        with pytest.raises(ValueError):
+            cosine_similarity_matrix([], np.ones((2, 3), dtype=np.float32))
+
 
 class TestEuclideanDistance:
     """Test Euclidean distance function."""